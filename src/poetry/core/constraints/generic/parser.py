@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import functools
 import re
 
 from typing import TYPE_CHECKING
@@ -10,6 +9,7 @@ from poetry.core.constraints.generic.constraint import Constraint
 from poetry.core.constraints.generic.constraint import ExtraConstraint
 from poetry.core.constraints.generic.union_constraint import UnionConstraint
 from poetry.core.constraints.version.exceptions import ParseConstraintError
+from poetry.core.utils.cache import lru_cache
 
 
 if TYPE_CHECKING:
@@ -28,12 +28,12 @@ STR_CMP_CONSTRAINT = re.compile(
 )
 
 
-@functools.cache
+@lru_cache(maxsize=2**12)
 def parse_constraint(constraints: str) -> BaseConstraint:
     return _parse_constraint(constraints, Constraint)
 
 
-@functools.cache
+@lru_cache(maxsize=2**10)
 def parse_extra_constraint(constraints: str) -> BaseConstraint:
     return _parse_constraint(constraints, ExtraConstraint)
 
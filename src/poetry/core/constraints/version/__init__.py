@@ -4,8 +4,10 @@ from poetry.core.constraints.version.empty_constraint import EmptyConstraint
 from poetry.core.constraints.version.parser import parse_constraint
 from poetry.core.constraints.version.parser import parse_marker_version_constraint
 from poetry.core.constraints.version.util import constraint_regions
+from poetry.core.constraints.version.util import sort_versions
 from poetry.core.constraints.version.version import Version
 from poetry.core.constraints.version.version_constraint import VersionConstraint
+from poetry.core.constraints.version.version_index import VersionIndex
 from poetry.core.constraints.version.version_range import VersionRange
 from poetry.core.constraints.version.version_range_constraint import (
     VersionRangeConstraint,
@@ -17,10 +19,12 @@ __all__ = (
     "EmptyConstraint",
     "Version",
     "VersionConstraint",
+    "VersionIndex",
     "VersionRange",
     "VersionRangeConstraint",
     "VersionUnion",
     "constraint_regions",
     "parse_constraint",
     "parse_marker_version_constraint",
+    "sort_versions",
 )
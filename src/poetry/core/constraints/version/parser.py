@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import functools
 import re
 
 from typing import TYPE_CHECKING
 
 from poetry.core.constraints.version.exceptions import ParseConstraintError
+from poetry.core.utils.cache import lru_cache
 from poetry.core.version.exceptions import InvalidVersionError
 
 
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     from poetry.core.constraints.version.version_constraint import VersionConstraint
 
 
-@functools.cache
+@lru_cache(maxsize=2**14)
 def parse_constraint(constraints: str) -> VersionConstraint:
     return _parse_constraint(constraints=constraints)
 
@@ -3,10 +3,13 @@ from __future__ import annotations
 from itertools import pairwise
 from typing import TYPE_CHECKING
 
+from poetry.core.constraints.version.version import Version
 from poetry.core.constraints.version.version_range import VersionRange
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from poetry.core.constraints.version.version_constraint import VersionConstraint
 
 
@@ -57,3 +60,20 @@ def constraint_regions(constraints: list[VersionConstraint]) -> list[VersionRang
     )
 
     return regions
+
+
+def sort_versions(versions: Iterable[str], reverse: bool = False) -> list[str]:
+    """
+    Sort version strings by the versions they represent.
+
+    Equal versions (e.g. "1.0" and "1.0.0") keep their relative order.
+    Raises InvalidVersionError if a string is not a valid PEP 440 version.
+    """
+    return [
+        text
+        for _, text in sorted(
+            ((Version.parse(text).sort_key, text) for text in versions),
+            key=lambda item: item[0],
+            reverse=reverse,
+        )
+    ]
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from bisect import bisect_right
+from typing import TYPE_CHECKING
+
+from poetry.core.constraints.version.version_range_constraint import (
+    VersionRangeConstraint,
+)
+from poetry.core.constraints.version.version_union import VersionUnion
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from poetry.core.constraints.version.version import Version
+    from poetry.core.constraints.version.version_constraint import VersionConstraint
+
+
+class VersionIndex:
+    """
+    Sorted versions that can be filtered by constraints efficiently.
+
+    The versions allowed by a constraint are found by bisecting the bounds
+    of each of its ranges. Only the versions at the boundaries of a range
+    have to be checked explicitly (e.g. post releases for exclusive minimums
+    and pre-releases for exclusive maximums).
+    """
+
+    def __init__(self, versions: Iterable[Version]) -> None:
+        self._versions = sorted(versions, key=lambda v: v.sort_key)
+        self._keys = [v.sort_key for v in self._versions]
+
+    @property
+    def versions(self) -> list[Version]:
+        return self._versions
+
+    def allowed_by(self, constraint: VersionConstraint) -> list[Version]:
+        """
+        Return the versions allowed by constraint in ascending order.
+        """
+        if constraint.is_empty():
+            return []
+
+        if constraint.is_any():
+            return list(self._versions)
+
+        if isinstance(constraint, VersionUnion):
+            if constraint.excludes_single_version:
+                # "!=V" does not allow local versions of V,
+                # which are not covered by its ranges "<V" and ">V".
+                excluded = constraint._excluded_single_version
+                start, stop = self._bounds(excluded)
+                return [
+                    *self._versions[:start],
+                    *(v for v in self._versions[start:stop] if not excluded.allows(v)),
+                    *self._versions[stop:],
+                ]
+
+            ranges = constraint.ranges
+        else:
+            assert isinstance(constraint, VersionRangeConstraint)
+            ranges = [constraint]
+
+        versions = self._versions
+        allowed: list[Version] = []
+        end = 0
+        for version_range in ranges:
+            start, stop = self._bounds(version_range)
+            start = max(start, end)
+            allowed_min = version_range.allowed_min
+            if (
+                allowed_min is not None
+                and not version_range.include_min
+                and allowed_min.is_local()
+                and not allowed_min.is_postrelease()
+            ):
+                # ">V+local" allows greater local versions of V, but not
+                # the post releases of V, which are sorted in between.
+                base = allowed_min.without_local()
+                while (
+                    start < stop
+                    and versions[start].without_local().without_postrelease() == base
+                ):
+                    if version_range.allows(versions[start]):
+                        allowed.append(versions[start])
+                    start += 1
+            # Otherwise, versions that are not allowed even though they are
+            # within the bounds are always at the start or at the end.
+            while start < stop and not version_range.allows(versions[start]):
+                start += 1
+            while stop > start and not version_range.allows(versions[stop - 1]):
+                stop -= 1
+            allowed += versions[start:stop]
+            end = max(end, stop)
+
+        return allowed
+
+    def _bounds(self, version_range: VersionRangeConstraint) -> tuple[int, int]:
+        allowed_min = version_range.allowed_min
+        if allowed_min is None:
+            start = 0
+        else:
+            start = bisect_left(self._keys, allowed_min.sort_key)
+
+        allowed_max = version_range.allowed_max
+        if allowed_max is None:
+            stop = len(self._keys)
+        else:
+            key = allowed_max.sort_key
+            if not allowed_max.is_local():
+                # Local versions of the maximum may be allowed, too.
+                # The last byte of the key represents the local segment
+                # and is lower than the first byte of any local segment.
+                key = key[:-1] + b"\x02"
+            stop = bisect_right(self._keys, key)
+
+        return start, stop
+
+    def __iter__(self) -> Iterator[Version]:
+        return iter(self._versions)
+
+    def __len__(self) -> int:
+        return len(self._versions)
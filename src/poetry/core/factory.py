@@ -4,6 +4,7 @@ import logging
 
 from collections import defaultdict
 from collections.abc import Mapping
+from functools import partial
 from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -39,9 +40,20 @@ class Factory:
     Factory class to create various elements needed by Poetry.
     """
 
+    def __init__(self) -> None:
+        # The warnings of the last project created by create_poetry().
+        self.warnings: list[str] = []
+
     def create_poetry(
-        self, cwd: Path | None = None, with_groups: bool = True
+        self, cwd: Path | None = None, with_groups: bool = True, lazy: bool = False
     ) -> Poetry:
+        """
+        Create a Poetry instance for the project in cwd (or a parent directory).
+
+        If lazy is True, the dependencies of the package are only parsed when
+        they are accessed (see ProjectPackage.defer_dependencies()). Thus, errors
+        in dependency specifications may be raised later.
+        """
         from poetry.core.poetry import Poetry
         from poetry.core.pyproject.toml import PyProjectTOML
 
@@ -57,7 +69,8 @@ class Factory:
 
             raise RuntimeError("The Poetry configuration is invalid:\n" + message)
 
-        for warning in check_result["warnings"]:
+        self.warnings = check_result["warnings"]
+        for warning in self.warnings:
             logger.warning(warning)
 
         # Load package
@@ -73,7 +86,7 @@ class Factory:
         assert isinstance(version, str)
         package = self.get_package(name, version)
         self.configure_package(
-            package, pyproject, poetry_file.parent, with_groups=with_groups
+            package, pyproject, poetry_file.parent, with_groups=with_groups, lazy=lazy
         )
 
         return Poetry(poetry_file, pyproject.poetry_config, package)
@@ -122,15 +135,15 @@ class Factory:
                 group = DependencyGroup(group)
 
         for name, constraints in dependencies.items():
+            if name.lower() == "python":
+                if group.name == MAIN_GROUP:
+                    cls._configure_python_versions(package, constraints)
+                continue
+
             _constraints = (
                 constraints if isinstance(constraints, list) else [constraints]
             )
             for _constraint in _constraints:
-                if name.lower() == "python":
-                    if group.name == MAIN_GROUP and isinstance(_constraint, str):
-                        package.python_versions = _constraint
-                    continue
-
                 group.add_poetry_dependency(
                     cls.create_dependency(
                         name,
@@ -149,6 +162,7 @@ class Factory:
         pyproject: PyProjectTOML,
         root: Path,
         with_groups: bool = True,
+        lazy: bool = False,
     ) -> None:
         project = pyproject.data.get("project", {})
         tool_poetry = pyproject.poetry_config
@@ -158,13 +172,29 @@ class Factory:
 
         cls._configure_package_metadata(package, project, tool_poetry, root)
         cls._configure_entry_points(package, project, tool_poetry)
-        cls._configure_package_dependencies(
-            package=package,
-            project=project,
-            tool_poetry=tool_poetry,
-            dependency_groups=dependency_groups,
-            with_groups=with_groups,
-        )
+        if lazy:
+            # The Python constraint is part of the metadata
+            # and does not require parsing the other dependencies.
+            for name, constraints in tool_poetry.get("dependencies", {}).items():
+                if name.lower() == "python":
+                    cls._configure_python_versions(package, constraints)
+            package.defer_dependencies(
+                partial(
+                    cls._configure_package_dependencies,
+                    project=project,
+                    tool_poetry=tool_poetry,
+                    dependency_groups=dependency_groups,
+                    with_groups=with_groups,
+                )
+            )
+        else:
+            cls._configure_package_dependencies(
+                package=package,
+                project=project,
+                tool_poetry=tool_poetry,
+                dependency_groups=dependency_groups,
+                with_groups=with_groups,
+            )
         cls._configure_package_poetry_specifics(package, tool_poetry)
 
     @classmethod
@@ -361,6 +391,21 @@ class Factory:
 
         package.entry_points = dict(entry_points)
 
+    @classmethod
+    def _configure_python_versions(
+        cls,
+        package: ProjectPackage,
+        constraints: list[DependencyConstraint] | DependencyConstraint,
+    ) -> None:
+        """
+        Set the Python versions of package from the "python" entry
+        of tool.poetry.dependencies. Only string constraints are supported.
+        """
+        _constraints = constraints if isinstance(constraints, list) else [constraints]
+        for _constraint in _constraints:
+            if isinstance(_constraint, str):
+                package.python_versions = _constraint
+
     @classmethod
     def _configure_package_dependencies(
         cls,
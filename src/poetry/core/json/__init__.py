@@ -1,13 +1,24 @@
 from __future__ import annotations
 
+import copy
+import functools
+import hashlib
+import importlib
 import json
 
 from importlib.resources import files
+from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Any
 
 import fastjsonschema
 
-from fastjsonschema.exceptions import JsonSchemaException
+from fastjsonschema.exceptions import JsonSchemaValueException
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from importlib.resources.abc import Traversable
 
 
 class ValidationError(ValueError):
@@ -15,20 +26,134 @@ class ValidationError(ValueError):
 
 
 def validate_object(obj: dict[str, Any], schema_name: str) -> list[str]:
+    """
+    Validate obj against a schema and return all errors.
+
+    fastjsonschema stops at the first error. To find further errors, the invalid
+    part of (a copy of) obj is removed and the remaining object is validated again.
+    """
+    validate = _get_validator(schema_name)
+
+    try:
+        validate(obj)
+    except JsonSchemaValueException as e:
+        return _collect_errors(validate, obj, e)
+
+    return []
+
+
+def generate_validator(schema_name: str) -> None:
+    """
+    Generate the validator module for a schema (see _get_validator()).
+    """
+    schema_file = _get_schema_file(schema_name)
+    content = schema_file.read_bytes()
+    code = fastjsonschema.compile_to_code(json.loads(content))
+    validators_dir = Path(str(files(__package__) / "validators"))
+    path = validators_dir / f"{_module_name(schema_name)}.py"
+    path.write_text(
+        f"# Generated from schemas/{schema_name}.json by"
+        " poetry.core.json.generate_validator(). Do not edit.\n"
+        f'SCHEMA_DIGEST = "{hashlib.sha256(content).hexdigest()}"\n'
+        f'FASTJSONSCHEMA_VERSION = "{fastjsonschema.VERSION}"\n'
+        f"{code}",
+        encoding="utf-8",
+    )
+
+
+@functools.cache
+def _get_validator(schema_name: str) -> Callable[[Any], Any]:
+    """
+    Return the validation function for a schema.
+
+    Validators that have been generated ahead of time (see generate_validator())
+    are used if they have been generated from the current schema by the current
+    version of fastjsonschema. Otherwise, the schema is compiled, which requires
+    generating and executing Python code.
+    """
+    schema_file = _get_schema_file(schema_name)
+    content = schema_file.read_bytes()
+
+    try:
+        module = importlib.import_module(
+            f"{__name__}.validators.{_module_name(schema_name)}"
+        )
+    except ImportError:
+        pass
+    else:
+        digest = hashlib.sha256(content).hexdigest()
+        if (
+            getattr(module, "SCHEMA_DIGEST", None) == digest
+            and getattr(module, "FASTJSONSCHEMA_VERSION", None)
+            == fastjsonschema.VERSION
+        ):
+            return module.validate  # type: ignore[no-any-return]
+
+    return fastjsonschema.compile(json.loads(content))  # type: ignore[no-any-return]
+
+
+def _collect_errors(
+    validate: Callable[[Any], Any],
+    obj: dict[str, Any],
+    error: JsonSchemaValueException,
+) -> list[str]:
+    errors = [error.message]
+    data = copy.deepcopy(obj)
+    removed: list[list[str]] = []
+    while True:
+        path = _remove_invalid_part(data, error.path[1:])
+        if path is None:
+            return errors
+        removed.append(path)
+
+        try:
+            validate(data)
+        except JsonSchemaValueException as e:
+            error = e
+        else:
+            return errors
+
+        if error.rule == "required" and any(
+            removed_path[:-1] == error.path[1:]
+            and removed_path[-1] in (error.rule_definition or ())
+            for removed_path in removed
+        ):
+            # The error has been caused by removing a required property.
+            return errors
+
+        errors.append(error.message)
+
+
+def _remove_invalid_part(data: dict[str, Any], path: list[str]) -> list[str] | None:
+    # Removing deeply nested properties may cause errors about missing required
+    # properties. Removing top-level properties would hide errors of their siblings
+    # (e.g. of other dependencies). Thus, we remove the second level if possible.
+    for depth in (2, 1):
+        if len(path) < depth:
+            continue
+
+        container: Any = data
+        for key in path[: depth - 1]:
+            if not isinstance(container, dict) or key not in container:
+                break
+            container = container[key]
+        else:
+            key = path[depth - 1]
+            if isinstance(container, dict) and key in container:
+                del container[key]
+                return path[:depth]
+
+    return None
+
+
+def _get_schema_file(schema_name: str) -> Traversable:
     schema_file = files(__package__) / "schemas" / f"{schema_name}.json"
 
     if not schema_file.is_file():
         raise ValueError(f"Schema {schema_name} does not exist.")
 
-    with schema_file.open(encoding="utf-8") as f:
-        schema = json.load(f)
+    return schema_file
 
-    validate = fastjsonschema.compile(schema)
-
-    errors = []
-    try:
-        validate(obj)
-    except JsonSchemaException as e:
-        errors = [e.message]
 
-    return errors
+def _module_name(schema_name: str) -> str:
+    return schema_name.replace("-", "_")
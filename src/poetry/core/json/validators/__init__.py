@@ -0,0 +1,5 @@
+"""
+Validators generated from the schemas by poetry.core.json.generate_validator().
+"""
+
+from __future__ import annotations
@@ -0,0 +1,54 @@
+# Generated from schemas/dependency-groups-schema.json by poetry.core.json.generate_validator(). Do not edit.
+SCHEMA_DIGEST = "127177b5b17c278ed5facc36ce04e86c01fd3d8106c8edf8e0dce4f7c0fd6cf1"
+FASTJSONSCHEMA_VERSION = "2.21.2"
+VERSION = "2.21.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'name': 'dependency-groups', 'type': 'object', 'additionalProperties': {'title': 'Dependency group requirements', 'type': 'array', 'items': {'oneOf': [{'type': 'string', 'description': 'A single dependency requirement'}, {'type': 'object', 'additionalProperties': False, 'required': ['include-group'], 'properties': {'include-group': {'type': 'string', 'description': 'The name of the group to include'}}}]}, 'examples': [['attrs', 'requests ~= 2.28', {'include-group': 'dev'}]]}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        for data_key in data_keys:
+            if data_key not in []:
+                data_value = data.get(data_key)
+                if not isinstance(data_value, (list, tuple)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".{data_key}".format(**locals()) + " must be array", value=data_value, name="" + (name_prefix or "data") + ".{data_key}".format(**locals()) + "", definition={'title': 'Dependency group requirements', 'type': 'array', 'items': {'oneOf': [{'type': 'string', 'description': 'A single dependency requirement'}, {'type': 'object', 'additionalProperties': False, 'required': ['include-group'], 'properties': {'include-group': {'type': 'string', 'description': 'The name of the group to include'}}}]}, 'examples': [['attrs', 'requests ~= 2.28', {'include-group': 'dev'}]]}, rule='type')
+                data_value_is_list = isinstance(data_value, (list, tuple))
+                if data_value_is_list:
+                    data_value_len = len(data_value)
+                    for data_value_x, data_value_item in enumerate(data_value):
+                        data_value_item_one_of_count1 = 0
+                        if data_value_item_one_of_count1 < 2:
+                            try:
+                                if not isinstance(data_value_item, (str)):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".{data_key}[{data_value_x}]".format(**locals()) + " must be string", value=data_value_item, name="" + (name_prefix or "data") + ".{data_key}[{data_value_x}]".format(**locals()) + "", definition={'type': 'string', 'description': 'A single dependency requirement'}, rule='type')
+                                data_value_item_one_of_count1 += 1
+                            except JsonSchemaValueException: pass
+                        if data_value_item_one_of_count1 < 2:
+                            try:
+                                if not isinstance(data_value_item, (dict)):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".{data_key}[{data_value_x}]".format(**locals()) + " must be object", value=data_value_item, name="" + (name_prefix or "data") + ".{data_key}[{data_value_x}]".format(**locals()) + "", definition={'type': 'object', 'additionalProperties': False, 'required': ['include-group'], 'properties': {'include-group': {'type': 'string', 'description': 'The name of the group to include'}}}, rule='type')
+                                data_value_item_is_dict = isinstance(data_value_item, dict)
+                                if data_value_item_is_dict:
+                                    data_value_item__missing_keys = set(['include-group']) - data_value_item.keys()
+                                    if data_value_item__missing_keys:
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".{data_key}[{data_value_x}]".format(**locals()) + " must contain " + (str(sorted(data_value_item__missing_keys)) + " properties"), value=data_value_item, name="" + (name_prefix or "data") + ".{data_key}[{data_value_x}]".format(**locals()) + "", definition={'type': 'object', 'additionalProperties': False, 'required': ['include-group'], 'properties': {'include-group': {'type': 'string', 'description': 'The name of the group to include'}}}, rule='required')
+                                    data_value_item_keys = set(data_value_item.keys())
+                                    if "include-group" in data_value_item_keys:
+                                        data_value_item_keys.remove("include-group")
+                                        data_value_item__includegroup = data_value_item["include-group"]
+                                        if not isinstance(data_value_item__includegroup, (str)):
+                                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".{data_key}[{data_value_x}].include-group".format(**locals()) + " must be string", value=data_value_item__includegroup, name="" + (name_prefix or "data") + ".{data_key}[{data_value_x}].include-group".format(**locals()) + "", definition={'type': 'string', 'description': 'The name of the group to include'}, rule='type')
+                                    if data_value_item_keys:
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".{data_key}[{data_value_x}]".format(**locals()) + " must not contain "+str(data_value_item_keys)+" properties", value=data_value_item, name="" + (name_prefix or "data") + ".{data_key}[{data_value_x}]".format(**locals()) + "", definition={'type': 'object', 'additionalProperties': False, 'required': ['include-group'], 'properties': {'include-group': {'type': 'string', 'description': 'The name of the group to include'}}}, rule='additionalProperties')
+                                data_value_item_one_of_count1 += 1
+                            except JsonSchemaValueException: pass
+                        if data_value_item_one_of_count1 != 1:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".{data_key}[{data_value_x}]".format(**locals()) + " must be valid exactly by one definition" + (" (" + str(data_value_item_one_of_count1) + " matches found)"), value=data_value_item, name="" + (name_prefix or "data") + ".{data_key}[{data_value_x}]".format(**locals()) + "", definition={'oneOf': [{'type': 'string', 'description': 'A single dependency requirement'}, {'type': 'object', 'additionalProperties': False, 'required': ['include-group'], 'properties': {'include-group': {'type': 'string', 'description': 'The name of the group to include'}}}]}, rule='oneOf')
+    return data
\ No newline at end of file
@@ -0,0 +1,1018 @@
+# Generated from schemas/poetry-schema.json by poetry.core.json.generate_validator(). Do not edit.
+SCHEMA_DIGEST = "2bc94a40953eb002f8adab8c032cc8701af5834f5e895feb736021b170215915"
+FASTJSONSCHEMA_VERSION = "2.21.2"
+VERSION = "2.21.2"
+from decimal import Decimal
+import re
+from fastjsonschema import JsonSchemaValueException
+
+
+REGEX_PATTERNS = {
+    '\\A[^\\n]*\\Z': re.compile('\\A[^\\n]*\\Z'),
+    'uri_re_pattern': re.compile('^\\w+:(\\/?\\/?)[^\\s]+\\Z'),
+    '^[a-zA-Z-_.0-9]+$': re.compile('^[a-zA-Z-_.0-9]+$'),
+    '^.+$': re.compile('^.+$')
+}
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-04/schema#', 'name': 'Package', 'type': 'object', 'additionalProperties': True, 'properties': {'package-mode': {'type': 'boolean', 'default': True, 'description': 'Whether Poetry is operated in package mode or non-package mode.'}, 'name': {'type': 'string', 'description': 'Package name (legacy).'}, 'version': {'type': 'string', 'description': 'Package version (legacy).'}, 'description': {'type': 'string', 'description': 'Short package description (legacy).', 'pattern': '\\A[^\\n]*\\Z'}, 'keywords': {'type': 'array', 'items': {'type': 'string', 'description': 'A tag/keyword that this package relates to (legacy).'}}, 'homepage': {'type': 'string', 'description': 'Homepage URL for the project (legacy).', 'format': 'uri'}, 'repository': {'type': 'string', 'description': 'Repository URL for the project (legacy).', 'format': 'uri'}, 'documentation': {'type': 'string', 'description': 'Documentation URL for the project (legacy).', 'format': 'uri'}, 'license': {'type': 'string', 'description': 'License name (legacy).'}, 'authors': {'type': 'array', 'description': 'List of authors that contributed to the package. This is typically the main maintainers, not the full list (legacy).', 'items': {'type': 'string'}}, 'maintainers': {'type': 'array', 'description': 'List of maintainers, other than the original author(s), that upkeep the package (legacy).', 'items': {'type': 'string'}}, 'readme': {'anyOf': [{'type': 'string', 'description': 'The path to the README file (legacy).'}, {'type': 'array', 'description': 'A list of paths to the readme files.', 'items': {'type': 'string'}}]}, 'classifiers': {'type': 'array', 'description': 'A list of trove classifiers (legacy).'}, 'packages': {'type': 'array', 'description': 'A list of packages to include in the final distribution.', 'items': {'type': 'object', 'description': 'Information about where the package resides.', 'additionalProperties': False, 'required': ['include'], 'properties': {'include': {'type': 'string', 'description': 'Path to file or directory to include.'}, 'from': {'type': 'string', 'description': 'Where the source directory of the package resides.'}, 'format': {'oneOf': [{'$ref': '#/definitions/package-format'}, {'type': 'array', 'items': {'$ref': '#/definitions/package-format'}}], 'description': 'The format(s) for which the package must be included.'}, 'to': {'type': 'string', 'description': 'Where the package should be installed in the final distribution.'}}}}, 'include': {'type': 'array', 'description': 'A list of files and folders to include.', 'items': {'anyOf': [{'type': 'string', 'description': 'Path to file or directory to include.'}, {'type': 'object', 'additionalProperties': False, 'required': ['path'], 'properties': {'path': {'type': 'string', 'description': 'Path to file or directory to include.'}, 'format': {'oneOf': [{'$ref': '#/definitions/package-format'}, {'type': 'array', 'items': {'$ref': '#/definitions/package-format'}}], 'description': 'The format(s) for which the package must be included.'}}}]}}, 'exclude': {'type': 'array', 'description': 'A list of files and folders to exclude.'}, 'dependencies': {'type': 'object', 'patternProperties': {'^[a-zA-Z-_.0-9]+$': {'oneOf': [{'$ref': '#/definitions/dependency'}, {'$ref': '#/definitions/long-dependency'}, {'$ref': '#/definitions/git-dependency'}, {'$ref': '#/definitions/file-dependency'}, {'$ref': '#/definitions/path-dependency'}, {'$ref': '#/definitions/url-dependency'}, {'$ref': '#/definitions/multiple-constraints-dependency'}, {'$ref': '#/definitions/dependency-options'}]}}}, 'dev-dependencies': {'type': 'object', 'patternProperties': {'^[a-zA-Z-_.0-9]+$': {'oneOf': [{'$ref': '#/definitions/dependency'}, {'$ref': '#/definitions/long-dependency'}, {'$ref': '#/definitions/git-dependency'}, {'$ref': '#/definitions/file-dependency'}, {'$ref': '#/definitions/path-dependency'}, {'$ref': '#/definitions/url-dependency'}, {'$ref': '#/definitions/multiple-constraints-dependency'}, {'$ref': '#/definitions/dependency-options'}]}}}, 'extras': {'type': 'object', 'description': 'Extras (legacy).', 'patternProperties': {'^[a-zA-Z-_.0-9]+$': {'type': 'array', 'items': {'type': 'string', 'pattern': '^[a-zA-Z-_.0-9]+$'}}}}, 'group': {'type': 'object', 'description': 'This represents groups of dependencies', 'patternProperties': {'^[a-zA-Z-_.0-9]+$': {'type': 'object', 'description': 'This represents a single dependency group', 'anyOf': [{'required': ['dependencies']}, {'required': ['include-groups']}, {'required': ['optional']}], 'properties': {'optional': {'type': 'boolean', 'description': 'Whether the dependency group is optional or not'}, 'include-groups': {'type': 'array', 'description': 'List of dependency group names included in this group.', 'items': {'type': 'string'}}, 'dependencies': {'type': 'object', 'patternProperties': {'^[a-zA-Z-_.0-9]+$': {'oneOf': [{'$ref': '#/definitions/dependency'}, {'$ref': '#/definitions/long-dependency'}, {'$ref': '#/definitions/git-dependency'}, {'$ref': '#/definitions/file-dependency'}, {'$ref': '#/definitions/path-dependency'}, {'$ref': '#/definitions/url-dependency'}, {'$ref': '#/definitions/multiple-constraints-dependency'}, {'$ref': '#/definitions/dependency-options'}]}}}}, 'additionalProperties': False}}}, 'build': {'oneOf': [{'$ref': '#/definitions/build-script'}, {'$ref': '#/definitions/build-config'}]}, 'scripts': {'type': 'object', 'description': 'A hash of scripts to be installed.', 'patternProperties': {'^[a-zA-Z-_.0-9]+$': {'oneOf': [{'type': 'string', 'description': 'A simple script pointing to a callable object.'}, {'type': 'object', 'oneOf': [{'$ref': '#/definitions/extra-script-legacy'}, {'$ref': '#/definitions/extra-scripts'}]}]}}}, 'plugins': {'type': 'object', 'description': 'A hash of hashes representing plugins', 'patternProperties': {'^[a-zA-Z-_.0-9]+$': {'type': 'object', 'patternProperties': {'^[a-zA-Z-_.0-9]+$': {'type': 'string'}}}}}, 'urls': {'type': 'object', 'patternProperties': {'^.+$': {'type': 'string', 'description': 'The full url of the custom url (Legacy).'}}}}, 'definitions': {'authors': {'type': 'array', 'description': 'List of authors that contributed to the package. This is typically the main maintainers, not the full list (legacy).', 'items': {'type': 'string'}}, 'maintainers': {'type': 'array', 'description': 'List of maintainers, other than the original author(s), that upkeep the package (legacy).', 'items': {'type': 'string'}}, 'include-path': {'type': 'string', 'description': 'Path to file or directory to include.'}, 'package-format': {'type': 'string', 'enum': ['sdist', 'wheel'], 'description': 'A Python packaging format.'}, 'package-formats': {'oneOf': [{'type': 'string', 'enum': ['sdist', 'wheel'], 'description': 'A Python packaging format.'}, {'type': 'array', 'items': {'type': 'string', 'enum': ['sdist', 'wheel'], 'description': 'A Python packaging format.'}}], 'description': 'The format(s) for which the package must be included.'}, 'dependencies': {'type': 'object', 'patternProperties': {'^[a-zA-Z-_.0-9]+$': {'oneOf': [{'type': 'string', 'description': 'The constraint of the dependency.'}, {'type': 'object', 'required': ['version'], 'additionalProperties': False, 'properties': {'version': {'type': 'string', 'description': 'The constraint of the dependency.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'source': {'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}}}, {'type': 'object', 'required': ['git'], 'additionalProperties': False, 'properties': {'git': {'type': 'string', 'description': 'The url of the git repository.'}, 'branch': {'type': 'string', 'description': 'The branch to checkout.'}, 'tag': {'type': 'string', 'description': 'The tag to checkout.'}, 'rev': {'type': 'string', 'description': 'The revision to checkout.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, {'type': 'object', 'required': ['file'], 'additionalProperties': False, 'properties': {'file': {'type': 'string', 'description': 'The path to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, {'type': 'object', 'required': ['path'], 'additionalProperties': False, 'properties': {'path': {'type': 'string', 'description': 'The path to the dependency.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, {'type': 'object', 'required': ['url'], 'additionalProperties': False, 'properties': {'url': {'type': 'string', 'description': 'The url to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, {'type': 'array', 'minItems': 1, 'items': {'oneOf': [{'$ref': '#/definitions/dependency'}, {'$ref': '#/definitions/long-dependency'}, {'$ref': '#/definitions/git-dependency'}, {'$ref': '#/definitions/file-dependency'}, {'$ref': '#/definitions/path-dependency'}, {'$ref': '#/definitions/url-dependency'}, {'$ref': '#/definitions/dependency-options'}]}}, {'type': 'object', 'additionalProperties': False, 'properties': {'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'source': {'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}]}}}, 'dependency': {'type': 'string', 'description': 'The constraint of the dependency.'}, 'long-dependency': {'type': 'object', 'required': ['version'], 'additionalProperties': False, 'properties': {'version': {'type': 'string', 'description': 'The constraint of the dependency.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'source': {'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}}}, 'git-dependency': {'type': 'object', 'required': ['git'], 'additionalProperties': False, 'properties': {'git': {'type': 'string', 'description': 'The url of the git repository.'}, 'branch': {'type': 'string', 'description': 'The branch to checkout.'}, 'tag': {'type': 'string', 'description': 'The tag to checkout.'}, 'rev': {'type': 'string', 'description': 'The revision to checkout.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, 'file-dependency': {'type': 'object', 'required': ['file'], 'additionalProperties': False, 'properties': {'file': {'type': 'string', 'description': 'The path to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, 'path-dependency': {'type': 'object', 'required': ['path'], 'additionalProperties': False, 'properties': {'path': {'type': 'string', 'description': 'The path to the dependency.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, 'url-dependency': {'type': 'object', 'required': ['url'], 'additionalProperties': False, 'properties': {'url': {'type': 'string', 'description': 'The url to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, 'dependency-options': {'type': 'object', 'additionalProperties': False, 'properties': {'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'source': {'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, 'multiple-constraints-dependency': {'type': 'array', 'minItems': 1, 'items': {'oneOf': [{'type': 'string', 'description': 'The constraint of the dependency.'}, {'type': 'object', 'required': ['version'], 'additionalProperties': False, 'properties': {'version': {'type': 'string', 'description': 'The constraint of the dependency.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'source': {'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}}}, {'type': 'object', 'required': ['git'], 'additionalProperties': False, 'properties': {'git': {'type': 'string', 'description': 'The url of the git repository.'}, 'branch': {'type': 'string', 'description': 'The branch to checkout.'}, 'tag': {'type': 'string', 'description': 'The tag to checkout.'}, 'rev': {'type': 'string', 'description': 'The revision to checkout.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, {'type': 'object', 'required': ['file'], 'additionalProperties': False, 'properties': {'file': {'type': 'string', 'description': 'The path to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, {'type': 'object', 'required': ['path'], 'additionalProperties': False, 'properties': {'path': {'type': 'string', 'description': 'The path to the dependency.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, {'type': 'object', 'required': ['url'], 'additionalProperties': False, 'properties': {'url': {'type': 'string', 'description': 'The url to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, {'type': 'object', 'additionalProperties': False, 'properties': {'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'source': {'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}]}}, 'script-table': {'type': 'object', 'oneOf': [{'type': 'object', 'description': 'A script that should be installed only if extras are activated.', 'additionalProperties': False, 'properties': {'callable': {'$ref': '#/definitions/script-legacy', 'description': 'The entry point of the script. Deprecated in favour of reference.'}, 'extras': {'type': 'array', 'description': 'The required extras for this script.', 'items': {'type': 'string'}}}}, {'type': 'object', 'description': "Either a console entry point or a script file that'll be included in the distribution package.", 'additionalProperties': False, 'properties': {'reference': {'type': 'string', 'description': 'If type is file this is the relative path of the script file, if console it is the module name.'}, 'type': {'description': 'Value can be either file or console.', 'type': 'string', 'enum': ['file', 'console']}, 'extras': {'type': 'array', 'description': 'The required extras for this script. Only applicable if type is console.', 'items': {'type': 'string'}}}, 'required': ['reference', 'type']}]}, 'script-legacy': {'type': 'string', 'description': 'A simple script pointing to a callable object.'}, 'extra-scripts': {'type': 'object', 'description': "Either a console entry point or a script file that'll be included in the distribution package.", 'additionalProperties': False, 'properties': {'reference': {'type': 'string', 'description': 'If type is file this is the relative path of the script file, if console it is the module name.'}, 'type': {'description': 'Value can be either file or console.', 'type': 'string', 'enum': ['file', 'console']}, 'extras': {'type': 'array', 'description': 'The required extras for this script. Only applicable if type is console.', 'items': {'type': 'string'}}}, 'required': ['reference', 'type']}, 'extra-script-legacy': {'type': 'object', 'description': 'A script that should be installed only if extras are activated.', 'additionalProperties': False, 'properties': {'callable': {'type': 'string', 'description': 'A simple script pointing to a callable object.'}, 'extras': {'type': 'array', 'description': 'The required extras for this script.', 'items': {'type': 'string'}}}}, 'build-script': {'type': 'string', 'description': 'The python script file used to build extensions.'}, 'build-config': {'type': 'object', 'description': 'Build specific configurations.', 'additionalProperties': False, 'properties': {'generate-setup-file': {'type': 'boolean', 'description': 'Generate and include a setup.py file in sdist.', 'default': False}, 'script': {'type': 'string', 'description': 'The python script file used to build extensions.'}}}, 'build-section': {'oneOf': [{'type': 'string', 'description': 'The python script file used to build extensions.'}, {'type': 'object', 'description': 'Build specific configurations.', 'additionalProperties': False, 'properties': {'generate-setup-file': {'type': 'boolean', 'description': 'Generate and include a setup.py file in sdist.', 'default': False}, 'script': {'$ref': '#/definitions/build-script'}}}]}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        if "package-mode" in data_keys:
+            data_keys.remove("package-mode")
+            data__packagemode = data["package-mode"]
+            if not isinstance(data__packagemode, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".package-mode must be boolean", value=data__packagemode, name="" + (name_prefix or "data") + ".package-mode", definition={'type': 'boolean', 'default': True, 'description': 'Whether Poetry is operated in package mode or non-package mode.'}, rule='type')
+        else: data["package-mode"] = True
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'type': 'string', 'description': 'Package name (legacy).'}, rule='type')
+        if "version" in data_keys:
+            data_keys.remove("version")
+            data__version = data["version"]
+            if not isinstance(data__version, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".version must be string", value=data__version, name="" + (name_prefix or "data") + ".version", definition={'type': 'string', 'description': 'Package version (legacy).'}, rule='type')
+        if "description" in data_keys:
+            data_keys.remove("description")
+            data__description = data["description"]
+            if not isinstance(data__description, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".description must be string", value=data__description, name="" + (name_prefix or "data") + ".description", definition={'type': 'string', 'description': 'Short package description (legacy).', 'pattern': '\\A[^\\n]*\\Z'}, rule='type')
+            if isinstance(data__description, str):
+                if not REGEX_PATTERNS['\\A[^\\n]*\\Z'].search(data__description):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".description must match pattern \\A[^\\n]*\\Z", value=data__description, name="" + (name_prefix or "data") + ".description", definition={'type': 'string', 'description': 'Short package description (legacy).', 'pattern': '\\A[^\\n]*\\Z'}, rule='pattern')
+        if "keywords" in data_keys:
+            data_keys.remove("keywords")
+            data__keywords = data["keywords"]
+            if not isinstance(data__keywords, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".keywords must be array", value=data__keywords, name="" + (name_prefix or "data") + ".keywords", definition={'type': 'array', 'items': {'type': 'string', 'description': 'A tag/keyword that this package relates to (legacy).'}}, rule='type')
+            data__keywords_is_list = isinstance(data__keywords, (list, tuple))
+            if data__keywords_is_list:
+                data__keywords_len = len(data__keywords)
+                for data__keywords_x, data__keywords_item in enumerate(data__keywords):
+                    if not isinstance(data__keywords_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".keywords[{data__keywords_x}]".format(**locals()) + " must be string", value=data__keywords_item, name="" + (name_prefix or "data") + ".keywords[{data__keywords_x}]".format(**locals()) + "", definition={'type': 'string', 'description': 'A tag/keyword that this package relates to (legacy).'}, rule='type')
+        if "homepage" in data_keys:
+            data_keys.remove("homepage")
+            data__homepage = data["homepage"]
+            if not isinstance(data__homepage, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".homepage must be string", value=data__homepage, name="" + (name_prefix or "data") + ".homepage", definition={'type': 'string', 'description': 'Homepage URL for the project (legacy).', 'format': 'uri'}, rule='type')
+            if isinstance(data__homepage, str):
+                if not REGEX_PATTERNS["uri_re_pattern"].match(data__homepage):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".homepage must be uri", value=data__homepage, name="" + (name_prefix or "data") + ".homepage", definition={'type': 'string', 'description': 'Homepage URL for the project (legacy).', 'format': 'uri'}, rule='format')
+        if "repository" in data_keys:
+            data_keys.remove("repository")
+            data__repository = data["repository"]
+            if not isinstance(data__repository, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".repository must be string", value=data__repository, name="" + (name_prefix or "data") + ".repository", definition={'type': 'string', 'description': 'Repository URL for the project (legacy).', 'format': 'uri'}, rule='type')
+            if isinstance(data__repository, str):
+                if not REGEX_PATTERNS["uri_re_pattern"].match(data__repository):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".repository must be uri", value=data__repository, name="" + (name_prefix or "data") + ".repository", definition={'type': 'string', 'description': 'Repository URL for the project (legacy).', 'format': 'uri'}, rule='format')
+        if "documentation" in data_keys:
+            data_keys.remove("documentation")
+            data__documentation = data["documentation"]
+            if not isinstance(data__documentation, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".documentation must be string", value=data__documentation, name="" + (name_prefix or "data") + ".documentation", definition={'type': 'string', 'description': 'Documentation URL for the project (legacy).', 'format': 'uri'}, rule='type')
+            if isinstance(data__documentation, str):
+                if not REGEX_PATTERNS["uri_re_pattern"].match(data__documentation):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".documentation must be uri", value=data__documentation, name="" + (name_prefix or "data") + ".documentation", definition={'type': 'string', 'description': 'Documentation URL for the project (legacy).', 'format': 'uri'}, rule='format')
+        if "license" in data_keys:
+            data_keys.remove("license")
+            data__license = data["license"]
+            if not isinstance(data__license, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".license must be string", value=data__license, name="" + (name_prefix or "data") + ".license", definition={'type': 'string', 'description': 'License name (legacy).'}, rule='type')
+        if "authors" in data_keys:
+            data_keys.remove("authors")
+            data__authors = data["authors"]
+            validate___definitions_authors(data__authors, custom_formats, (name_prefix or "data") + ".authors")
+        if "maintainers" in data_keys:
+            data_keys.remove("maintainers")
+            data__maintainers = data["maintainers"]
+            validate___definitions_maintainers(data__maintainers, custom_formats, (name_prefix or "data") + ".maintainers")
+        if "readme" in data_keys:
+            data_keys.remove("readme")
+            data__readme = data["readme"]
+            data__readme_any_of_count1 = 0
+            if not data__readme_any_of_count1:
+                try:
+                    if not isinstance(data__readme, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".readme must be string", value=data__readme, name="" + (name_prefix or "data") + ".readme", definition={'type': 'string', 'description': 'The path to the README file (legacy).'}, rule='type')
+                    data__readme_any_of_count1 += 1
+                except JsonSchemaValueException: pass
+            if not data__readme_any_of_count1:
+                try:
+                    if not isinstance(data__readme, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".readme must be array", value=data__readme, name="" + (name_prefix or "data") + ".readme", definition={'type': 'array', 'description': 'A list of paths to the readme files.', 'items': {'type': 'string'}}, rule='type')
+                    data__readme_is_list = isinstance(data__readme, (list, tuple))
+                    if data__readme_is_list:
+                        data__readme_len = len(data__readme)
+                        for data__readme_x, data__readme_item in enumerate(data__readme):
+                            if not isinstance(data__readme_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".readme[{data__readme_x}]".format(**locals()) + " must be string", value=data__readme_item, name="" + (name_prefix or "data") + ".readme[{data__readme_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                    data__readme_any_of_count1 += 1
+                except JsonSchemaValueException: pass
+            if not data__readme_any_of_count1:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".readme cannot be validated by any definition", value=data__readme, name="" + (name_prefix or "data") + ".readme", definition={'anyOf': [{'type': 'string', 'description': 'The path to the README file (legacy).'}, {'type': 'array', 'description': 'A list of paths to the readme files.', 'items': {'type': 'string'}}]}, rule='anyOf')
+        if "classifiers" in data_keys:
+            data_keys.remove("classifiers")
+            data__classifiers = data["classifiers"]
+            if not isinstance(data__classifiers, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".classifiers must be array", value=data__classifiers, name="" + (name_prefix or "data") + ".classifiers", definition={'type': 'array', 'description': 'A list of trove classifiers (legacy).'}, rule='type')
+        if "packages" in data_keys:
+            data_keys.remove("packages")
+            data__packages = data["packages"]
+            if not isinstance(data__packages, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".packages must be array", value=data__packages, name="" + (name_prefix or "data") + ".packages", definition={'type': 'array', 'description': 'A list of packages to include in the final distribution.', 'items': {'type': 'object', 'description': 'Information about where the package resides.', 'additionalProperties': False, 'required': ['include'], 'properties': {'include': {'type': 'string', 'description': 'Path to file or directory to include.'}, 'from': {'type': 'string', 'description': 'Where the source directory of the package resides.'}, 'format': {'oneOf': [{'$ref': '#/definitions/package-format'}, {'type': 'array', 'items': {'$ref': '#/definitions/package-format'}}], 'description': 'The format(s) for which the package must be included.'}, 'to': {'type': 'string', 'description': 'Where the package should be installed in the final distribution.'}}}}, rule='type')
+            data__packages_is_list = isinstance(data__packages, (list, tuple))
+            if data__packages_is_list:
+                data__packages_len = len(data__packages)
+                for data__packages_x, data__packages_item in enumerate(data__packages):
+                    if not isinstance(data__packages_item, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".packages[{data__packages_x}]".format(**locals()) + " must be object", value=data__packages_item, name="" + (name_prefix or "data") + ".packages[{data__packages_x}]".format(**locals()) + "", definition={'type': 'object', 'description': 'Information about where the package resides.', 'additionalProperties': False, 'required': ['include'], 'properties': {'include': {'type': 'string', 'description': 'Path to file or directory to include.'}, 'from': {'type': 'string', 'description': 'Where the source directory of the package resides.'}, 'format': {'oneOf': [{'$ref': '#/definitions/package-format'}, {'type': 'array', 'items': {'$ref': '#/definitions/package-format'}}], 'description': 'The format(s) for which the package must be included.'}, 'to': {'type': 'string', 'description': 'Where the package should be installed in the final distribution.'}}}, rule='type')
+                    data__packages_item_is_dict = isinstance(data__packages_item, dict)
+                    if data__packages_item_is_dict:
+                        data__packages_item__missing_keys = set(['include']) - data__packages_item.keys()
+                        if data__packages_item__missing_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".packages[{data__packages_x}]".format(**locals()) + " must contain " + (str(sorted(data__packages_item__missing_keys)) + " properties"), value=data__packages_item, name="" + (name_prefix or "data") + ".packages[{data__packages_x}]".format(**locals()) + "", definition={'type': 'object', 'description': 'Information about where the package resides.', 'additionalProperties': False, 'required': ['include'], 'properties': {'include': {'type': 'string', 'description': 'Path to file or directory to include.'}, 'from': {'type': 'string', 'description': 'Where the source directory of the package resides.'}, 'format': {'oneOf': [{'$ref': '#/definitions/package-format'}, {'type': 'array', 'items': {'$ref': '#/definitions/package-format'}}], 'description': 'The format(s) for which the package must be included.'}, 'to': {'type': 'string', 'description': 'Where the package should be installed in the final distribution.'}}}, rule='required')
+                        data__packages_item_keys = set(data__packages_item.keys())
+                        if "include" in data__packages_item_keys:
+                            data__packages_item_keys.remove("include")
+                            data__packages_item__include = data__packages_item["include"]
+                            validate___definitions_include_path(data__packages_item__include, custom_formats, (name_prefix or "data") + ".packages[{data__packages_x}].include".format(**locals()))
+                        if "from" in data__packages_item_keys:
+                            data__packages_item_keys.remove("from")
+                            data__packages_item__from = data__packages_item["from"]
+                            if not isinstance(data__packages_item__from, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".packages[{data__packages_x}].from".format(**locals()) + " must be string", value=data__packages_item__from, name="" + (name_prefix or "data") + ".packages[{data__packages_x}].from".format(**locals()) + "", definition={'type': 'string', 'description': 'Where the source directory of the package resides.'}, rule='type')
+                        if "format" in data__packages_item_keys:
+                            data__packages_item_keys.remove("format")
+                            data__packages_item__format = data__packages_item["format"]
+                            validate___definitions_package_formats(data__packages_item__format, custom_formats, (name_prefix or "data") + ".packages[{data__packages_x}].format".format(**locals()))
+                        if "to" in data__packages_item_keys:
+                            data__packages_item_keys.remove("to")
+                            data__packages_item__to = data__packages_item["to"]
+                            if not isinstance(data__packages_item__to, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".packages[{data__packages_x}].to".format(**locals()) + " must be string", value=data__packages_item__to, name="" + (name_prefix or "data") + ".packages[{data__packages_x}].to".format(**locals()) + "", definition={'type': 'string', 'description': 'Where the package should be installed in the final distribution.'}, rule='type')
+                        if data__packages_item_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".packages[{data__packages_x}]".format(**locals()) + " must not contain "+str(data__packages_item_keys)+" properties", value=data__packages_item, name="" + (name_prefix or "data") + ".packages[{data__packages_x}]".format(**locals()) + "", definition={'type': 'object', 'description': 'Information about where the package resides.', 'additionalProperties': False, 'required': ['include'], 'properties': {'include': {'type': 'string', 'description': 'Path to file or directory to include.'}, 'from': {'type': 'string', 'description': 'Where the source directory of the package resides.'}, 'format': {'oneOf': [{'$ref': '#/definitions/package-format'}, {'type': 'array', 'items': {'$ref': '#/definitions/package-format'}}], 'description': 'The format(s) for which the package must be included.'}, 'to': {'type': 'string', 'description': 'Where the package should be installed in the final distribution.'}}}, rule='additionalProperties')
+        if "include" in data_keys:
+            data_keys.remove("include")
+            data__include = data["include"]
+            if not isinstance(data__include, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".include must be array", value=data__include, name="" + (name_prefix or "data") + ".include", definition={'type': 'array', 'description': 'A list of files and folders to include.', 'items': {'anyOf': [{'type': 'string', 'description': 'Path to file or directory to include.'}, {'type': 'object', 'additionalProperties': False, 'required': ['path'], 'properties': {'path': {'type': 'string', 'description': 'Path to file or directory to include.'}, 'format': {'oneOf': [{'$ref': '#/definitions/package-format'}, {'type': 'array', 'items': {'$ref': '#/definitions/package-format'}}], 'description': 'The format(s) for which the package must be included.'}}}]}}, rule='type')
+            data__include_is_list = isinstance(data__include, (list, tuple))
+            if data__include_is_list:
+                data__include_len = len(data__include)
+                for data__include_x, data__include_item in enumerate(data__include):
+                    data__include_item_any_of_count2 = 0
+                    if not data__include_item_any_of_count2:
+                        try:
+                            validate___definitions_include_path(data__include_item, custom_formats, (name_prefix or "data") + ".include[{data__include_x}]".format(**locals()))
+                            data__include_item_any_of_count2 += 1
+                        except JsonSchemaValueException: pass
+                    if not data__include_item_any_of_count2:
+                        try:
+                            if not isinstance(data__include_item, (dict)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".include[{data__include_x}]".format(**locals()) + " must be object", value=data__include_item, name="" + (name_prefix or "data") + ".include[{data__include_x}]".format(**locals()) + "", definition={'type': 'object', 'additionalProperties': False, 'required': ['path'], 'properties': {'path': {'type': 'string', 'description': 'Path to file or directory to include.'}, 'format': {'oneOf': [{'$ref': '#/definitions/package-format'}, {'type': 'array', 'items': {'$ref': '#/definitions/package-format'}}], 'description': 'The format(s) for which the package must be included.'}}}, rule='type')
+                            data__include_item_is_dict = isinstance(data__include_item, dict)
+                            if data__include_item_is_dict:
+                                data__include_item__missing_keys = set(['path']) - data__include_item.keys()
+                                if data__include_item__missing_keys:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".include[{data__include_x}]".format(**locals()) + " must contain " + (str(sorted(data__include_item__missing_keys)) + " properties"), value=data__include_item, name="" + (name_prefix or "data") + ".include[{data__include_x}]".format(**locals()) + "", definition={'type': 'object', 'additionalProperties': False, 'required': ['path'], 'properties': {'path': {'type': 'string', 'description': 'Path to file or directory to include.'}, 'format': {'oneOf': [{'$ref': '#/definitions/package-format'}, {'type': 'array', 'items': {'$ref': '#/definitions/package-format'}}], 'description': 'The format(s) for which the package must be included.'}}}, rule='required')
+                                data__include_item_keys = set(data__include_item.keys())
+                                if "path" in data__include_item_keys:
+                                    data__include_item_keys.remove("path")
+                                    data__include_item__path = data__include_item["path"]
+                                    validate___definitions_include_path(data__include_item__path, custom_formats, (name_prefix or "data") + ".include[{data__include_x}].path".format(**locals()))
+                                if "format" in data__include_item_keys:
+                                    data__include_item_keys.remove("format")
+                                    data__include_item__format = data__include_item["format"]
+                                    validate___definitions_package_formats(data__include_item__format, custom_formats, (name_prefix or "data") + ".include[{data__include_x}].format".format(**locals()))
+                                if data__include_item_keys:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".include[{data__include_x}]".format(**locals()) + " must not contain "+str(data__include_item_keys)+" properties", value=data__include_item, name="" + (name_prefix or "data") + ".include[{data__include_x}]".format(**locals()) + "", definition={'type': 'object', 'additionalProperties': False, 'required': ['path'], 'properties': {'path': {'type': 'string', 'description': 'Path to file or directory to include.'}, 'format': {'oneOf': [{'$ref': '#/definitions/package-format'}, {'type': 'array', 'items': {'$ref': '#/definitions/package-format'}}], 'description': 'The format(s) for which the package must be included.'}}}, rule='additionalProperties')
+                            data__include_item_any_of_count2 += 1
+                        except JsonSchemaValueException: pass
+                    if not data__include_item_any_of_count2:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".include[{data__include_x}]".format(**locals()) + " cannot be validated by any definition", value=data__include_item, name="" + (name_prefix or "data") + ".include[{data__include_x}]".format(**locals()) + "", definition={'anyOf': [{'type': 'string', 'description': 'Path to file or directory to include.'}, {'type': 'object', 'additionalProperties': False, 'required': ['path'], 'properties': {'path': {'type': 'string', 'description': 'Path to file or directory to include.'}, 'format': {'oneOf': [{'$ref': '#/definitions/package-format'}, {'type': 'array', 'items': {'$ref': '#/definitions/package-format'}}], 'description': 'The format(s) for which the package must be included.'}}}]}, rule='anyOf')
+        if "exclude" in data_keys:
+            data_keys.remove("exclude")
+            data__exclude = data["exclude"]
+            if not isinstance(data__exclude, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".exclude must be array", value=data__exclude, name="" + (name_prefix or "data") + ".exclude", definition={'type': 'array', 'description': 'A list of files and folders to exclude.'}, rule='type')
+        if "dependencies" in data_keys:
+            data_keys.remove("dependencies")
+            data__dependencies = data["dependencies"]
+            validate___definitions_dependencies(data__dependencies, custom_formats, (name_prefix or "data") + ".dependencies")
+        if "dev-dependencies" in data_keys:
+            data_keys.remove("dev-dependencies")
+            data__devdependencies = data["dev-dependencies"]
+            validate___definitions_dependencies(data__devdependencies, custom_formats, (name_prefix or "data") + ".dev-dependencies")
+        if "extras" in data_keys:
+            data_keys.remove("extras")
+            data__extras = data["extras"]
+            if not isinstance(data__extras, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".extras must be object", value=data__extras, name="" + (name_prefix or "data") + ".extras", definition={'type': 'object', 'description': 'Extras (legacy).', 'patternProperties': {'^[a-zA-Z-_.0-9]+$': {'type': 'array', 'items': {'type': 'string', 'pattern': '^[a-zA-Z-_.0-9]+$'}}}}, rule='type')
+            data__extras_is_dict = isinstance(data__extras, dict)
+            if data__extras_is_dict:
+                data__extras_keys = set(data__extras.keys())
+                for data__extras_key, data__extras_val in data__extras.items():
+                    if REGEX_PATTERNS['^[a-zA-Z-_.0-9]+$'].search(data__extras_key):
+                        if data__extras_key in data__extras_keys:
+                            data__extras_keys.remove(data__extras_key)
+                        if not isinstance(data__extras_val, (list, tuple)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".extras.{data__extras_key}".format(**locals()) + " must be array", value=data__extras_val, name="" + (name_prefix or "data") + ".extras.{data__extras_key}".format(**locals()) + "", definition={'type': 'array', 'items': {'type': 'string', 'pattern': '^[a-zA-Z-_.0-9]+$'}}, rule='type')
+                        data__extras_val_is_list = isinstance(data__extras_val, (list, tuple))
+                        if data__extras_val_is_list:
+                            data__extras_val_len = len(data__extras_val)
+                            for data__extras_val_x, data__extras_val_item in enumerate(data__extras_val):
+                                if not isinstance(data__extras_val_item, (str)):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".extras.{data__extras_key}[{data__extras_val_x}]".format(**locals()) + " must be string", value=data__extras_val_item, name="" + (name_prefix or "data") + ".extras.{data__extras_key}[{data__extras_val_x}]".format(**locals()) + "", definition={'type': 'string', 'pattern': '^[a-zA-Z-_.0-9]+$'}, rule='type')
+                                if isinstance(data__extras_val_item, str):
+                                    if not REGEX_PATTERNS['^[a-zA-Z-_.0-9]+$'].search(data__extras_val_item):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".extras.{data__extras_key}[{data__extras_val_x}]".format(**locals()) + " must match pattern ^[a-zA-Z-_.0-9]+$", value=data__extras_val_item, name="" + (name_prefix or "data") + ".extras.{data__extras_key}[{data__extras_val_x}]".format(**locals()) + "", definition={'type': 'string', 'pattern': '^[a-zA-Z-_.0-9]+$'}, rule='pattern')
+        if "group" in data_keys:
+            data_keys.remove("group")
+            data__group = data["group"]
+            if not isinstance(data__group, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".group must be object", value=data__group, name="" + (name_prefix or "data") + ".group", definition={'type': 'object', 'description': 'This represents groups of dependencies', 'patternProperties': {'^[a-zA-Z-_.0-9]+$': {'type': 'object', 'description': 'This represents a single dependency group', 'anyOf': [{'required': ['dependencies']}, {'required': ['include-groups']}, {'required': ['optional']}], 'properties': {'optional': {'type': 'boolean', 'description': 'Whether the dependency group is optional or not'}, 'include-groups': {'type': 'array', 'description': 'List of dependency group names included in this group.', 'items': {'type': 'string'}}, 'dependencies': {'type': 'object', 'patternProperties': {'^[a-zA-Z-_.0-9]+$': {'oneOf': [{'$ref': '#/definitions/dependency'}, {'$ref': '#/definitions/long-dependency'}, {'$ref': '#/definitions/git-dependency'}, {'$ref': '#/definitions/file-dependency'}, {'$ref': '#/definitions/path-dependency'}, {'$ref': '#/definitions/url-dependency'}, {'$ref': '#/definitions/multiple-constraints-dependency'}, {'$ref': '#/definitions/dependency-options'}]}}}}, 'additionalProperties': False}}}, rule='type')
+            data__group_is_dict = isinstance(data__group, dict)
+            if data__group_is_dict:
+                data__group_keys = set(data__group.keys())
+                for data__group_key, data__group_val in data__group.items():
+                    if REGEX_PATTERNS['^[a-zA-Z-_.0-9]+$'].search(data__group_key):
+                        if data__group_key in data__group_keys:
+                            data__group_keys.remove(data__group_key)
+                        if not isinstance(data__group_val, (dict)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".group.{data__group_key}".format(**locals()) + " must be object", value=data__group_val, name="" + (name_prefix or "data") + ".group.{data__group_key}".format(**locals()) + "", definition={'type': 'object', 'description': 'This represents a single dependency group', 'anyOf': [{'required': ['dependencies']}, {'required': ['include-groups']}, {'required': ['optional']}], 'properties': {'optional': {'type': 'boolean', 'description': 'Whether the dependency group is optional or not'}, 'include-groups': {'type': 'array', 'description': 'List of dependency group names included in this group.', 'items': {'type': 'string'}}, 'dependencies': {'type': 'object', 'patternProperties': {'^[a-zA-Z-_.0-9]+$': {'oneOf': [{'$ref': '#/definitions/dependency'}, {'$ref': '#/definitions/long-dependency'}, {'$ref': '#/definitions/git-dependency'}, {'$ref': '#/definitions/file-dependency'}, {'$ref': '#/definitions/path-dependency'}, {'$ref': '#/definitions/url-dependency'}, {'$ref': '#/definitions/multiple-constraints-dependency'}, {'$ref': '#/definitions/dependency-options'}]}}}}, 'additionalProperties': False}, rule='type')
+                        data__group_val_any_of_count3 = 0
+                        if not data__group_val_any_of_count3:
+                            try:
+                                data__group_val_is_dict = isinstance(data__group_val, dict)
+                                if data__group_val_is_dict:
+                                    data__group_val__missing_keys = set(['dependencies']) - data__group_val.keys()
+                                    if data__group_val__missing_keys:
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".group.{data__group_key}".format(**locals()) + " must contain " + (str(sorted(data__group_val__missing_keys)) + " properties"), value=data__group_val, name="" + (name_prefix or "data") + ".group.{data__group_key}".format(**locals()) + "", definition={'required': ['dependencies']}, rule='required')
+                                data__group_val_any_of_count3 += 1
+                            except JsonSchemaValueException: pass
+                        if not data__group_val_any_of_count3:
+                            try:
+                                data__group_val_is_dict = isinstance(data__group_val, dict)
+                                if data__group_val_is_dict:
+                                    data__group_val__missing_keys = set(['include-groups']) - data__group_val.keys()
+                                    if data__group_val__missing_keys:
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".group.{data__group_key}".format(**locals()) + " must contain " + (str(sorted(data__group_val__missing_keys)) + " properties"), value=data__group_val, name="" + (name_prefix or "data") + ".group.{data__group_key}".format(**locals()) + "", definition={'required': ['include-groups']}, rule='required')
+                                data__group_val_any_of_count3 += 1
+                            except JsonSchemaValueException: pass
+                        if not data__group_val_any_of_count3:
+                            try:
+                                data__group_val_is_dict = isinstance(data__group_val, dict)
+                                if data__group_val_is_dict:
+                                    data__group_val__missing_keys = set(['optional']) - data__group_val.keys()
+                                    if data__group_val__missing_keys:
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".group.{data__group_key}".format(**locals()) + " must contain " + (str(sorted(data__group_val__missing_keys)) + " properties"), value=data__group_val, name="" + (name_prefix or "data") + ".group.{data__group_key}".format(**locals()) + "", definition={'required': ['optional']}, rule='required')
+                                data__group_val_any_of_count3 += 1
+                            except JsonSchemaValueException: pass
+                        if not data__group_val_any_of_count3:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".group.{data__group_key}".format(**locals()) + " cannot be validated by any definition", value=data__group_val, name="" + (name_prefix or "data") + ".group.{data__group_key}".format(**locals()) + "", definition={'type': 'object', 'description': 'This represents a single dependency group', 'anyOf': [{'required': ['dependencies']}, {'required': ['include-groups']}, {'required': ['optional']}], 'properties': {'optional': {'type': 'boolean', 'description': 'Whether the dependency group is optional or not'}, 'include-groups': {'type': 'array', 'description': 'List of dependency group names included in this group.', 'items': {'type': 'string'}}, 'dependencies': {'type': 'object', 'patternProperties': {'^[a-zA-Z-_.0-9]+$': {'oneOf': [{'$ref': '#/definitions/dependency'}, {'$ref': '#/definitions/long-dependency'}, {'$ref': '#/definitions/git-dependency'}, {'$ref': '#/definitions/file-dependency'}, {'$ref': '#/definitions/path-dependency'}, {'$ref': '#/definitions/url-dependency'}, {'$ref': '#/definitions/multiple-constraints-dependency'}, {'$ref': '#/definitions/dependency-options'}]}}}}, 'additionalProperties': False}, rule='anyOf')
+                        data__group_val_is_dict = isinstance(data__group_val, dict)
+                        if data__group_val_is_dict:
+                            data__group_val_keys = set(data__group_val.keys())
+                            if "optional" in data__group_val_keys:
+                                data__group_val_keys.remove("optional")
+                                data__group_val__optional = data__group_val["optional"]
+                                if not isinstance(data__group_val__optional, (bool)):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".group.{data__group_key}.optional".format(**locals()) + " must be boolean", value=data__group_val__optional, name="" + (name_prefix or "data") + ".group.{data__group_key}.optional".format(**locals()) + "", definition={'type': 'boolean', 'description': 'Whether the dependency group is optional or not'}, rule='type')
+                            if "include-groups" in data__group_val_keys:
+                                data__group_val_keys.remove("include-groups")
+                                data__group_val__includegroups = data__group_val["include-groups"]
+                                if not isinstance(data__group_val__includegroups, (list, tuple)):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".group.{data__group_key}.include-groups".format(**locals()) + " must be array", value=data__group_val__includegroups, name="" + (name_prefix or "data") + ".group.{data__group_key}.include-groups".format(**locals()) + "", definition={'type': 'array', 'description': 'List of dependency group names included in this group.', 'items': {'type': 'string'}}, rule='type')
+                                data__group_val__includegroups_is_list = isinstance(data__group_val__includegroups, (list, tuple))
+                                if data__group_val__includegroups_is_list:
+                                    data__group_val__includegroups_len = len(data__group_val__includegroups)
+                                    for data__group_val__includegroups_x, data__group_val__includegroups_item in enumerate(data__group_val__includegroups):
+                                        if not isinstance(data__group_val__includegroups_item, (str)):
+                                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".group.{data__group_key}.include-groups[{data__group_val__includegroups_x}]".format(**locals()) + " must be string", value=data__group_val__includegroups_item, name="" + (name_prefix or "data") + ".group.{data__group_key}.include-groups[{data__group_val__includegroups_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                            if "dependencies" in data__group_val_keys:
+                                data__group_val_keys.remove("dependencies")
+                                data__group_val__dependencies = data__group_val["dependencies"]
+                                validate___definitions_dependencies(data__group_val__dependencies, custom_formats, (name_prefix or "data") + ".group.{data__group_key}.dependencies".format(**locals()))
+                            if data__group_val_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".group.{data__group_key}".format(**locals()) + " must not contain "+str(data__group_val_keys)+" properties", value=data__group_val, name="" + (name_prefix or "data") + ".group.{data__group_key}".format(**locals()) + "", definition={'type': 'object', 'description': 'This represents a single dependency group', 'anyOf': [{'required': ['dependencies']}, {'required': ['include-groups']}, {'required': ['optional']}], 'properties': {'optional': {'type': 'boolean', 'description': 'Whether the dependency group is optional or not'}, 'include-groups': {'type': 'array', 'description': 'List of dependency group names included in this group.', 'items': {'type': 'string'}}, 'dependencies': {'type': 'object', 'patternProperties': {'^[a-zA-Z-_.0-9]+$': {'oneOf': [{'$ref': '#/definitions/dependency'}, {'$ref': '#/definitions/long-dependency'}, {'$ref': '#/definitions/git-dependency'}, {'$ref': '#/definitions/file-dependency'}, {'$ref': '#/definitions/path-dependency'}, {'$ref': '#/definitions/url-dependency'}, {'$ref': '#/definitions/multiple-constraints-dependency'}, {'$ref': '#/definitions/dependency-options'}]}}}}, 'additionalProperties': False}, rule='additionalProperties')
+        if "build" in data_keys:
+            data_keys.remove("build")
+            data__build = data["build"]
+            validate___definitions_build_section(data__build, custom_formats, (name_prefix or "data") + ".build")
+        if "scripts" in data_keys:
+            data_keys.remove("scripts")
+            data__scripts = data["scripts"]
+            if not isinstance(data__scripts, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".scripts must be object", value=data__scripts, name="" + (name_prefix or "data") + ".scripts", definition={'type': 'object', 'description': 'A hash of scripts to be installed.', 'patternProperties': {'^[a-zA-Z-_.0-9]+$': {'oneOf': [{'type': 'string', 'description': 'A simple script pointing to a callable object.'}, {'type': 'object', 'oneOf': [{'$ref': '#/definitions/extra-script-legacy'}, {'$ref': '#/definitions/extra-scripts'}]}]}}}, rule='type')
+            data__scripts_is_dict = isinstance(data__scripts, dict)
+            if data__scripts_is_dict:
+                data__scripts_keys = set(data__scripts.keys())
+                for data__scripts_key, data__scripts_val in data__scripts.items():
+                    if REGEX_PATTERNS['^[a-zA-Z-_.0-9]+$'].search(data__scripts_key):
+                        if data__scripts_key in data__scripts_keys:
+                            data__scripts_keys.remove(data__scripts_key)
+                        data__scripts_val_one_of_count4 = 0
+                        if data__scripts_val_one_of_count4 < 2:
+                            try:
+                                validate___definitions_script_legacy(data__scripts_val, custom_formats, (name_prefix or "data") + ".scripts.{data__scripts_key}".format(**locals()))
+                                data__scripts_val_one_of_count4 += 1
+                            except JsonSchemaValueException: pass
+                        if data__scripts_val_one_of_count4 < 2:
+                            try:
+                                validate___definitions_script_table(data__scripts_val, custom_formats, (name_prefix or "data") + ".scripts.{data__scripts_key}".format(**locals()))
+                                data__scripts_val_one_of_count4 += 1
+                            except JsonSchemaValueException: pass
+                        if data__scripts_val_one_of_count4 != 1:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".scripts.{data__scripts_key}".format(**locals()) + " must be valid exactly by one definition" + (" (" + str(data__scripts_val_one_of_count4) + " matches found)"), value=data__scripts_val, name="" + (name_prefix or "data") + ".scripts.{data__scripts_key}".format(**locals()) + "", definition={'oneOf': [{'type': 'string', 'description': 'A simple script pointing to a callable object.'}, {'type': 'object', 'oneOf': [{'$ref': '#/definitions/extra-script-legacy'}, {'$ref': '#/definitions/extra-scripts'}]}]}, rule='oneOf')
+        if "plugins" in data_keys:
+            data_keys.remove("plugins")
+            data__plugins = data["plugins"]
+            if not isinstance(data__plugins, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".plugins must be object", value=data__plugins, name="" + (name_prefix or "data") + ".plugins", definition={'type': 'object', 'description': 'A hash of hashes representing plugins', 'patternProperties': {'^[a-zA-Z-_.0-9]+$': {'type': 'object', 'patternProperties': {'^[a-zA-Z-_.0-9]+$': {'type': 'string'}}}}}, rule='type')
+            data__plugins_is_dict = isinstance(data__plugins, dict)
+            if data__plugins_is_dict:
+                data__plugins_keys = set(data__plugins.keys())
+                for data__plugins_key, data__plugins_val in data__plugins.items():
+                    if REGEX_PATTERNS['^[a-zA-Z-_.0-9]+$'].search(data__plugins_key):
+                        if data__plugins_key in data__plugins_keys:
+                            data__plugins_keys.remove(data__plugins_key)
+                        if not isinstance(data__plugins_val, (dict)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".plugins.{data__plugins_key}".format(**locals()) + " must be object", value=data__plugins_val, name="" + (name_prefix or "data") + ".plugins.{data__plugins_key}".format(**locals()) + "", definition={'type': 'object', 'patternProperties': {'^[a-zA-Z-_.0-9]+$': {'type': 'string'}}}, rule='type')
+                        data__plugins_val_is_dict = isinstance(data__plugins_val, dict)
+                        if data__plugins_val_is_dict:
+                            data__plugins_val_keys = set(data__plugins_val.keys())
+                            for data__plugins_val_key, data__plugins_val_val in data__plugins_val.items():
+                                if REGEX_PATTERNS['^[a-zA-Z-_.0-9]+$'].search(data__plugins_val_key):
+                                    if data__plugins_val_key in data__plugins_val_keys:
+                                        data__plugins_val_keys.remove(data__plugins_val_key)
+                                    if not isinstance(data__plugins_val_val, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".plugins.{data__plugins_key}.{data__plugins_val_key}".format(**locals()) + " must be string", value=data__plugins_val_val, name="" + (name_prefix or "data") + ".plugins.{data__plugins_key}.{data__plugins_val_key}".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "urls" in data_keys:
+            data_keys.remove("urls")
+            data__urls = data["urls"]
+            if not isinstance(data__urls, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".urls must be object", value=data__urls, name="" + (name_prefix or "data") + ".urls", definition={'type': 'object', 'patternProperties': {'^.+$': {'type': 'string', 'description': 'The full url of the custom url (Legacy).'}}}, rule='type')
+            data__urls_is_dict = isinstance(data__urls, dict)
+            if data__urls_is_dict:
+                data__urls_keys = set(data__urls.keys())
+                for data__urls_key, data__urls_val in data__urls.items():
+                    if REGEX_PATTERNS['^.+$'].search(data__urls_key):
+                        if data__urls_key in data__urls_keys:
+                            data__urls_keys.remove(data__urls_key)
+                        if not isinstance(data__urls_val, (str)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".urls.{data__urls_key}".format(**locals()) + " must be string", value=data__urls_val, name="" + (name_prefix or "data") + ".urls.{data__urls_key}".format(**locals()) + "", definition={'type': 'string', 'description': 'The full url of the custom url (Legacy).'}, rule='type')
+    return data
+
+def validate___definitions_script_table(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'oneOf': [{'type': 'object', 'description': 'A script that should be installed only if extras are activated.', 'additionalProperties': False, 'properties': {'callable': {'$ref': '#/definitions/script-legacy', 'description': 'The entry point of the script. Deprecated in favour of reference.'}, 'extras': {'type': 'array', 'description': 'The required extras for this script.', 'items': {'type': 'string'}}}}, {'type': 'object', 'description': "Either a console entry point or a script file that'll be included in the distribution package.", 'additionalProperties': False, 'properties': {'reference': {'type': 'string', 'description': 'If type is file this is the relative path of the script file, if console it is the module name.'}, 'type': {'description': 'Value can be either file or console.', 'type': 'string', 'enum': ['file', 'console']}, 'extras': {'type': 'array', 'description': 'The required extras for this script. Only applicable if type is console.', 'items': {'type': 'string'}}}, 'required': ['reference', 'type']}]}, rule='type')
+    data_one_of_count5 = 0
+    if data_one_of_count5 < 2:
+        try:
+            validate___definitions_extra_script_legacy(data, custom_formats, (name_prefix or "data") + "")
+            data_one_of_count5 += 1
+        except JsonSchemaValueException: pass
+    if data_one_of_count5 < 2:
+        try:
+            validate___definitions_extra_scripts(data, custom_formats, (name_prefix or "data") + "")
+            data_one_of_count5 += 1
+        except JsonSchemaValueException: pass
+    if data_one_of_count5 != 1:
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be valid exactly by one definition" + (" (" + str(data_one_of_count5) + " matches found)"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'oneOf': [{'type': 'object', 'description': 'A script that should be installed only if extras are activated.', 'additionalProperties': False, 'properties': {'callable': {'$ref': '#/definitions/script-legacy', 'description': 'The entry point of the script. Deprecated in favour of reference.'}, 'extras': {'type': 'array', 'description': 'The required extras for this script.', 'items': {'type': 'string'}}}}, {'type': 'object', 'description': "Either a console entry point or a script file that'll be included in the distribution package.", 'additionalProperties': False, 'properties': {'reference': {'type': 'string', 'description': 'If type is file this is the relative path of the script file, if console it is the module name.'}, 'type': {'description': 'Value can be either file or console.', 'type': 'string', 'enum': ['file', 'console']}, 'extras': {'type': 'array', 'description': 'The required extras for this script. Only applicable if type is console.', 'items': {'type': 'string'}}}, 'required': ['reference', 'type']}]}, rule='oneOf')
+    return data
+
+def validate___definitions_extra_scripts(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'description': "Either a console entry point or a script file that'll be included in the distribution package.", 'additionalProperties': False, 'properties': {'reference': {'type': 'string', 'description': 'If type is file this is the relative path of the script file, if console it is the module name.'}, 'type': {'description': 'Value can be either file or console.', 'type': 'string', 'enum': ['file', 'console']}, 'extras': {'type': 'array', 'description': 'The required extras for this script. Only applicable if type is console.', 'items': {'type': 'string'}}}, 'required': ['reference', 'type']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['reference', 'type']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'description': "Either a console entry point or a script file that'll be included in the distribution package.", 'additionalProperties': False, 'properties': {'reference': {'type': 'string', 'description': 'If type is file this is the relative path of the script file, if console it is the module name.'}, 'type': {'description': 'Value can be either file or console.', 'type': 'string', 'enum': ['file', 'console']}, 'extras': {'type': 'array', 'description': 'The required extras for this script. Only applicable if type is console.', 'items': {'type': 'string'}}}, 'required': ['reference', 'type']}, rule='required')
+        data_keys = set(data.keys())
+        if "reference" in data_keys:
+            data_keys.remove("reference")
+            data__reference = data["reference"]
+            if not isinstance(data__reference, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".reference must be string", value=data__reference, name="" + (name_prefix or "data") + ".reference", definition={'type': 'string', 'description': 'If type is file this is the relative path of the script file, if console it is the module name.'}, rule='type')
+        if "type" in data_keys:
+            data_keys.remove("type")
+            data__type = data["type"]
+            if not isinstance(data__type, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be string", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'description': 'Value can be either file or console.', 'type': 'string', 'enum': ['file', 'console']}, rule='type')
+            if data__type not in ['file', 'console']:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be one of ['file', 'console']", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'description': 'Value can be either file or console.', 'type': 'string', 'enum': ['file', 'console']}, rule='enum')
+        if "extras" in data_keys:
+            data_keys.remove("extras")
+            data__extras = data["extras"]
+            if not isinstance(data__extras, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".extras must be array", value=data__extras, name="" + (name_prefix or "data") + ".extras", definition={'type': 'array', 'description': 'The required extras for this script. Only applicable if type is console.', 'items': {'type': 'string'}}, rule='type')
+            data__extras_is_list = isinstance(data__extras, (list, tuple))
+            if data__extras_is_list:
+                data__extras_len = len(data__extras)
+                for data__extras_x, data__extras_item in enumerate(data__extras):
+                    if not isinstance(data__extras_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".extras[{data__extras_x}]".format(**locals()) + " must be string", value=data__extras_item, name="" + (name_prefix or "data") + ".extras[{data__extras_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'description': "Either a console entry point or a script file that'll be included in the distribution package.", 'additionalProperties': False, 'properties': {'reference': {'type': 'string', 'description': 'If type is file this is the relative path of the script file, if console it is the module name.'}, 'type': {'description': 'Value can be either file or console.', 'type': 'string', 'enum': ['file', 'console']}, 'extras': {'type': 'array', 'description': 'The required extras for this script. Only applicable if type is console.', 'items': {'type': 'string'}}}, 'required': ['reference', 'type']}, rule='additionalProperties')
+    return data
+
+def validate___definitions_extra_script_legacy(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'description': 'A script that should be installed only if extras are activated.', 'additionalProperties': False, 'properties': {'callable': {'type': 'string', 'description': 'A simple script pointing to a callable object.'}, 'extras': {'type': 'array', 'description': 'The required extras for this script.', 'items': {'type': 'string'}}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        if "callable" in data_keys:
+            data_keys.remove("callable")
+            data__callable = data["callable"]
+            validate___definitions_script_legacy(data__callable, custom_formats, (name_prefix or "data") + ".callable")
+        if "extras" in data_keys:
+            data_keys.remove("extras")
+            data__extras = data["extras"]
+            if not isinstance(data__extras, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".extras must be array", value=data__extras, name="" + (name_prefix or "data") + ".extras", definition={'type': 'array', 'description': 'The required extras for this script.', 'items': {'type': 'string'}}, rule='type')
+            data__extras_is_list = isinstance(data__extras, (list, tuple))
+            if data__extras_is_list:
+                data__extras_len = len(data__extras)
+                for data__extras_x, data__extras_item in enumerate(data__extras):
+                    if not isinstance(data__extras_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".extras[{data__extras_x}]".format(**locals()) + " must be string", value=data__extras_item, name="" + (name_prefix or "data") + ".extras[{data__extras_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'description': 'A script that should be installed only if extras are activated.', 'additionalProperties': False, 'properties': {'callable': {'type': 'string', 'description': 'A simple script pointing to a callable object.'}, 'extras': {'type': 'array', 'description': 'The required extras for this script.', 'items': {'type': 'string'}}}}, rule='additionalProperties')
+    return data
+
+def validate___definitions_script_legacy(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (str)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be string", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'string', 'description': 'A simple script pointing to a callable object.'}, rule='type')
+    return data
+
+def validate___definitions_build_section(data, custom_formats={}, name_prefix=None):
+    data_one_of_count6 = 0
+    if data_one_of_count6 < 2:
+        try:
+            validate___definitions_build_script(data, custom_formats, (name_prefix or "data") + "")
+            data_one_of_count6 += 1
+        except JsonSchemaValueException: pass
+    if data_one_of_count6 < 2:
+        try:
+            validate___definitions_build_config(data, custom_formats, (name_prefix or "data") + "")
+            data_one_of_count6 += 1
+        except JsonSchemaValueException: pass
+    if data_one_of_count6 != 1:
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be valid exactly by one definition" + (" (" + str(data_one_of_count6) + " matches found)"), value=data, name="" + (name_prefix or "data") + "", definition={'oneOf': [{'type': 'string', 'description': 'The python script file used to build extensions.'}, {'type': 'object', 'description': 'Build specific configurations.', 'additionalProperties': False, 'properties': {'generate-setup-file': {'type': 'boolean', 'description': 'Generate and include a setup.py file in sdist.', 'default': False}, 'script': {'$ref': '#/definitions/build-script'}}}]}, rule='oneOf')
+    return data
+
+def validate___definitions_build_config(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'description': 'Build specific configurations.', 'additionalProperties': False, 'properties': {'generate-setup-file': {'type': 'boolean', 'description': 'Generate and include a setup.py file in sdist.', 'default': False}, 'script': {'type': 'string', 'description': 'The python script file used to build extensions.'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        if "generate-setup-file" in data_keys:
+            data_keys.remove("generate-setup-file")
+            data__generatesetupfile = data["generate-setup-file"]
+            if not isinstance(data__generatesetupfile, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".generate-setup-file must be boolean", value=data__generatesetupfile, name="" + (name_prefix or "data") + ".generate-setup-file", definition={'type': 'boolean', 'description': 'Generate and include a setup.py file in sdist.', 'default': False}, rule='type')
+        else: data["generate-setup-file"] = False
+        if "script" in data_keys:
+            data_keys.remove("script")
+            data__script = data["script"]
+            validate___definitions_build_script(data__script, custom_formats, (name_prefix or "data") + ".script")
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'description': 'Build specific configurations.', 'additionalProperties': False, 'properties': {'generate-setup-file': {'type': 'boolean', 'description': 'Generate and include a setup.py file in sdist.', 'default': False}, 'script': {'type': 'string', 'description': 'The python script file used to build extensions.'}}}, rule='additionalProperties')
+    return data
+
+def validate___definitions_build_script(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (str)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be string", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'string', 'description': 'The python script file used to build extensions.'}, rule='type')
+    return data
+
+def validate___definitions_dependencies(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'patternProperties': {'^[a-zA-Z-_.0-9]+$': {'oneOf': [{'type': 'string', 'description': 'The constraint of the dependency.'}, {'type': 'object', 'required': ['version'], 'additionalProperties': False, 'properties': {'version': {'type': 'string', 'description': 'The constraint of the dependency.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'source': {'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}}}, {'type': 'object', 'required': ['git'], 'additionalProperties': False, 'properties': {'git': {'type': 'string', 'description': 'The url of the git repository.'}, 'branch': {'type': 'string', 'description': 'The branch to checkout.'}, 'tag': {'type': 'string', 'description': 'The tag to checkout.'}, 'rev': {'type': 'string', 'description': 'The revision to checkout.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, {'type': 'object', 'required': ['file'], 'additionalProperties': False, 'properties': {'file': {'type': 'string', 'description': 'The path to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, {'type': 'object', 'required': ['path'], 'additionalProperties': False, 'properties': {'path': {'type': 'string', 'description': 'The path to the dependency.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, {'type': 'object', 'required': ['url'], 'additionalProperties': False, 'properties': {'url': {'type': 'string', 'description': 'The url to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, {'type': 'array', 'minItems': 1, 'items': {'oneOf': [{'$ref': '#/definitions/dependency'}, {'$ref': '#/definitions/long-dependency'}, {'$ref': '#/definitions/git-dependency'}, {'$ref': '#/definitions/file-dependency'}, {'$ref': '#/definitions/path-dependency'}, {'$ref': '#/definitions/url-dependency'}, {'$ref': '#/definitions/dependency-options'}]}}, {'type': 'object', 'additionalProperties': False, 'properties': {'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'source': {'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}]}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        for data_key, data_val in data.items():
+            if REGEX_PATTERNS['^[a-zA-Z-_.0-9]+$'].search(data_key):
+                if data_key in data_keys:
+                    data_keys.remove(data_key)
+                data_val_one_of_count7 = 0
+                if data_val_one_of_count7 < 2:
+                    try:
+                        validate___definitions_dependency(data_val, custom_formats, (name_prefix or "data") + ".{data_key}".format(**locals()))
+                        data_val_one_of_count7 += 1
+                    except JsonSchemaValueException: pass
+                if data_val_one_of_count7 < 2:
+                    try:
+                        validate___definitions_long_dependency(data_val, custom_formats, (name_prefix or "data") + ".{data_key}".format(**locals()))
+                        data_val_one_of_count7 += 1
+                    except JsonSchemaValueException: pass
+                if data_val_one_of_count7 < 2:
+                    try:
+                        validate___definitions_git_dependency(data_val, custom_formats, (name_prefix or "data") + ".{data_key}".format(**locals()))
+                        data_val_one_of_count7 += 1
+                    except JsonSchemaValueException: pass
+                if data_val_one_of_count7 < 2:
+                    try:
+                        validate___definitions_file_dependency(data_val, custom_formats, (name_prefix or "data") + ".{data_key}".format(**locals()))
+                        data_val_one_of_count7 += 1
+                    except JsonSchemaValueException: pass
+                if data_val_one_of_count7 < 2:
+                    try:
+                        validate___definitions_path_dependency(data_val, custom_formats, (name_prefix or "data") + ".{data_key}".format(**locals()))
+                        data_val_one_of_count7 += 1
+                    except JsonSchemaValueException: pass
+                if data_val_one_of_count7 < 2:
+                    try:
+                        validate___definitions_url_dependency(data_val, custom_formats, (name_prefix or "data") + ".{data_key}".format(**locals()))
+                        data_val_one_of_count7 += 1
+                    except JsonSchemaValueException: pass
+                if data_val_one_of_count7 < 2:
+                    try:
+                        validate___definitions_multiple_constraints_dependency(data_val, custom_formats, (name_prefix or "data") + ".{data_key}".format(**locals()))
+                        data_val_one_of_count7 += 1
+                    except JsonSchemaValueException: pass
+                if data_val_one_of_count7 < 2:
+                    try:
+                        validate___definitions_dependency_options(data_val, custom_formats, (name_prefix or "data") + ".{data_key}".format(**locals()))
+                        data_val_one_of_count7 += 1
+                    except JsonSchemaValueException: pass
+                if data_val_one_of_count7 != 1:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".{data_key}".format(**locals()) + " must be valid exactly by one definition" + (" (" + str(data_val_one_of_count7) + " matches found)"), value=data_val, name="" + (name_prefix or "data") + ".{data_key}".format(**locals()) + "", definition={'oneOf': [{'type': 'string', 'description': 'The constraint of the dependency.'}, {'type': 'object', 'required': ['version'], 'additionalProperties': False, 'properties': {'version': {'type': 'string', 'description': 'The constraint of the dependency.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'source': {'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}}}, {'type': 'object', 'required': ['git'], 'additionalProperties': False, 'properties': {'git': {'type': 'string', 'description': 'The url of the git repository.'}, 'branch': {'type': 'string', 'description': 'The branch to checkout.'}, 'tag': {'type': 'string', 'description': 'The tag to checkout.'}, 'rev': {'type': 'string', 'description': 'The revision to checkout.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, {'type': 'object', 'required': ['file'], 'additionalProperties': False, 'properties': {'file': {'type': 'string', 'description': 'The path to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, {'type': 'object', 'required': ['path'], 'additionalProperties': False, 'properties': {'path': {'type': 'string', 'description': 'The path to the dependency.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, {'type': 'object', 'required': ['url'], 'additionalProperties': False, 'properties': {'url': {'type': 'string', 'description': 'The url to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, {'type': 'array', 'minItems': 1, 'items': {'oneOf': [{'$ref': '#/definitions/dependency'}, {'$ref': '#/definitions/long-dependency'}, {'$ref': '#/definitions/git-dependency'}, {'$ref': '#/definitions/file-dependency'}, {'$ref': '#/definitions/path-dependency'}, {'$ref': '#/definitions/url-dependency'}, {'$ref': '#/definitions/dependency-options'}]}}, {'type': 'object', 'additionalProperties': False, 'properties': {'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'source': {'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}]}, rule='oneOf')
+    return data
+
+def validate___definitions_dependency_options(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'properties': {'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'source': {'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        if "python" in data_keys:
+            data_keys.remove("python")
+            data__python = data["python"]
+            if not isinstance(data__python, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".python must be string", value=data__python, name="" + (name_prefix or "data") + ".python", definition={'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, rule='type')
+        if "platform" in data_keys:
+            data_keys.remove("platform")
+            data__platform = data["platform"]
+            if not isinstance(data__platform, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".platform must be string", value=data__platform, name="" + (name_prefix or "data") + ".platform", definition={'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, rule='type')
+        if "markers" in data_keys:
+            data_keys.remove("markers")
+            data__markers = data["markers"]
+            if not isinstance(data__markers, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".markers must be string", value=data__markers, name="" + (name_prefix or "data") + ".markers", definition={'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, rule='type')
+        if "allow-prereleases" in data_keys:
+            data_keys.remove("allow-prereleases")
+            data__allowprereleases = data["allow-prereleases"]
+            if not isinstance(data__allowprereleases, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".allow-prereleases must be boolean", value=data__allowprereleases, name="" + (name_prefix or "data") + ".allow-prereleases", definition={'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, rule='type')
+        if "source" in data_keys:
+            data_keys.remove("source")
+            data__source = data["source"]
+            if not isinstance(data__source, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".source must be string", value=data__source, name="" + (name_prefix or "data") + ".source", definition={'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}, rule='type')
+        if "develop" in data_keys:
+            data_keys.remove("develop")
+            data__develop = data["develop"]
+            if not isinstance(data__develop, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".develop must be boolean", value=data__develop, name="" + (name_prefix or "data") + ".develop", definition={'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}, rule='type')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'properties': {'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'source': {'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, rule='additionalProperties')
+    return data
+
+def validate___definitions_multiple_constraints_dependency(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (list, tuple)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be array", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'array', 'minItems': 1, 'items': {'oneOf': [{'type': 'string', 'description': 'The constraint of the dependency.'}, {'type': 'object', 'required': ['version'], 'additionalProperties': False, 'properties': {'version': {'type': 'string', 'description': 'The constraint of the dependency.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'source': {'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}}}, {'type': 'object', 'required': ['git'], 'additionalProperties': False, 'properties': {'git': {'type': 'string', 'description': 'The url of the git repository.'}, 'branch': {'type': 'string', 'description': 'The branch to checkout.'}, 'tag': {'type': 'string', 'description': 'The tag to checkout.'}, 'rev': {'type': 'string', 'description': 'The revision to checkout.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, {'type': 'object', 'required': ['file'], 'additionalProperties': False, 'properties': {'file': {'type': 'string', 'description': 'The path to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, {'type': 'object', 'required': ['path'], 'additionalProperties': False, 'properties': {'path': {'type': 'string', 'description': 'The path to the dependency.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, {'type': 'object', 'required': ['url'], 'additionalProperties': False, 'properties': {'url': {'type': 'string', 'description': 'The url to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, {'type': 'object', 'additionalProperties': False, 'properties': {'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'source': {'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}]}}, rule='type')
+    data_is_list = isinstance(data, (list, tuple))
+    if data_is_list:
+        data_len = len(data)
+        if data_len < 1:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain at least 1 items", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'array', 'minItems': 1, 'items': {'oneOf': [{'type': 'string', 'description': 'The constraint of the dependency.'}, {'type': 'object', 'required': ['version'], 'additionalProperties': False, 'properties': {'version': {'type': 'string', 'description': 'The constraint of the dependency.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'source': {'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}}}, {'type': 'object', 'required': ['git'], 'additionalProperties': False, 'properties': {'git': {'type': 'string', 'description': 'The url of the git repository.'}, 'branch': {'type': 'string', 'description': 'The branch to checkout.'}, 'tag': {'type': 'string', 'description': 'The tag to checkout.'}, 'rev': {'type': 'string', 'description': 'The revision to checkout.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, {'type': 'object', 'required': ['file'], 'additionalProperties': False, 'properties': {'file': {'type': 'string', 'description': 'The path to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, {'type': 'object', 'required': ['path'], 'additionalProperties': False, 'properties': {'path': {'type': 'string', 'description': 'The path to the dependency.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, {'type': 'object', 'required': ['url'], 'additionalProperties': False, 'properties': {'url': {'type': 'string', 'description': 'The url to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, {'type': 'object', 'additionalProperties': False, 'properties': {'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'source': {'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}]}}, rule='minItems')
+        for data_x, data_item in enumerate(data):
+            data_item_one_of_count8 = 0
+            if data_item_one_of_count8 < 2:
+                try:
+                    validate___definitions_dependency(data_item, custom_formats, (name_prefix or "data") + "[{data_x}]".format(**locals()))
+                    data_item_one_of_count8 += 1
+                except JsonSchemaValueException: pass
+            if data_item_one_of_count8 < 2:
+                try:
+                    validate___definitions_long_dependency(data_item, custom_formats, (name_prefix or "data") + "[{data_x}]".format(**locals()))
+                    data_item_one_of_count8 += 1
+                except JsonSchemaValueException: pass
+            if data_item_one_of_count8 < 2:
+                try:
+                    validate___definitions_git_dependency(data_item, custom_formats, (name_prefix or "data") + "[{data_x}]".format(**locals()))
+                    data_item_one_of_count8 += 1
+                except JsonSchemaValueException: pass
+            if data_item_one_of_count8 < 2:
+                try:
+                    validate___definitions_file_dependency(data_item, custom_formats, (name_prefix or "data") + "[{data_x}]".format(**locals()))
+                    data_item_one_of_count8 += 1
+                except JsonSchemaValueException: pass
+            if data_item_one_of_count8 < 2:
+                try:
+                    validate___definitions_path_dependency(data_item, custom_formats, (name_prefix or "data") + "[{data_x}]".format(**locals()))
+                    data_item_one_of_count8 += 1
+                except JsonSchemaValueException: pass
+            if data_item_one_of_count8 < 2:
+                try:
+                    validate___definitions_url_dependency(data_item, custom_formats, (name_prefix or "data") + "[{data_x}]".format(**locals()))
+                    data_item_one_of_count8 += 1
+                except JsonSchemaValueException: pass
+            if data_item_one_of_count8 < 2:
+                try:
+                    validate___definitions_dependency_options(data_item, custom_formats, (name_prefix or "data") + "[{data_x}]".format(**locals()))
+                    data_item_one_of_count8 += 1
+                except JsonSchemaValueException: pass
+            if data_item_one_of_count8 != 1:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}]".format(**locals()) + " must be valid exactly by one definition" + (" (" + str(data_item_one_of_count8) + " matches found)"), value=data_item, name="" + (name_prefix or "data") + "[{data_x}]".format(**locals()) + "", definition={'oneOf': [{'type': 'string', 'description': 'The constraint of the dependency.'}, {'type': 'object', 'required': ['version'], 'additionalProperties': False, 'properties': {'version': {'type': 'string', 'description': 'The constraint of the dependency.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'source': {'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}}}, {'type': 'object', 'required': ['git'], 'additionalProperties': False, 'properties': {'git': {'type': 'string', 'description': 'The url of the git repository.'}, 'branch': {'type': 'string', 'description': 'The branch to checkout.'}, 'tag': {'type': 'string', 'description': 'The tag to checkout.'}, 'rev': {'type': 'string', 'description': 'The revision to checkout.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, {'type': 'object', 'required': ['file'], 'additionalProperties': False, 'properties': {'file': {'type': 'string', 'description': 'The path to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, {'type': 'object', 'required': ['path'], 'additionalProperties': False, 'properties': {'path': {'type': 'string', 'description': 'The path to the dependency.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, {'type': 'object', 'required': ['url'], 'additionalProperties': False, 'properties': {'url': {'type': 'string', 'description': 'The url to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, {'type': 'object', 'additionalProperties': False, 'properties': {'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'source': {'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}]}, rule='oneOf')
+    return data
+
+def validate___definitions_url_dependency(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['url'], 'additionalProperties': False, 'properties': {'url': {'type': 'string', 'description': 'The url to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['url']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['url'], 'additionalProperties': False, 'properties': {'url': {'type': 'string', 'description': 'The url to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, rule='required')
+        data_keys = set(data.keys())
+        if "url" in data_keys:
+            data_keys.remove("url")
+            data__url = data["url"]
+            if not isinstance(data__url, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".url must be string", value=data__url, name="" + (name_prefix or "data") + ".url", definition={'type': 'string', 'description': 'The url to the file.'}, rule='type')
+        if "subdirectory" in data_keys:
+            data_keys.remove("subdirectory")
+            data__subdirectory = data["subdirectory"]
+            if not isinstance(data__subdirectory, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".subdirectory must be string", value=data__subdirectory, name="" + (name_prefix or "data") + ".subdirectory", definition={'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, rule='type')
+        if "python" in data_keys:
+            data_keys.remove("python")
+            data__python = data["python"]
+            if not isinstance(data__python, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".python must be string", value=data__python, name="" + (name_prefix or "data") + ".python", definition={'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, rule='type')
+        if "platform" in data_keys:
+            data_keys.remove("platform")
+            data__platform = data["platform"]
+            if not isinstance(data__platform, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".platform must be string", value=data__platform, name="" + (name_prefix or "data") + ".platform", definition={'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, rule='type')
+        if "markers" in data_keys:
+            data_keys.remove("markers")
+            data__markers = data["markers"]
+            if not isinstance(data__markers, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".markers must be string", value=data__markers, name="" + (name_prefix or "data") + ".markers", definition={'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, rule='type')
+        if "optional" in data_keys:
+            data_keys.remove("optional")
+            data__optional = data["optional"]
+            if not isinstance(data__optional, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".optional must be boolean", value=data__optional, name="" + (name_prefix or "data") + ".optional", definition={'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, rule='type')
+        if "extras" in data_keys:
+            data_keys.remove("extras")
+            data__extras = data["extras"]
+            if not isinstance(data__extras, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".extras must be array", value=data__extras, name="" + (name_prefix or "data") + ".extras", definition={'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, rule='type')
+            data__extras_is_list = isinstance(data__extras, (list, tuple))
+            if data__extras_is_list:
+                data__extras_len = len(data__extras)
+                for data__extras_x, data__extras_item in enumerate(data__extras):
+                    if not isinstance(data__extras_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".extras[{data__extras_x}]".format(**locals()) + " must be string", value=data__extras_item, name="" + (name_prefix or "data") + ".extras[{data__extras_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['url'], 'additionalProperties': False, 'properties': {'url': {'type': 'string', 'description': 'The url to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, rule='additionalProperties')
+    return data
+
+def validate___definitions_path_dependency(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['path'], 'additionalProperties': False, 'properties': {'path': {'type': 'string', 'description': 'The path to the dependency.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['path']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['path'], 'additionalProperties': False, 'properties': {'path': {'type': 'string', 'description': 'The path to the dependency.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, rule='required')
+        data_keys = set(data.keys())
+        if "path" in data_keys:
+            data_keys.remove("path")
+            data__path = data["path"]
+            if not isinstance(data__path, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".path must be string", value=data__path, name="" + (name_prefix or "data") + ".path", definition={'type': 'string', 'description': 'The path to the dependency.'}, rule='type')
+        if "subdirectory" in data_keys:
+            data_keys.remove("subdirectory")
+            data__subdirectory = data["subdirectory"]
+            if not isinstance(data__subdirectory, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".subdirectory must be string", value=data__subdirectory, name="" + (name_prefix or "data") + ".subdirectory", definition={'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, rule='type')
+        if "python" in data_keys:
+            data_keys.remove("python")
+            data__python = data["python"]
+            if not isinstance(data__python, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".python must be string", value=data__python, name="" + (name_prefix or "data") + ".python", definition={'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, rule='type')
+        if "platform" in data_keys:
+            data_keys.remove("platform")
+            data__platform = data["platform"]
+            if not isinstance(data__platform, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".platform must be string", value=data__platform, name="" + (name_prefix or "data") + ".platform", definition={'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, rule='type')
+        if "markers" in data_keys:
+            data_keys.remove("markers")
+            data__markers = data["markers"]
+            if not isinstance(data__markers, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".markers must be string", value=data__markers, name="" + (name_prefix or "data") + ".markers", definition={'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, rule='type')
+        if "optional" in data_keys:
+            data_keys.remove("optional")
+            data__optional = data["optional"]
+            if not isinstance(data__optional, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".optional must be boolean", value=data__optional, name="" + (name_prefix or "data") + ".optional", definition={'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, rule='type')
+        if "extras" in data_keys:
+            data_keys.remove("extras")
+            data__extras = data["extras"]
+            if not isinstance(data__extras, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".extras must be array", value=data__extras, name="" + (name_prefix or "data") + ".extras", definition={'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, rule='type')
+            data__extras_is_list = isinstance(data__extras, (list, tuple))
+            if data__extras_is_list:
+                data__extras_len = len(data__extras)
+                for data__extras_x, data__extras_item in enumerate(data__extras):
+                    if not isinstance(data__extras_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".extras[{data__extras_x}]".format(**locals()) + " must be string", value=data__extras_item, name="" + (name_prefix or "data") + ".extras[{data__extras_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "develop" in data_keys:
+            data_keys.remove("develop")
+            data__develop = data["develop"]
+            if not isinstance(data__develop, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".develop must be boolean", value=data__develop, name="" + (name_prefix or "data") + ".develop", definition={'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}, rule='type')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['path'], 'additionalProperties': False, 'properties': {'path': {'type': 'string', 'description': 'The path to the dependency.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, rule='additionalProperties')
+    return data
+
+def validate___definitions_file_dependency(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['file'], 'additionalProperties': False, 'properties': {'file': {'type': 'string', 'description': 'The path to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['file']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['file'], 'additionalProperties': False, 'properties': {'file': {'type': 'string', 'description': 'The path to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, rule='required')
+        data_keys = set(data.keys())
+        if "file" in data_keys:
+            data_keys.remove("file")
+            data__file = data["file"]
+            if not isinstance(data__file, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".file must be string", value=data__file, name="" + (name_prefix or "data") + ".file", definition={'type': 'string', 'description': 'The path to the file.'}, rule='type')
+        if "subdirectory" in data_keys:
+            data_keys.remove("subdirectory")
+            data__subdirectory = data["subdirectory"]
+            if not isinstance(data__subdirectory, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".subdirectory must be string", value=data__subdirectory, name="" + (name_prefix or "data") + ".subdirectory", definition={'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, rule='type')
+        if "python" in data_keys:
+            data_keys.remove("python")
+            data__python = data["python"]
+            if not isinstance(data__python, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".python must be string", value=data__python, name="" + (name_prefix or "data") + ".python", definition={'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, rule='type')
+        if "platform" in data_keys:
+            data_keys.remove("platform")
+            data__platform = data["platform"]
+            if not isinstance(data__platform, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".platform must be string", value=data__platform, name="" + (name_prefix or "data") + ".platform", definition={'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, rule='type')
+        if "markers" in data_keys:
+            data_keys.remove("markers")
+            data__markers = data["markers"]
+            if not isinstance(data__markers, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".markers must be string", value=data__markers, name="" + (name_prefix or "data") + ".markers", definition={'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, rule='type')
+        if "optional" in data_keys:
+            data_keys.remove("optional")
+            data__optional = data["optional"]
+            if not isinstance(data__optional, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".optional must be boolean", value=data__optional, name="" + (name_prefix or "data") + ".optional", definition={'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, rule='type')
+        if "extras" in data_keys:
+            data_keys.remove("extras")
+            data__extras = data["extras"]
+            if not isinstance(data__extras, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".extras must be array", value=data__extras, name="" + (name_prefix or "data") + ".extras", definition={'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, rule='type')
+            data__extras_is_list = isinstance(data__extras, (list, tuple))
+            if data__extras_is_list:
+                data__extras_len = len(data__extras)
+                for data__extras_x, data__extras_item in enumerate(data__extras):
+                    if not isinstance(data__extras_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".extras[{data__extras_x}]".format(**locals()) + " must be string", value=data__extras_item, name="" + (name_prefix or "data") + ".extras[{data__extras_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['file'], 'additionalProperties': False, 'properties': {'file': {'type': 'string', 'description': 'The path to the file.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}}}, rule='additionalProperties')
+    return data
+
+def validate___definitions_git_dependency(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['git'], 'additionalProperties': False, 'properties': {'git': {'type': 'string', 'description': 'The url of the git repository.'}, 'branch': {'type': 'string', 'description': 'The branch to checkout.'}, 'tag': {'type': 'string', 'description': 'The tag to checkout.'}, 'rev': {'type': 'string', 'description': 'The revision to checkout.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['git']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['git'], 'additionalProperties': False, 'properties': {'git': {'type': 'string', 'description': 'The url of the git repository.'}, 'branch': {'type': 'string', 'description': 'The branch to checkout.'}, 'tag': {'type': 'string', 'description': 'The tag to checkout.'}, 'rev': {'type': 'string', 'description': 'The revision to checkout.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, rule='required')
+        data_keys = set(data.keys())
+        if "git" in data_keys:
+            data_keys.remove("git")
+            data__git = data["git"]
+            if not isinstance(data__git, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".git must be string", value=data__git, name="" + (name_prefix or "data") + ".git", definition={'type': 'string', 'description': 'The url of the git repository.'}, rule='type')
+        if "branch" in data_keys:
+            data_keys.remove("branch")
+            data__branch = data["branch"]
+            if not isinstance(data__branch, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".branch must be string", value=data__branch, name="" + (name_prefix or "data") + ".branch", definition={'type': 'string', 'description': 'The branch to checkout.'}, rule='type')
+        if "tag" in data_keys:
+            data_keys.remove("tag")
+            data__tag = data["tag"]
+            if not isinstance(data__tag, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".tag must be string", value=data__tag, name="" + (name_prefix or "data") + ".tag", definition={'type': 'string', 'description': 'The tag to checkout.'}, rule='type')
+        if "rev" in data_keys:
+            data_keys.remove("rev")
+            data__rev = data["rev"]
+            if not isinstance(data__rev, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".rev must be string", value=data__rev, name="" + (name_prefix or "data") + ".rev", definition={'type': 'string', 'description': 'The revision to checkout.'}, rule='type')
+        if "subdirectory" in data_keys:
+            data_keys.remove("subdirectory")
+            data__subdirectory = data["subdirectory"]
+            if not isinstance(data__subdirectory, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".subdirectory must be string", value=data__subdirectory, name="" + (name_prefix or "data") + ".subdirectory", definition={'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, rule='type')
+        if "python" in data_keys:
+            data_keys.remove("python")
+            data__python = data["python"]
+            if not isinstance(data__python, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".python must be string", value=data__python, name="" + (name_prefix or "data") + ".python", definition={'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, rule='type')
+        if "platform" in data_keys:
+            data_keys.remove("platform")
+            data__platform = data["platform"]
+            if not isinstance(data__platform, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".platform must be string", value=data__platform, name="" + (name_prefix or "data") + ".platform", definition={'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, rule='type')
+        if "markers" in data_keys:
+            data_keys.remove("markers")
+            data__markers = data["markers"]
+            if not isinstance(data__markers, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".markers must be string", value=data__markers, name="" + (name_prefix or "data") + ".markers", definition={'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, rule='type')
+        if "allow-prereleases" in data_keys:
+            data_keys.remove("allow-prereleases")
+            data__allowprereleases = data["allow-prereleases"]
+            if not isinstance(data__allowprereleases, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".allow-prereleases must be boolean", value=data__allowprereleases, name="" + (name_prefix or "data") + ".allow-prereleases", definition={'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, rule='type')
+        if "allows-prereleases" in data_keys:
+            data_keys.remove("allows-prereleases")
+            data__allowsprereleases = data["allows-prereleases"]
+            if not isinstance(data__allowsprereleases, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".allows-prereleases must be boolean", value=data__allowsprereleases, name="" + (name_prefix or "data") + ".allows-prereleases", definition={'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, rule='type')
+        if "optional" in data_keys:
+            data_keys.remove("optional")
+            data__optional = data["optional"]
+            if not isinstance(data__optional, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".optional must be boolean", value=data__optional, name="" + (name_prefix or "data") + ".optional", definition={'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, rule='type')
+        if "extras" in data_keys:
+            data_keys.remove("extras")
+            data__extras = data["extras"]
+            if not isinstance(data__extras, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".extras must be array", value=data__extras, name="" + (name_prefix or "data") + ".extras", definition={'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, rule='type')
+            data__extras_is_list = isinstance(data__extras, (list, tuple))
+            if data__extras_is_list:
+                data__extras_len = len(data__extras)
+                for data__extras_x, data__extras_item in enumerate(data__extras):
+                    if not isinstance(data__extras_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".extras[{data__extras_x}]".format(**locals()) + " must be string", value=data__extras_item, name="" + (name_prefix or "data") + ".extras[{data__extras_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "develop" in data_keys:
+            data_keys.remove("develop")
+            data__develop = data["develop"]
+            if not isinstance(data__develop, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".develop must be boolean", value=data__develop, name="" + (name_prefix or "data") + ".develop", definition={'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}, rule='type')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['git'], 'additionalProperties': False, 'properties': {'git': {'type': 'string', 'description': 'The url of the git repository.'}, 'branch': {'type': 'string', 'description': 'The branch to checkout.'}, 'tag': {'type': 'string', 'description': 'The tag to checkout.'}, 'rev': {'type': 'string', 'description': 'The revision to checkout.'}, 'subdirectory': {'type': 'string', 'description': 'The relative path to the directory where the package is located.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'develop': {'type': 'boolean', 'description': 'Whether to install the dependency in development mode.'}}}, rule='additionalProperties')
+    return data
+
+def validate___definitions_long_dependency(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['version'], 'additionalProperties': False, 'properties': {'version': {'type': 'string', 'description': 'The constraint of the dependency.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'source': {'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['version']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['version'], 'additionalProperties': False, 'properties': {'version': {'type': 'string', 'description': 'The constraint of the dependency.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'source': {'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}}}, rule='required')
+        data_keys = set(data.keys())
+        if "version" in data_keys:
+            data_keys.remove("version")
+            data__version = data["version"]
+            if not isinstance(data__version, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".version must be string", value=data__version, name="" + (name_prefix or "data") + ".version", definition={'type': 'string', 'description': 'The constraint of the dependency.'}, rule='type')
+        if "python" in data_keys:
+            data_keys.remove("python")
+            data__python = data["python"]
+            if not isinstance(data__python, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".python must be string", value=data__python, name="" + (name_prefix or "data") + ".python", definition={'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, rule='type')
+        if "platform" in data_keys:
+            data_keys.remove("platform")
+            data__platform = data["platform"]
+            if not isinstance(data__platform, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".platform must be string", value=data__platform, name="" + (name_prefix or "data") + ".platform", definition={'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, rule='type')
+        if "markers" in data_keys:
+            data_keys.remove("markers")
+            data__markers = data["markers"]
+            if not isinstance(data__markers, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".markers must be string", value=data__markers, name="" + (name_prefix or "data") + ".markers", definition={'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, rule='type')
+        if "allow-prereleases" in data_keys:
+            data_keys.remove("allow-prereleases")
+            data__allowprereleases = data["allow-prereleases"]
+            if not isinstance(data__allowprereleases, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".allow-prereleases must be boolean", value=data__allowprereleases, name="" + (name_prefix or "data") + ".allow-prereleases", definition={'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, rule='type')
+        if "allows-prereleases" in data_keys:
+            data_keys.remove("allows-prereleases")
+            data__allowsprereleases = data["allows-prereleases"]
+            if not isinstance(data__allowsprereleases, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".allows-prereleases must be boolean", value=data__allowsprereleases, name="" + (name_prefix or "data") + ".allows-prereleases", definition={'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, rule='type')
+        if "optional" in data_keys:
+            data_keys.remove("optional")
+            data__optional = data["optional"]
+            if not isinstance(data__optional, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".optional must be boolean", value=data__optional, name="" + (name_prefix or "data") + ".optional", definition={'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, rule='type')
+        if "extras" in data_keys:
+            data_keys.remove("extras")
+            data__extras = data["extras"]
+            if not isinstance(data__extras, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".extras must be array", value=data__extras, name="" + (name_prefix or "data") + ".extras", definition={'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, rule='type')
+            data__extras_is_list = isinstance(data__extras, (list, tuple))
+            if data__extras_is_list:
+                data__extras_len = len(data__extras)
+                for data__extras_x, data__extras_item in enumerate(data__extras):
+                    if not isinstance(data__extras_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".extras[{data__extras_x}]".format(**locals()) + " must be string", value=data__extras_item, name="" + (name_prefix or "data") + ".extras[{data__extras_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "source" in data_keys:
+            data_keys.remove("source")
+            data__source = data["source"]
+            if not isinstance(data__source, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".source must be string", value=data__source, name="" + (name_prefix or "data") + ".source", definition={'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}, rule='type')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['version'], 'additionalProperties': False, 'properties': {'version': {'type': 'string', 'description': 'The constraint of the dependency.'}, 'python': {'type': 'string', 'description': 'The python versions for which the dependency should be installed.'}, 'platform': {'type': 'string', 'description': 'The platform(s) for which the dependency should be installed.'}, 'markers': {'type': 'string', 'description': 'The PEP 508 compliant environment markers for which the dependency should be installed.'}, 'allow-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'allows-prereleases': {'type': 'boolean', 'description': 'Whether the dependency allows prereleases or not.'}, 'optional': {'type': 'boolean', 'description': 'Whether the dependency is optional or not.'}, 'extras': {'type': 'array', 'description': 'The required extras for this dependency.', 'items': {'type': 'string'}}, 'source': {'type': 'string', 'description': 'The exclusive source used to search for this dependency.'}}}, rule='additionalProperties')
+    return data
+
+def validate___definitions_dependency(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (str)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be string", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'string', 'description': 'The constraint of the dependency.'}, rule='type')
+    return data
+
+def validate___definitions_package_formats(data, custom_formats={}, name_prefix=None):
+    data_one_of_count9 = 0
+    if data_one_of_count9 < 2:
+        try:
+            validate___definitions_package_format(data, custom_formats, (name_prefix or "data") + "")
+            data_one_of_count9 += 1
+        except JsonSchemaValueException: pass
+    if data_one_of_count9 < 2:
+        try:
+            if not isinstance(data, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must be array", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'array', 'items': {'type': 'string', 'enum': ['sdist', 'wheel'], 'description': 'A Python packaging format.'}}, rule='type')
+            data_is_list = isinstance(data, (list, tuple))
+            if data_is_list:
+                data_len = len(data)
+                for data_x, data_item in enumerate(data):
+                    validate___definitions_package_format(data_item, custom_formats, (name_prefix or "data") + "[{data_x}]".format(**locals()))
+            data_one_of_count9 += 1
+        except JsonSchemaValueException: pass
+    if data_one_of_count9 != 1:
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be valid exactly by one definition" + (" (" + str(data_one_of_count9) + " matches found)"), value=data, name="" + (name_prefix or "data") + "", definition={'oneOf': [{'type': 'string', 'enum': ['sdist', 'wheel'], 'description': 'A Python packaging format.'}, {'type': 'array', 'items': {'type': 'string', 'enum': ['sdist', 'wheel'], 'description': 'A Python packaging format.'}}], 'description': 'The format(s) for which the package must be included.'}, rule='oneOf')
+    return data
+
+def validate___definitions_package_format(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (str)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be string", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'string', 'enum': ['sdist', 'wheel'], 'description': 'A Python packaging format.'}, rule='type')
+    if data not in ['sdist', 'wheel']:
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be one of ['sdist', 'wheel']", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'string', 'enum': ['sdist', 'wheel'], 'description': 'A Python packaging format.'}, rule='enum')
+    return data
+
+def validate___definitions_include_path(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (str)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be string", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'string', 'description': 'Path to file or directory to include.'}, rule='type')
+    return data
+
+def validate___definitions_maintainers(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (list, tuple)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be array", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'array', 'description': 'List of maintainers, other than the original author(s), that upkeep the package (legacy).', 'items': {'type': 'string'}}, rule='type')
+    data_is_list = isinstance(data, (list, tuple))
+    if data_is_list:
+        data_len = len(data)
+        for data_x, data_item in enumerate(data):
+            if not isinstance(data_item, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}]".format(**locals()) + " must be string", value=data_item, name="" + (name_prefix or "data") + "[{data_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+    return data
+
+def validate___definitions_authors(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (list, tuple)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be array", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'array', 'description': 'List of authors that contributed to the package. This is typically the main maintainers, not the full list (legacy).', 'items': {'type': 'string'}}, rule='type')
+    data_is_list = isinstance(data, (list, tuple))
+    if data_is_list:
+        data_len = len(data)
+        for data_x, data_item in enumerate(data):
+            if not isinstance(data_item, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}]".format(**locals()) + " must be string", value=data_item, name="" + (name_prefix or "data") + "[{data_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+    return data
\ No newline at end of file
@@ -0,0 +1,425 @@
+# Generated from schemas/project-schema.json by poetry.core.json.generate_validator(). Do not edit.
+SCHEMA_DIGEST = "7be76226bf9368328f09ee2ff5b1a061e78ae8aff9a5d7552d6b626759b904f6"
+FASTJSONSCHEMA_VERSION = "2.21.2"
+VERSION = "2.21.2"
+from decimal import Decimal
+import re
+from fastjsonschema import JsonSchemaValueException
+
+
+REGEX_PATTERNS = {
+    '^([a-zA-Z\\d]|[a-zA-Z\\d][\\w.-]*[a-zA-Z\\d])$': re.compile('^([a-zA-Z\\d]|[a-zA-Z\\d][\\w.-]*[a-zA-Z\\d])\\Z'),
+    '^v?((([0-9]+)!)?([0-9]+(\\.[0-9]+)*)([-_\\.]?(alpha|a|beta|b|preview|pre|c|rc)[-_\\.]?([0-9]+)?)?((-([0-9]+))|([-_\\.]?(post|rev|r)[-_\\.]?([0-9]+)?))?([-_\\.]?(dev)[-_\\.]?([0-9]+)?)?)(\\+([a-zA-Z0-9]+([-_\\.][a-zA-Z0-9]+)*))?$': re.compile('^v?((([0-9]+)!)?([0-9]+(\\.[0-9]+)*)([-_\\.]?(alpha|a|beta|b|preview|pre|c|rc)[-_\\.]?([0-9]+)?)?((-([0-9]+))|([-_\\.]?(post|rev|r)[-_\\.]?([0-9]+)?))?([-_\\.]?(dev)[-_\\.]?([0-9]+)?)?)(\\+([a-zA-Z0-9]+([-_\\.][a-zA-Z0-9]+)*))?\\Z'),
+    'uri_re_pattern': re.compile('^\\w+:(\\/?\\/?)[^\\s]+\\Z'),
+    '^\\w+(\\.\\w+)*$': re.compile('^\\w+(\\.\\w+)*$'),
+    '^([a-z\\d]|[a-z\\d]([a-z\\d-](?!--))*[a-z\\d])$': re.compile('^([a-z\\d]|[a-z\\d]([a-z\\d-](?!--))*[a-z\\d])$'),
+    'email_re_pattern': re.compile('^(?!.*\\.\\..*@)[^@.][^@]*(?<!\\.)@[^@]+\\.[^@]+\\Z')
+}
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'name': 'project', 'type': 'object', 'additionalProperties': True, 'required': ['name'], 'properties': {'name': {'title': 'Project name', 'type': 'string', 'pattern': '^([a-zA-Z\\d]|[a-zA-Z\\d][\\w.-]*[a-zA-Z\\d])$'}, 'version': {'title': 'Project version', 'type': 'string', 'pattern': '^v?((([0-9]+)!)?([0-9]+(\\.[0-9]+)*)([-_\\.]?(alpha|a|beta|b|preview|pre|c|rc)[-_\\.]?([0-9]+)?)?((-([0-9]+))|([-_\\.]?(post|rev|r)[-_\\.]?([0-9]+)?))?([-_\\.]?(dev)[-_\\.]?([0-9]+)?)?)(\\+([a-zA-Z0-9]+([-_\\.][a-zA-Z0-9]+)*))?$', 'examples': ['42.0.1', '0.3.9rc7.post0.dev5']}, 'description': {'title': 'Project summary description', 'type': 'string'}, 'readme': {'title': 'Project full description', 'description': 'AKA the README', 'oneOf': [{'title': 'README file path', 'type': 'string'}, {'type': 'object', 'required': ['content-type'], 'properties': {'content-type': {'title': 'README text content-type', 'description': 'RFC 1341 compliant content-type (with optional charset, defaulting to UTF-8)', 'type': 'string'}}, 'oneOf': [{'additionalProperties': False, 'required': ['file'], 'properties': {'content-type': True, 'file': {'title': 'README file path', 'type': 'string'}}}, {'additionalProperties': False, 'required': ['text'], 'properties': {'content-type': True, 'text': {'title': 'README text', 'type': 'string'}}}]}], 'examples': ['README.md', {'file': 'README.txt', 'content-type': 'text/plain'}, {'text': '# Example project\n\nAn example project', 'content-type': 'text/markdown'}]}, 'requires-python': {'title': 'Python version compatibility', 'type': 'string', 'examples': ['>= 3.7']}, 'license': {'title': 'Project license', 'oneOf': [{'type': 'object', 'additionalProperties': False, 'required': ['file'], 'properties': {'file': {'title': 'License file path', 'type': 'string'}}}, {'type': 'object', 'additionalProperties': False, 'required': ['text'], 'properties': {'text': {'title': 'License text', 'type': 'string'}}}, {'type': 'string', 'description': 'A SPDX license identifier'}], 'examples': [{'text': 'MIT'}, {'file': 'LICENSE'}, 'MIT', 'BSD-2-Clause OR Apache-2.0', 'LicenseRef-Proprietary']}, 'license-files': {'title': 'License files', 'description': 'Relative paths or globs to paths of license files. Can be an empty list.', 'type': 'array', 'items': {'type': 'string'}}, 'authors': {'title': 'Project authors', 'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'anyOf': [{'required': ['name'], 'properties': {'name': True}}, {'required': ['email'], 'properties': {'email': True}}], 'properties': {'name': {'title': 'Author name', 'type': 'string'}, 'email': {'title': 'Author email', 'type': 'string', 'format': 'email'}}}}, 'maintainers': {'title': 'Project maintainers', 'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'anyOf': [{'required': ['name'], 'properties': {'name': True}}, {'required': ['email'], 'properties': {'email': True}}], 'properties': {'name': {'title': 'Author name', 'type': 'string'}, 'email': {'title': 'Author email', 'type': 'string', 'format': 'email'}}}}, 'keywords': {'title': 'Project keywords', 'type': 'array', 'items': {'type': 'string'}}, 'classifiers': {'title': 'Applicable Trove classifiers', 'type': 'array', 'items': {'type': 'string'}}, 'urls': {'title': 'Project URLs', 'type': 'object', 'additionalProperties': {'type': 'string', 'format': 'uri'}, 'examples': [{'homepage': 'https://example.com/example-project'}]}, 'scripts': {'title': 'Console scripts', 'type': 'object', 'additionalProperties': {'type': 'string'}, 'examples': [{'mycmd': 'package.module:object.function'}]}, 'gui-scripts': {'title': 'GUI scripts', 'type': 'object', 'additionalProperties': {'type': 'string'}, 'examples': [{'mycmd': 'package.module:object.function'}]}, 'entry-points': {'title': 'Other entry-point groups', 'type': 'object', 'additionalProperties': False, 'patternProperties': {'^\\w+(\\.\\w+)*$': {'type': 'object', 'additionalProperties': {'type': 'string'}}}, 'propertyNames': {'not': {'anyOf': [{'const': 'console_scripts'}, {'const': 'gui_scripts'}]}}, 'examples': [{'pygments.styles': {'monokai': 'package.module:object.attribute'}}]}, 'dependencies': {'title': 'Project dependency requirements', 'type': 'array', 'items': {'type': 'string'}, 'examples': [['attrs', 'requests ~= 2.28']]}, 'optional-dependencies': {'title': 'Project extra dependency requirements', 'description': 'keys are extra names', 'type': 'object', 'patternProperties': {'^([a-z\\d]|[a-z\\d]([a-z\\d-](?!--))*[a-z\\d])$': {'type': 'array', 'items': {'type': 'string'}}}, 'examples': [{'typing': ['boto3-stubs', 'typing-extensions ~= 4.1']}]}, 'dynamic': {'title': 'Dynamic metadata values', 'type': 'array', 'items': {'type': 'string', 'enum': ['version', 'description', 'readme', 'requires-python', 'license', 'license-files', 'authors', 'maintainers', 'keywords', 'classifiers', 'urls', 'scripts', 'gui-scripts', 'entry-points', 'dependencies', 'optional-dependencies']}, 'examples': [['version']]}}, 'definitions': {'projectAuthor': {'type': 'object', 'additionalProperties': False, 'anyOf': [{'required': ['name'], 'properties': {'name': True}}, {'required': ['email'], 'properties': {'email': True}}], 'properties': {'name': {'title': 'Author name', 'type': 'string'}, 'email': {'title': 'Author email', 'type': 'string', 'format': 'email'}}}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['name']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'name': 'project', 'type': 'object', 'additionalProperties': True, 'required': ['name'], 'properties': {'name': {'title': 'Project name', 'type': 'string', 'pattern': '^([a-zA-Z\\d]|[a-zA-Z\\d][\\w.-]*[a-zA-Z\\d])$'}, 'version': {'title': 'Project version', 'type': 'string', 'pattern': '^v?((([0-9]+)!)?([0-9]+(\\.[0-9]+)*)([-_\\.]?(alpha|a|beta|b|preview|pre|c|rc)[-_\\.]?([0-9]+)?)?((-([0-9]+))|([-_\\.]?(post|rev|r)[-_\\.]?([0-9]+)?))?([-_\\.]?(dev)[-_\\.]?([0-9]+)?)?)(\\+([a-zA-Z0-9]+([-_\\.][a-zA-Z0-9]+)*))?$', 'examples': ['42.0.1', '0.3.9rc7.post0.dev5']}, 'description': {'title': 'Project summary description', 'type': 'string'}, 'readme': {'title': 'Project full description', 'description': 'AKA the README', 'oneOf': [{'title': 'README file path', 'type': 'string'}, {'type': 'object', 'required': ['content-type'], 'properties': {'content-type': {'title': 'README text content-type', 'description': 'RFC 1341 compliant content-type (with optional charset, defaulting to UTF-8)', 'type': 'string'}}, 'oneOf': [{'additionalProperties': False, 'required': ['file'], 'properties': {'content-type': True, 'file': {'title': 'README file path', 'type': 'string'}}}, {'additionalProperties': False, 'required': ['text'], 'properties': {'content-type': True, 'text': {'title': 'README text', 'type': 'string'}}}]}], 'examples': ['README.md', {'file': 'README.txt', 'content-type': 'text/plain'}, {'text': '# Example project\n\nAn example project', 'content-type': 'text/markdown'}]}, 'requires-python': {'title': 'Python version compatibility', 'type': 'string', 'examples': ['>= 3.7']}, 'license': {'title': 'Project license', 'oneOf': [{'type': 'object', 'additionalProperties': False, 'required': ['file'], 'properties': {'file': {'title': 'License file path', 'type': 'string'}}}, {'type': 'object', 'additionalProperties': False, 'required': ['text'], 'properties': {'text': {'title': 'License text', 'type': 'string'}}}, {'type': 'string', 'description': 'A SPDX license identifier'}], 'examples': [{'text': 'MIT'}, {'file': 'LICENSE'}, 'MIT', 'BSD-2-Clause OR Apache-2.0', 'LicenseRef-Proprietary']}, 'license-files': {'title': 'License files', 'description': 'Relative paths or globs to paths of license files. Can be an empty list.', 'type': 'array', 'items': {'type': 'string'}}, 'authors': {'title': 'Project authors', 'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'anyOf': [{'required': ['name'], 'properties': {'name': True}}, {'required': ['email'], 'properties': {'email': True}}], 'properties': {'name': {'title': 'Author name', 'type': 'string'}, 'email': {'title': 'Author email', 'type': 'string', 'format': 'email'}}}}, 'maintainers': {'title': 'Project maintainers', 'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'anyOf': [{'required': ['name'], 'properties': {'name': True}}, {'required': ['email'], 'properties': {'email': True}}], 'properties': {'name': {'title': 'Author name', 'type': 'string'}, 'email': {'title': 'Author email', 'type': 'string', 'format': 'email'}}}}, 'keywords': {'title': 'Project keywords', 'type': 'array', 'items': {'type': 'string'}}, 'classifiers': {'title': 'Applicable Trove classifiers', 'type': 'array', 'items': {'type': 'string'}}, 'urls': {'title': 'Project URLs', 'type': 'object', 'additionalProperties': {'type': 'string', 'format': 'uri'}, 'examples': [{'homepage': 'https://example.com/example-project'}]}, 'scripts': {'title': 'Console scripts', 'type': 'object', 'additionalProperties': {'type': 'string'}, 'examples': [{'mycmd': 'package.module:object.function'}]}, 'gui-scripts': {'title': 'GUI scripts', 'type': 'object', 'additionalProperties': {'type': 'string'}, 'examples': [{'mycmd': 'package.module:object.function'}]}, 'entry-points': {'title': 'Other entry-point groups', 'type': 'object', 'additionalProperties': False, 'patternProperties': {'^\\w+(\\.\\w+)*$': {'type': 'object', 'additionalProperties': {'type': 'string'}}}, 'propertyNames': {'not': {'anyOf': [{'const': 'console_scripts'}, {'const': 'gui_scripts'}]}}, 'examples': [{'pygments.styles': {'monokai': 'package.module:object.attribute'}}]}, 'dependencies': {'title': 'Project dependency requirements', 'type': 'array', 'items': {'type': 'string'}, 'examples': [['attrs', 'requests ~= 2.28']]}, 'optional-dependencies': {'title': 'Project extra dependency requirements', 'description': 'keys are extra names', 'type': 'object', 'patternProperties': {'^([a-z\\d]|[a-z\\d]([a-z\\d-](?!--))*[a-z\\d])$': {'type': 'array', 'items': {'type': 'string'}}}, 'examples': [{'typing': ['boto3-stubs', 'typing-extensions ~= 4.1']}]}, 'dynamic': {'title': 'Dynamic metadata values', 'type': 'array', 'items': {'type': 'string', 'enum': ['version', 'description', 'readme', 'requires-python', 'license', 'license-files', 'authors', 'maintainers', 'keywords', 'classifiers', 'urls', 'scripts', 'gui-scripts', 'entry-points', 'dependencies', 'optional-dependencies']}, 'examples': [['version']]}}, 'definitions': {'projectAuthor': {'type': 'object', 'additionalProperties': False, 'anyOf': [{'required': ['name'], 'properties': {'name': True}}, {'required': ['email'], 'properties': {'email': True}}], 'properties': {'name': {'title': 'Author name', 'type': 'string'}, 'email': {'title': 'Author email', 'type': 'string', 'format': 'email'}}}}}, rule='required')
+        data_keys = set(data.keys())
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'title': 'Project name', 'type': 'string', 'pattern': '^([a-zA-Z\\d]|[a-zA-Z\\d][\\w.-]*[a-zA-Z\\d])$'}, rule='type')
+            if isinstance(data__name, str):
+                if not REGEX_PATTERNS['^([a-zA-Z\\d]|[a-zA-Z\\d][\\w.-]*[a-zA-Z\\d])$'].search(data__name):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must match pattern ^([a-zA-Z\\d]|[a-zA-Z\\d][\\w.-]*[a-zA-Z\\d])$", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'title': 'Project name', 'type': 'string', 'pattern': '^([a-zA-Z\\d]|[a-zA-Z\\d][\\w.-]*[a-zA-Z\\d])$'}, rule='pattern')
+        if "version" in data_keys:
+            data_keys.remove("version")
+            data__version = data["version"]
+            if not isinstance(data__version, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".version must be string", value=data__version, name="" + (name_prefix or "data") + ".version", definition={'title': 'Project version', 'type': 'string', 'pattern': '^v?((([0-9]+)!)?([0-9]+(\\.[0-9]+)*)([-_\\.]?(alpha|a|beta|b|preview|pre|c|rc)[-_\\.]?([0-9]+)?)?((-([0-9]+))|([-_\\.]?(post|rev|r)[-_\\.]?([0-9]+)?))?([-_\\.]?(dev)[-_\\.]?([0-9]+)?)?)(\\+([a-zA-Z0-9]+([-_\\.][a-zA-Z0-9]+)*))?$', 'examples': ['42.0.1', '0.3.9rc7.post0.dev5']}, rule='type')
+            if isinstance(data__version, str):
+                if not REGEX_PATTERNS['^v?((([0-9]+)!)?([0-9]+(\\.[0-9]+)*)([-_\\.]?(alpha|a|beta|b|preview|pre|c|rc)[-_\\.]?([0-9]+)?)?((-([0-9]+))|([-_\\.]?(post|rev|r)[-_\\.]?([0-9]+)?))?([-_\\.]?(dev)[-_\\.]?([0-9]+)?)?)(\\+([a-zA-Z0-9]+([-_\\.][a-zA-Z0-9]+)*))?$'].search(data__version):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".version must match pattern ^v?((([0-9]+)!)?([0-9]+(\\.[0-9]+)*)([-_\\.]?(alpha|a|beta|b|preview|pre|c|rc)[-_\\.]?([0-9]+)?)?((-([0-9]+))|([-_\\.]?(post|rev|r)[-_\\.]?([0-9]+)?))?([-_\\.]?(dev)[-_\\.]?([0-9]+)?)?)(\\+([a-zA-Z0-9]+([-_\\.][a-zA-Z0-9]+)*))?$", value=data__version, name="" + (name_prefix or "data") + ".version", definition={'title': 'Project version', 'type': 'string', 'pattern': '^v?((([0-9]+)!)?([0-9]+(\\.[0-9]+)*)([-_\\.]?(alpha|a|beta|b|preview|pre|c|rc)[-_\\.]?([0-9]+)?)?((-([0-9]+))|([-_\\.]?(post|rev|r)[-_\\.]?([0-9]+)?))?([-_\\.]?(dev)[-_\\.]?([0-9]+)?)?)(\\+([a-zA-Z0-9]+([-_\\.][a-zA-Z0-9]+)*))?$', 'examples': ['42.0.1', '0.3.9rc7.post0.dev5']}, rule='pattern')
+        if "description" in data_keys:
+            data_keys.remove("description")
+            data__description = data["description"]
+            if not isinstance(data__description, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".description must be string", value=data__description, name="" + (name_prefix or "data") + ".description", definition={'title': 'Project summary description', 'type': 'string'}, rule='type')
+        if "readme" in data_keys:
+            data_keys.remove("readme")
+            data__readme = data["readme"]
+            data__readme_one_of_count1 = 0
+            if data__readme_one_of_count1 < 2:
+                try:
+                    if not isinstance(data__readme, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".readme must be string", value=data__readme, name="" + (name_prefix or "data") + ".readme", definition={'title': 'README file path', 'type': 'string'}, rule='type')
+                    data__readme_one_of_count1 += 1
+                except JsonSchemaValueException: pass
+            if data__readme_one_of_count1 < 2:
+                try:
+                    if not isinstance(data__readme, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".readme must be object", value=data__readme, name="" + (name_prefix or "data") + ".readme", definition={'type': 'object', 'required': ['content-type'], 'properties': {'content-type': {'title': 'README text content-type', 'description': 'RFC 1341 compliant content-type (with optional charset, defaulting to UTF-8)', 'type': 'string'}}, 'oneOf': [{'additionalProperties': False, 'required': ['file'], 'properties': {'content-type': True, 'file': {'title': 'README file path', 'type': 'string'}}}, {'additionalProperties': False, 'required': ['text'], 'properties': {'content-type': True, 'text': {'title': 'README text', 'type': 'string'}}}]}, rule='type')
+                    data__readme_one_of_count2 = 0
+                    if data__readme_one_of_count2 < 2:
+                        try:
+                            data__readme_is_dict = isinstance(data__readme, dict)
+                            if data__readme_is_dict:
+                                data__readme__missing_keys = set(['file']) - data__readme.keys()
+                                if data__readme__missing_keys:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".readme must contain " + (str(sorted(data__readme__missing_keys)) + " properties"), value=data__readme, name="" + (name_prefix or "data") + ".readme", definition={'additionalProperties': False, 'required': ['file'], 'properties': {'content-type': True, 'file': {'title': 'README file path', 'type': 'string'}}}, rule='required')
+                                data__readme_keys = set(data__readme.keys())
+                                if "content-type" in data__readme_keys:
+                                    data__readme_keys.remove("content-type")
+                                    data__readme__contenttype = data__readme["content-type"]
+                                    pass
+                                if "file" in data__readme_keys:
+                                    data__readme_keys.remove("file")
+                                    data__readme__file = data__readme["file"]
+                                    if not isinstance(data__readme__file, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".readme.file must be string", value=data__readme__file, name="" + (name_prefix or "data") + ".readme.file", definition={'title': 'README file path', 'type': 'string'}, rule='type')
+                                if data__readme_keys:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".readme must not contain "+str(data__readme_keys)+" properties", value=data__readme, name="" + (name_prefix or "data") + ".readme", definition={'additionalProperties': False, 'required': ['file'], 'properties': {'content-type': True, 'file': {'title': 'README file path', 'type': 'string'}}}, rule='additionalProperties')
+                            data__readme_one_of_count2 += 1
+                        except JsonSchemaValueException: pass
+                    if data__readme_one_of_count2 < 2:
+                        try:
+                            data__readme_is_dict = isinstance(data__readme, dict)
+                            if data__readme_is_dict:
+                                data__readme__missing_keys = set(['text']) - data__readme.keys()
+                                if data__readme__missing_keys:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".readme must contain " + (str(sorted(data__readme__missing_keys)) + " properties"), value=data__readme, name="" + (name_prefix or "data") + ".readme", definition={'additionalProperties': False, 'required': ['text'], 'properties': {'content-type': True, 'text': {'title': 'README text', 'type': 'string'}}}, rule='required')
+                                data__readme_keys = set(data__readme.keys())
+                                if "content-type" in data__readme_keys:
+                                    data__readme_keys.remove("content-type")
+                                    data__readme__contenttype = data__readme["content-type"]
+                                    pass
+                                if "text" in data__readme_keys:
+                                    data__readme_keys.remove("text")
+                                    data__readme__text = data__readme["text"]
+                                    if not isinstance(data__readme__text, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".readme.text must be string", value=data__readme__text, name="" + (name_prefix or "data") + ".readme.text", definition={'title': 'README text', 'type': 'string'}, rule='type')
+                                if data__readme_keys:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".readme must not contain "+str(data__readme_keys)+" properties", value=data__readme, name="" + (name_prefix or "data") + ".readme", definition={'additionalProperties': False, 'required': ['text'], 'properties': {'content-type': True, 'text': {'title': 'README text', 'type': 'string'}}}, rule='additionalProperties')
+                            data__readme_one_of_count2 += 1
+                        except JsonSchemaValueException: pass
+                    if data__readme_one_of_count2 != 1:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".readme must be valid exactly by one definition" + (" (" + str(data__readme_one_of_count2) + " matches found)"), value=data__readme, name="" + (name_prefix or "data") + ".readme", definition={'type': 'object', 'required': ['content-type'], 'properties': {'content-type': {'title': 'README text content-type', 'description': 'RFC 1341 compliant content-type (with optional charset, defaulting to UTF-8)', 'type': 'string'}}, 'oneOf': [{'additionalProperties': False, 'required': ['file'], 'properties': {'content-type': True, 'file': {'title': 'README file path', 'type': 'string'}}}, {'additionalProperties': False, 'required': ['text'], 'properties': {'content-type': True, 'text': {'title': 'README text', 'type': 'string'}}}]}, rule='oneOf')
+                    data__readme_is_dict = isinstance(data__readme, dict)
+                    if data__readme_is_dict:
+                        data__readme__missing_keys = set(['content-type']) - data__readme.keys()
+                        if data__readme__missing_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".readme must contain " + (str(sorted(data__readme__missing_keys)) + " properties"), value=data__readme, name="" + (name_prefix or "data") + ".readme", definition={'type': 'object', 'required': ['content-type'], 'properties': {'content-type': {'title': 'README text content-type', 'description': 'RFC 1341 compliant content-type (with optional charset, defaulting to UTF-8)', 'type': 'string'}}, 'oneOf': [{'additionalProperties': False, 'required': ['file'], 'properties': {'content-type': True, 'file': {'title': 'README file path', 'type': 'string'}}}, {'additionalProperties': False, 'required': ['text'], 'properties': {'content-type': True, 'text': {'title': 'README text', 'type': 'string'}}}]}, rule='required')
+                        data__readme_keys = set(data__readme.keys())
+                        if "content-type" in data__readme_keys:
+                            data__readme_keys.remove("content-type")
+                            data__readme__contenttype = data__readme["content-type"]
+                            if not isinstance(data__readme__contenttype, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".readme.content-type must be string", value=data__readme__contenttype, name="" + (name_prefix or "data") + ".readme.content-type", definition={'title': 'README text content-type', 'description': 'RFC 1341 compliant content-type (with optional charset, defaulting to UTF-8)', 'type': 'string'}, rule='type')
+                    data__readme_one_of_count1 += 1
+                except JsonSchemaValueException: pass
+            if data__readme_one_of_count1 != 1:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".readme must be valid exactly by one definition" + (" (" + str(data__readme_one_of_count1) + " matches found)"), value=data__readme, name="" + (name_prefix or "data") + ".readme", definition={'title': 'Project full description', 'description': 'AKA the README', 'oneOf': [{'title': 'README file path', 'type': 'string'}, {'type': 'object', 'required': ['content-type'], 'properties': {'content-type': {'title': 'README text content-type', 'description': 'RFC 1341 compliant content-type (with optional charset, defaulting to UTF-8)', 'type': 'string'}}, 'oneOf': [{'additionalProperties': False, 'required': ['file'], 'properties': {'content-type': True, 'file': {'title': 'README file path', 'type': 'string'}}}, {'additionalProperties': False, 'required': ['text'], 'properties': {'content-type': True, 'text': {'title': 'README text', 'type': 'string'}}}]}], 'examples': ['README.md', {'file': 'README.txt', 'content-type': 'text/plain'}, {'text': '# Example project\n\nAn example project', 'content-type': 'text/markdown'}]}, rule='oneOf')
+        if "requires-python" in data_keys:
+            data_keys.remove("requires-python")
+            data__requirespython = data["requires-python"]
+            if not isinstance(data__requirespython, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".requires-python must be string", value=data__requirespython, name="" + (name_prefix or "data") + ".requires-python", definition={'title': 'Python version compatibility', 'type': 'string', 'examples': ['>= 3.7']}, rule='type')
+        if "license" in data_keys:
+            data_keys.remove("license")
+            data__license = data["license"]
+            data__license_one_of_count3 = 0
+            if data__license_one_of_count3 < 2:
+                try:
+                    if not isinstance(data__license, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".license must be object", value=data__license, name="" + (name_prefix or "data") + ".license", definition={'type': 'object', 'additionalProperties': False, 'required': ['file'], 'properties': {'file': {'title': 'License file path', 'type': 'string'}}}, rule='type')
+                    data__license_is_dict = isinstance(data__license, dict)
+                    if data__license_is_dict:
+                        data__license__missing_keys = set(['file']) - data__license.keys()
+                        if data__license__missing_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".license must contain " + (str(sorted(data__license__missing_keys)) + " properties"), value=data__license, name="" + (name_prefix or "data") + ".license", definition={'type': 'object', 'additionalProperties': False, 'required': ['file'], 'properties': {'file': {'title': 'License file path', 'type': 'string'}}}, rule='required')
+                        data__license_keys = set(data__license.keys())
+                        if "file" in data__license_keys:
+                            data__license_keys.remove("file")
+                            data__license__file = data__license["file"]
+                            if not isinstance(data__license__file, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".license.file must be string", value=data__license__file, name="" + (name_prefix or "data") + ".license.file", definition={'title': 'License file path', 'type': 'string'}, rule='type')
+                        if data__license_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".license must not contain "+str(data__license_keys)+" properties", value=data__license, name="" + (name_prefix or "data") + ".license", definition={'type': 'object', 'additionalProperties': False, 'required': ['file'], 'properties': {'file': {'title': 'License file path', 'type': 'string'}}}, rule='additionalProperties')
+                    data__license_one_of_count3 += 1
+                except JsonSchemaValueException: pass
+            if data__license_one_of_count3 < 2:
+                try:
+                    if not isinstance(data__license, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".license must be object", value=data__license, name="" + (name_prefix or "data") + ".license", definition={'type': 'object', 'additionalProperties': False, 'required': ['text'], 'properties': {'text': {'title': 'License text', 'type': 'string'}}}, rule='type')
+                    data__license_is_dict = isinstance(data__license, dict)
+                    if data__license_is_dict:
+                        data__license__missing_keys = set(['text']) - data__license.keys()
+                        if data__license__missing_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".license must contain " + (str(sorted(data__license__missing_keys)) + " properties"), value=data__license, name="" + (name_prefix or "data") + ".license", definition={'type': 'object', 'additionalProperties': False, 'required': ['text'], 'properties': {'text': {'title': 'License text', 'type': 'string'}}}, rule='required')
+                        data__license_keys = set(data__license.keys())
+                        if "text" in data__license_keys:
+                            data__license_keys.remove("text")
+                            data__license__text = data__license["text"]
+                            if not isinstance(data__license__text, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".license.text must be string", value=data__license__text, name="" + (name_prefix or "data") + ".license.text", definition={'title': 'License text', 'type': 'string'}, rule='type')
+                        if data__license_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".license must not contain "+str(data__license_keys)+" properties", value=data__license, name="" + (name_prefix or "data") + ".license", definition={'type': 'object', 'additionalProperties': False, 'required': ['text'], 'properties': {'text': {'title': 'License text', 'type': 'string'}}}, rule='additionalProperties')
+                    data__license_one_of_count3 += 1
+                except JsonSchemaValueException: pass
+            if data__license_one_of_count3 < 2:
+                try:
+                    if not isinstance(data__license, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".license must be string", value=data__license, name="" + (name_prefix or "data") + ".license", definition={'type': 'string', 'description': 'A SPDX license identifier'}, rule='type')
+                    data__license_one_of_count3 += 1
+                except JsonSchemaValueException: pass
+            if data__license_one_of_count3 != 1:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".license must be valid exactly by one definition" + (" (" + str(data__license_one_of_count3) + " matches found)"), value=data__license, name="" + (name_prefix or "data") + ".license", definition={'title': 'Project license', 'oneOf': [{'type': 'object', 'additionalProperties': False, 'required': ['file'], 'properties': {'file': {'title': 'License file path', 'type': 'string'}}}, {'type': 'object', 'additionalProperties': False, 'required': ['text'], 'properties': {'text': {'title': 'License text', 'type': 'string'}}}, {'type': 'string', 'description': 'A SPDX license identifier'}], 'examples': [{'text': 'MIT'}, {'file': 'LICENSE'}, 'MIT', 'BSD-2-Clause OR Apache-2.0', 'LicenseRef-Proprietary']}, rule='oneOf')
+        if "license-files" in data_keys:
+            data_keys.remove("license-files")
+            data__licensefiles = data["license-files"]
+            if not isinstance(data__licensefiles, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".license-files must be array", value=data__licensefiles, name="" + (name_prefix or "data") + ".license-files", definition={'title': 'License files', 'description': 'Relative paths or globs to paths of license files. Can be an empty list.', 'type': 'array', 'items': {'type': 'string'}}, rule='type')
+            data__licensefiles_is_list = isinstance(data__licensefiles, (list, tuple))
+            if data__licensefiles_is_list:
+                data__licensefiles_len = len(data__licensefiles)
+                for data__licensefiles_x, data__licensefiles_item in enumerate(data__licensefiles):
+                    if not isinstance(data__licensefiles_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".license-files[{data__licensefiles_x}]".format(**locals()) + " must be string", value=data__licensefiles_item, name="" + (name_prefix or "data") + ".license-files[{data__licensefiles_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "authors" in data_keys:
+            data_keys.remove("authors")
+            data__authors = data["authors"]
+            if not isinstance(data__authors, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".authors must be array", value=data__authors, name="" + (name_prefix or "data") + ".authors", definition={'title': 'Project authors', 'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'anyOf': [{'required': ['name'], 'properties': {'name': True}}, {'required': ['email'], 'properties': {'email': True}}], 'properties': {'name': {'title': 'Author name', 'type': 'string'}, 'email': {'title': 'Author email', 'type': 'string', 'format': 'email'}}}}, rule='type')
+            data__authors_is_list = isinstance(data__authors, (list, tuple))
+            if data__authors_is_list:
+                data__authors_len = len(data__authors)
+                for data__authors_x, data__authors_item in enumerate(data__authors):
+                    validate___definitions_projectauthor(data__authors_item, custom_formats, (name_prefix or "data") + ".authors[{data__authors_x}]".format(**locals()))
+        if "maintainers" in data_keys:
+            data_keys.remove("maintainers")
+            data__maintainers = data["maintainers"]
+            if not isinstance(data__maintainers, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".maintainers must be array", value=data__maintainers, name="" + (name_prefix or "data") + ".maintainers", definition={'title': 'Project maintainers', 'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'anyOf': [{'required': ['name'], 'properties': {'name': True}}, {'required': ['email'], 'properties': {'email': True}}], 'properties': {'name': {'title': 'Author name', 'type': 'string'}, 'email': {'title': 'Author email', 'type': 'string', 'format': 'email'}}}}, rule='type')
+            data__maintainers_is_list = isinstance(data__maintainers, (list, tuple))
+            if data__maintainers_is_list:
+                data__maintainers_len = len(data__maintainers)
+                for data__maintainers_x, data__maintainers_item in enumerate(data__maintainers):
+                    validate___definitions_projectauthor(data__maintainers_item, custom_formats, (name_prefix or "data") + ".maintainers[{data__maintainers_x}]".format(**locals()))
+        if "keywords" in data_keys:
+            data_keys.remove("keywords")
+            data__keywords = data["keywords"]
+            if not isinstance(data__keywords, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".keywords must be array", value=data__keywords, name="" + (name_prefix or "data") + ".keywords", definition={'title': 'Project keywords', 'type': 'array', 'items': {'type': 'string'}}, rule='type')
+            data__keywords_is_list = isinstance(data__keywords, (list, tuple))
+            if data__keywords_is_list:
+                data__keywords_len = len(data__keywords)
+                for data__keywords_x, data__keywords_item in enumerate(data__keywords):
+                    if not isinstance(data__keywords_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".keywords[{data__keywords_x}]".format(**locals()) + " must be string", value=data__keywords_item, name="" + (name_prefix or "data") + ".keywords[{data__keywords_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "classifiers" in data_keys:
+            data_keys.remove("classifiers")
+            data__classifiers = data["classifiers"]
+            if not isinstance(data__classifiers, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".classifiers must be array", value=data__classifiers, name="" + (name_prefix or "data") + ".classifiers", definition={'title': 'Applicable Trove classifiers', 'type': 'array', 'items': {'type': 'string'}}, rule='type')
+            data__classifiers_is_list = isinstance(data__classifiers, (list, tuple))
+            if data__classifiers_is_list:
+                data__classifiers_len = len(data__classifiers)
+                for data__classifiers_x, data__classifiers_item in enumerate(data__classifiers):
+                    if not isinstance(data__classifiers_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".classifiers[{data__classifiers_x}]".format(**locals()) + " must be string", value=data__classifiers_item, name="" + (name_prefix or "data") + ".classifiers[{data__classifiers_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "urls" in data_keys:
+            data_keys.remove("urls")
+            data__urls = data["urls"]
+            if not isinstance(data__urls, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".urls must be object", value=data__urls, name="" + (name_prefix or "data") + ".urls", definition={'title': 'Project URLs', 'type': 'object', 'additionalProperties': {'type': 'string', 'format': 'uri'}, 'examples': [{'homepage': 'https://example.com/example-project'}]}, rule='type')
+            data__urls_is_dict = isinstance(data__urls, dict)
+            if data__urls_is_dict:
+                data__urls_keys = set(data__urls.keys())
+                for data__urls_key in data__urls_keys:
+                    if data__urls_key not in []:
+                        data__urls_value = data__urls.get(data__urls_key)
+                        if not isinstance(data__urls_value, (str)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".urls.{data__urls_key}".format(**locals()) + " must be string", value=data__urls_value, name="" + (name_prefix or "data") + ".urls.{data__urls_key}".format(**locals()) + "", definition={'type': 'string', 'format': 'uri'}, rule='type')
+                        if isinstance(data__urls_value, str):
+                            if not REGEX_PATTERNS["uri_re_pattern"].match(data__urls_value):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".urls.{data__urls_key}".format(**locals()) + " must be uri", value=data__urls_value, name="" + (name_prefix or "data") + ".urls.{data__urls_key}".format(**locals()) + "", definition={'type': 'string', 'format': 'uri'}, rule='format')
+        if "scripts" in data_keys:
+            data_keys.remove("scripts")
+            data__scripts = data["scripts"]
+            if not isinstance(data__scripts, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".scripts must be object", value=data__scripts, name="" + (name_prefix or "data") + ".scripts", definition={'title': 'Console scripts', 'type': 'object', 'additionalProperties': {'type': 'string'}, 'examples': [{'mycmd': 'package.module:object.function'}]}, rule='type')
+            data__scripts_is_dict = isinstance(data__scripts, dict)
+            if data__scripts_is_dict:
+                data__scripts_keys = set(data__scripts.keys())
+                for data__scripts_key in data__scripts_keys:
+                    if data__scripts_key not in []:
+                        data__scripts_value = data__scripts.get(data__scripts_key)
+                        if not isinstance(data__scripts_value, (str)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".scripts.{data__scripts_key}".format(**locals()) + " must be string", value=data__scripts_value, name="" + (name_prefix or "data") + ".scripts.{data__scripts_key}".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "gui-scripts" in data_keys:
+            data_keys.remove("gui-scripts")
+            data__guiscripts = data["gui-scripts"]
+            if not isinstance(data__guiscripts, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".gui-scripts must be object", value=data__guiscripts, name="" + (name_prefix or "data") + ".gui-scripts", definition={'title': 'GUI scripts', 'type': 'object', 'additionalProperties': {'type': 'string'}, 'examples': [{'mycmd': 'package.module:object.function'}]}, rule='type')
+            data__guiscripts_is_dict = isinstance(data__guiscripts, dict)
+            if data__guiscripts_is_dict:
+                data__guiscripts_keys = set(data__guiscripts.keys())
+                for data__guiscripts_key in data__guiscripts_keys:
+                    if data__guiscripts_key not in []:
+                        data__guiscripts_value = data__guiscripts.get(data__guiscripts_key)
+                        if not isinstance(data__guiscripts_value, (str)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".gui-scripts.{data__guiscripts_key}".format(**locals()) + " must be string", value=data__guiscripts_value, name="" + (name_prefix or "data") + ".gui-scripts.{data__guiscripts_key}".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "entry-points" in data_keys:
+            data_keys.remove("entry-points")
+            data__entrypoints = data["entry-points"]
+            if not isinstance(data__entrypoints, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".entry-points must be object", value=data__entrypoints, name="" + (name_prefix or "data") + ".entry-points", definition={'title': 'Other entry-point groups', 'type': 'object', 'additionalProperties': False, 'patternProperties': {'^\\w+(\\.\\w+)*$': {'type': 'object', 'additionalProperties': {'type': 'string'}}}, 'propertyNames': {'not': {'anyOf': [{'const': 'console_scripts'}, {'const': 'gui_scripts'}]}}, 'examples': [{'pygments.styles': {'monokai': 'package.module:object.attribute'}}]}, rule='type')
+            data__entrypoints_is_dict = isinstance(data__entrypoints, dict)
+            if data__entrypoints_is_dict:
+                data__entrypoints_keys = set(data__entrypoints.keys())
+                for data__entrypoints_key, data__entrypoints_val in data__entrypoints.items():
+                    if REGEX_PATTERNS['^\\w+(\\.\\w+)*$'].search(data__entrypoints_key):
+                        if data__entrypoints_key in data__entrypoints_keys:
+                            data__entrypoints_keys.remove(data__entrypoints_key)
+                        if not isinstance(data__entrypoints_val, (dict)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".entry-points.{data__entrypoints_key}".format(**locals()) + " must be object", value=data__entrypoints_val, name="" + (name_prefix or "data") + ".entry-points.{data__entrypoints_key}".format(**locals()) + "", definition={'type': 'object', 'additionalProperties': {'type': 'string'}}, rule='type')
+                        data__entrypoints_val_is_dict = isinstance(data__entrypoints_val, dict)
+                        if data__entrypoints_val_is_dict:
+                            data__entrypoints_val_keys = set(data__entrypoints_val.keys())
+                            for data__entrypoints_val_key in data__entrypoints_val_keys:
+                                if data__entrypoints_val_key not in []:
+                                    data__entrypoints_val_value = data__entrypoints_val.get(data__entrypoints_val_key)
+                                    if not isinstance(data__entrypoints_val_value, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".entry-points.{data__entrypoints_key}.{data__entrypoints_val_key}".format(**locals()) + " must be string", value=data__entrypoints_val_value, name="" + (name_prefix or "data") + ".entry-points.{data__entrypoints_key}.{data__entrypoints_val_key}".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if data__entrypoints_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".entry-points must not contain "+str(data__entrypoints_keys)+" properties", value=data__entrypoints, name="" + (name_prefix or "data") + ".entry-points", definition={'title': 'Other entry-point groups', 'type': 'object', 'additionalProperties': False, 'patternProperties': {'^\\w+(\\.\\w+)*$': {'type': 'object', 'additionalProperties': {'type': 'string'}}}, 'propertyNames': {'not': {'anyOf': [{'const': 'console_scripts'}, {'const': 'gui_scripts'}]}}, 'examples': [{'pygments.styles': {'monokai': 'package.module:object.attribute'}}]}, rule='additionalProperties')
+                data__entrypoints_len = len(data__entrypoints)
+                if data__entrypoints_len != 0:
+                    data__entrypoints_property_names = True
+                    for data__entrypoints_key in data__entrypoints:
+                        try:
+                            try:
+                                data__entrypoints_key_any_of_count4 = 0
+                                if not data__entrypoints_key_any_of_count4:
+                                    try:
+                                        if data__entrypoints_key != "console_scripts":
+                                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".entry-points must be same as const definition: console_scripts", value=data__entrypoints_key, name="" + (name_prefix or "data") + ".entry-points", definition={'const': 'console_scripts'}, rule='const')
+                                        data__entrypoints_key_any_of_count4 += 1
+                                    except JsonSchemaValueException: pass
+                                if not data__entrypoints_key_any_of_count4:
+                                    try:
+                                        if data__entrypoints_key != "gui_scripts":
+                                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".entry-points must be same as const definition: gui_scripts", value=data__entrypoints_key, name="" + (name_prefix or "data") + ".entry-points", definition={'const': 'gui_scripts'}, rule='const')
+                                        data__entrypoints_key_any_of_count4 += 1
+                                    except JsonSchemaValueException: pass
+                                if not data__entrypoints_key_any_of_count4:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".entry-points cannot be validated by any definition", value=data__entrypoints_key, name="" + (name_prefix or "data") + ".entry-points", definition={'anyOf': [{'const': 'console_scripts'}, {'const': 'gui_scripts'}]}, rule='anyOf')
+                            except JsonSchemaValueException: pass
+                            else:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".entry-points must NOT match a disallowed definition", value=data__entrypoints_key, name="" + (name_prefix or "data") + ".entry-points", definition={'not': {'anyOf': [{'const': 'console_scripts'}, {'const': 'gui_scripts'}]}}, rule='not')
+                        except JsonSchemaValueException:
+                            data__entrypoints_property_names = False
+                    if not data__entrypoints_property_names:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".entry-points must be named by propertyName definition", value=data__entrypoints, name="" + (name_prefix or "data") + ".entry-points", definition={'title': 'Other entry-point groups', 'type': 'object', 'additionalProperties': False, 'patternProperties': {'^\\w+(\\.\\w+)*$': {'type': 'object', 'additionalProperties': {'type': 'string'}}}, 'propertyNames': {'not': {'anyOf': [{'const': 'console_scripts'}, {'const': 'gui_scripts'}]}}, 'examples': [{'pygments.styles': {'monokai': 'package.module:object.attribute'}}]}, rule='propertyNames')
+        if "dependencies" in data_keys:
+            data_keys.remove("dependencies")
+            data__dependencies = data["dependencies"]
+            if not isinstance(data__dependencies, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".dependencies must be array", value=data__dependencies, name="" + (name_prefix or "data") + ".dependencies", definition={'title': 'Project dependency requirements', 'type': 'array', 'items': {'type': 'string'}, 'examples': [['attrs', 'requests ~= 2.28']]}, rule='type')
+            data__dependencies_is_list = isinstance(data__dependencies, (list, tuple))
+            if data__dependencies_is_list:
+                data__dependencies_len = len(data__dependencies)
+                for data__dependencies_x, data__dependencies_item in enumerate(data__dependencies):
+                    if not isinstance(data__dependencies_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".dependencies[{data__dependencies_x}]".format(**locals()) + " must be string", value=data__dependencies_item, name="" + (name_prefix or "data") + ".dependencies[{data__dependencies_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "optional-dependencies" in data_keys:
+            data_keys.remove("optional-dependencies")
+            data__optionaldependencies = data["optional-dependencies"]
+            if not isinstance(data__optionaldependencies, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".optional-dependencies must be object", value=data__optionaldependencies, name="" + (name_prefix or "data") + ".optional-dependencies", definition={'title': 'Project extra dependency requirements', 'description': 'keys are extra names', 'type': 'object', 'patternProperties': {'^([a-z\\d]|[a-z\\d]([a-z\\d-](?!--))*[a-z\\d])$': {'type': 'array', 'items': {'type': 'string'}}}, 'examples': [{'typing': ['boto3-stubs', 'typing-extensions ~= 4.1']}]}, rule='type')
+            data__optionaldependencies_is_dict = isinstance(data__optionaldependencies, dict)
+            if data__optionaldependencies_is_dict:
+                data__optionaldependencies_keys = set(data__optionaldependencies.keys())
+                for data__optionaldependencies_key, data__optionaldependencies_val in data__optionaldependencies.items():
+                    if REGEX_PATTERNS['^([a-z\\d]|[a-z\\d]([a-z\\d-](?!--))*[a-z\\d])$'].search(data__optionaldependencies_key):
+                        if data__optionaldependencies_key in data__optionaldependencies_keys:
+                            data__optionaldependencies_keys.remove(data__optionaldependencies_key)
+                        if not isinstance(data__optionaldependencies_val, (list, tuple)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".optional-dependencies.{data__optionaldependencies_key}".format(**locals()) + " must be array", value=data__optionaldependencies_val, name="" + (name_prefix or "data") + ".optional-dependencies.{data__optionaldependencies_key}".format(**locals()) + "", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                        data__optionaldependencies_val_is_list = isinstance(data__optionaldependencies_val, (list, tuple))
+                        if data__optionaldependencies_val_is_list:
+                            data__optionaldependencies_val_len = len(data__optionaldependencies_val)
+                            for data__optionaldependencies_val_x, data__optionaldependencies_val_item in enumerate(data__optionaldependencies_val):
+                                if not isinstance(data__optionaldependencies_val_item, (str)):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".optional-dependencies.{data__optionaldependencies_key}[{data__optionaldependencies_val_x}]".format(**locals()) + " must be string", value=data__optionaldependencies_val_item, name="" + (name_prefix or "data") + ".optional-dependencies.{data__optionaldependencies_key}[{data__optionaldependencies_val_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "dynamic" in data_keys:
+            data_keys.remove("dynamic")
+            data__dynamic = data["dynamic"]
+            if not isinstance(data__dynamic, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".dynamic must be array", value=data__dynamic, name="" + (name_prefix or "data") + ".dynamic", definition={'title': 'Dynamic metadata values', 'type': 'array', 'items': {'type': 'string', 'enum': ['version', 'description', 'readme', 'requires-python', 'license', 'license-files', 'authors', 'maintainers', 'keywords', 'classifiers', 'urls', 'scripts', 'gui-scripts', 'entry-points', 'dependencies', 'optional-dependencies']}, 'examples': [['version']]}, rule='type')
+            data__dynamic_is_list = isinstance(data__dynamic, (list, tuple))
+            if data__dynamic_is_list:
+                data__dynamic_len = len(data__dynamic)
+                for data__dynamic_x, data__dynamic_item in enumerate(data__dynamic):
+                    if not isinstance(data__dynamic_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".dynamic[{data__dynamic_x}]".format(**locals()) + " must be string", value=data__dynamic_item, name="" + (name_prefix or "data") + ".dynamic[{data__dynamic_x}]".format(**locals()) + "", definition={'type': 'string', 'enum': ['version', 'description', 'readme', 'requires-python', 'license', 'license-files', 'authors', 'maintainers', 'keywords', 'classifiers', 'urls', 'scripts', 'gui-scripts', 'entry-points', 'dependencies', 'optional-dependencies']}, rule='type')
+                    if data__dynamic_item not in ['version', 'description', 'readme', 'requires-python', 'license', 'license-files', 'authors', 'maintainers', 'keywords', 'classifiers', 'urls', 'scripts', 'gui-scripts', 'entry-points', 'dependencies', 'optional-dependencies']:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".dynamic[{data__dynamic_x}]".format(**locals()) + " must be one of ['version', 'description', 'readme', 'requires-python', 'license', 'license-files', 'authors', 'maintainers', 'keywords', 'classifiers', 'urls', 'scripts', 'gui-scripts', 'entry-points', 'dependencies', 'optional-dependencies']", value=data__dynamic_item, name="" + (name_prefix or "data") + ".dynamic[{data__dynamic_x}]".format(**locals()) + "", definition={'type': 'string', 'enum': ['version', 'description', 'readme', 'requires-python', 'license', 'license-files', 'authors', 'maintainers', 'keywords', 'classifiers', 'urls', 'scripts', 'gui-scripts', 'entry-points', 'dependencies', 'optional-dependencies']}, rule='enum')
+    return data
+
+def validate___definitions_projectauthor(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'anyOf': [{'required': ['name'], 'properties': {'name': True}}, {'required': ['email'], 'properties': {'email': True}}], 'properties': {'name': {'title': 'Author name', 'type': 'string'}, 'email': {'title': 'Author email', 'type': 'string', 'format': 'email'}}}, rule='type')
+    data_any_of_count5 = 0
+    if not data_any_of_count5:
+        try:
+            data_is_dict = isinstance(data, dict)
+            if data_is_dict:
+                data__missing_keys = set(['name']) - data.keys()
+                if data__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'required': ['name'], 'properties': {'name': True}}, rule='required')
+                data_keys = set(data.keys())
+                if "name" in data_keys:
+                    data_keys.remove("name")
+                    data__name = data["name"]
+                    pass
+            data_any_of_count5 += 1
+        except JsonSchemaValueException: pass
+    if not data_any_of_count5:
+        try:
+            data_is_dict = isinstance(data, dict)
+            if data_is_dict:
+                data__missing_keys = set(['email']) - data.keys()
+                if data__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'required': ['email'], 'properties': {'email': True}}, rule='required')
+                data_keys = set(data.keys())
+                if "email" in data_keys:
+                    data_keys.remove("email")
+                    data__email = data["email"]
+                    pass
+            data_any_of_count5 += 1
+        except JsonSchemaValueException: pass
+    if not data_any_of_count5:
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " cannot be validated by any definition", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'anyOf': [{'required': ['name'], 'properties': {'name': True}}, {'required': ['email'], 'properties': {'email': True}}], 'properties': {'name': {'title': 'Author name', 'type': 'string'}, 'email': {'title': 'Author email', 'type': 'string', 'format': 'email'}}}, rule='anyOf')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'title': 'Author name', 'type': 'string'}, rule='type')
+        if "email" in data_keys:
+            data_keys.remove("email")
+            data__email = data["email"]
+            if not isinstance(data__email, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".email must be string", value=data__email, name="" + (name_prefix or "data") + ".email", definition={'title': 'Author email', 'type': 'string', 'format': 'email'}, rule='type')
+            if isinstance(data__email, str):
+                if not REGEX_PATTERNS["email_re_pattern"].match(data__email):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".email must be email", value=data__email, name="" + (name_prefix or "data") + ".email", definition={'title': 'Author email', 'type': 'string', 'format': 'email'}, rule='format')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'anyOf': [{'required': ['name'], 'properties': {'name': True}}, {'required': ['email'], 'properties': {'email': True}}], 'properties': {'name': {'title': 'Author name', 'type': 'string'}, 'email': {'title': 'Author email', 'type': 'string', 'format': 'email'}}}, rule='additionalProperties')
+    return data
\ No newline at end of file
@@ -7,6 +7,7 @@ from __future__ import annotations
 import logging
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Any
 
 from poetry.core.factory import Factory
@@ -14,9 +15,25 @@ from poetry.core.masonry.builders.sdist import SdistBuilder
 from poetry.core.masonry.builders.wheel import WheelBuilder
 
 
+if TYPE_CHECKING:
+    from poetry.core.poetry import Poetry
+
+
 log = logging.getLogger(__name__)
 
 
+def _create_poetry(config_settings: dict[str, Any] | None) -> Poetry:
+    cwd = Path().resolve()
+    # The "cache-dir" config setting also enables the BuildCache of WheelBuilder.
+    # Both caches use separate subdirectories of this directory.
+    if config_settings and (cache_dir := config_settings.get("cache-dir")):
+        from poetry.core.masonry.utils.project_cache import ProjectCache
+
+        return ProjectCache(Path(cache_dir)).create_poetry(cwd, with_groups=False)
+
+    return Factory().create_poetry(cwd, with_groups=False, lazy=True)
+
+
 def get_requires_for_build_wheel(
     config_settings: dict[str, Any] | None = None,
 ) -> list[str]:
@@ -39,7 +56,7 @@ get_requires_for_build_sdist = get_requires_for_build_wheel
 def prepare_metadata_for_build_wheel(
     metadata_directory: str, config_settings: dict[str, Any] | None = None
 ) -> str:
-    poetry = Factory().create_poetry(Path().resolve(), with_groups=False)
+    poetry = _create_poetry(config_settings)
     builder = WheelBuilder(poetry, config_settings=config_settings)
     metadata_path = Path(metadata_directory)
     dist_info = builder.prepare_metadata(metadata_path)
@@ -52,7 +69,7 @@ def build_wheel(
     metadata_directory: str | None = None,
 ) -> str:
     """Builds a wheel, places it in wheel_directory"""
-    poetry = Factory().create_poetry(Path().resolve(), with_groups=False)
+    poetry = _create_poetry(config_settings)
     metadata_path = None if metadata_directory is None else Path(metadata_directory)
 
     return WheelBuilder.make_in(
@@ -67,7 +84,7 @@ def build_sdist(
     sdist_directory: str, config_settings: dict[str, Any] | None = None
 ) -> str:
     """Builds an sdist, places it in sdist_directory"""
-    poetry = Factory().create_poetry(Path().resolve(), with_groups=False)
+    poetry = _create_poetry(config_settings)
 
     path = SdistBuilder(poetry, config_settings=config_settings).build(
         Path(sdist_directory)
@@ -81,7 +98,7 @@ def build_editable(
     config_settings: dict[str, Any] | None = None,
     metadata_directory: str | None = None,
 ) -> str:
-    poetry = Factory().create_poetry(Path().resolve(), with_groups=False)
+    poetry = _create_poetry(config_settings)
     metadata_path = None if metadata_directory is None else Path(metadata_directory)
 
     return WheelBuilder.make_in(
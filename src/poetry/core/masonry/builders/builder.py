@@ -11,7 +11,13 @@ from typing import Any
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from poetry.core.masonry.metadata import Metadata
+    from poetry.core.masonry.utils.exclusions import ExclusionTrie
     from poetry.core.masonry.utils.module import Module
+    from poetry.core.masonry.utils.project_tree import ProjectTree
     from poetry.core.poetry import Poetry
 
 
@@ -34,8 +40,6 @@ class Builder:
         executable: Path | None = None,
         config_settings: dict[str, Any] | None = None,
     ) -> None:
-        from poetry.core.masonry.metadata import Metadata
-
         if not poetry.is_package_mode:
             raise RuntimeError(
                 "Building a package is not possible in non-package mode."
@@ -48,9 +52,19 @@ class Builder:
 
         self._package = poetry.package
         self._path: Path = poetry.pyproject_path.parent
+        self._exclusions: ExclusionTrie | None = None
         self._excluded_files: set[str] | None = None
+        self._project_tree: ProjectTree | None = None
+        self._gitignore = self._get_gitignore_mode()
         self._executable = Path(executable or sys.executable)
-        self._meta = Metadata.from_package(self._package)
+
+    @cached_property
+    def _meta(self) -> Metadata:
+        # Only created on demand, e.g. it is not required
+        # for building a wheel from prepared metadata.
+        from poetry.core.masonry.metadata import Metadata
+
+        return Metadata.from_package(self._package)
 
     @cached_property
     def _module(self) -> Module:
@@ -74,6 +88,18 @@ class Builder:
             includes=includes,
         )
 
+    @property
+    def project_tree(self) -> ProjectTree:
+        """
+        Snapshot of the project's directory tree shared by all traversals.
+        """
+        if self._project_tree is None:
+            from poetry.core.masonry.utils.project_tree import ProjectTree
+
+            self._project_tree = ProjectTree()
+
+        return self._project_tree
+
     @property
     def executable(self) -> Path:
         return self._executable
@@ -89,43 +115,73 @@ class Builder:
                 local=local_version_label
             )
 
+    def _get_gitignore_mode(self) -> str:
+        gitignore = self._config_settings.get("gitignore", "git")
+        if gitignore not in {"git", "native"}:
+            raise ValueError(
+                f"Invalid value for config setting 'gitignore': {gitignore!r}"
+            )
+
+        return str(gitignore)
+
     def build(self, target_dir: Path | None) -> Path:
         raise NotImplementedError
 
-    def find_excluded_files(self, fmt: str | None = None) -> set[str]:
-        if self._excluded_files is None:
-            from poetry.core.vcs import get_vcs
+    def _get_vcs_ignored_files(self) -> list[str]:
+        if self._gitignore == "native":
+            from poetry.core.vcs import get_gitignore
+
+            try:
+                gitignore = get_gitignore(self._path)
+            except ValueError as e:
+                logger.debug(f"Falling back to git: {e}")
+            else:
+                if gitignore is None:
+                    return []
+
+                return gitignore.get_ignored_files(self._path, directories=True)
+
+        from poetry.core.vcs import get_vcs
+
+        vcs = get_vcs(self._path)
+        if vcs is None:
+            return []
+
+        return vcs.get_ignored_files(directories=True)
+
+    def find_exclusions(self, fmt: str | None = None) -> ExclusionTrie:
+        if self._exclusions is None:
+            from poetry.core.masonry.utils.exclusions import ExclusionTrie
+
+            exclusions = ExclusionTrie()
 
             # Checking VCS
-            vcs = get_vcs(self._path)
-            vcs_ignored_files = set(vcs.get_ignored_files()) if vcs else set()
-
-            def add_all_files(path: Path, target: set[str]) -> None:
-                all_files = (
-                    [f for f in path.glob("**/*") if f.is_file()]
-                    if path.is_dir()
-                    else [path]
-                )
-                target.update(f.relative_to(self._path).as_posix() for f in all_files)
+            for ignored in self._get_vcs_ignored_files():
+                exclusions.exclude(ignored)
 
-            explicitly_excluded: set[str] = set()
             for excluded_glob in self._package.exclude:
                 for excluded in self._path.glob(str(excluded_glob)):
-                    add_all_files(excluded, explicitly_excluded)
+                    exclusions.exclude(excluded.relative_to(self._path))
 
-            explicitly_included: set[str] = set()
             for inc in self._module.explicit_includes:
                 if fmt and fmt not in inc.formats:
                     continue
 
                 for included in inc.elements:
-                    add_all_files(included, explicitly_included)
+                    exclusions.include(included.relative_to(self._path))
+
+            for ignored in exclusions.excluded_paths():
+                logger.debug(f"Ignoring: {ignored}")
+
+            self._exclusions = exclusions
 
-            ignored = (vcs_ignored_files | explicitly_excluded) - explicitly_included
-            for ignored_file in ignored:
-                logger.debug(f"Ignoring: {ignored_file}")
+        return self._exclusions
 
-            self._excluded_files = ignored
+    def find_excluded_files(self, fmt: str | None = None) -> set[str]:
+        if self._excluded_files is None:
+            self._excluded_files = set(
+                self.find_exclusions(fmt).excluded_files(self._path)
+            )
 
         return self._excluded_files
 
@@ -135,30 +191,70 @@ class Builder:
         if "__pycache__" in exclude_path.parts or exclude_path.suffix == ".pyc":
             return True
 
-        while True:
-            if exclude_path.as_posix() in self.find_excluded_files(fmt=self.format):
-                return True
-
-            if len(exclude_path.parts) > 1:
-                exclude_path = exclude_path.parent
-            else:
-                break
+        return self.find_exclusions(fmt=self.format).is_excluded_parts(
+            exclude_path.parts
+        )
 
-        return False
+    def walk(
+        self, top: Path, follow_symlinks: bool = False
+    ) -> Iterator[tuple[Path, list[str], list[str]]]:
+        """
+        Walk a directory of the project like os.walk()
+        without descending into excluded directories.
+        """
+        exclusions = self.find_exclusions(fmt=self.format)
+        try:
+            top_parts: tuple[str, ...] | None = (
+                top.resolve().relative_to(self._path.resolve()).parts
+            )
+        except ValueError:
+            top_parts = None
+
+        for directory, dirnames, filenames in self.project_tree.walk(
+            top, follow_symlinks=follow_symlinks
+        ):
+            if top_parts is not None:
+                parts = (*top_parts, *directory.relative_to(top).parts)
+                dirnames[:] = [
+                    name
+                    for name in dirnames
+                    if name != "__pycache__"
+                    and not exclusions.is_pruned((*parts, name))
+                ]
+
+            yield directory, dirnames, filenames
+
+    def _find_files(self, top: Path, follow_symlinks: bool = False) -> Iterator[Path]:
+        for directory, _, filenames in self.walk(top, follow_symlinks=follow_symlinks):
+            for filename in filenames:
+                yield directory / filename
 
     def find_files_to_add(self, exclude_build: bool = True) -> set[BuildIncludeFile]:
         """
         Finds all files to add to the tarball
         """
         from poetry.core.masonry.utils.package_include import PackageInclude
+        from poetry.core.masonry.utils.project_tree import ProjectTree
 
         to_add = set()
 
+        # Files may have been generated by a build script,
+        # so the includes are refreshed and a new snapshot is taken.
+        self._project_tree = ProjectTree()
+
         for include in self._module.includes:
             include.refresh()
             formats = include.formats
 
-            for file in include.elements:
+            elements: Iterable[Path]
+            if isinstance(include, PackageInclude) and include.package_dir:
+                # Walk the package directory without descending
+                # into excluded directories.
+                elements = self._find_files(include.package_dir, follow_symlinks=True)
+            else:
+                elements = include.elements
+
+            for file in elements:
                 if "__pycache__" in file.parts:
                     # This is just a shortcut. It will be ignored later anyway.
                     continue
@@ -183,7 +279,7 @@ class Builder:
 
                 if file.is_dir():
                     if self.format in formats:
-                        for current_file in file.glob("**/*"):
+                        for current_file in self._find_files(file):
                             include_file = BuildIncludeFile(
                                 path=current_file,
                                 project_root=self._path,
@@ -191,11 +287,8 @@ class Builder:
                                 target_dir=target_dir,
                             )
 
-                            if not (
-                                current_file.is_dir()
-                                or self.is_excluded(
-                                    include_file.relative_to_project_root()
-                                )
+                            if not self.is_excluded(
+                                include_file.relative_to_project_root()
                             ):
                                 to_add.add(include_file)
                     continue
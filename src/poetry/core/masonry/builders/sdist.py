@@ -247,7 +247,7 @@ class SdistBuilder(Builder):
         if include.source is not None:
             pkgdir = str(include.base)
 
-        base = str(include.elements[0].parent)
+        base = str(include.package_dir or include.elements[0].parent)
 
         pkg_name = include.package
         pkg_data: dict[str, list[str]] = defaultdict(list)
@@ -268,19 +268,15 @@ class SdistBuilder(Builder):
             # Relative to the top-level package
             return pkg_name, Path(rel_path).as_posix()
 
-        for path, _dirnames, filenames in os.walk(base, topdown=True):
-            if Path(path).name == "__pycache__":
-                # This is just a shortcut. It will be ignored later anyway.
-                continue
-
-            from_top_level = Path(os.path.relpath(path, base)).as_posix()
+        for directory, _dirnames, filenames in self.walk(Path(base)):
+            from_top_level = Path(os.path.relpath(directory, base)).as_posix()
             if from_top_level == ".":
                 continue
 
             is_subpkg = any(
                 filename.endswith(".py") for filename in filenames
             ) and not all(
-                self.is_excluded(Path(path, filename).relative_to(self._path))
+                self.is_excluded((directory / filename).relative_to(self._path))
                 for filename in filenames
                 if filename.endswith(".py")
             )
@@ -292,9 +288,8 @@ class SdistBuilder(Builder):
                 pkg, from_nearest_pkg = find_nearest_pkg(from_top_level)
 
                 data_elements = [
-                    f.relative_to(self._path)
-                    for f in Path(path).glob("*")
-                    if not f.is_dir()
+                    (directory / filename).relative_to(self._path)
+                    for filename in filenames
                 ]
 
                 data = [e for e in data_elements if not self.is_excluded(e)]
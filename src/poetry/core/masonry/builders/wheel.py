@@ -14,10 +14,13 @@ import tempfile
 import zipfile
 
 from base64 import urlsafe_b64encode
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from functools import cached_property
+from io import BytesIO
 from io import StringIO
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import TextIO
@@ -28,16 +31,24 @@ from poetry.core import __version__
 from poetry.core.constraints.version import parse_constraint
 from poetry.core.masonry.builders.builder import Builder
 from poetry.core.masonry.builders.sdist import SdistBuilder
+from poetry.core.masonry.utils.build_cache import BuildCache
+from poetry.core.masonry.utils.build_cache import compress
+from poetry.core.masonry.utils.build_cache import compress_file
 from poetry.core.masonry.utils.helpers import distribution_name
 from poetry.core.masonry.utils.helpers import normalize_file_permissions
 from poetry.core.masonry.utils.package_include import PackageInclude
+from poetry.core.masonry.utils.project_tree import ProjectTree
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from collections.abc import Iterator
+    from concurrent.futures import Future
+    from typing import IO
 
     from packaging.utils import NormalizedName
 
+    from poetry.core.masonry.utils.build_cache import CompressedFile
     from poetry.core.poetry import Poetry
 
     ZipInfoTimestamp = tuple[int, int, int, int, int, int]
@@ -51,6 +62,8 @@ Tag: {tag}
 
 logger = logging.getLogger(__name__)
 
+COPY_BUFSIZE = 1024 * 64
+
 
 class WheelBuilder(Builder):
     format = "wheel"
@@ -72,6 +85,22 @@ class WheelBuilder(Builder):
             self._original_path = original.parent
         self._editable = editable
         self._metadata_directory = metadata_directory
+        self._jobs = self._get_jobs()
+        self._build_cache: BuildCache | None = None
+        if cache_dir := self._config_settings.get("cache-dir"):
+            self._build_cache = BuildCache(Path(cache_dir))
+
+    def _get_jobs(self) -> int:
+        jobs = self._config_settings.get("jobs", 1)
+        try:
+            jobs = int(jobs)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid value for config setting 'jobs': {jobs!r}")
+
+        if jobs < 0:
+            raise ValueError(f"Invalid value for config setting 'jobs': {jobs!r}")
+
+        return jobs or os.cpu_count() or 1
 
     @classmethod
     def make_in(
@@ -137,14 +166,15 @@ class WheelBuilder(Builder):
             self._copy_file_scripts(zip_file)
 
             if self._metadata_directory is None:
-                with TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
-                    metadata_directory = self.prepare_metadata(Path(temp_dir))
-                    self._copy_dist_info(zip_file, metadata_directory)
+                self._add_dist_info(zip_file)
             else:
                 self._copy_dist_info(zip_file, self._metadata_directory)
 
             self._write_record(zip_file)
 
+        if self._build_cache is not None:
+            self._build_cache.save()
+
         wheel_path = target_dir / self.wheel_filename
         if wheel_path.exists():
             wheel_path.unlink()
@@ -184,7 +214,13 @@ class WheelBuilder(Builder):
                 finally:
                     os.chdir(current_path)
             else:
-                with SdistBuilder(poetry=self._poetry).setup_py() as setup:
+                sdist_builder = SdistBuilder(
+                    poetry=self._poetry, config_settings=self._config_settings
+                )
+                # Share the snapshot of the project tree (if any)
+                # so that directories are not scanned again.
+                sdist_builder._project_tree = self._project_tree
+                with sdist_builder.setup_py() as setup:
                     # We need to place ourselves in the temporary
                     # directory in order to build the package
                     current_path = Path.cwd()
@@ -206,18 +242,22 @@ class WheelBuilder(Builder):
                         # builds, so we assume that it's okay
                         return
 
-                    for pkg in sorted(lib.glob("**/*")):
-                        if pkg.is_dir() or self.is_excluded(pkg):
+                    existing = set(wheel.namelist())
+                    to_add = []
+                    for pkg in sorted(ProjectTree().files(lib)):
+                        if self.is_excluded(pkg):
                             continue
 
                         rel_path = pkg.relative_to(lib)
 
-                        if rel_path.as_posix() in wheel.namelist():
+                        if rel_path.as_posix() in existing:
                             continue
 
                         logger.debug(f"Adding: {rel_path}")
 
-                        self._add_file(wheel, pkg, rel_path)
+                        to_add.append((pkg, rel_path))
+
+                    self._add_files(wheel, to_add)
 
     def _get_build_purelib_dir(self) -> Path:
         return self._path / "build" / "lib"
@@ -268,12 +308,13 @@ print(sysconfig.get_platform(), sys.implementation.cache_tag, sep='-')
     def _copy_file_scripts(self, wheel: zipfile.ZipFile) -> None:
         file_scripts = self.convert_script_files()
 
-        for abs_path in file_scripts:
-            self._add_file(
-                wheel,
-                abs_path,
-                Path(self.wheel_data_folder) / "scripts" / abs_path.name,
-            )
+        self._add_files(
+            wheel,
+            (
+                (abs_path, Path(self.wheel_data_folder) / "scripts" / abs_path.name)
+                for abs_path in file_scripts
+            ),
+        )
 
     def _run_build_command(self, setup: Path) -> None:
         if self._editable:
@@ -308,35 +349,89 @@ print(sysconfig.get_platform(), sys.implementation.cache_tag, sep='-')
 
         # Walk the files and compress them,
         # sorting everything so the order is stable.
-        for file in sorted(to_add, key=lambda x: x.path):
-            self._add_file(wheel, file.path, file.relative_to_target_root())
+        self._add_files(
+            wheel,
+            (
+                (file.path, file.relative_to_target_root())
+                for file in sorted(to_add, key=lambda x: x.path)
+            ),
+        )
 
     def prepare_metadata(self, metadata_directory: Path) -> Path:
         dist_info = metadata_directory / self.dist_info
         dist_info.mkdir(parents=True, exist_ok=True)
 
+        for rel_path, content in self._get_dist_info_files().items():
+            dest = dist_info / rel_path
+            if isinstance(content, Path):
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy(content, dest)
+            else:
+                with dest.open("w", encoding="utf-8", newline="\n") as f:
+                    f.write(content)
+
+        return dist_info
+
+    def _get_dist_info_files(self) -> dict[Path, str | Path]:
+        """
+        Return the files of the dist-info directory by their relative path.
+
+        Generated files are given by their content, legal files by their path.
+        """
+        files: dict[Path, str | Path] = {}
+
         if self._poetry.package.entry_points:
-            with (dist_info / "entry_points.txt").open(
-                "w", encoding="utf-8", newline="\n"
-            ) as f:
+            with StringIO() as f:
                 self._write_entry_points(f)
+                files[Path("entry_points.txt")] = f.getvalue()
 
-        with (dist_info / "WHEEL").open("w", encoding="utf-8", newline="\n") as f:
+        with StringIO() as f:
             self._write_wheel_file(f)
+            files[Path("WHEEL")] = f.getvalue()
 
-        with (dist_info / "METADATA").open("w", encoding="utf-8", newline="\n") as f:
+        with StringIO() as f:
             self._write_metadata_file(f)
+            files[Path("METADATA")] = f.getvalue()
 
         for legal_file in self._get_legal_files():
             if not legal_file.is_file():
                 logger.debug(f"Skipping: {legal_file.as_posix()}")
                 continue
 
-            dest = dist_info / "licenses" / legal_file.relative_to(self._path)
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy(legal_file, dest)
+            files[Path("licenses", legal_file.relative_to(self._path))] = legal_file
 
-        return dist_info
+        return files
+
+    def _add_dist_info(self, wheel: zipfile.ZipFile) -> None:
+        """
+        Add the dist-info directory without writing it to disk first.
+
+        The files are added in the same order and with the same attributes
+        as by _copy_dist_info() from a directory created by prepare_metadata().
+        """
+        dist_info = Path(self.dist_info)
+        files = self._get_dist_info_files()
+        # Consecutive legal files are added together,
+        # so that they can be compressed in parallel.
+        legal_files: list[tuple[Path, Path]] = []
+        for rel_path in sorted(files):
+            content = files[rel_path]
+            if isinstance(content, Path):
+                legal_files.append((content, dist_info / rel_path))
+                continue
+
+            if legal_files:
+                self._add_files(wheel, legal_files)
+                legal_files = []
+
+            # Same attributes as a file written by prepare_metadata()
+            with self._write_to_zip(
+                wheel, (dist_info / rel_path).as_posix(), stat.S_IFREG | 0o644
+            ) as f:
+                f.write(content)
+
+        if legal_files:
+            self._add_files(wheel, legal_files)
 
     def _write_record(self, wheel: zipfile.ZipFile) -> None:
         # Write a record of the files in the wheel
@@ -359,27 +454,30 @@ print(sysconfig.get_platform(), sys.implementation.cache_tag, sep='-')
 
     def _copy_dist_info(self, wheel: zipfile.ZipFile, source: Path) -> None:
         dist_info = Path(self.dist_info)
-        for file in sorted(source.glob("**/*")):
-            if not file.is_file():
-                continue
-
-            rel_path = file.relative_to(source)
-            target = dist_info / rel_path
-            self._add_file(wheel, file, target)
+        self._add_files(
+            wheel,
+            (
+                (file, dist_info / file.relative_to(source))
+                for file in sorted(source.glob("**/*"))
+                if file.is_file()
+            ),
+        )
 
     @property
     def dist_info(self) -> str:
-        return self.dist_info_name(self._package.name, self._meta.version)
+        return self.dist_info_name(
+            self._package.name, self._package.version.to_string()
+        )
 
     @property
     def wheel_data_folder(self) -> str:
         name = distribution_name(self._package.name)
-        return f"{name}-{self._meta.version}.data"
+        return f"{name}-{self._package.version.to_string()}.data"
 
     @property
     def wheel_filename(self) -> str:
         name = distribution_name(self._package.name)
-        version = self._meta.version
+        version = self._package.version.to_string()
         return f"{name}-{version}-{self.tag}.whl"
 
     def supports_python2(self) -> bool:
@@ -448,50 +546,131 @@ for t in packaging_tags.sys_tags():
             tag = (impl, "none", platform)
         return "-".join(tag)
 
+    def _add_files(
+        self,
+        wheel: zipfile.ZipFile,
+        files: Iterable[tuple[Path, Path]],
+    ) -> None:
+        """
+        Add files (given as pairs of full path and path in the wheel) in order.
+
+        If more than one job is configured, the files are read, hashed
+        and compressed in a thread pool. Only appending the compressed data
+        to the wheel is done serially so that the resulting wheel is identical
+        to one built with a single job.
+
+        If a build cache is configured, compressed data of unchanged files
+        is taken from the cache.
+
+        Both require adding compressed data to the wheel directly. If this is not
+        supported by zipfile, the files are added serially and without the cache.
+        """
+        if (
+            self._build_cache is None and self._jobs == 1
+        ) or not _supports_precompressed_data():
+            for full_path, rel_path in files:
+                self._add_file(wheel, full_path, rel_path)
+            return
+
+        compress = compress_file
+        if self._build_cache is not None:
+            compress = self._build_cache.get
+
+        if self._jobs == 1:
+            for full_path, rel_path in files:
+                self._add_compressed_file(
+                    wheel, full_path, rel_path, compress(full_path)
+                )
+            return
+
+        # Limit the number of pending files to bound memory usage.
+        max_pending = self._jobs * 2
+        with ThreadPoolExecutor(max_workers=self._jobs) as executor:
+            pending: deque[tuple[Path, Path, Future[CompressedFile]]] = deque()
+            for full_path, rel_path in files:
+                pending.append(
+                    (full_path, rel_path, executor.submit(compress, full_path))
+                )
+                if len(pending) >= max_pending:
+                    full_path, rel_path, future = pending.popleft()
+                    self._add_compressed_file(
+                        wheel, full_path, rel_path, future.result()
+                    )
+
+            while pending:
+                full_path, rel_path, future = pending.popleft()
+                self._add_compressed_file(wheel, full_path, rel_path, future.result())
+
     def _add_file(
         self,
         wheel: zipfile.ZipFile,
         full_path: Path,
         rel_path: Path,
     ) -> None:
-        # We always want to have /-separated paths in the zip file and in RECORD
-        rel_path_name = rel_path.as_posix()
-        zinfo = zipfile.ZipInfo(rel_path_name, self._zipfile_date_time)
-
-        # Normalize permission bits to either 755 (executable) or 644
-        st_mode = full_path.stat().st_mode
-        new_mode = normalize_file_permissions(st_mode)
-        zinfo.external_attr = (new_mode & 0xFFFF) << 16  # Unix attributes
-
-        if stat.S_ISDIR(st_mode):
-            zinfo.external_attr |= 0x10  # MS-DOS directory flag
+        zinfo = self._get_zip_info(full_path, rel_path)
 
+        # Stream the file into the wheel in chunks and compute the hash
+        # and the size on the way, so that the file is read only once
+        # and memory usage does not depend on the size of the file.
         hashsum = hashlib.sha256()
-        with full_path.open("rb") as src:
+        size = 0
+        with full_path.open("rb") as src, wheel.open(zinfo, mode="w") as dest:
             while True:
-                buf = src.read(1024 * 8)
+                buf = src.read(COPY_BUFSIZE)
                 if not buf:
                     break
                 hashsum.update(buf)
+                dest.write(buf)
+                size += len(buf)
 
-            src.seek(0)
-            wheel.writestr(zinfo, src.read(), compress_type=zipfile.ZIP_DEFLATED)
-
-        size = full_path.stat().st_size
         hash_digest = urlsafe_b64encode(hashsum.digest()).decode("ascii").rstrip("=")
 
-        self._records.append((rel_path_name, hash_digest, size))
+        self._records.append((zinfo.filename, hash_digest, size))
+
+    def _add_compressed_file(
+        self,
+        wheel: zipfile.ZipFile,
+        full_path: Path,
+        rel_path: Path,
+        compressed: CompressedFile,
+    ) -> None:
+        zinfo = self._get_zip_info(full_path, rel_path)
+        zinfo.file_size = compressed.size
+
+        with wheel.open(zinfo, mode="w") as dest:
+            _write_precompressed_data(dest, compressed)
+
+        self._records.append((zinfo.filename, compressed.hash_digest, compressed.size))
+
+    def _get_zip_info(self, full_path: Path, rel_path: Path) -> zipfile.ZipInfo:
+        # We always want to have /-separated paths in the zip file and in RECORD
+        zinfo = zipfile.ZipInfo(rel_path.as_posix(), self._zipfile_date_time)
+
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+
+        st = full_path.stat()
+        # Same as in ZipFile.writestr(), so that ZIP64 is used in the same cases.
+        zinfo.file_size = st.st_size
+
+        # Normalize permission bits to either 755 (executable) or 644
+        new_mode = normalize_file_permissions(st.st_mode)
+        zinfo.external_attr = (new_mode & 0xFFFF) << 16  # Unix attributes
+
+        if stat.S_ISDIR(st.st_mode):
+            zinfo.external_attr |= 0x10  # MS-DOS directory flag
+
+        return zinfo
 
     @contextlib.contextmanager
     def _write_to_zip(
-        self, wheel: zipfile.ZipFile, rel_path: str
+        self, wheel: zipfile.ZipFile, rel_path: str, mode: int = 0o644
     ) -> Iterator[StringIO]:
         sio = StringIO()
         yield sio
 
         date_time = self._zipfile_date_time
         zi = zipfile.ZipInfo(rel_path, date_time)
-        zi.external_attr = (0o644 & 0xFFFF) << 16  # Unix attributes
+        zi.external_attr = (mode & 0xFFFF) << 16  # Unix attributes
         b = sio.getvalue().encode("utf-8")
         hashsum = hashlib.sha256(b)
         hash_digest = urlsafe_b64encode(hashsum.digest()).decode("ascii").rstrip("=")
@@ -560,3 +739,67 @@ for t in packaging_tags.sys_tags():
         Write out metadata in the 2.x format (email like)
         """
         fp.write(self.get_metadata_content())
+
+
+class _PrecompressedData:
+    """
+    Stand-in for a zlib compressor that returns already compressed data.
+    """
+
+    def __init__(self, deflated: bytes) -> None:
+        self._deflated = deflated
+
+    def compress(self, data: bytes) -> bytes:
+        deflated, self._deflated = self._deflated, b""
+        return deflated
+
+    def flush(self) -> bytes:
+        return b""
+
+
+# The private attributes of the writers returned by ZipFile.open()
+# that are replaced by _write_precompressed_data().
+_ZIP_WRITER_ATTRIBUTES = ("_compressor", "_crc", "_file_size")
+
+
+def _write_precompressed_data(dest: IO[bytes], compressed: CompressedFile) -> None:
+    # The data has already been compressed so the compressor of the
+    # zip entry is replaced to just pass through the compressed data
+    # and the CRC and size of the uncompressed data are set directly.
+    dest._compressor = _PrecompressedData(  # type: ignore[attr-defined]
+        compressed.deflated
+    )
+    dest._crc = compressed.crc  # type: ignore[attr-defined]
+    dest._file_size = compressed.size  # type: ignore[attr-defined]
+    dest.write(b"")
+
+
+@cache
+def _supports_precompressed_data() -> bool:
+    """
+    Return whether compressed data can be added to zip files directly.
+
+    This relies on internals of zipfile, which may change between Python versions.
+    Thus, a small zip file is written and read back to check that it works.
+    """
+    data = b"poetry-core"
+    buffer = BytesIO()
+    try:
+        with zipfile.ZipFile(buffer, mode="w") as zf:
+            zinfo = zipfile.ZipInfo("check")
+            zinfo.compress_type = zipfile.ZIP_DEFLATED
+            with zf.open(zinfo, mode="w") as dest:
+                supported = all(hasattr(dest, a) for a in _ZIP_WRITER_ATTRIBUTES)
+                if supported:
+                    _write_precompressed_data(dest, compress(data))
+
+        if supported:
+            with zipfile.ZipFile(buffer) as zf:
+                supported = zf.read("check") == data
+    except Exception:
+        supported = False
+
+    if not supported:
+        logger.debug("Cannot add compressed data to zip files")
+
+    return supported
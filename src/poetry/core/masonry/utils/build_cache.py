@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+
+from base64 import urlsafe_b64encode
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 2
+
+# Entries of files that have not been built for this long are removed.
+MAX_ENTRY_AGE = 30 * 24 * 60 * 60
+# Objects that are not referenced by any entry are only removed after this
+# long, because they may belong to a concurrent build that did not save yet.
+OBJECT_GRACE_PERIOD = 60 * 60
+
+
+@dataclasses.dataclass(frozen=True)
+class CompressedFile:
+    """
+    A file compressed with the same parameters zipfile uses for ZIP_DEFLATED.
+    """
+
+    deflated: bytes
+    crc: int
+    size: int
+    hash_digest: str
+
+
+def compress(data: bytes) -> CompressedFile:
+    # hashlib and zlib release the GIL for large buffers,
+    # so this scales when being called from multiple threads.
+    hashsum = hashlib.sha256(data)
+    hash_digest = urlsafe_b64encode(hashsum.digest()).decode("ascii").rstrip("=")
+
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    deflated = compressor.compress(data) + compressor.flush()
+
+    return CompressedFile(deflated, zlib.crc32(data), len(data), hash_digest)
+
+
+def compress_file(path: Path) -> CompressedFile:
+    return compress(path.read_bytes())
+
+
+class BuildCache:
+    """
+    Content-addressed cache of compressed wheel members.
+
+    Compressed data is stored by the SHA-256 digest of the uncompressed data.
+    Files are looked up by their path, size, mtime and inode first, so that
+    unchanged files are neither read nor hashed. If any of those changed,
+    the file is hashed and only compressed if its content changed.
+
+    Several projects and concurrent builds can share a cache. When saving, the
+    entries used by the build are merged into the index on disk. Entries that
+    have not been used for MAX_ENTRY_AGE are removed, as well as objects that are
+    no longer referenced by any entry and older than OBJECT_GRACE_PERIOD.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._objects = path / "objects"
+        self._index_file = path / "index.json"
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+        self._used: dict[str, list[str | int]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path) -> CompressedFile:
+        key = str(path.resolve())
+        st = path.stat()
+        stat_key: list[str | int] = [st.st_size, st.st_mtime_ns, st.st_ino]
+
+        entry = self._index.get(key)
+        if entry is not None and entry[:3] == stat_key:
+            _, _, _, hex_digest, crc, _ = entry
+            assert isinstance(hex_digest, str)
+            assert isinstance(crc, int)
+            compressed = self._read_object(hex_digest, crc, st.st_size)
+            if compressed is not None:
+                self._use(key, [*stat_key, hex_digest, crc], hit=True)
+                return compressed
+
+        data = path.read_bytes()
+        hex_digest = hashlib.sha256(data).hexdigest()
+        crc = zlib.crc32(data)
+        compressed = self._read_object(hex_digest, crc, len(data))
+        if compressed is None:
+            compressed = compress(data)
+            self._write_object(hex_digest, compressed.deflated)
+            hit = False
+        else:
+            hit = True
+
+        self._use(key, [*stat_key, hex_digest, crc], hit=hit)
+
+        return compressed
+
+    def save(self) -> None:
+        now = int(time.time())
+        # Reload the index so that entries saved by other builds
+        # since this cache has been loaded are kept.
+        index = {
+            key: entry
+            for key, entry in self._load_index().items()
+            if now - int(entry[5]) < MAX_ENTRY_AGE
+        }
+        index.update(self._used)
+
+        self._path.mkdir(parents=True, exist_ok=True)
+        content = {
+            "version": CACHE_FORMAT_VERSION,
+            "zlib": zlib.ZLIB_RUNTIME_VERSION,
+            "files": index,
+        }
+        tmp_file = self._index_file.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_file.open("w", encoding="utf-8") as f:
+            json.dump(content, f)
+        tmp_file.replace(self._index_file)
+
+        self._remove_unused_objects({str(entry[3]) for entry in index.values()})
+
+        logger.debug(
+            f"Build cache: {self.hits} hits, {self.misses} misses,"
+            f" {len(self._used)} files"
+        )
+
+    def _load_index(self) -> dict[str, list[str | int]]:
+        try:
+            with self._index_file.open(encoding="utf-8") as f:
+                content = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        # Compressed data is only reusable if it was compressed
+        # with the same zlib version.
+        if (
+            not isinstance(content, dict)
+            or content.get("version") != CACHE_FORMAT_VERSION
+            or content.get("zlib") != zlib.ZLIB_RUNTIME_VERSION
+        ):
+            logger.debug("Discarding incompatible build cache")
+            return {}
+
+        files: dict[str, list[str | int]] = content.get("files", {})
+        return files
+
+    def _use(self, key: str, entry: list[str | int], hit: bool) -> None:
+        entry = [*entry, int(time.time())]
+        with self._lock:
+            self._used[key] = entry
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _remove_unused_objects(self, used_objects: set[str]) -> None:
+        if not self._objects.exists():
+            return
+
+        threshold = time.time() - OBJECT_GRACE_PERIOD
+        for obj in self._objects.iterdir():
+            if obj.name in used_objects:
+                continue
+            try:
+                if obj.stat().st_mtime < threshold:
+                    obj.unlink()
+            except OSError:
+                # removed by a concurrent build
+                pass
+
+    def _read_object(
+        self, hex_digest: str, crc: int, size: int
+    ) -> CompressedFile | None:
+        try:
+            deflated = (self._objects / hex_digest).read_bytes()
+        except OSError:
+            return None
+
+        digest = bytes.fromhex(hex_digest)
+        hash_digest = urlsafe_b64encode(digest).decode("ascii").rstrip("=")
+
+        return CompressedFile(deflated, crc, size, hash_digest)
+
+    def _write_object(self, hex_digest: str, deflated: bytes) -> None:
+        self._objects.mkdir(parents=True, exist_ok=True)
+        obj = self._objects / hex_digest
+        # Write to a temporary file first so that a concurrent or aborted
+        # build never leaves a truncated object behind.
+        tmp_file = obj.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_file.write_bytes(deflated)
+        tmp_file.replace(obj)
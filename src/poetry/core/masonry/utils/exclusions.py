@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Sequence
+
+
+class _Node:
+    __slots__ = ("children", "contains_included", "excluded", "included")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.excluded = False
+        self.included = False
+        # whether this node or one of its descendants is included
+        self.contains_included = False
+
+
+class ExclusionTrie:
+    """
+    Prefix trie of excluded and explicitly included paths.
+
+    Paths are relative to the project root and split into their components.
+    Marking a directory affects everything below it, so an excluded directory
+    is stored only once, no matter how many files it contains. A path is
+    excluded if it or one of its parents is excluded, unless it or one of
+    its parents is explicitly included.
+    """
+
+    def __init__(self) -> None:
+        self._root = _Node()
+
+    def exclude(self, path: str | Path) -> None:
+        self._node(path).excluded = True
+
+    def include(self, path: str | Path) -> None:
+        node = self._root
+        node.contains_included = True
+        for part in _parts(path):
+            node = node.children.setdefault(part, _Node())
+            node.contains_included = True
+
+        node.included = True
+
+    def is_excluded(self, path: str | Path) -> bool:
+        return self.is_excluded_parts(_parts(path))
+
+    def is_excluded_parts(self, parts: Sequence[str]) -> bool:
+        node = self._root
+        excluded = False
+        for part in parts:
+            child = node.children.get(part)
+            if child is None:
+                break
+
+            if child.included:
+                return False
+
+            excluded = excluded or child.excluded
+            node = child
+
+        return excluded
+
+    def is_pruned(self, parts: Sequence[str]) -> bool:
+        """
+        Whether the path and everything below it is excluded.
+
+        In contrast to is_excluded(), this is False for an excluded directory
+        if something below it is explicitly included. Directories for which
+        this is True do not have to be traversed.
+        """
+        node = self._root
+        excluded = False
+        for part in parts:
+            child = node.children.get(part)
+            if child is None:
+                return excluded
+
+            if child.included:
+                return False
+
+            excluded = excluded or child.excluded
+            node = child
+
+        return excluded and not node.contains_included
+
+    def excluded_paths(self) -> Iterator[str]:
+        """
+        Yield the excluded paths (files or directories) as posix strings.
+        """
+        stack: list[tuple[tuple[str, ...], _Node]] = [((), self._root)]
+        while stack:
+            parts, node = stack.pop()
+            if node.excluded:
+                yield "/".join(parts)
+
+            for name, child in node.children.items():
+                stack.append(((*parts, name), child))
+
+    def excluded_files(self, root: Path) -> Iterator[str]:
+        """
+        Yield all excluded files below root as posix strings relative to root.
+
+        Excluded paths that do not exist are yielded as they are.
+        """
+        for excluded in self.excluded_paths():
+            path = root / excluded
+            if not path.is_dir():
+                if self.is_excluded(excluded):
+                    yield excluded
+                continue
+
+            for file in path.glob("**/*"):
+                if not file.is_file():
+                    continue
+
+                rel_path = file.relative_to(root)
+                if self.is_excluded_parts(rel_path.parts):
+                    yield rel_path.as_posix()
+
+    def _node(self, path: str | Path) -> _Node:
+        node = self._root
+        for part in _parts(path):
+            node = node.children.setdefault(part, _Node())
+
+        return node
+
+
+def _parts(path: str | Path) -> Sequence[str]:
+    if isinstance(path, Path):
+        return path.parts
+
+    return [part for part in path.split("/") if part and part != "."]
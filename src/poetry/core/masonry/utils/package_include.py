@@ -23,6 +23,8 @@ class PackageInclude(Include):
         self._is_module = False
         self._source = source
         self._target = target
+        self._package_dir: Path | None = None
+        self._expanded = False
 
         if source is not None:
             base = base / source
@@ -34,6 +36,25 @@ class PackageInclude(Include):
     def package(self) -> str:
         return self._package
 
+    @property
+    def elements(self) -> list[Path]:
+        if self._package_dir is not None and not self._expanded:
+            self._elements = sorted(self._package_dir.glob("**/*"))
+            self._expanded = True
+
+        return self._elements
+
+    @property
+    def package_dir(self) -> Path | None:
+        """
+        The directory of the package if the include is a directory.
+
+        The elements of such an include (everything in the directory)
+        are only determined when they are accessed so that consumers can
+        traverse the directory themselves instead.
+        """
+        return self._package_dir
+
     @property
     def source(self) -> str | None:
         return self._source
@@ -65,6 +86,10 @@ class PackageInclude(Include):
     def has_modules(self) -> bool:
         # Packages no longer need an __init__.py in python3, but there must
         # at least be one .py file for it to be considered a package
+        if self._package_dir is not None and not self._expanded:
+            # Stop at the first module instead of expanding the whole directory.
+            return next(self._package_dir.glob("**/*.py"), None) is not None
+
         return any(element.suffix == ".py" for element in self.elements)
 
     def check_elements(self) -> PackageInclude:
@@ -73,6 +98,9 @@ class PackageInclude(Include):
                 f"{self._base / self._include} does not contain any element"
             )
 
+        self._package_dir = None
+        self._expanded = False
+
         root = self._elements[0]
         if len(self._elements) > 1:
             # Probably glob
@@ -85,7 +113,7 @@ class PackageInclude(Include):
         elif root.is_dir():
             # If it's a directory, we include everything inside it
             self._package = root.name
-            self._elements: list[Path] = sorted(root.glob("**/*"))
+            self._package_dir = root
 
             if not (self.is_stub_only() or self.has_modules()):
                 raise ValueError(f"{root.name} is not a package.")
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+from poetry.core import __version__
+from poetry.core.factory import Factory
+from poetry.core.packages.path_dependency import PathDependency
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from poetry.core.poetry import Poetry
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 2
+
+# The files that decide whether a directory dependency is a Python project.
+PROJECT_FILES = ("pyproject.toml", "setup.py", "setup.cfg")
+
+
+class ProjectCache:
+    """
+    On-disk cache of the Poetry instances created by Factory.create_poetry().
+
+    PEP 517 frontends usually call each hook in a separate process. With this
+    cache, only the first hook parses and validates pyproject.toml and the
+    dependencies. Subsequent hooks load the resulting Poetry instance instead.
+
+    There is one entry per project. It is only used if it has been created from
+    the same pyproject.toml by the same versions of poetry-core and Python,
+    and if the readmes and license files the project refers to did not change.
+    Path dependencies are validated when they are created, so the entry is
+    also discarded if a path dependency or its project files changed.
+
+    The entries are stored in the subdirectory "projects" of path. Thus, the
+    PEP 517 backend can use the same "cache-dir" config setting for this cache
+    and for the BuildCache of the wheel builder, which uses other subdirectories.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path / "projects"
+        self.hits = 0
+        self.misses = 0
+
+    def create_poetry(
+        self, cwd: Path | None = None, with_groups: bool = True
+    ) -> Poetry:
+        poetry_file = Factory.locate(cwd)
+        key = self._key(poetry_file, with_groups)
+        cache_file = self._path / f"{hashlib.sha256(key[0]).hexdigest()}.pickle"
+
+        cached = self._load(cache_file, key)
+        if cached is not None:
+            poetry, warnings = cached
+            for warning in warnings:
+                logger.warning(warning)
+            self.hits += 1
+            return poetry
+
+        factory = Factory()
+        poetry = factory.create_poetry(
+            poetry_file.parent, with_groups=with_groups, lazy=True
+        )
+        # Configure the dependencies so that they are stored, too.
+        _ = poetry.package.all_requires
+        self._save(cache_file, key, poetry, factory.warnings)
+        self.misses += 1
+
+        return poetry
+
+    def _key(self, poetry_file: Path, with_groups: bool) -> tuple[bytes, str]:
+        location = f"{poetry_file.resolve()}:{with_groups}".encode()
+        digest = hashlib.sha256(poetry_file.read_bytes())
+        digest.update(f"{__version__}:{sys.version}".encode())
+
+        return location, digest.hexdigest()
+
+    def _load(
+        self, cache_file: Path, key: tuple[bytes, str]
+    ) -> tuple[Poetry, list[str]] | None:
+        try:
+            with cache_file.open("rb") as f:
+                header = pickle.load(f)
+                if (
+                    not isinstance(header, dict)
+                    or header.get("version") != CACHE_FORMAT_VERSION
+                    or header.get("key") != key[1]
+                    or header.get("files") != self._file_digests(header["files"])
+                    or header.get("paths") != self._path_types(header["paths"])
+                ):
+                    logger.debug(f"Discarding outdated project cache {cache_file}")
+                    return None
+
+                poetry: Poetry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, KeyError):
+            return None
+
+        warnings: list[str] = header["warnings"]
+        return poetry, warnings
+
+    def _save(
+        self,
+        cache_file: Path,
+        key: tuple[bytes, str],
+        poetry: Poetry,
+        warnings: list[str],
+    ) -> None:
+        package = poetry.package
+        files = [str(readme) for readme in package.readmes]
+        if isinstance(package.license_files, Path):
+            assert package.root_dir is not None
+            files.append(str(package.root_dir / package.license_files))
+
+        paths = []
+        for dependency in package.all_requires:
+            if isinstance(dependency, PathDependency):
+                paths.append(str(dependency.full_path))
+                if dependency.is_directory():
+                    files.extend(
+                        str(dependency.full_path / name) for name in PROJECT_FILES
+                    )
+
+        header: dict[str, Any] = {
+            "version": CACHE_FORMAT_VERSION,
+            "key": key[1],
+            "files": self._file_digests(files),
+            "paths": self._path_types(paths),
+            "warnings": warnings,
+        }
+
+        self._path.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so that concurrent builds
+        # never read a truncated entry.
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_file.open("wb") as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(poetry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_file.replace(cache_file)
+
+    @staticmethod
+    def _file_digests(files: Iterable[str]) -> dict[str, str | None]:
+        digests: dict[str, str | None] = {}
+        for file in files:
+            try:
+                digests[file] = hashlib.sha256(Path(file).read_bytes()).hexdigest()
+            except OSError:
+                digests[file] = None
+
+        return digests
+
+    @staticmethod
+    def _path_types(paths: Iterable[str]) -> dict[str, str | None]:
+        types: dict[str, str | None] = {}
+        for path in paths:
+            if Path(path).is_dir():
+                types[path] = "directory"
+            elif Path(path).exists():
+                types[path] = "file"
+            else:
+                types[path] = None
+
+        return types
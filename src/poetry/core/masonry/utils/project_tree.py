@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import os
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+class _Listing:
+    __slots__ = ("dirnames", "filenames", "symlinked_dirnames")
+
+    def __init__(self, directory: Path) -> None:
+        self.dirnames: list[str] = []
+        self.filenames: list[str] = []
+        self.symlinked_dirnames: set[str] = set()
+
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    # DirEntry caches the result of stat,
+                    # which is usually available without an additional syscall.
+                    if entry.is_dir():
+                        self.dirnames.append(entry.name)
+                        if entry.is_symlink():
+                            self.symlinked_dirnames.add(entry.name)
+                    elif entry.is_file():
+                        self.filenames.append(entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+
+        self.dirnames.sort()
+        self.filenames.sort()
+
+
+class ProjectTree:
+    """
+    Cached snapshot of (parts of) a project's directory tree.
+
+    Each directory is scanned at most once with os.scandir(). Consumers share
+    the snapshot instead of doing their own traversals with a stat call per
+    entry. Like Path.glob("**/*") and os.walk(), symlinks to directories are
+    listed but not descended into by default.
+
+    A snapshot does not notice files that are created after a directory
+    has been scanned, so a new instance must be used after running
+    a build script.
+    """
+
+    def __init__(self) -> None:
+        self._listings: dict[Path, _Listing] = {}
+
+    def listdir(self, directory: Path) -> tuple[list[str], list[str]]:
+        """
+        Return the sorted names of the directories and files in directory.
+        """
+        listing = self._listing(directory)
+
+        return listing.dirnames, listing.filenames
+
+    def walk(
+        self, top: Path, follow_symlinks: bool = False
+    ) -> Iterator[tuple[Path, list[str], list[str]]]:
+        """
+        Walk the tree top-down like os.walk().
+
+        The caller may remove names from the yielded list of directory names
+        to prevent them from being visited. If follow_symlinks is True,
+        symlinks to directories are descended into, but each target only once.
+        """
+        visited_links: set[str] = set()
+        stack = [top]
+        while stack:
+            directory = stack.pop()
+            listing = self._listing(directory)
+            dirnames = list(listing.dirnames)
+            yield directory, dirnames, listing.filenames
+
+            for name in reversed(dirnames):
+                path = directory / name
+                if name in listing.symlinked_dirnames:
+                    if not follow_symlinks:
+                        continue
+
+                    target = os.path.realpath(path)
+                    if target in visited_links:
+                        continue
+                    visited_links.add(target)
+
+                stack.append(path)
+
+    def files(self, top: Path, follow_symlinks: bool = False) -> Iterator[Path]:
+        """
+        Yield all files below top.
+        """
+        for directory, _, filenames in self.walk(top, follow_symlinks=follow_symlinks):
+            for filename in filenames:
+                yield directory / filename
+
+    def _listing(self, directory: Path) -> _Listing:
+        listing = self._listings.get(directory)
+        if listing is None:
+            listing = self._listings[directory] = _Listing(directory)
+
+        return listing
@@ -17,6 +17,7 @@ from poetry.core.packages.specification import PackageSpecification
 from poetry.core.packages.utils.utils import contains_group_without_marker
 from poetry.core.packages.utils.utils import create_nested_marker
 from poetry.core.packages.utils.utils import normalize_python_version_markers
+from poetry.core.utils.cache import lru_cache
 from poetry.core.version.markers import parse_marker
 
 
@@ -30,6 +31,7 @@ if TYPE_CHECKING:
     from poetry.core.packages.directory_dependency import DirectoryDependency
     from poetry.core.packages.file_dependency import FileDependency
     from poetry.core.version.markers import BaseMarker
+    from poetry.core.version.requirements import Requirement
 
     T = TypeVar("T", bound="Dependency")
 
@@ -137,7 +139,6 @@ class Dependency(PackageSpecification):
     @marker.setter
     def marker(self, marker: str | BaseMarker) -> None:
         from poetry.core.constraints.version import parse_constraint
-        from poetry.core.packages.utils.utils import convert_markers
         from poetry.core.version.markers import BaseMarker
         from poetry.core.version.markers import parse_marker
 
@@ -146,36 +147,16 @@ class Dependency(PackageSpecification):
 
         self._marker = marker
 
-        markers = convert_markers(marker)
-
-        if "extra" in markers:
+        new_in_extras, self._python_versions = _get_marker_properties(marker)
+        if new_in_extras is not None:
             # If we have extras, the dependency is optional
             self.deactivate()
 
-            new_in_extras = []
-            for or_ in markers["extra"]:
-                for op, extra in or_:
-                    if op == "==":
-                        new_in_extras.append(canonicalize_name(extra))
-                    elif op == "" and ("||" in extra or "," in extra):
-                        sep = "||" if "||" in extra else ","
-                        extra_values = [e.strip() for e in extra.split(sep)]
-                        for _extra in extra_values:
-                            if not _extra.startswith("!="):
-                                new_in_extras.append(canonicalize_name(_extra))
             self._in_extras = [
                 *self._in_extras,
                 *(e for e in new_in_extras if e not in self._in_extras),
             ]
 
-        # Recalculate python versions.
-        self._python_versions = "*"
-        if not contains_group_without_marker(markers, "python_version"):
-            python_version_markers = markers["python_version"]
-            self._python_versions = normalize_python_version_markers(
-                python_version_markers
-            )
-
         self._python_constraint = parse_constraint(self._python_versions)
 
     @property
@@ -345,6 +326,18 @@ class Dependency(PackageSpecification):
         `relative_to` path is specified, this is used as the base directory if the
         identified dependency is of file or directory type.
         """
+        from poetry.core.version.requirements import parse_requirement
+
+        req = parse_requirement(_remove_comment(name))
+        return cls._create_from_requirement(req, relative_to, groups)
+
+    @classmethod
+    def _create_from_requirement(
+        cls,
+        req: Requirement,
+        relative_to: Path | None = None,
+        groups: Iterable[str] | None = None,
+    ) -> Dependency:
         from poetry.core.packages.url_dependency import URLDependency
         from poetry.core.packages.utils.link import Link
         from poetry.core.packages.utils.utils import cached_is_dir
@@ -357,17 +350,6 @@ class Dependency(PackageSpecification):
         from poetry.core.packages.vcs_dependency import VCSDependency
         from poetry.core.utils.patterns import wheel_file_re
         from poetry.core.vcs.git import ParsedUrl
-        from poetry.core.version.requirements import parse_requirement
-
-        # Removing comments
-        parts = name.split(" #", 1)
-        name = parts[0].strip()
-        if len(parts) > 1:
-            rest = parts[1]
-            if " ;" in rest:
-                name += " ;" + rest.split(" ;", 1)[1]
-
-        req = parse_requirement(name)
 
         name = req.name
         link = None
@@ -440,6 +422,7 @@ class Dependency(PackageSpecification):
                 )
             elif is_file_uri:
                 # handle RFC 8089 references
+                assert req.url is not None
                 path = url_to_path(req.url)
                 dep = _make_file_or_dir_dep(
                     name=name,
@@ -450,6 +433,7 @@ class Dependency(PackageSpecification):
                     groups=groups,
                 )
             else:
+                assert req.url is not None
                 with suppress(ValueError):
                     # this is a local path not using the file URI scheme
                     dep = _make_file_or_dir_dep(
@@ -475,6 +459,43 @@ class Dependency(PackageSpecification):
 
         return dep
 
+    @classmethod
+    def create_from_pep_508_batch(
+        cls,
+        names: Iterable[str],
+        relative_to: Path | None = None,
+        groups: Iterable[str] | None = None,
+    ) -> list[Dependency]:
+        """
+        Resolve many PEP-508 requirement strings (e.g. the "Requires-Dist" entries
+        of a distribution) to `Dependency` instances.
+
+        Identical requirement strings are only resolved once. Further, constraints
+        and markers are shared by all dependencies with the same constraint
+        or marker string.
+        """
+        from poetry.core.version.requirements import Requirement
+
+        if groups is not None:
+            groups = list(groups)
+
+        constraints: dict[str, VersionConstraint] = {}
+        markers: dict[str, BaseMarker] = {}
+        created: dict[str, Dependency] = {}
+        dependencies = []
+        for name in names:
+            dependency = created.get(name)
+            if dependency is None:
+                req = Requirement(_remove_comment(name), constraints, markers)
+                dependency = created[name] = cls._create_from_requirement(
+                    req, relative_to=relative_to, groups=groups
+                )
+                dependencies.append(dependency)
+            else:
+                dependencies.append(dependency.clone())
+
+        return dependencies
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Dependency):
             return NotImplemented
@@ -505,6 +526,52 @@ class Dependency(PackageSpecification):
         return f"<{self.__class__.__name__} {self}>"
 
 
+def _remove_comment(requirement: str) -> str:
+    parts = requirement.split(" #", 1)
+    requirement = parts[0].strip()
+    if len(parts) > 1:
+        rest = parts[1]
+        if " ;" in rest:
+            requirement += " ;" + rest.split(" ;", 1)[1]
+
+    return requirement
+
+
+@lru_cache(maxsize=2**12)
+def _get_marker_properties(
+    marker: BaseMarker,
+) -> tuple[tuple[NormalizedName, ...] | None, str]:
+    """
+    Return the extras (or None if the marker does not depend on extras)
+    and the python versions of a marker.
+    """
+    from poetry.core.packages.utils.utils import convert_markers
+
+    markers = convert_markers(marker)
+
+    in_extras: tuple[NormalizedName, ...] | None = None
+    if "extra" in markers:
+        new_in_extras = []
+        for or_ in markers["extra"]:
+            for op, extra in or_:
+                if op == "==":
+                    new_in_extras.append(canonicalize_name(extra))
+                elif op == "" and ("||" in extra or "," in extra):
+                    sep = "||" if "||" in extra else ","
+                    extra_values = [e.strip() for e in extra.split(sep)]
+                    for _extra in extra_values:
+                        if not _extra.startswith("!="):
+                            new_in_extras.append(canonicalize_name(_extra))
+        in_extras = tuple(new_in_extras)
+
+    python_versions = "*"
+    if not contains_group_without_marker(markers, "python_version"):
+        python_version_markers = markers["python_version"]
+        python_versions = normalize_python_version_markers(python_version_markers)
+
+    return in_extras, python_versions
+
+
 def _make_file_or_dir_dep(
     name: str,
     path: Path,
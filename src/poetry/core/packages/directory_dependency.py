@@ -3,6 +3,7 @@ from __future__ import annotations
 import functools
 
 from typing import TYPE_CHECKING
+from typing import Any
 
 from poetry.core.packages.path_dependency import PathDependency
 from poetry.core.packages.utils.utils import is_python_project
@@ -41,6 +42,16 @@ class DirectoryDependency(PathDependency):
         # cache this function to avoid multiple IO reads and parsing
         self.supports_poetry = functools.lru_cache(maxsize=1)(self._supports_poetry)
 
+    def __getstate__(self) -> dict[str, Any]:
+        # The cached bound method cannot be pickled.
+        state = self.__dict__.copy()
+        del state["supports_poetry"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.supports_poetry = functools.lru_cache(maxsize=1)(self._supports_poetry)
+
     @property
     def develop(self) -> bool:
         return self._develop
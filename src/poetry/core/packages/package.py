@@ -13,6 +13,7 @@ from poetry.core.constraints.version import parse_constraint
 from poetry.core.constraints.version.exceptions import ParseConstraintError
 from poetry.core.packages.dependency_group import MAIN_GROUP
 from poetry.core.packages.specification import PackageSpecification
+from poetry.core.utils.cache import lru_cache
 from poetry.core.utils.patterns import AUTHOR_REGEX
 from poetry.core.version.exceptions import InvalidVersionError
 
@@ -345,58 +346,25 @@ class Package(PackageSpecification):
 
     @property
     def all_classifiers(self) -> list[str]:
-        from poetry.core.constraints.version import Version
-
-        classifiers = list(self.classifiers)
-
         # Automatically set python classifiers
         if self.python_versions == "*":
             python_constraint = parse_constraint("~2.7 || ^3.4")
         else:
             python_constraint = self.python_constraint
 
-        python_classifier_prefix = "Programming Language :: Python"
-        python_classifiers = []
-
-        # we sort python versions by sorting an int tuple of (major, minor) version
-        # to ensure we sort 3.10 after 3.9
-        for version in sorted(
-            self.AVAILABLE_PYTHONS, key=lambda x: tuple(map(int, x.split(".")))
-        ):
-            if len(version) == 1:
-                constraint = parse_constraint(version + ".*")
-            else:
-                constraint = Version.parse(version)
-
-            if python_constraint.allows_any(constraint):
-                classifier = f"{python_classifier_prefix} :: {version}"
-                if classifier not in python_classifiers:
-                    python_classifiers.append(classifier)
-
-        # Automatically set license classifiers
-        if self.license:
-            # License classifiers have been deprecated in PEP 639.
-            # We only use them for licenses from the deprecated [project.license] table
-            # (via self.license) and not if self.license_expression is set.
-            classifiers.append(self.license.classifier)
-
-        # Sort classifiers and insert python classifiers at the right location. We do
-        # it like this so that 3.10 is sorted after 3.9.
-        sorted_classifiers = []
-        python_classifiers_inserted = False
-        for classifier in sorted(set(classifiers) - set(python_classifiers)):
-            if (
-                not python_classifiers_inserted
-                and classifier > python_classifier_prefix
-            ):
-                sorted_classifiers.extend(python_classifiers)
-                python_classifiers_inserted = True
-            sorted_classifiers.append(classifier)
-
-        if not python_classifiers_inserted:
-            sorted_classifiers.extend(python_classifiers)
-
-        return sorted_classifiers
+        # License classifiers have been deprecated in PEP 639.
+        # We only use them for licenses from the deprecated [project.license] table
+        # (via self.license) and not if self.license_expression is set.
+        license_classifier = self.license.classifier if self.license else None
+
+        return list(
+            _all_classifiers(
+                tuple(self.classifiers),
+                python_constraint,
+                license_classifier,
+                frozenset(self.AVAILABLE_PYTHONS),
+            )
+        )
 
     @property
     def urls(self) -> dict[str, str]:
@@ -678,3 +646,61 @@ class Package(PackageSpecification):
 
         args_str = ", ".join(args)
         return f"Package({args_str})"
+
+
+@lru_cache(maxsize=2**4)
+def _python_version_constraints(
+    available_pythons: frozenset[str],
+) -> tuple[tuple[str, VersionConstraint], ...]:
+    """
+    Return the available python versions and the constraints
+    a package has to allow to be classified with them.
+    """
+    from poetry.core.constraints.version import Version
+
+    constraints: list[tuple[str, VersionConstraint]] = []
+    # we sort python versions by sorting an int tuple of (major, minor) version
+    # to ensure we sort 3.10 after 3.9
+    for version in sorted(
+        available_pythons, key=lambda x: tuple(map(int, x.split(".")))
+    ):
+        if len(version) == 1:
+            constraints.append((version, parse_constraint(version + ".*")))
+        else:
+            constraints.append((version, Version.parse(version)))
+
+    return tuple(constraints)
+
+
+@lru_cache(maxsize=2**10)
+def _all_classifiers(
+    classifiers: tuple[str, ...],
+    python_constraint: VersionConstraint,
+    license_classifier: str | None,
+    available_pythons: frozenset[str],
+) -> tuple[str, ...]:
+    python_classifier_prefix = "Programming Language :: Python"
+    python_classifiers = [
+        f"{python_classifier_prefix} :: {version}"
+        for version, constraint in _python_version_constraints(available_pythons)
+        if python_constraint.allows_any(constraint)
+    ]
+
+    all_classifiers = set(classifiers)
+    if license_classifier:
+        all_classifiers.add(license_classifier)
+
+    # Sort classifiers and insert python classifiers at the right location. We do
+    # it like this so that 3.10 is sorted after 3.9.
+    sorted_classifiers = []
+    python_classifiers_inserted = False
+    for classifier in sorted(all_classifiers - set(python_classifiers)):
+        if not python_classifiers_inserted and classifier > python_classifier_prefix:
+            sorted_classifiers.extend(python_classifiers)
+            python_classifiers_inserted = True
+        sorted_classifiers.append(classifier)
+
+    if not python_classifiers_inserted:
+        sorted_classifiers.extend(python_classifiers)
+
+    return tuple(sorted_classifiers)
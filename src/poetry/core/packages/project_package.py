@@ -7,11 +7,15 @@ from poetry.core.constraints.version import parse_constraint
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from collections.abc import Mapping
     from collections.abc import Sequence
 
+    from packaging.utils import NormalizedName
+
     from poetry.core.constraints.version import Version
     from poetry.core.packages.dependency import Dependency
+    from poetry.core.packages.dependency_group import DependencyGroup
 
 from poetry.core.packages.package import Package
 
@@ -22,6 +26,8 @@ class ProjectPackage(Package):
         name: str,
         version: str | Version,
     ) -> None:
+        self._configure_dependencies: Callable[[ProjectPackage], None] | None = None
+
         super().__init__(name, version)
 
         # Attributes must be immutable for clone() to be safe!
@@ -40,6 +46,41 @@ class ProjectPackage(Package):
         if self._python_versions == "*":
             self._python_constraint = parse_constraint("~2.7 || >=3.4")
 
+    def defer_dependencies(self, configure: Callable[[ProjectPackage], None]) -> None:
+        """
+        Defer configuring the dependency groups and extras until they are accessed.
+
+        configure is called with the package (or a clone of it) as argument.
+        """
+        self._configure_dependencies = configure
+
+    def _ensure_dependencies(self) -> None:
+        if (configure := self._configure_dependencies) is not None:
+            self._configure_dependencies = None
+            configure(self)
+
+    @property
+    def _dependency_groups(self) -> Mapping[NormalizedName, DependencyGroup]:
+        self._ensure_dependencies()
+        return self._groups
+
+    @_dependency_groups.setter
+    def _dependency_groups(
+        self, value: Mapping[NormalizedName, DependencyGroup]
+    ) -> None:
+        self._ensure_dependencies()
+        self._groups = value
+
+    @property
+    def extras(self) -> Mapping[NormalizedName, Sequence[Dependency]]:
+        self._ensure_dependencies()
+        return self._extras
+
+    @extras.setter
+    def extras(self, value: Mapping[NormalizedName, Sequence[Dependency]]) -> None:
+        self._ensure_dependencies()
+        self._extras = value
+
     @property
     def build_script(self) -> str | None:
         return self.build_config.get("script")
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import dataclasses
-import functools
 import re
 import sys
 import warnings
@@ -16,9 +15,11 @@ from urllib.request import url2pathname
 from poetry.core.constraints.version import Version
 from poetry.core.constraints.version import VersionRange
 from poetry.core.constraints.version import parse_marker_version_constraint
+from poetry.core.utils.cache import lru_cache
 from poetry.core.version.markers import SingleMarker
 from poetry.core.version.markers import SingleMarkerLike
 from poetry.core.version.markers import dnf
+from poetry.core.version.markers import unbounded_expansion
 
 
 if TYPE_CHECKING:
@@ -132,13 +133,13 @@ def strip_extras(path: str) -> tuple[Path, str | None]:
     return Path(path_no_extras), extras
 
 
-@functools.cache
+@lru_cache(maxsize=2**12)
 def cached_is_dir(path: Path) -> bool:
     """A cached version of `Path.is_dir`."""
     return path.is_dir()
 
 
-@functools.cache
+@lru_cache(maxsize=2**12)
 def is_python_project(path: Path) -> bool:
     """Return true if the directory is a Python project"""
     if not cached_is_dir(path):
@@ -176,7 +177,8 @@ def convert_markers(marker: BaseMarker) -> ConvertedMarkers:
     from poetry.core.version.markers import SingleMarker
 
     requirements: ConvertedMarkers = {}
-    marker = dnf(marker)
+    with unbounded_expansion():
+        marker = dnf(marker)
     conjunctions = marker.markers if isinstance(marker, MarkerUnion) else [marker]
     group_count = len(conjunctions)
 
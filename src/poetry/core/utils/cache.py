@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import functools
+import threading
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generic
+from typing import NamedTuple
+from typing import TypeVar
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+K = TypeVar("K")
+V = TypeVar("V")
+R = TypeVar("R")
+
+_MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    currsize: int
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Thread-safe mapping with a bounded number of entries and statistics.
+
+    If the cache is full, the least recently used entry is evicted.
+    A maxsize of None means that the cache is unbounded.
+    """
+
+    def __init__(self, maxsize: int | None = 128) -> None:
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"Invalid maxsize: {maxsize}")
+
+        self._maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def maxsize(self) -> int | None:
+        return self._maxsize
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """
+        Return the value for key and mark it as recently used
+        or return default if key is not in the cache.
+        """
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self._misses += 1
+                return default
+
+            self._hits += 1
+            self._data.move_to_end(key)
+
+        return value  # type: ignore[return-value]
+
+    def set(self, key: K, value: V) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def resize(self, maxsize: int | None) -> None:
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"Invalid maxsize: {maxsize}")
+
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def items(self) -> list[tuple[K, V]]:
+        """
+        Return the entries from the least to the most recently used one.
+        """
+        with self._lock:
+            return list(self._data.items())
+
+    def clear(self) -> None:
+        """
+        Remove all entries and reset the statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._maxsize,
+                len(self._data),
+            )
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _evict(self) -> None:
+        if self._maxsize is None:
+            return
+
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+            self._evictions += 1
+
+
+class FunctionCache:
+    """
+    Registry entry for a function memoized with functools.lru_cache().
+
+    The entries are stored in the C implementation of functools, so that
+    cache hits do not execute any Python code. Unlike LRUCache, the maximum
+    size of the cache cannot be changed after the function has been decorated.
+    """
+
+    def __init__(self, func: Callable[..., Any]) -> None:
+        self._func = func
+
+    @property
+    def maxsize(self) -> int | None:
+        maxsize: int | None = self._func.cache_info().maxsize  # type: ignore[attr-defined]
+        return maxsize
+
+    def clear(self) -> None:
+        """
+        Remove all entries and reset the statistics.
+        """
+        self._func.cache_clear()  # type: ignore[attr-defined]
+
+    def info(self) -> CacheInfo:
+        info = self._func.cache_info()  # type: ignore[attr-defined]
+        # Each miss adds an entry, so entries that are missing have been evicted.
+        return CacheInfo(
+            info.hits,
+            info.misses,
+            max(info.misses - info.currsize, 0),
+            info.maxsize,
+            info.currsize,
+        )
+
+    def __len__(self) -> int:
+        return self.info().currsize
+
+
+_registry: dict[str, LRUCache[Any, Any] | FunctionCache] = {}
+_registry_lock = threading.Lock()
+
+
+def register_cache(name: str, cache: LRUCache[Any, Any] | FunctionCache | None) -> None:
+    """
+    Register cache under name, replacing any cache with the same name.
+
+    Passing None removes the cache with this name from the registry.
+    """
+    with _registry_lock:
+        if cache is None:
+            _registry.pop(name, None)
+        else:
+            _registry[name] = cache
+
+
+def get_cache(name: str) -> LRUCache[Any, Any] | FunctionCache | None:
+    with _registry_lock:
+        return _registry.get(name)
+
+
+def get_caches() -> dict[str, LRUCache[Any, Any] | FunctionCache]:
+    """
+    Return the registered caches by name.
+    """
+    with _registry_lock:
+        return dict(_registry)
+
+
+def cache_info() -> dict[str, CacheInfo]:
+    """
+    Return the statistics of all registered caches by name.
+    """
+    return {name: cache.info() for name, cache in get_caches().items()}
+
+
+def clear_all() -> None:
+    """
+    Remove all entries from all registered caches.
+    """
+    for cache in get_caches().values():
+        cache.clear()
+
+
+def lru_cache(
+    maxsize: int | None = 128, name: str | None = None
+) -> Callable[[Callable[..., R]], Callable[..., R]]:
+    """
+    Memoize a function with functools.lru_cache() and register its cache.
+
+    The cache is registered under name (defaults to the qualified name of the
+    function), so that it can be inspected and cleared via the registry.
+    The registered FunctionCache is also available as the attribute "cache"
+    of the decorated function.
+    """
+
+    def decorator(func: Callable[..., R]) -> Callable[..., R]:
+        wrapper = functools.lru_cache(maxsize=maxsize)(func)
+        cache = FunctionCache(wrapper)
+        register_cache(name or f"{func.__module__}.{func.__qualname__}", cache)
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
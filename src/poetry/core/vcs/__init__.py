@@ -10,6 +10,8 @@ from poetry.core.vcs.git import Git
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from poetry.core.vcs.gitignore import GitIgnore
+
 
 def get_vcs(directory: Path) -> Git | None:
     directory = directory.resolve(strict=True)
@@ -42,3 +44,17 @@ def get_vcs(directory: Path) -> Git | None:
         vcs = None
 
     return vcs
+
+
+def get_gitignore(directory: Path) -> GitIgnore | None:
+    """
+    Counterpart of get_vcs() that evaluates the ignore rules of the
+    git repository containing directory without running git.
+    """
+    from poetry.core.vcs.gitignore import GitIgnore
+
+    gitignore = GitIgnore.find(directory)
+    if gitignore is None or gitignore.is_ignored(directory):
+        return None
+
+    return gitignore
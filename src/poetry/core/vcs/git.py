@@ -257,11 +257,79 @@ class Git:
             return (0, 0, 0)
         return int(version.group(1)), int(version.group(2)), int(version.group(3))
 
-    def get_ignored_files(self, folder: Path | None = None) -> list[str]:
-        args = []
+    def get_ignored_files(
+        self, folder: Path | None = None, directories: bool = False
+    ) -> list[str]:
+        """
+        Return the ignored files.
+
+        If directories is True, directories that are ignored as a whole
+        are returned with a trailing slash instead of all files in them.
+        """
         if folder is None and self._work_dir:
             folder = self._work_dir
 
+        args = ["ls-files", "--others", "-i", "--exclude-standard"]
+        if directories:
+            args.append("--directory")
+        output = self.run(*args, folder=folder).strip()
+        ignored = output.split("\n") if output else []
+
+        if directories:
+            # Git also lists untracked directories that are not ignored themselves
+            # if all their contents are ignored. Files that are added later would
+            # be excluded, too. Thus, the ignored files in them are listed instead.
+            listed_directories = [path for path in ignored if path.endswith("/")]
+            ignored_directories = self._check_ignore(listed_directories, folder)
+            not_ignored = [
+                path for path in listed_directories if path not in ignored_directories
+            ]
+            if not_ignored:
+                output = self.run(
+                    "ls-files",
+                    "--others",
+                    "-i",
+                    "--exclude-standard",
+                    "--",
+                    *not_ignored,
+                    folder=folder,
+                ).strip()
+                files = output.split("\n") if output else []
+                ignored = [path for path in ignored if path not in not_ignored]
+                ignored += self._collapse_ignored_directories(files, folder)
+                ignored = list(dict.fromkeys(ignored))
+
+        return ignored
+
+    def _collapse_ignored_directories(
+        self, files: list[str], folder: Path | None
+    ) -> list[str]:
+        """
+        Replace files in directories that are ignored themselves
+        by the outermost of these directories.
+        """
+        parents: dict[str, list[str]] = {}
+        for file in files:
+            parts = file.split("/")[:-1]
+            parents[file] = ["/".join(parts[: i + 1]) + "/" for i in range(len(parts))]
+
+        ignored_directories = self._check_ignore(
+            sorted({parent for file in files for parent in parents[file]}), folder
+        )
+
+        return [
+            next((p for p in parents[file] if p in ignored_directories), file)
+            for file in files
+        ]
+
+    def _check_ignore(self, paths: list[str], folder: Path | None) -> set[str]:
+        """
+        Return the paths that match an ignore rule themselves.
+        """
+        if not paths:
+            return set()
+
+        args = [executable()]
         if folder:
             args += [
                 "--git-dir",
@@ -269,11 +337,20 @@ class Git:
                 "--work-tree",
                 folder.as_posix(),
             ]
+        args += ["check-ignore", "--stdin"]
 
-        args += ["ls-files", "--others", "-i", "--exclude-standard"]
-        output = self.run(*args).strip()
+        # check-ignore exits with 1 if none of the paths is ignored.
+        result = subprocess.run(
+            args,
+            input="\n".join(paths).encode(),
+            capture_output=True,
+        )
+        if result.returncode not in (0, 1):
+            raise subprocess.CalledProcessError(
+                result.returncode, args, result.stdout, result.stderr
+            )
 
-        return output.split("\n") if output else []
+        return set(result.stdout.decode().splitlines())
 
     def run(self, *args: Any, **kwargs: Any) -> str:
         folder = kwargs.pop("folder", None)
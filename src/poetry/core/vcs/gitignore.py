@@ -0,0 +1,533 @@
+from __future__ import annotations
+
+import os
+import re
+import struct
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+# https://git-scm.com/docs/index-format
+INDEX_SIGNATURE = b"DIRC"
+INDEX_EXTENDED_FLAG = 0x4000
+INDEX_SPLIT_EXTENSION = b"link"
+
+_CHARACTER_CLASSES = {
+    "alnum": "a-zA-Z0-9",
+    "alpha": "a-zA-Z",
+    "blank": r" \t",
+    "cntrl": r"\x00-\x1f\x7f",
+    "digit": "0-9",
+    "graph": "!-~",
+    "lower": "a-z",
+    "print": " -~",
+    "punct": r"!-/:-@\[-`{-~",
+    "space": r" \t\n\r\f\v",
+    "upper": "A-Z",
+    "xdigit": "0-9A-Fa-f",
+}
+
+
+class _Pattern:
+    __slots__ = ("base", "basename_only", "dir_only", "negated", "regex")
+
+    def __init__(
+        self,
+        regex: re.Pattern[str],
+        base: str,
+        negated: bool,
+        dir_only: bool,
+        basename_only: bool,
+    ) -> None:
+        self.regex = regex
+        # directory containing the .gitignore file, relative to the work tree
+        # and with a trailing slash (empty for the root of the work tree)
+        self.base = base
+        self.negated = negated
+        self.dir_only = dir_only
+        self.basename_only = basename_only
+
+    def matches(self, path: str, basename: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+
+        if not path.startswith(self.base):
+            return False
+
+        if self.basename_only:
+            return self.regex.fullmatch(basename) is not None
+
+        return self.regex.fullmatch(path, len(self.base)) is not None
+
+
+class GitIgnore:
+    """
+    Pure Python implementation of git's ignore rules.
+
+    This is an alternative to asking git via subprocess calls,
+    which can be slow or impossible in sandboxed build environments.
+    Patterns are read from .gitignore files, $GIT_DIR/info/exclude and
+    the file configured by core.excludesFile (or its default location).
+    Tracked files are read from the index because git never ignores them.
+
+    Not supported are environment variables like GIT_DIR, includes in
+    git config files and split indexes. The latter results in a ValueError.
+    """
+
+    def __init__(self, work_tree: Path, git_dir: Path) -> None:
+        self._work_tree = work_tree
+        self._git_dir = git_dir
+
+        common_dir = git_dir
+        commondir_file = git_dir / "commondir"
+        if commondir_file.is_file():
+            common_dir = git_dir / commondir_file.read_text(encoding="utf-8").strip()
+
+        config: dict[str, str] = {}
+        xdg_config_home = Path(
+            os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+        )
+        for config_file in [
+            xdg_config_home / "git" / "config",
+            Path.home() / ".gitconfig",
+            common_dir / "config",
+        ]:
+            config.update(_read_config(config_file))
+
+        self._ignore_case = config.get("core.ignorecase", "").lower() in {
+            "true",
+            "yes",
+            "on",
+            "1",
+        }
+        hash_size = 32 if config.get("extensions.objectformat") == "sha256" else 20
+
+        excludes_file = config.get("core.excludesfile")
+        self._base_patterns = [
+            *self._read_patterns(
+                Path(excludes_file).expanduser()
+                if excludes_file
+                else xdg_config_home / "git" / "ignore",
+                "",
+            ),
+            *self._read_patterns(common_dir / "info" / "exclude", ""),
+        ]
+
+        self._tracked_files: set[str] = set()
+        self._tracked_dirs: set[str] = set()
+        for path in _read_index(git_dir / "index", hash_size):
+            if path.endswith("/"):
+                # directory entry of a sparse index
+                path = path[:-1]
+                self._tracked_dirs.add(path)
+            else:
+                self._tracked_files.add(path)
+
+            parent, _, _ = path.rpartition("/")
+            while parent and parent not in self._tracked_dirs:
+                self._tracked_dirs.add(parent)
+                parent, _, _ = parent.rpartition("/")
+
+    @classmethod
+    def find(cls, directory: Path) -> GitIgnore | None:
+        """
+        Return the ignore rules of the git repository containing directory,
+        or None if directory is not part of a git repository.
+        """
+        directory = directory.resolve()
+        for candidate in [directory, *directory.parents]:
+            dot_git = candidate / ".git"
+            if dot_git.is_dir():
+                return cls(candidate, dot_git)
+
+            if dot_git.is_file():
+                # worktrees and submodules
+                content = dot_git.read_text(encoding="utf-8").strip()
+                if content.startswith("gitdir:"):
+                    git_dir = candidate / content[len("gitdir:") :].strip()
+                    return cls(candidate, git_dir.resolve())
+
+        return None
+
+    @property
+    def work_tree(self) -> Path:
+        return self._work_tree
+
+    def is_ignored(self, path: Path) -> bool:
+        """
+        Whether path, which must be inside the work tree, is ignored.
+
+        Like git, this checks the parent directories of path, too.
+        """
+        parts = path.resolve().relative_to(self._work_tree).parts
+        patterns = self._base_patterns
+        prefix = ""
+        for i, part in enumerate(parts):
+            patterns = self._patterns(patterns, self._work_tree / prefix, prefix)
+            current = f"{prefix}{part}"
+            is_dir = i < len(parts) - 1 or (self._work_tree / current).is_dir()
+            if not is_dir and current in self._tracked_files:
+                return False
+
+            if self._matches(patterns, current, part, is_dir):
+                return True
+
+            prefix = f"{current}/"
+
+        return False
+
+    def get_ignored_files(
+        self, directory: Path | None = None, directories: bool = False
+    ) -> list[str]:
+        """
+        Return the untracked files below directory that are ignored,
+        like `git ls-files --others --ignored --exclude-standard`.
+
+        Paths are relative to directory, which defaults to the work tree.
+        If directories is True, directories that are ignored as a whole
+        are returned with a trailing slash instead of all files in them.
+        """
+        if directory is None:
+            directory = self._work_tree
+        directory = directory.resolve()
+        rel_parts = directory.relative_to(self._work_tree).parts
+
+        # The rules of parent directories apply, too.
+        patterns = self._base_patterns
+        ignored = False
+        prefix = ""
+        for part in rel_parts:
+            if not ignored:
+                patterns = self._patterns(patterns, self._work_tree / prefix, prefix)
+                ignored = self._matches(patterns, f"{prefix}{part}", part, True)
+            prefix = f"{prefix}{part}/"
+
+        result: list[str] = []
+        offset = len(prefix)
+        stack = [(directory, prefix, patterns, ignored)]
+        while stack:
+            current, prefix, patterns, ignored = stack.pop()
+            if not ignored:
+                patterns = self._patterns(patterns, current, prefix)
+
+            for entry in _scandir(current):
+                path = f"{prefix}{entry.name}"
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if not is_dir:
+                    if path not in self._tracked_files and (
+                        ignored or self._matches(patterns, path, entry.name, False)
+                    ):
+                        result.append(path[offset:])
+                    continue
+
+                entry_ignored = ignored or self._matches(
+                    patterns, path, entry.name, True
+                )
+                entry_path = Path(entry.path)
+                if path in self._tracked_dirs:
+                    stack.append((entry_path, f"{path}/", patterns, entry_ignored))
+                elif entry_ignored:
+                    if directories:
+                        result.append(f"{path[offset:]}/")
+                    else:
+                        result.extend(
+                            f"{path[offset:]}/{file}"
+                            for file in _untracked_files(entry_path)
+                        )
+                elif not (entry_path / ".git").exists():
+                    # nested repositories are not descended into
+                    stack.append((entry_path, f"{path}/", patterns, False))
+
+        return sorted(result)
+
+    def _patterns(
+        self, patterns: list[_Pattern], directory: Path, base: str
+    ) -> list[_Pattern]:
+        new_patterns = self._read_patterns(directory / ".gitignore", base)
+        if not new_patterns:
+            return patterns
+
+        return [*patterns, *new_patterns]
+
+    def _read_patterns(self, path: Path, base: str) -> list[_Pattern]:
+        try:
+            content = path.read_text(encoding="utf-8", errors="surrogateescape")
+        except OSError:
+            return []
+
+        flags = re.DOTALL | (re.IGNORECASE if self._ignore_case else 0)
+        patterns = []
+        for line in content.removeprefix("\ufeff").splitlines():
+            pattern = _parse_pattern(line, base, flags)
+            if pattern is not None:
+                patterns.append(pattern)
+
+        return patterns
+
+    @staticmethod
+    def _matches(
+        patterns: list[_Pattern], path: str, basename: str, is_dir: bool
+    ) -> bool:
+        # The last matching pattern decides.
+        for pattern in reversed(patterns):
+            if pattern.matches(path, basename, is_dir):
+                return not pattern.negated
+
+        return False
+
+
+def _parse_pattern(line: str, base: str, flags: int) -> _Pattern | None:
+    if not line or line.startswith("#"):
+        return None
+
+    # Trailing spaces are ignored unless they are escaped.
+    end = len(line)
+    while end > 0 and line[end - 1] == " " and not line[: end - 1].endswith("\\"):
+        end -= 1
+    line = line[:end]
+
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:]
+
+    dir_only = line.endswith("/")
+    if dir_only:
+        line = line[:-1]
+
+    # A pattern without a slash matches at any level below the .gitignore file.
+    basename_only = "/" not in line
+    line = line.removeprefix("/")
+    if not line:
+        return None
+
+    regex = _translate(line)
+    if regex is None:
+        return None
+
+    return _Pattern(re.compile(regex, flags), base, negated, dir_only, basename_only)
+
+
+def _translate(pattern: str) -> str | None:
+    """
+    Translate a gitignore pattern to a regular expression.
+
+    Returns None for invalid patterns, which never match.
+    """
+    result = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            j = i
+            while j < n and pattern[j] == "*":
+                j += 1
+
+            if (
+                j - i > 1
+                and (i == 0 or pattern[i - 1] == "/")
+                and (j == n or pattern[j] == "/")
+            ):
+                if j == n:
+                    result.append(".*")
+                else:
+                    # zero or more directories
+                    result.append("(?:.*/)?")
+                    j += 1
+            else:
+                result.append("[^/]*")
+            i = j
+        elif c == "?":
+            result.append("[^/]")
+            i += 1
+        elif c == "[":
+            i, bracket = _translate_bracket(pattern, i)
+            if bracket is None:
+                return None
+            result.append(bracket)
+        elif c == "\\":
+            if i + 1 == n:
+                return None
+            result.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            result.append(re.escape(c))
+            i += 1
+
+    return "".join(result)
+
+
+def _translate_bracket(pattern: str, start: int) -> tuple[int, str | None]:
+    i = start + 1
+    n = len(pattern)
+    negated = i < n and pattern[i] in "!^"
+    if negated:
+        i += 1
+
+    items = []
+    first = True
+    while True:
+        if i >= n:
+            return i, None
+
+        c = pattern[i]
+        if c == "]" and not first:
+            break
+        first = False
+
+        if pattern.startswith("[:", i):
+            end = pattern.find(":]", i + 2)
+            if end != -1:
+                character_class = _CHARACTER_CLASSES.get(pattern[i + 2 : end])
+                if character_class is None:
+                    return i, None
+                items.append(character_class)
+                i = end + 2
+                continue
+
+        if c == "\\":
+            i += 1
+            if i >= n:
+                return i, None
+            c = pattern[i]
+
+        if i + 2 < n and pattern[i + 1] == "-" and pattern[i + 2] != "]":
+            i += 2
+            upper = pattern[i]
+            if upper == "\\":
+                i += 1
+                if i >= n:
+                    return i, None
+                upper = pattern[i]
+            items.append(f"{re.escape(c)}-{re.escape(upper)}")
+        else:
+            items.append(re.escape(c))
+        i += 1
+
+    # A bracket expression never matches a slash.
+    if negated:
+        return i + 1, f"[^/{''.join(items)}]"
+
+    return i + 1, f"(?!/)[{''.join(items)}]"
+
+
+def _scandir(directory: Path) -> list[os.DirEntry[str]]:
+    try:
+        with os.scandir(directory) as it:
+            return sorted(
+                (entry for entry in it if entry.name != ".git"),
+                key=lambda entry: entry.name,
+            )
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return []
+
+
+def _untracked_files(directory: Path) -> Iterable[str]:
+    for entry in _scandir(directory):
+        if entry.is_dir(follow_symlinks=False):
+            for file in _untracked_files(Path(entry.path)):
+                yield f"{entry.name}/{file}"
+        else:
+            yield entry.name
+
+
+def _read_config(path: Path) -> dict[str, str]:
+    """
+    Read the (sub)section-less settings of a git config file
+    as a mapping of lowercase "section.key" to value.
+    """
+    try:
+        content = path.read_text(encoding="utf-8")
+    except OSError:
+        return {}
+
+    config = {}
+    section = ""
+    for line in content.splitlines():
+        line = line.strip()
+        if not line or line[0] in "#;":
+            continue
+
+        if line.startswith("["):
+            section = line[1 : line.find("]")].strip().lower()
+            continue
+
+        key, sep, value = line.partition("=")
+        value = value.strip()
+        if not sep:
+            value = "true"
+        elif value.startswith('"'):
+            value = value[1:].partition('"')[0]
+        else:
+            value = re.split(r"\s[#;]", value, maxsplit=1)[0].strip()
+
+        config[f"{section}.{key.strip().lower()}"] = value
+
+    return config
+
+
+def _read_index(path: Path, hash_size: int) -> list[str]:
+    """
+    Read the paths of the entries of a git index file.
+    """
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return []
+
+    try:
+        signature, version, count = struct.unpack_from(">4sII", data)
+        if signature != INDEX_SIGNATURE or version not in {2, 3, 4}:
+            raise ValueError(f"Unsupported git index: {path}")
+
+        paths = []
+        previous = b""
+        offset = 12
+        for _ in range(count):
+            flags_offset = offset + 40 + hash_size
+            (flags,) = struct.unpack_from(">H", data, flags_offset)
+            name_offset = flags_offset + 2
+            if flags & INDEX_EXTENDED_FLAG:
+                name_offset += 2
+
+            if version == 4:
+                # The path is prefix-compressed relative to the previous entry.
+                strip, name_offset = _read_varint(data, name_offset)
+                end = data.index(b"\0", name_offset)
+                name = previous[: len(previous) - strip] + data[name_offset:end]
+                offset = end + 1
+            else:
+                end = data.index(b"\0", name_offset)
+                name = data[name_offset:end]
+                # entries are padded with 1-8 nul bytes to a multiple of 8 bytes
+                offset += (end - offset + 8) & ~7
+
+            paths.append(os.fsdecode(name))
+            previous = name
+
+        while offset + 8 <= len(data) - hash_size:
+            extension, size = struct.unpack_from(">4sI", data, offset)
+            if extension == INDEX_SPLIT_EXTENSION:
+                raise ValueError(f"Split git index is not supported: {path}")
+            offset += 8 + size
+    except struct.error as e:
+        raise ValueError(f"Invalid git index: {path}") from e
+
+    return paths
+
+
+def _read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    c = data[offset]
+    offset += 1
+    value = c & 0x7F
+    while c & 0x80:
+        c = data[offset]
+        offset += 1
+        value = ((value + 1) << 7) | (c & 0x7F)
+
+    return value, offset
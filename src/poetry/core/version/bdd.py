@@ -0,0 +1,494 @@
+"""
+Reduced ordered binary decision diagrams (BDDs) for environment markers.
+
+The variables of a diagram are atomic conditions on a single marker name:
+
+- ``name >= version`` or ``name > version`` for version-like markers;
+  all other version constraints are boolean combinations of these bounds,
+- ``name == value`` for other markers,
+- ``"value" in name`` for substring checks like ``"tegra" in platform_release``.
+
+Variables are ordered by marker name, kind and value. Thus, all variables of
+the same name and kind are adjacent in every diagram, which allows respecting
+their dependencies when creating nodes: a lower bound implies all smaller
+lower bounds and a name cannot be equal to two different values at the same
+time (except for "extra"). Nodes are created in the unique table of a manager,
+so that equivalent markers are represented by the same node. Therefore,
+comparing diagrams is an O(1) operation and intersections and unions are
+polynomial in the size of the diagrams instead of requiring a (potentially
+exponential) conversion to disjunctive or conjunctive normal form.
+
+Markers on different names are treated as independent. The only exception
+are python_version and python_full_version: python_version markers are
+normalized to python_full_version constraints, e.g. 'python_version > "3.8"'
+and 'python_full_version >= "3.9.0"' are represented by the same variable.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from packaging.utils import canonicalize_name
+
+from poetry.core.constraints.generic import Constraint
+from poetry.core.constraints.generic import MultiConstraint
+from poetry.core.constraints.generic import UnionConstraint
+from poetry.core.constraints.version import VersionConstraint
+from poetry.core.constraints.version import VersionRangeConstraint
+from poetry.core.constraints.version import VersionUnion
+from poetry.core.packages.utils.utils import get_python_constraint_from_marker
+from poetry.core.version.markers import PYTHON_VERSION_MARKERS
+from poetry.core.version.markers import AnyMarker
+from poetry.core.version.markers import EmptyMarker
+from poetry.core.version.markers import MarkerUnion
+from poetry.core.version.markers import MultiMarker
+from poetry.core.version.markers import SingleMarker
+from poetry.core.version.markers import SingleMarkerLike
+from poetry.core.version.markers import parse_marker
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from poetry.core.constraints.generic import BaseConstraint
+    from poetry.core.version.markers import BaseMarker
+
+
+# kinds of variables
+_BOUND = 0
+_EQUAL = 1
+_CONTAINS = 2
+
+# A variable is identified by a tuple of name, kind and value. Variables of
+# kind _BOUND have an additional element that indicates a strict bound.
+_Key = tuple[Any, ...]
+
+FALSE = 0
+TRUE = 1
+
+
+class MarkerDiagram:
+    """
+    Node of a MarkerBDD representing a marker.
+
+    Diagrams of the same manager are equal if and only if
+    the markers they represent are equivalent.
+    """
+
+    __slots__ = ("_bdd", "_node")
+
+    def __init__(self, bdd: MarkerBDD, node: int) -> None:
+        self._bdd = bdd
+        self._node = node
+
+    @property
+    def bdd(self) -> MarkerBDD:
+        return self._bdd
+
+    @property
+    def node(self) -> int:
+        return self._node
+
+    def is_any(self) -> bool:
+        return self._node == TRUE
+
+    def is_empty(self) -> bool:
+        return self._node == FALSE
+
+    def intersect(self, other: MarkerDiagram) -> MarkerDiagram:
+        return self._bdd.intersection(self, other)
+
+    def union(self, other: MarkerDiagram) -> MarkerDiagram:
+        return self._bdd.union(self, other)
+
+    def invert(self) -> MarkerDiagram:
+        return self._bdd.invert(self)
+
+    def to_marker(self) -> BaseMarker:
+        return self._bdd.to_marker(self)
+
+    def __and__(self, other: MarkerDiagram) -> MarkerDiagram:
+        return self.intersect(other)
+
+    def __or__(self, other: MarkerDiagram) -> MarkerDiagram:
+        return self.union(other)
+
+    def __invert__(self) -> MarkerDiagram:
+        return self.invert()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MarkerDiagram):
+            return NotImplemented
+
+        return self._bdd is other._bdd and self._node == other._node
+
+    def __hash__(self) -> int:
+        return hash((id(self._bdd), self._node))
+
+    def __len__(self) -> int:
+        return self._bdd.size(self)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.to_marker()}>"
+
+
+class MarkerBDD:
+    """
+    Manager for MarkerDiagrams.
+
+    The manager owns the nodes and the caches of the operations. Only diagrams
+    of the same manager can be combined. A manager grows with every marker that
+    is converted into a diagram, so it should be discarded when it is not
+    needed anymore.
+    """
+
+    def __init__(self) -> None:
+        self._keys: list[_Key] = []
+        self._variables: dict[_Key, int] = {}
+        # Terminal nodes do not have a variable. Their children are irrelevant.
+        self._var: list[int] = [-1, -1]
+        self._low: list[int] = [FALSE, TRUE]
+        self._high: list[int] = [FALSE, TRUE]
+        self._unique: dict[tuple[int, int, int], int] = {}
+        self._and_cache: dict[tuple[int, int], int] = {}
+        self._or_cache: dict[tuple[int, int], int] = {}
+        self._not_cache: dict[int, int] = {}
+        self._literals: dict[tuple[int, bool], BaseMarker] = {}
+
+    @property
+    def true(self) -> MarkerDiagram:
+        return MarkerDiagram(self, TRUE)
+
+    @property
+    def false(self) -> MarkerDiagram:
+        return MarkerDiagram(self, FALSE)
+
+    def from_marker(self, marker: BaseMarker) -> MarkerDiagram:
+        return MarkerDiagram(self, self._from_marker(marker))
+
+    def to_marker(self, diagram: MarkerDiagram) -> BaseMarker:
+        """
+        Convert a diagram back into a marker.
+
+        The marker is built from the paths of the diagram in disjunctive or
+        conjunctive normal form, whichever is less complex.
+        """
+        self._check(diagram)
+        node = diagram.node
+        if node == TRUE:
+            return AnyMarker()
+        if node == FALSE:
+            return EmptyMarker()
+
+        dnf = MarkerUnion.of(
+            *(
+                MultiMarker.of(*(self._literal(var, value) for var, value in path))
+                for path in self._paths(node, TRUE)
+            )
+        )
+        cnf = MultiMarker.of(
+            *(
+                MarkerUnion.of(*(self._literal(var, not value) for var, value in path))
+                for path in self._paths(node, FALSE)
+            )
+        )
+
+        return min(dnf, cnf, key=lambda m: m.complexity)
+
+    def intersection(self, *diagrams: MarkerDiagram) -> MarkerDiagram:
+        node = TRUE
+        for diagram in diagrams:
+            self._check(diagram)
+            node = self._and(node, diagram.node)
+
+        return MarkerDiagram(self, node)
+
+    def union(self, *diagrams: MarkerDiagram) -> MarkerDiagram:
+        node = FALSE
+        for diagram in diagrams:
+            self._check(diagram)
+            node = self._or(node, diagram.node)
+
+        return MarkerDiagram(self, node)
+
+    def invert(self, diagram: MarkerDiagram) -> MarkerDiagram:
+        self._check(diagram)
+
+        return MarkerDiagram(self, self._not(diagram.node))
+
+    def size(self, diagram: MarkerDiagram) -> int:
+        """
+        Return the number of inner nodes of a diagram.
+        """
+        self._check(diagram)
+        seen = set()
+        stack = [diagram.node]
+        while stack:
+            node = stack.pop()
+            if node <= TRUE or node in seen:
+                continue
+            seen.add(node)
+            stack.append(self._low[node])
+            stack.append(self._high[node])
+
+        return len(seen)
+
+    def _check(self, diagram: MarkerDiagram) -> None:
+        if diagram.bdd is not self:
+            raise ValueError("The diagram belongs to another MarkerBDD.")
+
+    def _from_marker(self, marker: BaseMarker) -> int:
+        if isinstance(marker, AnyMarker):
+            return TRUE
+        if isinstance(marker, EmptyMarker):
+            return FALSE
+        if isinstance(marker, MultiMarker):
+            node = TRUE
+            for m in marker.markers:
+                node = self._and(node, self._from_marker(m))
+            return node
+        if isinstance(marker, MarkerUnion):
+            node = FALSE
+            for m in marker.markers:
+                node = self._or(node, self._from_marker(m))
+            return node
+        if isinstance(marker, SingleMarkerLike):
+            if marker.name in PYTHON_VERSION_MARKERS:
+                return self._from_version_constraint(
+                    "python_full_version", get_python_constraint_from_marker(marker)
+                )
+            if isinstance(marker.constraint, VersionConstraint):
+                return self._from_version_constraint(marker.name, marker.constraint)
+            return self._from_generic_constraint(marker.name, marker.constraint)
+
+        raise TypeError(f"Unsupported marker: {marker!r}")
+
+    def _from_version_constraint(self, name: str, constraint: VersionConstraint) -> int:
+        if constraint.is_empty():
+            return FALSE
+        if constraint.is_any():
+            return TRUE
+        if isinstance(constraint, VersionUnion):
+            node = FALSE
+            for range_ in constraint.ranges:
+                node = self._or(node, self._from_version_constraint(name, range_))
+            return node
+
+        assert isinstance(constraint, VersionRangeConstraint)
+        node = TRUE
+        if constraint.min is not None:
+            # >= min or > min
+            node = self._variable(
+                (name, _BOUND, constraint.min, not constraint.include_min)
+            )
+        if constraint.max is not None:
+            # < max is not(>= max) and <= max is not(> max)
+            upper = self._variable(
+                (name, _BOUND, constraint.max, constraint.include_max)
+            )
+            node = self._and(node, self._not(upper))
+
+        return node
+
+    def _from_generic_constraint(self, name: str, constraint: BaseConstraint) -> int:
+        if constraint.is_empty():
+            return FALSE
+        if constraint.is_any():
+            return TRUE
+        if isinstance(constraint, MultiConstraint):
+            node = TRUE
+            for c in constraint.constraints:
+                node = self._and(node, self._from_generic_constraint(name, c))
+            return node
+        if isinstance(constraint, UnionConstraint):
+            node = FALSE
+            for alternative in constraint.constraints:
+                node = self._or(node, self._from_generic_constraint(name, alternative))
+            return node
+
+        assert isinstance(constraint, Constraint)
+        value = constraint.value
+        if name == "extra":
+            value = canonicalize_name(value)
+        if constraint.operator in {"==", "!="}:
+            node = self._variable((name, _EQUAL, value))
+        else:
+            assert constraint.operator in {"in", "not in"}
+            node = self._variable((name, _CONTAINS, value))
+
+        if constraint.operator in {"!=", "not in"}:
+            node = self._not(node)
+
+        return node
+
+    def _variable(self, key: _Key) -> int:
+        var = self._variables.get(key)
+        if var is None:
+            var = self._variables[key] = len(self._keys)
+            self._keys.append(key)
+
+        return self._node(var, FALSE, TRUE)
+
+    def _group(self, var: int) -> tuple[str, int] | None:
+        """
+        Return the group of variables that depend on each other.
+        """
+        name, kind = self._keys[var][:2]
+        if kind == _CONTAINS or (kind == _EQUAL and name == "extra"):
+            return None
+
+        return name, kind
+
+    def _precedes(self, var1: int, var2: int) -> bool:
+        # Terminals are always last.
+        if var2 < 0:
+            return var1 >= 0
+        if var1 < 0:
+            return False
+        return self._keys[var1] < self._keys[var2]
+
+    def _assume_false(self, node: int, group: tuple[str, int]) -> int:
+        """
+        Return the node for all variables of group being false.
+
+        Only the top of node has to be considered because variables
+        of the same group are adjacent.
+        """
+        while node > TRUE and self._group(self._var[node]) == group:
+            node = self._low[node]
+
+        return node
+
+    def _node(self, var: int, low: int, high: int) -> int:
+        if low == high:
+            return low
+
+        group = self._group(var)
+        if group is not None:
+            if group[1] == _BOUND:
+                # If a bound is not satisfied, greater bounds are not satisfied
+                # either. Greater bounds do not matter if the diagram does not
+                # depend on this bound if they are not satisfied.
+                low = self._assume_false(low, group)
+                if low == high or self._assume_false(high, group) == low:
+                    return high
+            else:
+                # If the name is equal to the value of this variable,
+                # it is not equal to other values.
+                high = self._assume_false(high, group)
+                if low == high or self._assume_false(low, group) == high:
+                    return low
+
+        key = (var, low, high)
+        node = self._unique.get(key)
+        if node is None:
+            node = self._unique[key] = len(self._var)
+            self._var.append(var)
+            self._low.append(low)
+            self._high.append(high)
+
+        return node
+
+    def _cofactors(self, node: int, var: int) -> tuple[int, int]:
+        if self._var[node] == var:
+            return self._low[node], self._high[node]
+        return node, node
+
+    def _and(self, u: int, v: int) -> int:
+        if u == FALSE or v == FALSE:
+            return FALSE
+        if u in (TRUE, v):
+            return v
+        if v == TRUE:
+            return u
+        if u > v:
+            u, v = v, u
+
+        key = (u, v)
+        result = self._and_cache.get(key)
+        if result is None:
+            var = self._top(u, v)
+            u_low, u_high = self._cofactors(u, var)
+            v_low, v_high = self._cofactors(v, var)
+            result = self._and_cache[key] = self._node(
+                var, self._and(u_low, v_low), self._and(u_high, v_high)
+            )
+
+        return result
+
+    def _or(self, u: int, v: int) -> int:
+        if u == TRUE or v == TRUE:
+            return TRUE
+        if u in (FALSE, v):
+            return v
+        if v == FALSE:
+            return u
+        if u > v:
+            u, v = v, u
+
+        key = (u, v)
+        result = self._or_cache.get(key)
+        if result is None:
+            var = self._top(u, v)
+            u_low, u_high = self._cofactors(u, var)
+            v_low, v_high = self._cofactors(v, var)
+            result = self._or_cache[key] = self._node(
+                var, self._or(u_low, v_low), self._or(u_high, v_high)
+            )
+
+        return result
+
+    def _not(self, u: int) -> int:
+        if u <= TRUE:
+            return 1 - u
+
+        result = self._not_cache.get(u)
+        if result is None:
+            result = self._not_cache[u] = self._node(
+                self._var[u], self._not(self._low[u]), self._not(self._high[u])
+            )
+
+        return result
+
+    def _top(self, u: int, v: int) -> int:
+        var_u = self._var[u]
+        var_v = self._var[v]
+        return var_u if self._precedes(var_u, var_v) else var_v
+
+    def _paths(
+        self, node: int, terminal: int
+    ) -> Iterator[tuple[tuple[int, bool], ...]]:
+        if node == terminal:
+            yield ()
+            return
+        if node <= TRUE:
+            return
+
+        var = self._var[node]
+        for value, child in ((True, self._high[node]), (False, self._low[node])):
+            for path in self._paths(child, terminal):
+                yield (var, value), *path
+
+    def _literal(self, var: int, value: bool) -> BaseMarker:
+        literal = self._literals.get((var, value))
+        if literal is not None:
+            return literal
+
+        key = self._keys[var]
+        name, kind = key[:2]
+        if kind == _BOUND:
+            version, strict = key[2:]
+            operator = (">" if strict else ">=") if value else ("<=" if strict else "<")
+            if name == "python_full_version" and not strict and version.precision < 3:
+                # 'python_full_version >= "3.9"' is printed as 'python_version >= "3.9"'
+                name = "python_version"
+            literal = SingleMarker(name, f"{operator}{version.text}")
+        elif kind == _EQUAL:
+            literal = SingleMarker(name, f"{'==' if value else '!='}{key[2]}")
+        else:
+            operator = "in" if value else "not in"
+            literal = parse_marker(f'"{key[2]}" {operator} {name}')
+
+        self._literals[(var, value)] = literal
+        return literal
@@ -2,16 +2,23 @@ from __future__ import annotations
 
 import functools
 import itertools
+import math
+import pickle
 import re
 import threading
+import weakref
 
 from abc import ABC
+from abc import ABCMeta
 from abc import abstractmethod
 from collections import defaultdict
+from collections.abc import Mapping
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import ClassVar
 from typing import Generic
+from typing import NamedTuple
 from typing import TypeVar
 
 from packaging.utils import canonicalize_name
@@ -25,19 +32,26 @@ from poetry.core.constraints.version import VersionConstraint
 from poetry.core.constraints.version import VersionRange
 from poetry.core.constraints.version import VersionUnion
 from poetry.core.constraints.version.exceptions import ParseConstraintError
+from poetry.core.utils.cache import LRUCache
+from poetry.core.utils.cache import lru_cache
+from poetry.core.utils.cache import register_cache
 from poetry.core.version.grammars import GRAMMAR_PEP_508_MARKERS
 from poetry.core.version.parser import Parser
+from poetry.core.version.pep508 import PEP508SyntaxError
+from poetry.core.version.pep508 import parse_marker_groups
 
 
 if TYPE_CHECKING:
     from collections.abc import Callable
     from collections.abc import Iterable
     from collections.abc import Iterator
-    from collections.abc import Mapping
     from collections.abc import Sequence
+    from pathlib import Path
 
     from lark import Tree
 
+    from poetry.core.version.pep508 import MarkerGroups
+
 
 class InvalidMarkerError(ValueError):
     """
@@ -72,8 +86,172 @@ PYTHON_VERSION_MARKERS = {"python_version", "python_full_version"}
 # Parser: PEP 508 Environment Markers
 _parser = Parser(GRAMMAR_PEP_508_MARKERS, "lalr")
 
+_MISSING = object()
+
+
+class MarkerEnvironment(Mapping[str, Any]):
+    """
+    Environment for validating markers that parses each value only once.
+
+    When validating many markers against the same environment, wrapping the
+    environment avoids parsing its values again for each single marker.
+    """
+
+    def __init__(self, environment: Mapping[str, Any]) -> None:
+        self._environment = environment
+        self._parsed: dict[tuple[str, bool], Any] = {}
+        self._extras: set[str] | None = None
+
+    def parsed(
+        self,
+        name: str,
+        is_version: bool,
+        parser: Callable[[str], BaseConstraint | VersionConstraint],
+    ) -> BaseConstraint | VersionConstraint | None:
+        """
+        Return the parsed value of name or None if the environment does not
+        contain name. The type of parser is determined by name and is_version.
+        """
+        key = (name, is_version)
+        parsed = self._parsed.get(key, _MISSING)
+        if parsed is _MISSING:
+            if name in self._environment:
+                parsed = parser(self._environment[name])
+            else:
+                parsed = None
+            self._parsed[key] = parsed
+
+        return parsed  # type: ignore[no-any-return]
+
+    def extras(self) -> set[str] | None:
+        """
+        Return the normalized active extras or None if extras are not specified.
+        """
+        if self._extras is None and "extra" in self._environment:
+            extras = self._environment["extra"]
+            if isinstance(extras, str):
+                extras = {extras}
+            self._extras = {canonicalize_name(extra) for extra in extras}
+
+        return self._extras
+
+    def __getitem__(self, key: str) -> Any:
+        return self._environment[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._environment)
+
+    def __len__(self) -> int:
+        return len(self._environment)
+
+
+class _MarkerMeta(ABCMeta):
+    """
+    Intern markers so that structurally equal markers are the same object.
+    """
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        key = _arguments_key(cls, args, kwargs)
+        if key is None:
+            return _intern(super().__call__(*args, **kwargs))
+
+        # Look the marker up before it is built, which is costly for SingleMarker.
+        marker = _markers_by_arguments.get(key)
+        if marker is None:
+            marker = _intern(super().__call__(*args, **kwargs))
+            _markers_by_arguments.add(key, marker)
+
+        return marker
+
+
+class _InternTable:
+    """
+    Thread-safe table of weak references to markers.
+
+    Looking up a key is a single dictionary lookup and does not need the lock.
+    Dead references are pruned from time to time because weak references with
+    callbacks are significantly slower.
+    """
+
+    MIN_PRUNE_SIZE = 1024
+
+    def __init__(self) -> None:
+        self._refs: dict[tuple[object, ...], weakref.ReferenceType[BaseMarker]] = {}
+        self._lock = threading.Lock()
+        self._prune_size = self.MIN_PRUNE_SIZE
+
+    def get(self, key: tuple[object, ...]) -> BaseMarker | None:
+        ref = self._refs.get(key)
+        return None if ref is None else ref()
+
+    def add(self, key: tuple[object, ...], marker: M) -> M:
+        """
+        Add marker under key and return it
+        or return the marker that has been added under key by another thread.
+        """
+        with self._lock:
+            ref = self._refs.get(key)
+            existing = None if ref is None else ref()
+            if existing is not None:
+                return existing  # type: ignore[return-value]
+
+            self._refs[key] = weakref.ref(marker)
+            if len(self._refs) > self._prune_size:
+                self._refs = {k: r for k, r in self._refs.items() if r() is not None}
+                self._prune_size = max(self.MIN_PRUNE_SIZE, 2 * len(self._refs))
+
+        return marker
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+
+_interned_markers = _InternTable()
+_markers_by_arguments = _InternTable()
+
+M = TypeVar("M", bound="BaseMarker")
+
+
+def _arguments_key(
+    cls: type, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[object, ...] | None:
+    # Only strings and booleans are compared by their type and value,
+    # e.g. equal constraints or markers may differ in their string representation.
+    if not cls.__dict__.get("_intern_by_arguments") or not all(
+        type(arg) is str or type(arg) is bool for arg in (*args, *kwargs.values())
+    ):
+        return None
+
+    return (cls, args, *kwargs.items()) if kwargs else (cls, args)
+
+
+def _intern(marker: M) -> M:
+    key = marker._intern_key
+    if key is None:
+        return marker
+
+    interned = _interned_markers.get(key)
+    if interned is not None:
+        return interned  # type: ignore[return-value]
+
+    # The hash is computed only once per structurally distinct marker.
+    marker._hash = marker._compute_hash()
+    return _interned_markers.add(key, marker)
+
+
+def _unpickle_marker(cls: type[M], state: dict[str, Any]) -> M:
+    marker = cls.__new__(cls)
+    marker.__dict__.update(state)
+    return _intern(marker)
+
+
+class BaseMarker(metaclass=_MarkerMeta):
+    _hash: int
+    # Whether markers of exactly this class are looked up by the arguments
+    # of the constructor before they are built. Only set this if string
+    # and boolean arguments determine the marker.
+    _intern_by_arguments: ClassVar[bool] = False
 
-class BaseMarker(ABC):
     @property
     def complexity(self) -> tuple[int, int]:
         """
@@ -101,6 +279,40 @@ class BaseMarker(ABC):
     def validate(self, environment: Mapping[str, Any] | None) -> bool:
         raise NotImplementedError
 
+    def compile(self) -> Callable[[Mapping[str, Any] | None], bool]:
+        """
+        Return a function that is equivalent to validate().
+
+        The function evaluates a flat tree of closures instead of dispatching
+        to the marker's methods. Environments that are passed as
+        MarkerEnvironment are not wrapped again, so that values are parsed
+        only once for all markers that are evaluated against them.
+        """
+        evaluate = self._evaluator
+
+        def validate(environment: Mapping[str, Any] | None) -> bool:
+            if environment is None:
+                return True
+
+            if not isinstance(environment, MarkerEnvironment):
+                environment = MarkerEnvironment(environment)
+
+            return evaluate(environment)
+
+        return validate
+
+    @property
+    def _evaluator(self) -> Callable[[MarkerEnvironment], bool]:
+        # Markers are immutable, so the evaluator can be cached.
+        evaluator = self.__dict__.get("_compiled")
+        if evaluator is None:
+            evaluator = self.__dict__["_compiled"] = self._compile()
+
+        return evaluator
+
+    def _compile(self) -> Callable[[MarkerEnvironment], bool]:
+        return self.validate
+
     @abstractmethod
     def without_extras(self) -> BaseMarker:
         raise NotImplementedError
@@ -126,6 +338,31 @@ class BaseMarker(ABC):
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} {self}>"
 
+    @property
+    def _intern_key(self) -> tuple[object, ...] | None:
+        """
+        Markers with the same key are interchangeable,
+        including their string representation.
+
+        Markers without a key, e.g. of subclasses that are not part of
+        poetry-core, are not interned.
+        """
+        return None
+
+    def _compute_hash(self) -> int:
+        """
+        Compute the hash of an interned marker, which is returned by __hash__().
+        """
+        raise NotImplementedError
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The hash of strings is not stable across processes
+        # and closures cannot be pickled.
+        state = {
+            k: v for k, v in self.__dict__.items() if k not in {"_hash", "_compiled"}
+        }
+        return _unpickle_marker, (self.__class__, state)
+
     @abstractmethod
     def __hash__(self) -> int:
         raise NotImplementedError
@@ -136,6 +373,8 @@ class BaseMarker(ABC):
 
 
 class AnyMarker(BaseMarker):
+    _intern_by_arguments: ClassVar[bool] = True
+
     def intersect(self, other: BaseMarker) -> BaseMarker:
         return other
 
@@ -148,6 +387,9 @@ class AnyMarker(BaseMarker):
     def validate(self, environment: Mapping[str, Any] | None) -> bool:
         return True
 
+    def _compile(self) -> Callable[[MarkerEnvironment], bool]:
+        return lambda environment: True
+
     def without_extras(self) -> BaseMarker:
         return self
 
@@ -171,9 +413,16 @@ class AnyMarker(BaseMarker):
     def __repr__(self) -> str:
         return "<AnyMarker>"
 
-    def __hash__(self) -> int:
+    @property
+    def _intern_key(self) -> tuple[object, ...]:
+        return (self.__class__,)
+
+    def _compute_hash(self) -> int:
         return hash("any")
 
+    def __hash__(self) -> int:
+        return self._hash
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, BaseMarker):
             return NotImplemented
@@ -182,6 +431,8 @@ class AnyMarker(BaseMarker):
 
 
 class EmptyMarker(BaseMarker):
+    _intern_by_arguments: ClassVar[bool] = True
+
     def intersect(self, other: BaseMarker) -> BaseMarker:
         return self
 
@@ -194,6 +445,9 @@ class EmptyMarker(BaseMarker):
     def validate(self, environment: Mapping[str, Any] | None) -> bool:
         return False
 
+    def _compile(self) -> Callable[[MarkerEnvironment], bool]:
+        return lambda environment: False
+
     def without_extras(self) -> BaseMarker:
         return self
 
@@ -217,9 +471,16 @@ class EmptyMarker(BaseMarker):
     def __repr__(self) -> str:
         return "<EmptyMarker>"
 
-    def __hash__(self) -> int:
+    @property
+    def _intern_key(self) -> tuple[object, ...]:
+        return (self.__class__,)
+
+    def _compute_hash(self) -> int:
         return hash("empty")
 
+    def __hash__(self) -> int:
+        return self._hash
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, BaseMarker):
             return NotImplemented
@@ -264,6 +525,10 @@ class SingleMarkerLike(BaseMarker, ABC, Generic[SingleMarkerConstraint]):
     def _key(self) -> tuple[object, ...]:
         return self._name, self._constraint
 
+    @property
+    def _intern_key(self) -> tuple[object, ...]:
+        return self.__class__, self._name, self._constraint
+
     def validate(self, environment: Mapping[str, Any] | None) -> bool:
         if environment is None:
             return True
@@ -275,6 +540,9 @@ class SingleMarkerLike(BaseMarker, ABC, Generic[SingleMarkerConstraint]):
         # "extra == 'a'" will be true if "a" is one of the active extras.
         # "extra != 'a'" will be true if "a" is not one of the active extras.
         # Further, extra names are normalized for comparison.
+        if isinstance(environment, MarkerEnvironment):
+            return self._evaluator(environment)
+
         if self._name == "extra":
             extras = environment["extra"]
             if isinstance(extras, str):
@@ -293,6 +561,36 @@ class SingleMarkerLike(BaseMarker, ABC, Generic[SingleMarkerConstraint]):
         constraint = self._parser(environment[self._name])
         return self._constraint.allows(constraint)  # type: ignore[arg-type]
 
+    def _compile(self) -> Callable[[MarkerEnvironment], bool]:
+        name = self._name
+        if name == "extra":
+            assert isinstance(self._constraint, Constraint)
+            normalized_value = canonicalize_name(self._constraint.value)
+            if self._constraint.operator == "==":
+
+                def evaluate_extra(environment: MarkerEnvironment) -> bool:
+                    extras = environment.extras()
+                    return extras is None or normalized_value in extras
+
+            else:
+                assert self._constraint.operator == "!="
+
+                def evaluate_extra(environment: MarkerEnvironment) -> bool:
+                    extras = environment.extras()
+                    return extras is None or normalized_value not in extras
+
+            return evaluate_extra
+
+        is_version = isinstance(self._constraint, VersionConstraint)
+        parser = self._parser
+        allows = self._constraint.allows
+
+        def evaluate(environment: MarkerEnvironment) -> bool:
+            value = environment.parsed(name, is_version, parser)
+            return value is None or allows(value)  # type: ignore[arg-type]
+
+        return evaluate
+
     def without_extras(self) -> BaseMarker:
         return self.exclude("extra")
 
@@ -333,14 +631,20 @@ class SingleMarkerLike(BaseMarker, ABC, Generic[SingleMarkerConstraint]):
 
         return other.union(self)
 
+    def _compute_hash(self) -> int:
+        return hash(self._key)
+
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, SingleMarkerLike):
             return NotImplemented
 
         return self._key == other._key
 
     def __hash__(self) -> int:
-        return hash(self._key)
+        return self._hash
 
 
 class SingleMarker(SingleMarkerLike[BaseConstraint | VersionConstraint]):
@@ -350,6 +654,7 @@ class SingleMarker(SingleMarkerLike[BaseConstraint | VersionConstraint]):
     _CONSTRAINT_RE_PATTERN_2 = STR_CMP_CONSTRAINT
 
     VALUE_SEPARATOR_RE = re.compile("[ ,|]+")
+    _intern_by_arguments: ClassVar[bool] = True
     _VERSION_LIKE_MARKER_NAME: ClassVar[set[str]] = {
         "python_version",
         "python_full_version",
@@ -450,6 +755,16 @@ class SingleMarker(SingleMarkerLike[BaseConstraint | VersionConstraint]):
     def _key(self) -> tuple[object, ...]:
         return self._name, self._operator, self._value
 
+    @property
+    def _intern_key(self) -> tuple[object, ...]:
+        return (
+            self.__class__,
+            self._name,
+            self._operator,
+            self._value,
+            self._swapped_name_value,
+        )
+
     def reduce_by_python_constraint(
         self, python_constraint: VersionConstraint
     ) -> BaseMarker:
@@ -525,13 +840,16 @@ class SingleMarker(SingleMarkerLike[BaseConstraint | VersionConstraint]):
         return parse_marker(constraint)
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, SingleMarker):
             return NotImplemented
 
         return self._key == other._key
 
     def __hash__(self) -> int:
-        return hash(self._key)
+        return self._hash
 
     def __str__(self) -> str:
         if self._swapped_name_value:
@@ -556,6 +874,11 @@ class AtomicMultiMarker(SingleMarkerLike[MultiConstraint]):
             return self.expand().validate(environment)
         return super().validate(environment)
 
+    def _compile(self) -> Callable[[MarkerEnvironment], bool]:
+        if self._name == "extra":
+            return self.expand()._evaluator
+        return super()._compile()
+
     def invert(self) -> BaseMarker:
         return AtomicMarkerUnion(self._name, self._constraint.invert())
 
@@ -589,6 +912,11 @@ class AtomicMarkerUnion(SingleMarkerLike[UnionConstraint]):
             return self.expand().validate(environment)
         return super().validate(environment)
 
+    def _compile(self) -> Callable[[MarkerEnvironment], bool]:
+        if self._name == "extra":
+            return self.expand()._evaluator
+        return super()._compile()
+
     def invert(self) -> BaseMarker:
         return AtomicMultiMarker(self._name, self._constraint.invert())
 
@@ -773,6 +1101,14 @@ class MultiMarker(BaseMarker):
     def validate(self, environment: Mapping[str, Any] | None) -> bool:
         return all(m.validate(environment) for m in self._markers)
 
+    def _compile(self) -> Callable[[MarkerEnvironment], bool]:
+        evaluators = tuple(m._evaluator for m in self._markers)
+
+        def evaluate(environment: MarkerEnvironment) -> bool:
+            return all(evaluator(environment) for evaluator in evaluators)
+
+        return evaluate
+
     def without_extras(self) -> BaseMarker:
         return self.exclude("extra")
 
@@ -806,14 +1142,24 @@ class MultiMarker(BaseMarker):
 
         return MarkerUnion(*markers)
 
+    @property
+    def _intern_key(self) -> tuple[object, ...]:
+        return self.__class__, self._markers
+
+    def _compute_hash(self) -> int:
+        return hash(("multi", *self._markers))
+
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, MultiMarker):
             return False
 
         return self._markers == other.markers
 
     def __hash__(self) -> int:
-        return hash(("multi", *self._markers))
+        return self._hash
 
     def __str__(self) -> str:
         elements = []
@@ -979,6 +1325,14 @@ class MarkerUnion(BaseMarker):
     def validate(self, environment: Mapping[str, Any] | None) -> bool:
         return any(m.validate(environment) for m in self._markers)
 
+    def _compile(self) -> Callable[[MarkerEnvironment], bool]:
+        evaluators = tuple(m._evaluator for m in self._markers)
+
+        def evaluate(environment: MarkerEnvironment) -> bool:
+            return any(evaluator(environment) for evaluator in evaluators)
+
+        return evaluate
+
     def without_extras(self) -> BaseMarker:
         return self.exclude("extra")
 
@@ -1029,32 +1383,287 @@ class MarkerUnion(BaseMarker):
         markers = [marker.invert() for marker in self._markers]
         return MultiMarker(*markers)
 
+    @property
+    def _intern_key(self) -> tuple[object, ...]:
+        return self.__class__, self._markers
+
+    def _compute_hash(self) -> int:
+        return hash(("union", *self._markers))
+
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, MarkerUnion):
             return False
 
         return self._markers == other.markers
 
     def __hash__(self) -> int:
-        return hash(("union", *self._markers))
+        return self._hash
 
     def __str__(self) -> str:
         return " or ".join(str(m) for m in self._markers)
 
 
-@functools.cache
+class EnvironmentSpace:
+    """
+    Finite set of target environments to evaluate markers against.
+
+    The result of evaluating a marker is a bitset, in which bit i is set
+    if the marker is satisfied by the i-th environment. Thus, markers can be
+    combined and filtered with bitwise operations instead of validating them
+    again. Results are memoized per marker for the lifetime of the marker.
+    """
+
+    def __init__(self, environments: Iterable[Mapping[str, Any]]) -> None:
+        self._environments = tuple(
+            env if isinstance(env, MarkerEnvironment) else MarkerEnvironment(env)
+            for env in environments
+        )
+        self._all = (1 << len(self._environments)) - 1
+        self._masks: weakref.WeakKeyDictionary[BaseMarker, int] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def environments(self) -> tuple[MarkerEnvironment, ...]:
+        return self._environments
+
+    @property
+    def all(self) -> int:
+        """
+        The bitset of all environments.
+        """
+        return self._all
+
+    def mask(self, marker: BaseMarker) -> int:
+        """
+        Return the bitset of the environments that satisfy marker.
+        """
+        mask = self._masks.get(marker)
+        if mask is None:
+            if marker.is_any():
+                mask = self._all
+            elif marker.is_empty():
+                mask = 0
+            else:
+                evaluate = marker._evaluator
+                mask = 0
+                for i, environment in enumerate(self._environments):
+                    if evaluate(environment):
+                        mask |= 1 << i
+            self._masks[marker] = mask
+
+        return mask
+
+    def select(self, mask: int) -> list[MarkerEnvironment]:
+        """
+        Return the environments in mask.
+        """
+        return [env for i, env in enumerate(self._environments) if mask >> i & 1]
+
+    def partition(self, markers: Iterable[BaseMarker]) -> dict[int, list[BaseMarker]]:
+        """
+        Group markers by the bitset of the environments that satisfy them.
+        """
+        partition: dict[int, list[BaseMarker]] = defaultdict(list)
+        for marker in markers:
+            partition[self.mask(marker)].append(marker)
+
+        return dict(partition)
+
+    def reduce(self, marker: BaseMarker) -> BaseMarker:
+        """
+        Return a marker that is equivalent to marker for all environments
+        in this space, but omits parts that are constant in this space.
+        """
+        mask = self.mask(marker)
+        if mask == self._all:
+            return AnyMarker()
+        if mask == 0:
+            return EmptyMarker()
+
+        if isinstance(marker, MultiMarker):
+            return MultiMarker.of(*(self.reduce(m) for m in marker.markers))
+        if isinstance(marker, MarkerUnion):
+            return MarkerUnion.of(*(self.reduce(m) for m in marker.markers))
+
+        return marker
+
+    def __len__(self) -> int:
+        return len(self._environments)
+
+
+DEFAULT_MARKER_CACHE_SIZE = 2**16
+MARKER_CACHE_FORMAT_VERSION = 2
+
+T = TypeVar("T")
+
+
+class MarkerCache(LRUCache[tuple[Any, ...], Any]):
+    """
+    Cache for the results of parsing and normalizing markers.
+
+    The results of parse_marker(), cnf(), dnf() and the merging of single markers
+    are stored in the active marker cache (see set_marker_cache()). If a path is
+    given, the entries of a previous process are loaded from this file and
+    can be stored for the next process with save().
+    """
+
+    def __init__(
+        self, maxsize: int | None = DEFAULT_MARKER_CACHE_SIZE, path: Path | None = None
+    ) -> None:
+        super().__init__(maxsize)
+        self._path = path
+        if path is not None:
+            self.load(path)
+
+    def load(self, path: Path) -> None:
+        """
+        Add the entries stored in path. Incompatible or invalid files are ignored.
+        """
+        from poetry.core import __version__
+
+        try:
+            with path.open("rb") as f:
+                content = pickle.load(f)
+        except (
+            OSError,
+            pickle.UnpicklingError,
+            AttributeError,
+            EOFError,
+            ImportError,
+            IndexError,
+        ):
+            return
+
+        if (
+            not isinstance(content, dict)
+            or content.get("version") != MARKER_CACHE_FORMAT_VERSION
+            or content.get("poetry-core") != __version__
+        ):
+            return
+
+        for key, value in content.get("entries", ()):
+            self.set(key, value)
+
+    def save(self, path: Path | None = None) -> None:
+        """
+        Store the entries in path (defaults to the path the cache was created with).
+        """
+        from poetry.core import __version__
+
+        path = path or self._path
+        if path is None:
+            raise ValueError("No path to store the marker cache in")
+
+        content = {
+            "version": MARKER_CACHE_FORMAT_VERSION,
+            "poetry-core": __version__,
+            "entries": self.items(),
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = path.with_name(f"{path.name}.tmp")
+        with tmp_file.open("wb") as f:
+            pickle.dump(content, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_file.replace(path)
+
+
+_marker_cache: MarkerCache | None = MarkerCache()
+register_cache(__name__, _marker_cache)
+
+
+def get_marker_cache() -> MarkerCache | None:
+    return _marker_cache
+
+
+def set_marker_cache(cache: MarkerCache | None) -> MarkerCache | None:
+    """
+    Replace the active marker cache and return the previous one.
+
+    Passing None disables caching. The active cache is registered
+    as "poetry.core.version.markers" (see poetry.core.utils.cache.get_caches()).
+    """
+    global _marker_cache
+
+    previous = _marker_cache
+    _marker_cache = cache
+    register_cache(__name__, cache)
+    _parse_marker_cached.cache_clear()  # type: ignore[attr-defined]
+    return previous
+
+
+def _cached(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Memoize func in the active marker cache.
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args: Any) -> T:
+        cache = _marker_cache
+        if cache is None:
+            return func(*args)
+
+        key = (name, *args)
+        result = cache.get(key, _MISSING)
+        if result is _MISSING:
+            cycles = _normalization.cycles
+            result = func(*args)
+            if _normalization.cycles == cycles:
+                cache.set(key, result)
+
+        return result  # type: ignore[return-value]
+
+    return wrapper
+
+
+class _UncacheableResultError(Exception):
+    def __init__(self, result: BaseMarker) -> None:
+        self.result = result
+
+
 def parse_marker(marker: str) -> BaseMarker:
+    if _marker_cache is None:
+        return _parse_marker(marker)
+
+    try:
+        return _parse_marker_cached(marker)
+    except _UncacheableResultError as e:
+        return e.result
+
+
+@lru_cache(maxsize=2**12, name=f"{__name__}.parse_marker")
+def _parse_marker_cached(marker: str) -> BaseMarker:
+    # Parsed markers are looked up in this C-level cache first because
+    # parse_marker() is called far more often than anything else.
+    # Since functools does not cache exceptions, results that depend
+    # on a detected cycle are passed by raising an exception.
+    cycles = _normalization.cycles
+    result = _parse_marker(marker)
+    if _normalization.cycles != cycles:
+        raise _UncacheableResultError(result)
+
+    return result
+
+
+@_cached
+def _parse_marker(marker: str) -> BaseMarker:
     if marker == "<empty>":
         return EmptyMarker()
 
     if not marker or marker == "*":
         return AnyMarker()
 
-    parsed = _parser.parse(marker)
-
-    markers = _compact_markers(parsed.children)
+    try:
+        groups = parse_marker_groups(marker)
+    except PEP508SyntaxError:
+        # Let Lark parse the marker or report a meaningful error.
+        parsed = _parser.parse(marker)
+        return _compact_markers(parsed.children)
 
-    return markers
+    return _markers_from_groups(groups)
 
 
 def _compact_markers(
@@ -1082,25 +1691,53 @@ def _compact_markers(
         elif token.data == f"{tree_prefix}item":
             name, op, value = token.children
             swapped_name_value = value.type == f"{tree_prefix}MARKER_NAME"
-            stringed_value = name.type in {
-                f"{tree_prefix}ESCAPED_STRING",
-                f"{tree_prefix}SINGLE_QUOTED_STRING",
-            }
             if swapped_name_value:
                 name, value = value, name
 
-            value = value[1:-1]
-
-            sub_marker = SingleMarker(
-                str(name),
-                f'"{value}" {op}' if stringed_value else f"{op} {value}",
-                swapped_name_value=swapped_name_value,
+            sub_marker = _single_marker(
+                str(name), str(op), value[1:-1], swapped_name_value
             )
             groups[-1].append(sub_marker)
 
         elif token.data == f"{tree_prefix}BOOL_OP" and token.children[0] == "or":
             groups.append([])
 
+    return _combine_marker_groups(groups, top_level)
+
+
+def _markers_from_groups(groups: MarkerGroups, top_level: bool = True) -> BaseMarker:
+    """
+    Build a marker from the result of the recursive descent parser.
+
+    The result is the same as the one of _compact_markers() for the Lark tree.
+    """
+    return _combine_marker_groups(
+        [
+            [
+                _markers_from_groups(item, top_level=False)
+                if isinstance(item, list)
+                else _single_marker(*item)
+                for item in group
+            ]
+            for group in groups
+        ],
+        top_level,
+    )
+
+
+def _single_marker(
+    name: str, op: str, value: str, swapped_name_value: bool
+) -> SingleMarker:
+    return SingleMarker(
+        name,
+        f'"{value}" {op}' if swapped_name_value else f"{op} {value}",
+        swapped_name_value=swapped_name_value,
+    )
+
+
+def _combine_marker_groups(
+    groups: list[list[BaseMarker]], top_level: bool
+) -> BaseMarker:
     # Combine the groups.
     sub_markers = [
         group[0] if len(group) == 1 else MultiMarker(*group) for group in groups
@@ -1114,11 +1751,160 @@ def _compact_markers(
     return union(*sub_markers)
 
 
-@functools.cache
+DEFAULT_MAX_PRODUCT_SIZE = 2**20
+DEFAULT_MAX_CLAUSES = 2**14
+
+
+class ExpansionBudgetInfo(NamedTuple):
+    product_size_exceeded: int
+    clauses_exceeded: int
+    max_product_size: int | None
+    max_clauses: int | None
+
+
+class ExpansionBudget:
+    """
+    Limits for the expansion of markers into CNF or DNF.
+
+    The expansion is a product of the markers of the sub-markers, which may grow
+    exponentially. If the product of the number of markers of the sub-markers
+    exceeds max_product_size or if the expansion would result in more than
+    max_clauses clauses, cnf() and dnf() abort early and return the marker
+    unnormalized. A limit of None means that the respective size is unbounded.
+    The budget counts how often each limit has been exceeded.
+
+    By default, the active budget (see get_expansion_budget()) has no limits.
+    A budget with the default limits can be activated with
+    set_expansion_budget(ExpansionBudget()).
+    """
+
+    def __init__(
+        self,
+        max_product_size: int | None = DEFAULT_MAX_PRODUCT_SIZE,
+        max_clauses: int | None = DEFAULT_MAX_CLAUSES,
+    ) -> None:
+        for limit in (max_product_size, max_clauses):
+            if limit is not None and limit < 1:
+                raise ValueError(f"Invalid limit: {limit}")
+
+        self._max_product_size = max_product_size
+        self._max_clauses = max_clauses
+        self._lock = threading.Lock()
+        self._product_size_exceeded = 0
+        self._clauses_exceeded = 0
+
+    @property
+    def max_product_size(self) -> int | None:
+        return self._max_product_size
+
+    @property
+    def max_clauses(self) -> int | None:
+        return self._max_clauses
+
+    def check_product_size(self, size: int) -> None:
+        if self._max_product_size is not None and size > self._max_product_size:
+            with self._lock:
+                self._product_size_exceeded += 1
+            raise _ExpansionBudgetExceededError
+
+    def check_clauses(self, clauses: int) -> None:
+        if self._max_clauses is not None and clauses > self._max_clauses:
+            with self._lock:
+                self._clauses_exceeded += 1
+            raise _ExpansionBudgetExceededError
+
+    def reset(self) -> None:
+        """
+        Reset the statistics.
+        """
+        with self._lock:
+            self._product_size_exceeded = self._clauses_exceeded = 0
+
+    def info(self) -> ExpansionBudgetInfo:
+        with self._lock:
+            return ExpansionBudgetInfo(
+                self._product_size_exceeded,
+                self._clauses_exceeded,
+                self._max_product_size,
+                self._max_clauses,
+            )
+
+
+class _ExpansionBudgetExceededError(Exception):
+    pass
+
+
+_expansion_budget = ExpansionBudget(None, None)
+_unbounded_expansion = threading.local()
+
+
+def get_expansion_budget() -> ExpansionBudget:
+    return _expansion_budget
+
+
+def set_expansion_budget(budget: ExpansionBudget) -> ExpansionBudget:
+    """
+    Replace the active expansion budget and return the previous one.
+
+    Passing ExpansionBudget(None, None) disables the limits, which is the default.
+    With limits, cnf() and dnf() may return markers that are not in normal form.
+    intersection() and union() still return equivalent markers in this case,
+    but they may not be simplified.
+    """
+    global _expansion_budget
+
+    previous = _expansion_budget
+    _expansion_budget = budget
+    return previous
+
+
+@contextmanager
+def unbounded_expansion() -> Iterator[None]:
+    """
+    Ignore the expansion budget in the current thread.
+
+    For callers that rely on getting a real CNF or DNF.
+    """
+    previous = getattr(_unbounded_expansion, "active", False)
+    _unbounded_expansion.active = True
+    try:
+        yield
+    finally:
+        _unbounded_expansion.active = previous
+
+
 def cnf(marker: BaseMarker) -> BaseMarker:
-    """Transforms the marker into CNF (conjunctive normal form)."""
+    """
+    Transforms the marker into CNF (conjunctive normal form).
+
+    If an expansion budget with limits has been set (see set_expansion_budget())
+    and the expansion exceeds it, the marker is returned unchanged,
+    i.e. not in CNF.
+    """
+    try:
+        return _cnf(marker)
+    except _ExpansionBudgetExceededError:
+        return marker
+
+
+def dnf(marker: BaseMarker) -> BaseMarker:
+    """
+    Transforms the marker into DNF (disjunctive normal form).
+
+    If an expansion budget with limits has been set (see set_expansion_budget())
+    and the expansion exceeds it, the marker is returned unchanged,
+    i.e. not in DNF.
+    """
+    try:
+        return _dnf(marker)
+    except _ExpansionBudgetExceededError:
+        return marker
+
+
+@_cached
+def _cnf(marker: BaseMarker) -> BaseMarker:
     if isinstance(marker, MarkerUnion):
-        cnf_markers = [cnf(m) for m in marker.markers]
+        cnf_markers = [_cnf(m) for m in marker.markers]
         sub_marker_lists = [
             m.markers if isinstance(m, MultiMarker) else [m] for m in cnf_markers
         ]
@@ -1127,16 +1913,15 @@ def cnf(marker: BaseMarker) -> BaseMarker:
         )
 
     if isinstance(marker, MultiMarker):
-        return MultiMarker.of(*[cnf(m) for m in marker.markers])
+        return MultiMarker.of(*[_cnf(m) for m in marker.markers])
 
     return marker
 
 
-@functools.cache
-def dnf(marker: BaseMarker) -> BaseMarker:
-    """Transforms the marker into DNF (disjunctive normal form)."""
+@_cached
+def _dnf(marker: BaseMarker) -> BaseMarker:
     if isinstance(marker, MultiMarker):
-        dnf_markers = [dnf(m) for m in marker.markers]
+        dnf_markers = [_dnf(m) for m in marker.markers]
         sub_marker_lists = [
             m.markers if isinstance(m, MarkerUnion) else [m] for m in dnf_markers
         ]
@@ -1145,41 +1930,77 @@ def dnf(marker: BaseMarker) -> BaseMarker:
         )
 
     if isinstance(marker, MarkerUnion):
-        return MarkerUnion.of(*[dnf(m) for m in marker.markers])
+        return MarkerUnion.of(*[_dnf(m) for m in marker.markers])
 
     return marker
 
 
-def detect_recursion(func: Callable[..., BaseMarker]) -> Callable[..., BaseMarker]:
-    """Decorator to detect recursions in `intersection` and `union` early."""
-    func.call_args = defaultdict(list)  # type: ignore[attr-defined]
+class _NormalizationState(threading.local):
+    def __init__(self) -> None:
+        # Arguments of the calls of intersection() and union()
+        # that are currently being normalized.
+        self.active: set[tuple[str, tuple[BaseMarker, ...]]] = set()
+        # Number of cycles that have been detected.
+        self.cycles = 0
+
+
+_normalization = _NormalizationState()
+
+
+class _NormalizationCycleError(RecursionError):
+    pass
+
+
+def _detect_cycles(func: Callable[..., BaseMarker]) -> Callable[..., BaseMarker]:
+    """
+    Decorator to detect cycles of `intersection` and `union` early.
+
+    The arguments of the calls in progress are kept in a per-thread set,
+    so that a cycle is detected in O(1). The normalization itself is still
+    recursive: if a function is called again with the same markers while these
+    are being normalized, a RecursionError is raised to unwind the cycle.
+    It is handled like a real RecursionError by the innermost call that
+    is still choosing a candidate. Results that depend on a detected cycle
+    are not stored in the marker cache.
+    """
+    name = func.__name__
 
+    @functools.wraps(func)
     def decorated(*markers: BaseMarker) -> BaseMarker:
-        thread_id = threading.get_ident()
-        call_args = func.call_args[thread_id]  # type: ignore[attr-defined]
-        if markers in call_args:
-            raise RecursionError
-        call_args.append(markers)
+        state = _normalization
+        key = (name, markers)
+        if key in state.active:
+            state.cycles += 1
+            raise _NormalizationCycleError
+
+        state.active.add(key)
         try:
-            result = func(*markers)
+            return func(*markers)
         finally:
-            call_args.pop()
-        return result
+            state.active.discard(key)
 
     return decorated
 
 
-@detect_recursion
-def intersection(*markers: BaseMarker) -> BaseMarker:
-    # Sometimes normalization makes it more complicated instead of simple
-    # -> choose candidate with the least complexity
-    unnormalized: BaseMarker = MultiMarker(*markers)
+def _unnormalized(
+    marker_type: type[MultiMarker | MarkerUnion], markers: tuple[BaseMarker, ...]
+) -> BaseMarker:
+    unnormalized: BaseMarker = marker_type(*markers)
     while (
         isinstance(unnormalized, (MultiMarker, MarkerUnion))
         and len(unnormalized.markers) == 1
     ):
         unnormalized = unnormalized.markers[0]
 
+    return unnormalized
+
+
+@_detect_cycles
+def intersection(*markers: BaseMarker) -> BaseMarker:
+    # Sometimes normalization makes it more complicated instead of simple
+    # -> choose candidate with the least complexity
+    unnormalized = _unnormalized(MultiMarker, markers)
+
     disjunction = dnf(unnormalized)
     if not isinstance(disjunction, MarkerUnion):
         return disjunction
@@ -1196,16 +2017,11 @@ def intersection(*markers: BaseMarker) -> BaseMarker:
     return min(*candidates, key=lambda x: x.complexity)
 
 
-@detect_recursion
+@_detect_cycles
 def union(*markers: BaseMarker) -> BaseMarker:
     # Sometimes normalization makes it more complicated instead of simple
     # -> choose candidate with the least complexity
-    unnormalized: BaseMarker = MarkerUnion(*markers)
-    while (
-        isinstance(unnormalized, (MultiMarker, MarkerUnion))
-        and len(unnormalized.markers) == 1
-    ):
-        unnormalized = unnormalized.markers[0]
+    unnormalized = _unnormalized(MarkerUnion, markers)
 
     conjunction = cnf(unnormalized)
     if not isinstance(conjunction, MultiMarker):
@@ -1229,16 +2045,26 @@ def _unique_product(
     """
     Returns an itertools.product of the sub_marker_lists
     without duplicates (and equivalents) removed while maintaining order.
+
+    Raises _ExpansionBudgetExceededError if the product exceeds
+    the active expansion budget.
     """
+    budget = (
+        None if getattr(_unbounded_expansion, "active", False) else _expansion_budget
+    )
+    if budget is not None:
+        budget.check_product_size(math.prod(len(m) for m in sub_marker_lists))
     unique_sets = set()
     for sub_marker_list in itertools.product(*sub_marker_lists):
         sub_marker_set = frozenset(sub_marker_list)
         if sub_marker_set not in unique_sets:
             unique_sets.add(sub_marker_set)
+            if budget is not None:
+                budget.check_clauses(len(unique_sets))
             yield sub_marker_list
 
 
-@functools.cache
+@_cached
 def _merge_single_markers(
     marker1: SingleMarkerLike[SingleMarkerConstraint],
     marker2: SingleMarkerLike[SingleMarkerConstraint],
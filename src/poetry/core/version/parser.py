@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import hashlib
+import pickle
+
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -12,6 +15,15 @@ if TYPE_CHECKING:
 
 
 class Parser:
+    """
+    Lazily created Lark parser for a grammar.
+
+    If there are serialized parser tables next to the grammar (see save_tables()),
+    they are loaded instead of analyzing the grammar and building the tables.
+    Tables that have been created for another version of Lark or from other
+    grammar files are ignored.
+    """
+
     def __init__(
         self, grammar: Path, parser: str = "lalr", debug: bool = False
     ) -> None:
@@ -20,12 +32,67 @@ class Parser:
         self._debug = debug
         self._lark: Lark | None = None
 
-    def parse(self, text: str, **kwargs: Any) -> Tree:
-        from lark import Lark
+    @property
+    def tables(self) -> Path:
+        return self._grammar.with_suffix(".pickle")
 
+    def parse(self, text: str, **kwargs: Any) -> Tree:
         if self._lark is None:
-            self._lark = Lark.open(
-                grammar_filename=self._grammar, parser=self._parser, debug=self._debug
-            )
+            self._lark = self._load_tables() or self._create()
 
         return self._lark.parse(text=text, **kwargs)
+
+    def save_tables(self) -> None:
+        """
+        Serialize the parser tables so that they can be loaded by other processes.
+        """
+        from lark import __version__
+        from lark.grammar import Rule
+        from lark.lexer import TerminalDef
+
+        data, memo = self._create().memo_serialize([TerminalDef, Rule])
+        content = {
+            "lark": __version__,
+            "grammars": self._grammars_digest(),
+            "data": data,
+            "memo": memo,
+        }
+        with self.tables.open("wb") as f:
+            pickle.dump(content, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _create(self) -> Lark:
+        from lark import Lark
+
+        return Lark.open(
+            grammar_filename=self._grammar, parser=self._parser, debug=self._debug
+        )
+
+    def _load_tables(self) -> Lark | None:
+        if self._parser != "lalr" or self._debug:
+            return None
+
+        from lark import Lark
+        from lark import __version__
+
+        try:
+            with self.tables.open("rb") as f:
+                content = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+        if (
+            not isinstance(content, dict)
+            or content.get("lark") != __version__
+            or content.get("grammars") != self._grammars_digest()
+        ):
+            return None
+
+        return Lark._load_from_dict(content["data"], content["memo"])
+
+    def _grammars_digest(self) -> str:
+        # Grammars may import each other, so we consider all of them.
+        digest = hashlib.sha256()
+        for grammar in sorted(self._grammar.parent.glob("*.lark")):
+            digest.update(grammar.read_bytes())
+
+        return digest.hexdigest()
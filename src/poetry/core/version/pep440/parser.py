@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import functools
 import re
 
 from typing import TYPE_CHECKING
@@ -8,6 +7,7 @@ from typing import TypeVar
 
 from packaging.version import VERSION_PATTERN
 
+from poetry.core.utils.cache import lru_cache
 from poetry.core.version.exceptions import InvalidVersionError
 from poetry.core.version.pep440 import Release
 from poetry.core.version.pep440 import ReleaseTag
@@ -63,7 +63,7 @@ class PEP440Parser:
         )
 
     @classmethod
-    @functools.cache
+    @lru_cache(maxsize=2**16)
     def parse(cls, value: str, version_class: type[T]) -> T:
         match = cls._regex.search(value) if value else None
         if not match:
@@ -80,5 +80,5 @@ class PEP440Parser:
 
 
 def parse_pep440(value: str, version_class: type[T]) -> T:
-    version: T = PEP440Parser.parse(value, version_class)  # type: ignore[arg-type]
+    version: T = PEP440Parser.parse(value, version_class)
     return version
@@ -0,0 +1,221 @@
+"""
+Recursive descent parser for PEP 508 requirements and environment markers.
+
+The parser accepts the same language as the Lark grammars in
+poetry.core.version.grammars, but avoids loading the grammars and building
+parse trees. It is stricter in some rare cases (e.g. escaped quotes in values):
+if it raises PEP508SyntaxError, callers fall back to the Lark parser, which
+either accepts the input or reports a detailed error.
+"""
+
+from __future__ import annotations
+
+import re
+
+from typing import NamedTuple
+from typing import NoReturn
+from typing import Union
+
+
+# A marker item consists of the marker name, the operator, the value
+# (without quotes) and whether the value comes before the name.
+MarkerItem = tuple[str, str, str, bool]
+
+# A disjunction of conjunctions of marker items or nested markers,
+# e.g. [[A, B], [C, D]] represents "(A and B) or (C and D)"
+MarkerGroups = list[list[Union[MarkerItem, "MarkerGroups"]]]
+
+_WHITESPACE = re.compile(r"[ \t]*")
+_MARKER_NAME = re.compile(
+    r"implementation_version"
+    r"|platform_python_implementation"
+    r"|implementation_name"
+    r"|python_full_version"
+    r"|platform_release"
+    r"|platform_version"
+    r"|platform_machine"
+    r"|platform_system"
+    r"|python_version"
+    r"|sys_platform"
+    r"|os_name"
+    r"|os\.name"
+    r"|sys\.platform"
+    r"|platform\.version"
+    r"|platform\.machine"
+    r"|platform\.python_implementation"
+    r"|python_implementation"
+    r"|extra"
+)
+_MARKER_OP = re.compile(r"===|==|>=|<=|>|<|!=|~=|not in|in")
+# Double-quoted strings may contain escape sequences. We leave those to Lark.
+_MARKER_VALUE = re.compile(r"""'[^']*'|"[^"\\\n]*\"""")
+_BOOL_OP = re.compile(r"and|or")
+_NAME = re.compile(r"[a-zA-Z0-9][a-zA-Z0-9\-_.]*")
+_VERSION_CONSTRAINT = re.compile(r"(~=|==|!=|<=|>=|<|>)\s*[^,;\s)]*", re.IGNORECASE)
+_URI = re.compile(r"[^ ]+")
+
+
+class PEP508SyntaxError(ValueError):
+    """
+    The input could not be parsed.
+    """
+
+
+class ParsedRequirement(NamedTuple):
+    name: str
+    extras: list[str]
+    constraints: list[str]
+    url: str | None
+    marker: str | None
+
+
+class _Scanner:
+    def __init__(self, text: str) -> None:
+        self._text = text
+        self._pos = 0
+
+    @property
+    def position(self) -> int:
+        return self._pos
+
+    def at_end(self) -> bool:
+        self._skip_whitespace()
+        return self._pos == len(self._text)
+
+    def accept(self, literal: str) -> bool:
+        self._skip_whitespace()
+        if self._text.startswith(literal, self._pos):
+            self._pos += len(literal)
+            return True
+
+        return False
+
+    def expect(self, literal: str) -> None:
+        if not self.accept(literal):
+            self.fail()
+
+    def match(self, pattern: re.Pattern[str]) -> str | None:
+        self._skip_whitespace()
+        m = pattern.match(self._text, self._pos)
+        if m is None:
+            return None
+
+        self._pos = m.end()
+        return m.group()
+
+    def fail(self) -> NoReturn:
+        raise PEP508SyntaxError(
+            f"Unexpected input at column {self._pos + 1}: {self._text!r}"
+        )
+
+    def _skip_whitespace(self) -> None:
+        m = _WHITESPACE.match(self._text, self._pos)
+        assert m is not None
+        self._pos = m.end()
+
+
+def parse_marker_groups(text: str) -> MarkerGroups:
+    """
+    Parse an environment marker into groups of marker items.
+    """
+    scanner = _Scanner(text)
+    groups = _parse_marker(scanner)
+    if not scanner.at_end():
+        scanner.fail()
+
+    return groups
+
+
+def parse_requirement_parts(text: str) -> ParsedRequirement:
+    """
+    Parse a PEP 508 requirement into its parts.
+
+    The parts are not validated any further, e.g. constraints are
+    the raw strings of the version specifiers. The marker is only checked
+    for syntax errors and returned as string, so that the result of parsing
+    it can be shared by all requirements with the same marker.
+    """
+    scanner = _Scanner(text)
+    name = scanner.match(_NAME)
+    if name is None:
+        scanner.fail()
+
+    extras = []
+    if scanner.accept("["):
+        extra = scanner.match(_NAME)
+        if extra is not None:
+            extras.append(extra)
+            while scanner.accept(","):
+                extra = scanner.match(_NAME)
+                if extra is None:
+                    scanner.fail()
+                extras.append(extra)
+        scanner.expect("]")
+
+    constraints = []
+    url = None
+    if scanner.accept("@"):
+        url = scanner.match(_URI)
+        if url is None:
+            scanner.fail()
+    else:
+        parenthesized = scanner.accept("(")
+        constraint = scanner.match(_VERSION_CONSTRAINT)
+        if constraint is not None:
+            constraints.append(constraint)
+            while scanner.accept(","):
+                constraint = scanner.match(_VERSION_CONSTRAINT)
+                if constraint is None:
+                    scanner.fail()
+                constraints.append(constraint)
+        elif parenthesized:
+            scanner.fail()
+        if parenthesized:
+            scanner.expect(")")
+
+    marker = None
+    if scanner.accept(";"):
+        start = scanner.position
+        _parse_marker(scanner)
+        marker = text[start : scanner.position].strip(" \t")
+
+    if not scanner.at_end():
+        scanner.fail()
+
+    return ParsedRequirement(name, extras, constraints, url, marker)
+
+
+def _parse_marker(scanner: _Scanner) -> MarkerGroups:
+    groups: MarkerGroups = [[_parse_atom(scanner)]]
+    while True:
+        bool_op = scanner.match(_BOOL_OP)
+        if bool_op is None:
+            return groups
+        if bool_op == "or":
+            groups.append([])
+        groups[-1].append(_parse_atom(scanner))
+
+
+def _parse_atom(scanner: _Scanner) -> MarkerItem | MarkerGroups:
+    if scanner.accept("("):
+        groups = _parse_marker(scanner)
+        scanner.expect(")")
+        return groups
+
+    name = scanner.match(_MARKER_NAME)
+    if name is not None:
+        op = scanner.match(_MARKER_OP)
+        value = scanner.match(_MARKER_VALUE)
+        if op is None or value is None:
+            scanner.fail()
+        return name, op, value[1:-1], False
+
+    value = scanner.match(_MARKER_VALUE)
+    if value is not None:
+        op = scanner.match(_MARKER_OP)
+        name = scanner.match(_MARKER_NAME)
+        if op is None or name is None:
+            scanner.fail()
+        return name, op, value[1:-1], True
+
+    scanner.fail()
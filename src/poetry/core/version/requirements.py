@@ -1,20 +1,28 @@
 from __future__ import annotations
 
-import functools
 import urllib.parse as urlparse
 
 from typing import TYPE_CHECKING
+from typing import NamedTuple
 
 from poetry.core.constraints.version import parse_constraint
 from poetry.core.constraints.version.exceptions import ParseConstraintError
+from poetry.core.utils.cache import lru_cache
 from poetry.core.version.grammars import GRAMMAR_PEP_508_CONSTRAINTS
 from poetry.core.version.markers import _compact_markers
+from poetry.core.version.markers import parse_marker
 from poetry.core.version.parser import Parser
+from poetry.core.version.pep508 import PEP508SyntaxError
+from poetry.core.version.pep508 import parse_requirement_parts
 
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from poetry.core.constraints.version import VersionConstraint
+    from poetry.core.version.markers import BaseMarker
+    from poetry.core.version.pep508 import ParsedRequirement
+
 
 class InvalidRequirementError(ValueError):
     """
@@ -26,6 +34,14 @@ class InvalidRequirementError(ValueError):
 _parser = Parser(GRAMMAR_PEP_508_CONSTRAINTS, "lalr")
 
 
+class _LarkRequirement(NamedTuple):
+    name: str
+    extras: list[str]
+    constraints: list[str]
+    url: str | None
+    marker: BaseMarker | None
+
+
 class Requirement:
     """
     Parse a requirement.
@@ -33,25 +49,30 @@ class Requirement:
     Parse a given requirement string into its parts, such as name, specifier,
     URL, and extras. Raises InvalidRequirementError on a badly-formed requirement
     string.
-    """
 
-    def __init__(self, requirement_string: str) -> None:
-        from lark import UnexpectedCharacters
-        from lark import UnexpectedToken
+    If constraints or markers are given, the parsed version constraint and marker
+    are looked up in and added to these dictionaries by their strings, so that
+    requirements parsed with the same dictionaries share equal constraints
+    and markers.
+    """
 
+    def __init__(
+        self,
+        requirement_string: str,
+        constraints: dict[str, VersionConstraint] | None = None,
+        markers: dict[str, BaseMarker] | None = None,
+    ) -> None:
+        parts: ParsedRequirement | _LarkRequirement
         try:
-            parsed = _parser.parse(requirement_string)
-        except (UnexpectedCharacters, UnexpectedToken) as e:
-            raise InvalidRequirementError(
-                "The requirement is invalid: Unexpected character at column"
-                f" {e.column}\n\n{e.get_context(requirement_string)}"
-            )
+            parts = parse_requirement_parts(requirement_string)
+        except PEP508SyntaxError:
+            # Let Lark parse the requirement or report a meaningful error.
+            parts = self._parse_with_lark(requirement_string)
 
-        self.name: str = next(parsed.scan_values(lambda t: t.type == "NAME")).value
-        url = next(parsed.scan_values(lambda t: t.type == "URI"), None)
+        self.name: str = parts.name
+        url = parts.url
 
         if url:
-            url = url.value
             parsed_url = urlparse.urlparse(url)
             if parsed_url.scheme == "file":
                 if urlparse.urlunparse(parsed_url) != url:
@@ -64,22 +85,26 @@ class Requirement:
                 raise InvalidRequirementError(
                     f'The requirement is invalid: invalid URL "{url}"'
                 )
-            self.url = url
+            self.url: str | None = url
         else:
             self.url = None
 
-        self.extras: Sequence[str] = [
-            e.value for e in parsed.scan_values(lambda t: t.type == "EXTRA")
-        ]
-        constraint = next(parsed.find_data("version_specification"), None)
-        constraint = ",".join(constraint.children) if constraint else "*"
+        self.extras: Sequence[str] = parts.extras
+        constraint = ",".join(parts.constraints) if parts.constraints else "*"
 
-        try:
-            self.constraint = parse_constraint(constraint)
-        except ParseConstraintError:
-            raise InvalidRequirementError(
-                f'The requirement is invalid: invalid version constraint "{constraint}"'
-            )
+        parsed_constraint = constraints.get(constraint) if constraints else None
+        if parsed_constraint is None:
+            try:
+                parsed_constraint = parse_constraint(constraint)
+            except ParseConstraintError:
+                raise InvalidRequirementError(
+                    "The requirement is invalid: invalid version constraint"
+                    f' "{constraint}"'
+                )
+            if constraints is not None:
+                constraints[constraint] = parsed_constraint
+
+        self.constraint = parsed_constraint
 
         if self.constraint.is_empty():
             raise InvalidRequirementError(
@@ -88,13 +113,44 @@ class Requirement:
 
         self.pretty_constraint = constraint
 
+        self.marker: BaseMarker | None
+        if isinstance(parts.marker, str):
+            if markers is None:
+                self.marker = parse_marker(parts.marker)
+            else:
+                self.marker = markers.get(parts.marker)
+                if self.marker is None:
+                    self.marker = markers[parts.marker] = parse_marker(parts.marker)
+        else:
+            self.marker = parts.marker
+
+    @staticmethod
+    def _parse_with_lark(requirement_string: str) -> _LarkRequirement:
+        from lark import UnexpectedCharacters
+        from lark import UnexpectedToken
+
+        try:
+            parsed = _parser.parse(requirement_string)
+        except (UnexpectedCharacters, UnexpectedToken) as e:
+            raise InvalidRequirementError(
+                "The requirement is invalid: Unexpected character at column"
+                f" {e.column}\n\n{e.get_context(requirement_string)}"
+            )
+
+        name = next(parsed.scan_values(lambda t: t.type == "NAME")).value
+        url = next(parsed.scan_values(lambda t: t.type == "URI"), None)
+        extras = [e.value for e in parsed.scan_values(lambda t: t.type == "EXTRA")]
+        constraint = next(parsed.find_data("version_specification"), None)
+        constraints = [str(c) for c in constraint.children] if constraint else []
         marker = next(parsed.find_data("marker_spec"), None)
         if marker:
             marker = _compact_markers(
                 marker.children[0].children, tree_prefix="markers__"
             )
 
-        self.marker = marker
+        return _LarkRequirement(
+            name, extras, constraints, url.value if url else None, marker
+        )
 
     def __str__(self) -> str:
         parts = [self.name]
@@ -118,6 +174,6 @@ class Requirement:
         return f"<Requirement({str(self)!r})>"
 
 
-@functools.cache
+@lru_cache(maxsize=2**14)
 def parse_requirement(requirement_string: str) -> Requirement:
     return Requirement(requirement_string)
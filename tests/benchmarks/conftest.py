@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest import Config
+    from pytest import FixtureRequest
+    from pytest import TerminalReporter
+
+
+results_key = pytest.StashKey[list[str]]()
+
+
+@pytest.fixture
+def report(request: FixtureRequest) -> Callable[[str], None]:
+    """
+    Return a function to report a result, which is shown in the terminal summary.
+    """
+    return request.config.stash.setdefault(results_key, []).append
+
+
+def pytest_terminal_summary(terminalreporter: TerminalReporter, config: Config) -> None:
+    results = config.stash.get(results_key, [])
+    if results:
+        terminalreporter.section("benchmarks")
+        for result in results:
+            terminalreporter.write_line(result)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import time
+import zipfile
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pytest
+
+from poetry.core.factory import Factory
+from poetry.core.masonry.builders.wheel import WheelBuilder
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+pytestmark = pytest.mark.benchmark
+
+IGNORED_FILES = 100_000
+
+PYPROJECT = """\
+[project]
+name = "my-package"
+version = "1.2.3"
+"""
+
+
+@pytest.fixture(autouse=True)
+def with_mocked_get_vcs() -> None:
+    # disabled global mocking of get_vcs
+    pass
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    if shutil.which("git") is None:
+        pytest.skip("git is not available")
+
+    # isolate from the user's git configuration and global excludes
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "home" / ".config"))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+
+    path = tmp_path / "project"
+    package = path / "my_package"
+    package.mkdir(parents=True)
+    (path / "pyproject.toml").write_text(PYPROJECT, encoding="utf-8")
+    (path / ".gitignore").write_text("build/\n", encoding="utf-8")
+    (package / "__init__.py").touch()
+
+    ignored = package / "build"
+    for i in range(IGNORED_FILES):
+        directory = ignored / str(i // 1000)
+        if not i % 1000:
+            directory.mkdir(parents=True)
+        (directory / f"{i}.py").touch()
+
+    subprocess.check_call(["git", "init", "-q"], cwd=path)
+
+    return path
+
+
+def test_wheel_with_ignored_directory(
+    project: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    report: Callable[[str], None],
+) -> None:
+    """
+    Build a wheel of a package that contains a git-ignored directory
+    with many files.
+    """
+    scanned: list[Path] = []
+    scandir = os.scandir
+
+    def scandir_spy(path: Any = ".") -> Any:
+        scanned.append(Path(os.path.abspath(path)))  # noqa: PTH100
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir_spy)
+
+    start = time.perf_counter()
+    filename = WheelBuilder.make_in(
+        Factory().create_poetry(project), directory=tmp_path / "dist"
+    )
+    elapsed = time.perf_counter() - start
+
+    monkeypatch.undo()
+
+    with zipfile.ZipFile(tmp_path / "dist" / filename) as z:
+        assert "my_package/__init__.py" in z.namelist()
+        assert not any("/build/" in name for name in z.namelist())
+
+    # The ignored directory must be pruned instead of walked and filtered,
+    # which would not fail the benchmark otherwise but only make it slower.
+    ignored = project / "my_package" / "build"
+    assert not [path for path in scanned if path == ignored or ignored in path.parents]
+
+    report(
+        f"WheelBuilder.make_in() with {IGNORED_FILES} ignored files: {elapsed:.2f}s,"
+        f" {len(scanned)} directories scanned"
+    )
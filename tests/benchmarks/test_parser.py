@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import os
+import statistics
+import subprocess
+import sys
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+import poetry.core
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+pytestmark = pytest.mark.benchmark
+
+RUNS = 10
+
+# Lark (vendored by poetry-core) is imported before measuring
+# because importing it does not depend on how the parsers are created.
+STARTUP_SCRIPT = """\
+import time
+
+import poetry.core
+import lark
+
+from poetry.core.version.grammars import GRAMMAR_PEP_508_CONSTRAINTS
+from poetry.core.version.grammars import GRAMMAR_PEP_508_MARKERS
+from poetry.core.version.parser import Parser
+
+start = time.perf_counter()
+Parser(GRAMMAR_PEP_508_CONSTRAINTS).parse('foo[bar] (>=1.0) ; python_version >= "3.8"')
+Parser(GRAMMAR_PEP_508_MARKERS).parse('python_version >= "3.8"')
+print(time.perf_counter() - start)
+"""
+
+
+def test_parser_startup(report: Callable[[str], None]) -> None:
+    """
+    Create the parsers of the PEP 508 grammars in fresh processes,
+    like PEP 517 frontends do for each hook.
+    """
+    env = os.environ.copy()
+    # the sources that are tested
+    env["PYTHONPATH"] = str(Path(poetry.core.__file__).parent.parent.parent)
+
+    timings = [
+        float(
+            subprocess.check_output(
+                [sys.executable, "-c", STARTUP_SCRIPT], env=env, text=True
+            )
+        )
+        for _ in range(RUNS)
+    ]
+
+    report(
+        "Creating the PEP 508 parsers in a fresh process:"
+        f" min {min(timings):.4f}s, median {statistics.median(timings):.4f}s"
+    )
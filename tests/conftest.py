@@ -31,13 +31,26 @@ def pytest_addoption(parser: Parser) -> None:
         default=False,
         help="enable integration tests",
     )
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        dest="benchmark",
+        default=False,
+        help="enable benchmarks",
+    )
 
 
 def pytest_configure(config: Config) -> None:
     config.addinivalue_line("markers", "integration: mark integration tests")
-
-    if not config.option.integration:
-        config.option.markexpr = "not integration"
+    config.addinivalue_line("markers", "benchmark: mark benchmarks")
+
+    disabled = [
+        f"not {marker}"
+        for marker in ("integration", "benchmark")
+        if not getattr(config.option, marker)
+    ]
+    if disabled:
+        config.option.markexpr = " and ".join(disabled)
 
 
 def get_project_from_dir(base_directory: Path) -> Callable[[str], Path]:
@@ -8,6 +8,7 @@ from poetry.core.constraints.version import EmptyConstraint
 from poetry.core.constraints.version import Version
 from poetry.core.constraints.version import VersionRange
 from poetry.core.constraints.version import constraint_regions
+from poetry.core.constraints.version import sort_versions
 
 
 if TYPE_CHECKING:
@@ -81,3 +82,21 @@ def test_constraint_regions(
 ) -> None:
     regions = constraint_regions(versions)
     assert regions == expected
+
+
+def test_sort_versions() -> None:
+    versions = ["1.0", "1.0a1", "1.0.post1", "0.9", "1!0.1", "1.0.0", "1.0.dev0"]
+
+    assert sort_versions(versions) == [
+        "0.9",
+        "1.0.dev0",
+        "1.0a1",
+        "1.0",
+        "1.0.0",
+        "1.0.post1",
+        "1!0.1",
+    ]
+    assert sort_versions(versions) == [
+        v.text for v in sorted(Version.parse(v) for v in versions)
+    ]
+    assert sort_versions(versions, reverse=True)[:2] == ["1!0.1", "1.0.post1"]
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from poetry.core.constraints.version import EmptyConstraint
+from poetry.core.constraints.version import Version
+from poetry.core.constraints.version import VersionIndex
+from poetry.core.constraints.version import parse_constraint
+
+
+RELEASES = ["0.9", "1.0", "1.0.0", "1.1", "2.0", "2.1", "3.0"]
+SUFFIXES = ["", ".dev0", "a1", "a1.post1", "rc1", ".post1", ".post1.dev1"]
+LOCALS = ["", "+local", "+1"]
+VERSIONS = [
+    Version.parse(f"{release}{suffix}{local}")
+    for release, suffix, local in itertools.product(RELEASES, SUFFIXES, LOCALS)
+]
+
+CONSTRAINTS = [
+    "*",
+    "1.0",
+    "1.0+local",
+    "==1.0.*",
+    "!=1.0",
+    ">1.0",
+    ">=1.0",
+    "<2.0",
+    "<=2.0",
+    ">1.0a1",
+    "<2.0a1",
+    "<=2.0a1",
+    ">1.0.post1",
+    ">1.0+local",
+    ">1.0+local,<1.0.post1",
+    ">=1.0+local",
+    "<1.0+local",
+    "<=1.0+local",
+    "!=1.0+local",
+    "!=1.0.post1",
+    ">=1.0,<2.0",
+    ">1.0,<=2.0",
+    "^1.0",
+    "~1.0",
+    "<1.0 || >=2.0",
+    "<1.0 || >1.0,<1.1 || >=2.1.dev0",
+    ">=1.0.dev0,<2.0a1",
+    ">=3.1",
+    "<0.9",
+]
+
+
+@pytest.fixture
+def index() -> VersionIndex:
+    return VersionIndex(VERSIONS)
+
+
+def test_versions_are_sorted(index: VersionIndex) -> None:
+    assert index.versions == sorted(VERSIONS)
+    assert list(index) == index.versions
+    assert len(index) == len(VERSIONS)
+
+
+@pytest.mark.parametrize("constraint", CONSTRAINTS)
+def test_allowed_by(index: VersionIndex, constraint: str) -> None:
+    c = parse_constraint(constraint)
+
+    assert index.allowed_by(c) == [v for v in index if c.allows(v)]
+
+
+def test_allowed_by_empty_constraint(index: VersionIndex) -> None:
+    assert index.allowed_by(EmptyConstraint()) == []
+    assert VersionIndex([]).allowed_by(parse_constraint(">=1.0")) == []
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import importlib
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pytest
+
+from poetry.core.json import _get_validator
+from poetry.core.json import validate_object
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+SCHEMA_NAMES = ["dependency-groups-schema", "poetry-schema", "project-schema"]
+
+
+@pytest.fixture(autouse=True)
+def clear_validators() -> Iterator[None]:
+    _get_validator.cache_clear()
+    yield
+    _get_validator.cache_clear()
+
+
+@pytest.mark.parametrize("schema_name", SCHEMA_NAMES)
+def test_shipped_validators_are_up_to_date(schema_name: str) -> None:
+    module = importlib.import_module(
+        f"poetry.core.json.validators.{schema_name.replace('-', '_')}"
+    )
+
+    assert _get_validator(schema_name) is module.validate, (
+        "Outdated validator, run 'make json/validators'."
+    )
+
+
+@pytest.mark.parametrize("attribute", ["SCHEMA_DIGEST", "FASTJSONSCHEMA_VERSION"])
+def test_outdated_validators_are_ignored(
+    monkeypatch: pytest.MonkeyPatch, attribute: str
+) -> None:
+    from poetry.core.json.validators import poetry_schema
+
+    monkeypatch.setattr(poetry_schema, attribute, "outdated")
+
+    assert _get_validator("poetry-schema") is not poetry_schema.validate
+    assert validate_object({"package-mode": "foo"}, "poetry-schema") == [
+        "data.package-mode must be boolean"
+    ]
+
+
+def test_unknown_schema() -> None:
+    with pytest.raises(ValueError):
+        validate_object({}, "unknown-schema")
+
+
+def test_all_errors_are_reported() -> None:
+    obj: dict[str, Any] = {
+        "description": "multi-\nline",
+        "dependencies": {"foo": 1, "bar": "^1.0", "baz": {"version": 2}},
+        "extras": {"test": ["a{[*+"]},
+        "package-mode": "foo",
+    }
+
+    errors = validate_object(obj, "poetry-schema")
+
+    assert errors == [
+        "data.package-mode must be boolean",
+        r"data.description must match pattern \A[^\n]*\Z",
+        "data.dependencies.foo must be valid exactly by one definition"
+        " (0 matches found)",
+        "data.dependencies.baz must be valid exactly by one definition"
+        " (0 matches found)",
+        "data.extras.test[0] must match pattern ^[a-zA-Z-_.0-9]+$",
+    ]
+    assert obj["dependencies"] == {"foo": 1, "bar": "^1.0", "baz": {"version": 2}}
+
+
+def test_missing_required_properties_caused_by_removal_are_not_reported() -> None:
+    errors = validate_object({"name": 1, "version": 2}, "project-schema")
+
+    assert errors == ["data.name must be string"]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import shutil
+
 from email.parser import Parser
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -8,6 +10,7 @@ import pytest
 
 from poetry.core.factory import Factory
 from poetry.core.masonry.builders.builder import Builder
+from poetry.core.masonry.utils.project_tree import ProjectTree
 from poetry.core.utils._compat import tomllib
 
 
@@ -61,6 +64,95 @@ def test_builder_find_excluded_files_dirs(mocker: MockerFixture) -> None:
     }
 
 
+def test_builder_find_excluded_files_native_gitignore(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    project_path = tmp_path / "project"
+    shutil.copytree(
+        Path(__file__).parent / "fixtures" / "exclude-include-dir", project_path
+    )
+    (project_path / ".git").mkdir()
+    (project_path / ".gitignore").write_text(
+        "/my_package/git-exclude-dir\n", encoding="utf-8"
+    )
+    for file in [
+        "include-dir/file",
+        "other-dir/include-file",
+        "other-dir/other-file",
+        "file",
+    ]:
+        path = project_path / "my_package" / "git-exclude-dir" / file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    get_vcs = mocker.patch("poetry.core.vcs.get_vcs")
+
+    builder = Builder(
+        Factory().create_poetry(project_path),
+        config_settings={"gitignore": "native"},
+    )
+
+    assert builder.find_excluded_files() == {
+        "my_package/exclude-dir/file",
+        "my_package/exclude-dir/other-dir/other-file",
+        "my_package/git-exclude-dir/file",
+        "my_package/git-exclude-dir/other-dir/other-file",
+    }
+    assert get_vcs.call_count == 0
+
+
+def test_builder_invalid_gitignore_config_setting() -> None:
+    with pytest.raises(ValueError) as err:
+        Builder(
+            Factory().create_poetry(Path(__file__).parent / "fixtures" / "complete"),
+            config_settings={"gitignore": "svn"},
+        )
+
+    assert str(err.value) == "Invalid value for config setting 'gitignore': 'svn'"
+
+
+def test_builder_find_exclusions_dirs(mocker: MockerFixture) -> None:
+    mocker.patch("poetry.core.vcs.git.Git.get_ignored_files", return_value=[])
+
+    builder = Builder(
+        Factory().create_poetry(
+            Path(__file__).parent / "fixtures" / "exclude-include-dir"
+        )
+    )
+    exclusions = builder.find_exclusions()
+
+    # excluded directories are stored as a whole
+    assert set(exclusions.excluded_paths()) == {"my_package/exclude-dir"}
+    assert builder.is_excluded("my_package/exclude-dir/file")
+    assert builder.is_excluded("my_package/exclude-dir/new-dir/new-file")
+    assert not builder.is_excluded("my_package/exclude-dir/include-dir/file")
+    assert not builder.is_excluded("my_package/exclude-dir/other-dir/include-file")
+    assert builder.is_excluded("my_package/exclude-dir/other-dir/other-file")
+    assert not builder.is_excluded("my_package/__init__.py")
+
+
+def test_builder_find_files_to_add_does_not_enter_ignored_dirs(
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch(
+        "poetry.core.vcs.git.Git.get_ignored_files",
+        return_value=["my_package/data/sub_data/"],
+    )
+    listing = mocker.spy(ProjectTree, "_listing")
+    project_path = (
+        Path(__file__).parent / "fixtures" / "default_with_excluded_data_toml"
+    )
+    builder = Builder(Factory().create_poetry(project_path))
+
+    files = {
+        f.relative_to_project_root().as_posix() for f in builder.find_files_to_add()
+    }
+
+    assert files == {"my_package/__init__.py"}
+    scanned = {Path(call.args[1]).resolve() for call in listing.call_args_list}
+    assert (project_path / "my_package" / "data").resolve() in scanned
+    assert (project_path / "my_package" / "data" / "sub_data").resolve() not in scanned
+
+
 def test_builder_find_case_sensitive_excluded_files(mocker: MockerFixture) -> None:
     mocker.patch("poetry.core.vcs.git.Git.get_ignored_files", return_value=[])
 
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import hashlib
 import importlib.machinery
+import io
 import logging
 import os
 import re
 import shutil
 import zipfile
 
+from base64 import urlsafe_b64encode
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
@@ -16,6 +19,8 @@ import pytest
 
 from poetry.core.factory import Factory
 from poetry.core.masonry.builders.wheel import WheelBuilder
+from poetry.core.masonry.builders.wheel import _supports_precompressed_data
+from poetry.core.masonry.utils import build_cache
 from tests.masonry.builders.test_sdist import project
 
 
@@ -105,6 +110,200 @@ def test_wheel_package_target_dir(tmp_path: Path, target_dir: str | None) -> Non
         assert "my_package/sub_pkg1/__init__.py" in z.namelist()
 
 
+@pytest.mark.parametrize("project", ["complete", "licenses_and_copying"])
+@pytest.mark.parametrize("jobs", ["0", "4"])
+def test_wheel_parallel_is_identical(tmp_path: Path, project: str, jobs: str) -> None:
+    module_path = fixtures_dir / project
+    serial = tmp_path / "serial"
+    parallel = tmp_path / "parallel"
+
+    filename = WheelBuilder.make_in(
+        Factory().create_poetry(module_path), directory=serial
+    )
+    WheelBuilder.make_in(
+        Factory().create_poetry(module_path),
+        directory=parallel,
+        config_settings={"jobs": jobs},
+    )
+
+    assert (parallel / filename).read_bytes() == (serial / filename).read_bytes()
+
+
+@pytest.mark.parametrize("jobs", ["1", "4"])
+def test_wheel_build_cache_is_identical(
+    tmp_path: Path, mocker: MockerFixture, jobs: str
+) -> None:
+    module_path = fixtures_dir / "complete"
+    config_settings = {"cache-dir": str(tmp_path / "cache"), "jobs": jobs}
+    compress = mocker.spy(build_cache, "compress")
+
+    filename = WheelBuilder.make_in(
+        Factory().create_poetry(module_path), directory=tmp_path / "default"
+    )
+    WheelBuilder.make_in(
+        Factory().create_poetry(module_path),
+        directory=tmp_path / "cold",
+        config_settings=config_settings,
+    )
+    assert compress.call_count > 0
+    compress.reset_mock()
+    WheelBuilder.make_in(
+        Factory().create_poetry(module_path),
+        directory=tmp_path / "warm",
+        config_settings=config_settings,
+    )
+
+    # dist-info files are generated in memory and legal files did not change,
+    # so nothing is compressed again
+    assert compress.call_count == 0
+    expected = (tmp_path / "default" / filename).read_bytes()
+    assert (tmp_path / "cold" / filename).read_bytes() == expected
+    assert (tmp_path / "warm" / filename).read_bytes() == expected
+
+
+@pytest.mark.parametrize("config_settings", [{"jobs": "4"}, {"cache-dir": None}])
+def test_wheel_without_precompressed_data_support_is_identical(
+    tmp_path: Path, mocker: MockerFixture, config_settings: dict[str, Any]
+) -> None:
+    module_path = fixtures_dir / "complete"
+    if "cache-dir" in config_settings:
+        config_settings["cache-dir"] = str(tmp_path / "cache")
+
+    filename = WheelBuilder.make_in(
+        Factory().create_poetry(module_path), directory=tmp_path / "default"
+    )
+    mocker.patch(
+        "poetry.core.masonry.builders.wheel._supports_precompressed_data",
+        return_value=False,
+    )
+    add_compressed_file = mocker.spy(WheelBuilder, "_add_compressed_file")
+    WheelBuilder.make_in(
+        Factory().create_poetry(module_path),
+        directory=tmp_path / "fallback",
+        config_settings=config_settings,
+    )
+
+    assert add_compressed_file.call_count == 0
+    assert (tmp_path / "fallback" / filename).read_bytes() == (
+        tmp_path / "default" / filename
+    ).read_bytes()
+
+
+def test_supports_precompressed_data(mocker: MockerFixture) -> None:
+    _supports_precompressed_data.cache_clear()
+    assert _supports_precompressed_data()
+
+    # zipfile internals changed
+    _supports_precompressed_data.cache_clear()
+    mocker.patch.object(zipfile.ZipFile, "open", return_value=io.BytesIO())
+    assert not _supports_precompressed_data()
+
+    _supports_precompressed_data.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "config_settings",
+    [{"jobs": "4"}, {"cache-dir": None}, {"jobs": "4", "cache-dir": None}],
+)
+def test_wheel_adds_precompressed_data(
+    tmp_path: Path, mocker: MockerFixture, config_settings: dict[str, Any]
+) -> None:
+    # Adding compressed data relies on internals of zipfile. This test runs on
+    # all supported Python versions to ensure that the fallback is not taken.
+    module_path = fixtures_dir / "complete"
+    if "cache-dir" in config_settings:
+        config_settings["cache-dir"] = str(tmp_path / "cache")
+
+    _supports_precompressed_data.cache_clear()
+    assert _supports_precompressed_data()
+
+    add_file = mocker.spy(WheelBuilder, "_add_file")
+    add_compressed_file = mocker.spy(WheelBuilder, "_add_compressed_file")
+    filename = WheelBuilder.make_in(
+        Factory().create_poetry(module_path),
+        directory=tmp_path / "precompressed",
+        config_settings=config_settings,
+    )
+
+    assert add_compressed_file.call_count > 0
+    assert add_file.call_count == 0
+
+    mocker.stopall()
+    WheelBuilder.make_in(
+        Factory().create_poetry(module_path), directory=tmp_path / "default"
+    )
+    assert (tmp_path / "precompressed" / filename).read_bytes() == (
+        tmp_path / "default" / filename
+    ).read_bytes()
+
+
+@pytest.mark.parametrize("project", ["complete", "licenses_and_copying"])
+@pytest.mark.parametrize("editable", [False, True])
+def test_wheel_dist_info_is_identical_to_prepared_metadata(
+    tmp_path: Path, project: str, editable: bool
+) -> None:
+    module_path = fixtures_dir / project
+    metadata_directory = WheelBuilder(
+        Factory().create_poetry(module_path)
+    ).prepare_metadata(tmp_path / "metadata")
+
+    filename = WheelBuilder.make_in(
+        Factory().create_poetry(module_path),
+        directory=tmp_path / "in_memory",
+        editable=editable,
+    )
+    WheelBuilder.make_in(
+        Factory().create_poetry(module_path),
+        directory=tmp_path / "prepared",
+        editable=editable,
+        metadata_directory=metadata_directory,
+    )
+
+    expected = (tmp_path / "prepared" / filename).read_bytes()
+    assert (tmp_path / "in_memory" / filename).read_bytes() == expected
+
+
+def test_wheel_dist_info_order_is_identical_to_prepared_metadata(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    module_path = fixtures_dir / "licenses_and_copying"
+    get_dist_info_files = WheelBuilder._get_dist_info_files
+
+    def dist_info_files(builder: WheelBuilder) -> dict[Path, str | Path]:
+        # a generated file that is sorted after the legal files
+        return {**get_dist_info_files(builder), Path("zzz.txt"): "content"}
+
+    mocker.patch.object(WheelBuilder, "_get_dist_info_files", dist_info_files)
+    metadata_directory = WheelBuilder(
+        Factory().create_poetry(module_path)
+    ).prepare_metadata(tmp_path / "metadata")
+
+    filename = WheelBuilder.make_in(
+        Factory().create_poetry(module_path), directory=tmp_path / "in_memory"
+    )
+    WheelBuilder.make_in(
+        Factory().create_poetry(module_path),
+        directory=tmp_path / "prepared",
+        metadata_directory=metadata_directory,
+    )
+
+    with zipfile.ZipFile(tmp_path / "in_memory" / filename) as z:
+        names = [name for name in z.namelist() if ".dist-info/" in name]
+    assert [name.split("/", 1)[1] for name in names[-2:]] == ["zzz.txt", "RECORD"]
+    expected = (tmp_path / "prepared" / filename).read_bytes()
+    assert (tmp_path / "in_memory" / filename).read_bytes() == expected
+
+
+@pytest.mark.parametrize("jobs", ["-1", "many"])
+def test_wheel_parallel_invalid_jobs(jobs: str) -> None:
+    module_path = fixtures_dir / "complete"
+
+    with pytest.raises(ValueError, match="Invalid value for config setting 'jobs'"):
+        WheelBuilder(
+            Factory().create_poetry(module_path), config_settings={"jobs": jobs}
+        )
+
+
 def test_wheel_prerelease() -> None:
     module_path = fixtures_dir / "prerelease"
     WheelBuilder.make(Factory().create_poetry(module_path))
@@ -409,6 +608,27 @@ def test_wheel_with_file_with_comma() -> None:
         assert '\n"comma_file/a,b.py"' in records.decode()
 
 
+def test_wheel_streams_large_file(tmp_path: Path, mocker: MockerFixture) -> None:
+    root = tmp_path / "complete"
+    shutil.copytree(fixtures_dir / "complete", root)
+    content = os.urandom(1024 * 1024)
+    (root / "my_package" / "large.bin").write_bytes(content)
+    writestr = mocker.spy(zipfile.ZipFile, "writestr")
+
+    WheelBuilder.make(Factory().create_poetry(root))
+
+    whl = root / "dist" / "my_package-1.2.3-py3-none-any.whl"
+    with zipfile.ZipFile(str(whl)) as z:
+        assert z.read("my_package/large.bin") == content
+        records = z.read("my_package-1.2.3.dist-info/RECORD").decode()
+
+    digest = urlsafe_b64encode(hashlib.sha256(content).digest()).decode()
+    assert f"my_package/large.bin,sha256={digest.rstrip('=')},{len(content)}" in records
+    # files are streamed into the wheel instead of being written in one go
+    written_at_once = {call.args[1].filename for call in writestr.call_args_list}
+    assert "my_package/large.bin" not in written_at_once
+
+
 def test_default_src_with_excluded_data(mocker: MockerFixture) -> None:
     mocker.patch(
         "poetry.core.vcs.git.Git.get_ignored_files",
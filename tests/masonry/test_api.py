@@ -416,6 +416,38 @@ def test_prepare_metadata_for_build_wheel_with_bad_path_dep_succeeds(
     assert "does not exist" in record.message
 
 
+def test_build_wheel_with_metadata_directory_does_not_parse_dependencies(
+    caplog: LogCaptureFixture,
+) -> None:
+    with (
+        TemporaryDirectory(ignore_cleanup_errors=True) as tmp_dir,
+        cwd(fixtures / "with_bad_path_dep"),
+    ):
+        dist_info = api.prepare_metadata_for_build_wheel(str(tmp_dir))
+        assert len(caplog.records) == 1
+
+        caplog.clear()
+        filename = api.build_wheel(
+            str(tmp_dir), metadata_directory=str(Path(tmp_dir) / dist_info)
+        )
+        assert (Path(tmp_dir) / filename).exists()
+    assert len(caplog.records) == 0
+
+
+def test_build_wheel_with_project_cache(tmp_path: Path) -> None:
+    config_settings = {"cache-dir": str(tmp_path / "cache")}
+    with cwd(fixtures / "complete_new"):
+        dist_info = api.prepare_metadata_for_build_wheel(
+            str(tmp_path), config_settings=config_settings
+        )
+        filename = api.build_wheel(str(tmp_path), config_settings=config_settings)
+
+    assert len(list((tmp_path / "cache" / "projects").iterdir())) == 1
+    with zipfile.ZipFile(tmp_path / filename) as zip_file:
+        metadata = zip_file.read(f"{dist_info}/METADATA").decode()
+    assert metadata == (tmp_path / dist_info / "METADATA").read_text(encoding="utf-8")
+
+
 @pytest.mark.parametrize("project", ["complete", "complete_new", "complete_dynamic"])
 def test_build_editable_wheel(project: str) -> None:
     pkg_dir = fixtures / project
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import json
+import os
+import zlib
+
+from typing import TYPE_CHECKING
+
+from poetry.core.masonry.utils import build_cache
+from poetry.core.masonry.utils.build_cache import BuildCache
+from poetry.core.masonry.utils.build_cache import compress_file
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+def test_compress_file(tmp_path: Path) -> None:
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"content" * 100)
+
+    compressed = compress_file(path)
+
+    assert zlib.decompress(compressed.deflated, -15) == b"content" * 100
+    assert compressed.crc == zlib.crc32(b"content" * 100)
+    assert compressed.size == 700
+    assert compressed.hash_digest == "N_LufOPgGfQ2mLQEVRlZZCGs3d0fZjqhPOMCaJAHjhA"
+
+
+def test_build_cache_reuses_unchanged_files(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    cache_dir = tmp_path / "cache"
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"content" * 100)
+
+    cache = BuildCache(cache_dir)
+    assert cache.get(path) == compress_file(path)
+    assert (cache.hits, cache.misses) == (0, 1)
+    cache.save()
+
+    read_bytes = mocker.spy(type(path), "read_bytes")
+    cache = BuildCache(cache_dir)
+    assert cache.get(path) == compress_file(path)
+    assert (cache.hits, cache.misses) == (1, 0)
+    # the source file is only read by compress_file() in the assertion
+    assert [call.args[0] for call in read_bytes.call_args_list].count(path) == 1
+
+
+def test_build_cache_touched_file_is_not_compressed_again(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    cache_dir = tmp_path / "cache"
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"content")
+
+    cache = BuildCache(cache_dir)
+    cache.get(path)
+    cache.save()
+
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    compress = mocker.spy(build_cache, "compress")
+
+    cache = BuildCache(cache_dir)
+    assert cache.get(path) == compress_file(path)
+    assert (cache.hits, cache.misses) == (1, 0)
+    # only called by compress_file() in the assertion
+    assert compress.call_count == 1
+
+
+def test_build_cache_changed_file(tmp_path: Path, mocker: MockerFixture) -> None:
+    cache_dir = tmp_path / "cache"
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"content")
+
+    cache = BuildCache(cache_dir)
+    cache.get(path)
+    cache.save()
+
+    path.write_bytes(b"changed content")
+
+    cache = BuildCache(cache_dir)
+    assert cache.get(path) == compress_file(path)
+    assert (cache.hits, cache.misses) == (0, 1)
+    cache.save()
+
+    # the object of the old content is kept for concurrent builds for a while
+    assert len(list((cache_dir / "objects").iterdir())) == 2
+
+    mocker.patch.object(build_cache, "OBJECT_GRACE_PERIOD", -1)
+    BuildCache(cache_dir).save()
+
+    assert len(list((cache_dir / "objects").iterdir())) == 1
+
+
+def test_build_cache_shared_by_projects(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    paths = []
+    for project in ("foo", "bar"):
+        path = tmp_path / project / "file.txt"
+        path.parent.mkdir()
+        path.write_bytes(f"{project} content".encode())
+        paths.append(path)
+
+    # concurrent builds of both projects
+    caches = [BuildCache(cache_dir), BuildCache(cache_dir)]
+    for cache, path in zip(caches, paths):
+        cache.get(path)
+    for cache in caches:
+        cache.save()
+
+    # sequential builds of both projects
+    for path in paths:
+        cache = BuildCache(cache_dir)
+        assert cache.get(path) == compress_file(path)
+        assert (cache.hits, cache.misses) == (1, 0)
+        cache.save()
+
+    assert len(list((cache_dir / "objects").iterdir())) == 2
+
+
+def test_build_cache_removes_old_entries(tmp_path: Path, mocker: MockerFixture) -> None:
+    cache_dir = tmp_path / "cache"
+    paths = [tmp_path / "old.txt", tmp_path / "new.txt"]
+    for path in paths:
+        path.write_bytes(path.name.encode())
+
+    time = mocker.patch("time.time", return_value=1_000_000_000)
+    cache = BuildCache(cache_dir)
+    cache.get(paths[0])
+    cache.save()
+
+    time.return_value += build_cache.MAX_ENTRY_AGE
+    cache = BuildCache(cache_dir)
+    cache.get(paths[1])
+    cache.save()
+
+    index = json.loads((cache_dir / "index.json").read_text(encoding="utf-8"))
+    assert list(index["files"]) == [str(paths[1].resolve())]
+
+
+def test_build_cache_ignores_invalid_index(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    (cache_dir / "index.json").write_text("{invalid", encoding="utf-8")
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"content")
+
+    cache = BuildCache(cache_dir)
+
+    assert cache.get(path) == compress_file(path)
+    assert (cache.hits, cache.misses) == (0, 1)
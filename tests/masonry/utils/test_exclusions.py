@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from poetry.core.masonry.utils.exclusions import ExclusionTrie
+
+
+@pytest.fixture
+def exclusions() -> ExclusionTrie:
+    exclusions = ExclusionTrie()
+    exclusions.exclude("pkg/excluded")
+    exclusions.exclude("pkg/excluded.txt")
+    exclusions.include("pkg/excluded/included")
+    exclusions.include("pkg/excluded/included.txt")
+    exclusions.exclude("pkg/excluded/included/excluded.txt")
+    return exclusions
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("pkg", False),
+        ("pkg/file.txt", False),
+        ("pkg/excluded.txt", True),
+        ("pkg/excluded.txt/file", True),
+        ("pkg/excluded", True),
+        ("pkg/excluded/file.txt", True),
+        ("pkg/excluded/sub/file.txt", True),
+        ("pkg/excluded/included", False),
+        ("pkg/excluded/included.txt", False),
+        ("pkg/excluded/included/file.txt", False),
+        # explicit includes take precedence over exclusions
+        ("pkg/excluded/included/excluded.txt", False),
+        ("pkg/other/excluded", False),
+    ],
+)
+def test_exclusion_trie_is_excluded(
+    exclusions: ExclusionTrie, path: str, expected: bool
+) -> None:
+    assert exclusions.is_excluded(path) is expected
+    assert exclusions.is_excluded(Path(path)) is expected
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("pkg", False),
+        ("pkg/file.txt", False),
+        ("pkg/excluded.txt", True),
+        # something below is included
+        ("pkg/excluded", False),
+        ("pkg/excluded/sub", True),
+        ("pkg/excluded/sub/subsub", True),
+        ("pkg/excluded/included", False),
+        ("pkg/excluded/included/excluded.txt", False),
+    ],
+)
+def test_exclusion_trie_is_pruned(
+    exclusions: ExclusionTrie, path: str, expected: bool
+) -> None:
+    assert exclusions.is_pruned(path.split("/")) is expected
+
+
+def test_exclusion_trie_excluded_paths(exclusions: ExclusionTrie) -> None:
+    assert set(exclusions.excluded_paths()) == {
+        "pkg/excluded",
+        "pkg/excluded.txt",
+        "pkg/excluded/included/excluded.txt",
+    }
+
+
+def test_exclusion_trie_excluded_files(
+    exclusions: ExclusionTrie, tmp_path: Path
+) -> None:
+    for file in [
+        "pkg/file.txt",
+        "pkg/excluded/file.txt",
+        "pkg/excluded/sub/file.txt",
+        "pkg/excluded/included/file.txt",
+        "pkg/excluded/included.txt",
+    ]:
+        path = tmp_path / file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+    assert set(exclusions.excluded_files(tmp_path)) == {
+        # does not exist but is returned as is
+        "pkg/excluded.txt",
+        "pkg/excluded/file.txt",
+        "pkg/excluded/sub/file.txt",
+    }
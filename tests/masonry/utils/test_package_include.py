@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
 from poetry.core.masonry.utils.package_include import PackageInclude
 
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 fixtures_dir = Path(__file__).parent / "fixtures"
 with_includes = fixtures_dir / "with_includes"
 
@@ -31,6 +35,25 @@ def test_package_include_with_simple_dir() -> None:
     assert pkg_include.elements == [with_includes / "bar/baz.py"]
 
 
+def test_package_include_with_dir_is_expanded_lazily(mocker: MockerFixture) -> None:
+    glob = mocker.spy(Path, "glob")
+
+    pkg_include = PackageInclude(base=fixtures_dir, include="with_includes", formats=[])
+
+    assert pkg_include.package_dir == with_includes
+    assert not any(call.args[1] == "**/*" for call in glob.call_args_list)
+    assert with_includes / "bar/baz.py" in pkg_include.elements
+    assert any(call.args[1] == "**/*" for call in glob.call_args_list)
+
+
+def test_package_include_with_glob_has_no_package_dir() -> None:
+    pkg_include = PackageInclude(
+        base=with_includes, include="extra_package/**/*.py", formats=[]
+    )
+
+    assert pkg_include.package_dir is None
+
+
 def test_package_include_with_nested_dir() -> None:
     pkg_include = PackageInclude(
         base=with_includes, include="extra_package/**/*.py", formats=[]
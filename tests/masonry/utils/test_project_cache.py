@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import shutil
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from poetry.core.factory import Factory
+from poetry.core.masonry.metadata import Metadata
+from poetry.core.masonry.utils.project_cache import ProjectCache
+from poetry.core.packages.path_dependency import PathDependency
+
+
+if TYPE_CHECKING:
+    from pytest import LogCaptureFixture
+    from pytest_mock import MockerFixture
+
+
+fixtures_dir = Path(__file__).parent.parent / "builders" / "fixtures"
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    path = tmp_path / "project"
+    shutil.copytree(fixtures_dir / "complete_new", path)
+
+    return path
+
+
+def test_project_cache_reuses_project(
+    project: Path, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    cache_dir = tmp_path / "cache"
+    cache = ProjectCache(cache_dir)
+    poetry = cache.create_poetry(project, with_groups=False)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    create_poetry = mocker.spy(Factory, "create_poetry")
+    cache = ProjectCache(cache_dir)
+    cached = cache.create_poetry(project / "my_package", with_groups=False)
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert create_poetry.call_count == 0
+
+    assert cached.pyproject_path == poetry.pyproject_path
+    assert cached.local_config == poetry.local_config
+    assert cached.package.all_requires == poetry.package.all_requires
+    assert vars(Metadata.from_package(cached.package)) == vars(
+        Metadata.from_package(poetry.package)
+    )
+
+
+def test_project_cache_distinguishes_groups(project: Path, tmp_path: Path) -> None:
+    cache = ProjectCache(tmp_path / "cache")
+    poetry = cache.create_poetry(project, with_groups=False)
+    assert not poetry.package.has_dependency_group("dev")
+
+    poetry = cache.create_poetry(project, with_groups=True)
+    assert poetry.package.has_dependency_group("dev")
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+@pytest.mark.parametrize("file", ["pyproject.toml", "README.rst"])
+def test_project_cache_detects_changes(
+    project: Path, tmp_path: Path, file: str
+) -> None:
+    cache = ProjectCache(tmp_path / "cache")
+    cache.create_poetry(project)
+
+    path = project / file
+    path.write_text(path.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    cache.create_poetry(project)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    cache.create_poetry(project)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+@pytest.mark.parametrize("change", ["pyproject.toml", "setup.py", "remove"])
+def test_project_cache_detects_changes_of_path_dependencies(
+    tmp_path: Path, change: str
+) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "pyproject.toml").write_text(
+        '[tool.poetry]\nname = "foo"\nversion = "1.0"\n\n'
+        '[tool.poetry.dependencies]\ndep = { path = "../dep" }\n',
+        encoding="utf-8",
+    )
+    dependency = tmp_path / "dep"
+    dependency.mkdir()
+    (dependency / "pyproject.toml").write_text(
+        '[project]\nname = "dep"\nversion = "1.0"\n', encoding="utf-8"
+    )
+
+    cache = ProjectCache(tmp_path / "cache")
+    cache.create_poetry(project)
+    cache.create_poetry(project)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    if change == "remove":
+        shutil.rmtree(dependency)
+    else:
+        (dependency / change).write_text("\n", encoding="utf-8")
+    poetry = cache.create_poetry(project)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    dep = poetry.package.all_requires[0]
+    assert isinstance(dep, PathDependency)
+    assert dep.validate(raise_error=False) is (change != "remove")
+
+
+def test_project_cache_ignores_invalid_entries(project: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    cache = ProjectCache(cache_dir)
+    cache.create_poetry(project)
+
+    for entry in (cache_dir / "projects").iterdir():
+        entry.write_bytes(b"invalid")
+
+    cache.create_poetry(project)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_project_cache_logs_warnings(
+    project: Path, tmp_path: Path, caplog: LogCaptureFixture
+) -> None:
+    cache = ProjectCache(tmp_path / "cache")
+    cache.create_poetry(project)
+    warnings = [r.message for r in caplog.records if r.levelname == "WARNING"]
+    assert warnings
+
+    caplog.clear()
+    cache.create_poetry(project)
+    assert cache.hits == 1
+    assert [r.message for r in caplog.records if r.levelname == "WARNING"] == warnings
+
+
+def test_project_cache_validates_once(
+    project: Path, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    validate = mocker.spy(Factory, "validate")
+    cache = ProjectCache(tmp_path / "cache")
+    cache.create_poetry(project)
+
+    assert validate.call_count == 1
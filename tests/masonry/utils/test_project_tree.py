@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import os
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from poetry.core.masonry.utils.project_tree import ProjectTree
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def tree_root(tmp_path: Path) -> Path:
+    for file in ["a.txt", ".hidden", "sub/b.txt", "sub/subsub/c.txt", "other/d.txt"]:
+        path = tmp_path / file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    (tmp_path / "empty").mkdir()
+
+    return tmp_path
+
+
+def test_project_tree_listdir(tree_root: Path) -> None:
+    tree = ProjectTree()
+
+    assert tree.listdir(tree_root) == (
+        ["empty", "other", "sub"],
+        [".hidden", "a.txt"],
+    )
+    assert tree.listdir(tree_root / "missing") == ([], [])
+
+
+def test_project_tree_walk(tree_root: Path) -> None:
+    tree = ProjectTree()
+
+    assert [
+        (path.relative_to(tree_root).as_posix(), dirnames, filenames)
+        for path, dirnames, filenames in tree.walk(tree_root)
+    ] == [
+        (".", ["empty", "other", "sub"], [".hidden", "a.txt"]),
+        ("empty", [], []),
+        ("other", [], ["d.txt"]),
+        ("sub", ["subsub"], ["b.txt"]),
+        ("sub/subsub", [], ["c.txt"]),
+    ]
+
+
+def test_project_tree_walk_prune(tree_root: Path) -> None:
+    tree = ProjectTree()
+
+    visited = []
+    for path, dirnames, _ in tree.walk(tree_root):
+        visited.append(path.relative_to(tree_root).as_posix())
+        if "sub" in dirnames:
+            dirnames.remove("sub")
+
+    assert visited == [".", "empty", "other"]
+    # pruning does not modify the snapshot
+    assert tree.listdir(tree_root)[0] == ["empty", "other", "sub"]
+
+
+def test_project_tree_files_matches_glob(tree_root: Path) -> None:
+    tree = ProjectTree()
+
+    assert sorted(tree.files(tree_root)) == sorted(
+        p for p in tree_root.glob("**/*") if p.is_file()
+    )
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks not supported")
+def test_project_tree_does_not_follow_symlinked_dirs(tree_root: Path) -> None:
+    try:
+        (tree_root / "link").symlink_to(tree_root / "sub", target_is_directory=True)
+    except OSError:
+        pytest.skip("symlinks not supported")
+
+    tree = ProjectTree()
+
+    assert tree.listdir(tree_root)[0] == ["empty", "link", "other", "sub"]
+    assert all("link" not in p.parts for p in tree.files(tree_root))
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks not supported")
+def test_project_tree_follows_symlinked_dirs_once(tree_root: Path) -> None:
+    try:
+        (tree_root / "sub" / "link").symlink_to(tree_root, target_is_directory=True)
+    except OSError:
+        pytest.skip("symlinks not supported")
+
+    tree = ProjectTree()
+
+    assert sorted(
+        p.relative_to(tree_root).as_posix()
+        for p in tree.files(tree_root / "sub", follow_symlinks=True)
+    ) == [
+        "sub/b.txt",
+        "sub/link/.hidden",
+        "sub/link/a.txt",
+        "sub/link/other/d.txt",
+        "sub/link/sub/b.txt",
+        "sub/link/sub/subsub/c.txt",
+        "sub/subsub/c.txt",
+    ]
+
+
+def test_project_tree_scans_directories_once(
+    tree_root: Path, mocker: MockerFixture
+) -> None:
+    scandir = mocker.spy(os, "scandir")
+    tree = ProjectTree()
+
+    list(tree.files(tree_root))
+    list(tree.walk(tree_root / "sub"))
+    tree.listdir(tree_root)
+
+    assert scandir.call_count == 5
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
 from packaging.utils import canonicalize_name
@@ -13,6 +15,10 @@ from poetry.core.version.markers import parse_marker
 from poetry.core.version.requirements import InvalidRequirementError
 
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
 @pytest.mark.parametrize(
     "constraint",
     [
@@ -396,6 +402,50 @@ def test_create_from_pep_508_starting_with_digit() -> None:
     assert dependency.name == "2captcha-python"
 
 
+def test_create_from_pep_508_batch() -> None:
+    requirements = [
+        'foo>=1.0 ; python_version >= "3.9"',
+        'bar>=1.0 ; python_version >= "3.9" and extra == "test"',
+        "baz @ https://example.com/baz-1.0.tar.gz",
+        'foo>=1.0 ; python_version >= "3.9"',
+        'bar >=1.0; python_version >= "3.9" and extra == "test"',
+    ]
+
+    dependencies = Dependency.create_from_pep_508_batch(
+        iter(requirements), groups=iter(["dev"])
+    )
+
+    assert dependencies == [Dependency.create_from_pep_508(r) for r in requirements]
+    assert [d.groups for d in dependencies] == [frozenset(["dev"])] * 5
+    assert [d.in_extras for d in dependencies] == [[], ["test"], [], [], ["test"]]
+    assert dependencies[0] is not dependencies[3]
+    assert dependencies[1].constraint is dependencies[0].constraint
+    assert dependencies[1].marker is dependencies[4].marker
+    assert dependencies[0].python_constraint is dependencies[1].python_constraint
+
+
+def test_create_from_pep_508_batch_parses_constraints_and_markers_once(
+    mocker: MockerFixture,
+) -> None:
+    from poetry.core.version import requirements
+
+    parse_constraint = mocker.spy(requirements, "parse_constraint")
+    parse_marker = mocker.spy(requirements, "parse_marker")
+
+    dependencies = Dependency.create_from_pep_508_batch(
+        [
+            'foo>=1.0 ; python_version >= "3.9"',
+            'bar>=1.0 ; python_version >= "3.9"',
+            "baz>=1.0",
+        ]
+    )
+
+    assert parse_constraint.call_count == 1
+    assert parse_marker.call_count == 1
+    assert dependencies[0].constraint is dependencies[2].constraint
+    assert dependencies[0].marker is dependencies[1].marker
+
+
 @pytest.mark.parametrize(
     "dependency1, dependency2, expected",
     [
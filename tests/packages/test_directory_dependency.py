@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import pickle
 import sys
 
 from pathlib import Path
@@ -216,3 +217,13 @@ def test_directory_dependency_non_poetry_pep517(fixture: str, name: str) -> None
         if "does not seem to be a Python package" not in str(e):
             raise e from e
         pytest.fail(f"A {name} project not recognized as valid directory dependency")
+
+
+def test_directory_dependency_pickle() -> None:
+    dependency = DirectoryDependency("simple-project", SAMPLE_PROJECT, develop=True)
+
+    unpickled = pickle.loads(pickle.dumps(dependency))
+
+    assert unpickled == dependency
+    assert unpickled.develop
+    assert unpickled.supports_poetry()
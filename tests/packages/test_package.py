@@ -23,6 +23,8 @@ from poetry.core.version.exceptions import InvalidVersionError
 
 
 if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
     from poetry.core.packages.directory_dependency import DirectoryDependency
     from poetry.core.packages.file_dependency import FileDependency
     from poetry.core.packages.url_dependency import URLDependency
@@ -138,6 +140,40 @@ def test_all_classifiers_with_license_classifiers_if_no_spdx() -> None:
     ]
 
 
+def test_all_classifiers_returns_new_list() -> None:
+    package = Package("foo", "0.1.0")
+    package.python_versions = "^3.12"
+    package.classifiers = ["Topic :: Software Development"]
+
+    classifiers = package.all_classifiers
+    assert classifiers == [
+        "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3.12",
+        "Programming Language :: Python :: 3.13",
+        "Programming Language :: Python :: 3.14",
+        "Topic :: Software Development",
+    ]
+
+    classifiers.clear()
+    assert len(package.all_classifiers) == 5
+
+    package.classifiers = [*package.classifiers, "Framework :: Django"]
+    assert package.all_classifiers[0] == "Framework :: Django"
+
+
+def test_all_classifiers_available_pythons(mocker: MockerFixture) -> None:
+    package = Package("foo", "0.1.0")
+    package.python_versions = ">=3.13"
+
+    mocker.patch.object(Package, "AVAILABLE_PYTHONS", {"3", "3.13", "3.14", "3.15"})
+    assert package.all_classifiers == [
+        "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3.13",
+        "Programming Language :: Python :: 3.14",
+        "Programming Language :: Python :: 3.15",
+    ]
+
+
 @pytest.mark.parametrize("groups", [["main"], ["dev"]])
 def test_package_add_dependency_vcs_groups(groups: list[str], f: Factory) -> None:
     package = Package("foo", "0.1.0")
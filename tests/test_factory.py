@@ -2106,3 +2106,72 @@ The Poetry configuration is invalid:
         error_type=RuntimeError,
         temporary_directory=temporary_directory,
     )
+
+
+@pytest.mark.parametrize(
+    "project",
+    [
+        "sample_project",
+        "sample_project_new",
+        "sample_project_with_groups_new",
+        "project_with_markers_and_extras",
+    ],
+)
+@pytest.mark.parametrize("with_groups", [True, False])
+def test_create_poetry_lazy(project: str, with_groups: bool) -> None:
+    eager = Factory().create_poetry(fixtures_dir / project, with_groups=with_groups)
+    lazy = Factory().create_poetry(
+        fixtures_dir / project, with_groups=with_groups, lazy=True
+    )
+
+    assert lazy.package._configure_dependencies is not None
+    assert lazy.package.python_versions == eager.package.python_versions
+    assert lazy.package.entry_points == eager.package.entry_points
+    assert lazy.package._configure_dependencies is not None
+
+    assert lazy.package.dependency_group_names() == (
+        eager.package.dependency_group_names()
+    )
+    assert lazy.package._configure_dependencies is None
+    assert [d.to_pep_508() for d in lazy.package.all_requires] == [
+        d.to_pep_508() for d in eager.package.all_requires
+    ]
+    assert lazy.package.extras == eager.package.extras
+
+
+def test_create_poetry_lazy_clone() -> None:
+    poetry = Factory().create_poetry(
+        fixtures_dir / "sample_project_with_groups_new", lazy=True
+    )
+    package = poetry.package
+
+    clone = package.clone()
+    assert clone._configure_dependencies is not None
+
+    without_docs = package.without_dependency_groups(["docs"])
+    assert package._configure_dependencies is None
+    assert clone._configure_dependencies is not None
+
+    assert not without_docs.has_dependency_group("docs")
+    assert clone.has_dependency_group("docs")
+    assert package.has_dependency_group("docs")
+    assert clone.all_requires == package.all_requires
+    assert clone.dependency_group("docs") is not package.dependency_group("docs")
+
+
+def test_create_poetry_lazy_python_version(tmp_path: Path) -> None:
+    content = """\
+[project]
+name = "foo"
+version = "1"
+requires-python = ">=3.8"
+
+[tool.poetry.dependencies]
+python = "^3.10"
+"""
+    (tmp_path / "pyproject.toml").write_text(content, encoding="utf-8")
+    poetry = Factory().create_poetry(tmp_path, lazy=True)
+
+    assert poetry.package._configure_dependencies is not None
+    assert poetry.package.python_versions == "^3.10"
+    assert str(poetry.package.python_constraint) == ">=3.10,<4.0"
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import pytest
+
+from poetry.core.constraints.version import Version
+from poetry.core.constraints.version import parse_constraint
+from poetry.core.utils.cache import CacheInfo
+from poetry.core.utils.cache import FunctionCache
+from poetry.core.utils.cache import LRUCache
+from poetry.core.utils.cache import cache_info
+from poetry.core.utils.cache import clear_all
+from poetry.core.utils.cache import get_cache
+from poetry.core.utils.cache import get_caches
+from poetry.core.utils.cache import lru_cache
+from poetry.core.utils.cache import register_cache
+from poetry.core.version.markers import MarkerCache
+from poetry.core.version.markers import set_marker_cache
+from poetry.core.version.requirements import parse_requirement
+
+
+def test_lru_cache_get_and_set() -> None:
+    cache: LRUCache[str, int | None] = LRUCache(maxsize=2)
+
+    assert cache.get("a") is None
+    assert cache.get("a", 0) == 0
+    cache.set("a", 1)
+    cache.set("b", None)
+
+    assert cache.get("a") == 1
+    assert cache.get("b", 0) is None
+    assert "a" in cache
+    assert len(cache) == 2
+    assert cache.info() == CacheInfo(
+        hits=2, misses=2, evictions=0, maxsize=2, currsize=2
+    )
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.items() == [("a", 1), ("c", 3)]
+    assert cache.info().evictions == 1
+
+
+def test_lru_cache_resize() -> None:
+    cache: LRUCache[int, int] = LRUCache(maxsize=None)
+    for i in range(10):
+        cache.set(i, i)
+
+    cache.resize(3)
+
+    assert cache.items() == [(7, 7), (8, 8), (9, 9)]
+    assert cache.info() == CacheInfo(
+        hits=0, misses=0, evictions=7, maxsize=3, currsize=3
+    )
+
+
+def test_lru_cache_clear() -> None:
+    cache: LRUCache[str, int] = LRUCache()
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("b")
+
+    cache.clear()
+
+    assert cache.info() == CacheInfo(
+        hits=0, misses=0, evictions=0, maxsize=128, currsize=0
+    )
+
+
+def test_lru_cache_invalid_maxsize() -> None:
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=-1)
+
+
+def test_lru_cache_decorator() -> None:
+    calls = []
+
+    @lru_cache(maxsize=2, name="test-decorator")
+    def double(value: int, factor: int = 2) -> int:
+        calls.append(value)
+        return value * factor
+
+    try:
+        assert double(1) == 2
+        assert double(1) == 2
+        assert double(1, factor=3) == 3
+        assert double(2) == 4
+
+        assert calls == [1, 1, 2]
+        cache = get_cache("test-decorator")
+        assert isinstance(cache, FunctionCache)
+        assert cache is double.cache  # type: ignore[attr-defined]
+        assert cache.info() == CacheInfo(
+            hits=1, misses=3, evictions=1, maxsize=2, currsize=2
+        )
+
+        cache.clear()
+
+        assert double.cache_info().currsize == 0  # type: ignore[attr-defined]
+    finally:
+        register_cache("test-decorator", None)
+
+    assert get_cache("test-decorator") is None
+
+
+def test_lru_cache_decorator_default_name() -> None:
+    @lru_cache()
+    def identity(value: int) -> int:
+        return value
+
+    name = f"{__name__}.{identity.__qualname__}"
+    try:
+        assert get_caches()[name] is identity.cache  # type: ignore[attr-defined]
+        assert isinstance(identity.cache, FunctionCache)  # type: ignore[attr-defined]
+    finally:
+        register_cache(name, None)
+
+
+def test_clear_all() -> None:
+    parse_constraint(">=1.0")
+    parse_requirement('foo>=1.0; python_version >= "3.8"')
+    Version.parse("1.0")
+
+    names = {
+        "poetry.core.constraints.version.parser.parse_constraint",
+        "poetry.core.version.requirements.parse_requirement",
+        "poetry.core.version.pep440.parser.PEP440Parser.parse",
+        "poetry.core.version.markers",
+        "poetry.core.version.markers.parse_marker",
+    }
+    assert names <= set(get_caches())
+    assert all(cache_info()[name].currsize > 0 for name in names)
+
+    clear_all()
+
+    assert all(info.currsize == 0 for info in cache_info().values())
+    assert parse_constraint(">=1.0") == parse_constraint(">=1.0")
+
+
+def test_marker_cache_is_registered() -> None:
+    cache = MarkerCache()
+    previous = set_marker_cache(cache)
+    try:
+        assert get_cache("poetry.core.version.markers") is cache
+    finally:
+        set_marker_cache(previous)
+
+    assert get_cache("poetry.core.version.markers") is previous
@@ -0,0 +1,393 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from poetry.core.vcs import get_gitignore
+from poetry.core.vcs.git import Git
+from poetry.core.vcs.git import executable
+from poetry.core.vcs.gitignore import GitIgnore
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+@pytest.fixture(autouse=True)
+def with_mocked_get_vcs() -> None:
+    # disabled global mocking of get_vcs
+    pass
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    # isolate from the user's git configuration and global excludes
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "home" / ".config"))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    if shutil.which("git") is None:
+        (repo_path / ".git").mkdir()
+    else:
+        subprocess.check_call([executable(), "init", "-q"], cwd=repo_path)
+
+    return repo_path
+
+
+@pytest.fixture
+def cross_check() -> Callable[[Path, list[str], bool], None]:
+    """
+    Compare the native implementation with the output of git
+    for the same repository (only if git is available).
+    """
+
+    def check(repo_path: Path, expected: list[str], directories: bool) -> None:
+        native = GitIgnore.find(repo_path)
+        assert native is not None
+        assert native.get_ignored_files(directories=directories) == expected
+
+        if shutil.which("git") is None:
+            return
+
+        git_result = Git().get_ignored_files(folder=repo_path, directories=directories)
+        assert expected == sorted(git_result)
+
+    return check
+
+
+def _create(repo_path: Path, files: dict[str, str]) -> None:
+    for name, content in files.items():
+        path = repo_path / name
+        if name.endswith("/"):
+            path.mkdir(parents=True, exist_ok=True)
+            continue
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+
+@pytest.mark.parametrize(
+    ("files", "expected"),
+    [
+        # basename patterns match at any level
+        (
+            {".gitignore": "*.log\n", "a.log": "", "b.txt": "", "sub/c.log": ""},
+            ["a.log", "sub/c.log"],
+        ),
+        # a leading or middle slash anchors the pattern
+        (
+            {
+                ".gitignore": "/a.txt\nsub/b.txt\n",
+                "a.txt": "",
+                "b.txt": "",
+                "sub/a.txt": "",
+                "sub/b.txt": "",
+                "other/sub/b.txt": "",
+            },
+            ["a.txt", "sub/b.txt"],
+        ),
+        # a trailing slash only matches directories
+        (
+            {
+                ".gitignore": "build/\n",
+                "build/file": "",
+                "sub/build/file": "",
+                "other/build": "",
+            },
+            ["build/file", "sub/build/file"],
+        ),
+        # the last matching pattern decides
+        (
+            {
+                ".gitignore": "*.log\n!keep.log\n",
+                "a.log": "",
+                "keep.log": "",
+                "sub/keep.log": "",
+            },
+            ["a.log"],
+        ),
+        # files in an ignored directory cannot be re-included
+        (
+            {
+                ".gitignore": "dir/\n!dir/file\n",
+                "dir/file": "",
+                "dir/other": "",
+            },
+            ["dir/file", "dir/other"],
+        ),
+        # ... but files in a directory whose contents are ignored can
+        (
+            {
+                ".gitignore": "dir/*\n!dir/file\n",
+                "dir/file": "",
+                "dir/other": "",
+            },
+            ["dir/other"],
+        ),
+        # double asterisks
+        (
+            {
+                ".gitignore": "**/logs\na/**/b\nc/**\n",
+                "logs/1": "",
+                "x/logs/2": "",
+                "a/b": "",
+                "a/x/y/b": "",
+                "a/c": "",
+                "c/d/e": "",
+                "c.txt": "",
+            },
+            ["a/b", "a/x/y/b", "c/d/e", "logs/1", "x/logs/2"],
+        ),
+        # character classes, wildcards and escapes
+        (
+            {
+                ".gitignore": (
+                    "file[0-2].txt\n[!a-z]*.dat\n?.cfg\n[[:digit:]]x\n"
+                    "\\#hash\n\\!bang\nb\\ \n"
+                ),
+                "file1.txt": "",
+                "file3.txt": "",
+                "1.dat": "",
+                "a.dat": "",
+                "a.cfg": "",
+                "ab.cfg": "",
+                "5x": "",
+                "#hash": "",
+                "!bang": "",
+                "b ": "",
+                "b": "",
+            },
+            ["!bang", "#hash", "1.dat", "5x", "a.cfg", "b ", "file1.txt"],
+        ),
+        # comments, blank lines and trailing spaces
+        (
+            {
+                ".gitignore": "# a.txt\n\nb.txt   \n",
+                "# a.txt": "",
+                "a.txt": "",
+                "b.txt": "",
+            },
+            ["b.txt"],
+        ),
+        # patterns of nested .gitignore files are relative to their directory
+        # and take precedence
+        (
+            {
+                ".gitignore": "*.txt\n",
+                "sub/.gitignore": "!*.txt\n/local\n",
+                "a.txt": "",
+                "sub/b.txt": "",
+                "sub/local": "",
+                "sub/deeper/local": "",
+                "local": "",
+            },
+            ["a.txt", "sub/local"],
+        ),
+    ],
+)
+def test_gitignore_get_ignored_files(
+    repo: Path,
+    cross_check: Callable[[Path, list[str], bool], None],
+    files: dict[str, str],
+    expected: list[str],
+) -> None:
+    _create(repo, files)
+
+    cross_check(repo, expected, False)
+
+
+def test_gitignore_get_ignored_files_directories(
+    repo: Path, cross_check: Callable[[Path, list[str], bool], None]
+) -> None:
+    _create(
+        repo,
+        {
+            ".gitignore": "/ignored\n*.log\n",
+            "ignored/dir/file": "",
+            "ignored/file": "",
+            "other.log": "",
+            "dir/file.log": "",
+            "dir/file.txt": "",
+        },
+    )
+
+    cross_check(repo, ["dir/file.log", "ignored/", "other.log"], True)
+
+
+def test_gitignore_get_ignored_files_directories_not_ignored_themselves(
+    repo: Path, cross_check: Callable[[Path, list[str], bool], None]
+) -> None:
+    # Untracked directories that only contain ignored files are not ignored,
+    # so files that are added to them later must not be excluded.
+    _create(
+        repo,
+        {
+            ".gitignore": "*.so\nbuild/\n",
+            "a/x.so": "",
+            "a/b/y.so": "",
+            "c/build/file.py": "",
+        },
+    )
+
+    cross_check(repo, ["a/b/y.so", "a/x.so", "c/build/"], True)
+
+
+def test_gitignore_info_exclude(
+    repo: Path, cross_check: Callable[[Path, list[str], bool], None]
+) -> None:
+    _create(
+        repo,
+        {
+            ".git/info/exclude": "*.log\n",
+            ".gitignore": "!keep.log\n",
+            "a.log": "",
+            "keep.log": "",
+        },
+    )
+
+    cross_check(repo, ["a.log"], False)
+
+
+def test_gitignore_global_excludes_file(
+    repo: Path, cross_check: Callable[[Path, list[str], bool], None]
+) -> None:
+    _create(
+        repo.parent,
+        {
+            "home/.gitconfig": '[core]\n\texcludesFile = "~/global-ignore"\n',
+            "home/global-ignore": "*.log\n",
+        },
+    )
+    _create(repo, {"a.log": "", "b.txt": ""})
+
+    cross_check(repo, ["a.log"], False)
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not available")
+@pytest.mark.parametrize("index_version", ["2", "3", "4"])
+def test_gitignore_tracked_files_are_not_ignored(
+    repo: Path,
+    cross_check: Callable[[Path, list[str], bool], None],
+    index_version: str,
+) -> None:
+    _create(
+        repo,
+        {
+            ".gitignore": "*.log\ntracked-dir/\n",
+            "tracked.log": "",
+            "untracked.log": "",
+            "tracked-dir/a/file": "",
+            "tracked-dir/b/file": "",
+            "tracked-dir/file": "",
+        },
+    )
+    git = [executable(), "-c", f"index.version={index_version}"]
+    subprocess.check_call(
+        [*git, "add", "-f", "tracked.log", "tracked-dir/a/file"], cwd=repo
+    )
+    if index_version == "3":
+        subprocess.check_call([*git, "add", "-N", "-f", "tracked-dir/file"], cwd=repo)
+
+    expected = ["tracked-dir/b/file", "untracked.log"]
+    if index_version != "3":
+        expected.insert(1, "tracked-dir/file")
+    cross_check(repo, expected, False)
+    cross_check(repo, ["tracked-dir/b/", *expected[1:]], True)
+
+
+def test_gitignore_get_ignored_files_subdirectory(repo: Path) -> None:
+    _create(
+        repo,
+        {
+            ".gitignore": "/sub/a.txt\nb.txt\n",
+            "sub/.gitignore": "c.txt\n",
+            "sub/a.txt": "",
+            "sub/b.txt": "",
+            "sub/c.txt": "",
+            "sub/d.txt": "",
+            "c.txt": "",
+        },
+    )
+
+    gitignore = GitIgnore.find(repo / "sub")
+
+    assert gitignore is not None
+    assert gitignore.work_tree == repo.resolve()
+    assert gitignore.get_ignored_files(repo / "sub") == ["a.txt", "b.txt", "c.txt"]
+
+
+def test_gitignore_is_ignored(repo: Path) -> None:
+    _create(repo, {".gitignore": "/ignored\n*.log\n", "ignored/": "", "sub/": ""})
+
+    gitignore = GitIgnore.find(repo)
+
+    assert gitignore is not None
+    assert not gitignore.is_ignored(repo)
+    assert not gitignore.is_ignored(repo / "sub")
+    assert gitignore.is_ignored(repo / "ignored")
+    assert gitignore.is_ignored(repo / "ignored" / "sub")
+    assert gitignore.is_ignored(repo / "sub" / "file.log")
+
+
+def test_gitignore_nested_repository_is_skipped(repo: Path) -> None:
+    _create(repo, {".gitignore": "*.log\n", "nested/.git/": "", "nested/a.log": ""})
+
+    gitignore = GitIgnore.find(repo)
+
+    assert gitignore is not None
+    assert gitignore.get_ignored_files() == []
+
+
+def test_gitignore_find_worktree(tmp_path: Path) -> None:
+    git_dir = tmp_path / "repo" / ".git" / "worktrees" / "wt"
+    _create(
+        tmp_path,
+        {
+            "repo/.git/info/exclude": "*.log\n",
+            "repo/.git/worktrees/wt/commondir": "../..\n",
+            "wt/.git": f"gitdir: {git_dir}\n",
+            "wt/a.log": "",
+        },
+    )
+
+    gitignore = GitIgnore.find(tmp_path / "wt" / "sub")
+
+    assert gitignore is not None
+    assert gitignore.work_tree == (tmp_path / "wt").resolve()
+    assert gitignore.get_ignored_files() == ["a.log"]
+
+
+def test_gitignore_find_no_repository(tmp_path: Path) -> None:
+    assert GitIgnore.find(tmp_path) is None
+
+
+def test_get_gitignore(repo: Path, mocker: MockerFixture) -> None:
+    _create(repo, {".gitignore": "/ignored\n", "ignored/": "", "sub/": ""})
+    run = mocker.spy(subprocess, "run")
+    check_output = mocker.spy(subprocess, "check_output")
+
+    gitignore = get_gitignore(repo / "sub")
+
+    assert gitignore is not None
+    assert gitignore.work_tree == repo.resolve()
+    assert get_gitignore(repo / "ignored") is None
+    assert run.call_count == 0
+    assert check_output.call_count == 0
+
+
+def test_gitignore_split_index_is_not_supported(repo: Path) -> None:
+    index = b"DIRC" + (2).to_bytes(4, "big") + (0).to_bytes(4, "big")
+    index += b"link" + (20).to_bytes(4, "big") + b"\0" * 20
+    (repo / ".git" / "index").write_bytes(index + b"\0" * 20)
+
+    with pytest.raises(ValueError, match="Split git index is not supported"):
+        GitIgnore.find(repo)
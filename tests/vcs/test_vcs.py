@@ -573,3 +573,27 @@ def test_get_ignored_files_empty_repo(tmp_path: Path) -> None:
     git = Git()
     result = git.get_ignored_files(folder=repo_path)
     assert result == []
+
+
+@pytest.mark.parametrize(
+    ("directories", "expected"),
+    [
+        (False, ["ignored/dir/file", "ignored/file", "other.log"]),
+        (True, ["ignored/", "other.log"]),
+    ],
+)
+def test_get_ignored_files_directories(
+    tmp_path: Path, directories: bool, expected: list[str]
+) -> None:
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    assert subprocess.check_call([executable(), "init"], cwd=repo_path) == 0
+    (repo_path / ".gitignore").write_text("/ignored\n*.log\n", encoding="utf-8")
+    (repo_path / "ignored" / "dir").mkdir(parents=True)
+    (repo_path / "ignored" / "dir" / "file").touch()
+    (repo_path / "ignored" / "file").touch()
+    (repo_path / "other.log").touch()
+
+    git = Git()
+    result = git.get_ignored_files(folder=repo_path, directories=directories)
+    assert sorted(result) == expected
@@ -541,3 +541,51 @@ def test_local_version_ordering_and_equality() -> None:
     assert v_local > v_plain
     # They must not be equal
     assert v_plain != v_local
+
+
+SORT_KEY_VERSIONS = [
+    "0",
+    "0.0.1",
+    "0.9",
+    "1",
+    "1.0.0",
+    "1.0.dev0",
+    "1.0a1.dev1",
+    "1.0a1",
+    "1.0a2",
+    "1.0alpha10",
+    "1.0b2",
+    "1.0rc1",
+    "1.0rc1.post1",
+    "1.0+abc.1",
+    "1.0+abc",
+    "1.0+abc.def",
+    "1.0+0",
+    "1.0+1",
+    "1.0+10",
+    "1.0+1.abc",
+    "1.0.post1.dev1",
+    "1.0.post1",
+    "1.0.post256",
+    "1.0.post1+local",
+    "1.0.0.0.1",
+    "1.2",
+    "1.10",
+    "2!0.1",
+    "1!1.0",
+    "1!1.0.dev1",
+    "255.1",
+    "256.1",
+    "65536",
+    "99999999999999999999999",
+]
+
+
+@pytest.mark.parametrize("version1", SORT_KEY_VERSIONS)
+def test_sort_key_orders_like_versions(version1: str) -> None:
+    v1 = PEP440Version.parse(version1)
+    for version2 in SORT_KEY_VERSIONS:
+        v2 = PEP440Version.parse(version2)
+
+        assert (v1.sort_key < v2.sort_key) == (v1 < v2), version2
+        assert (v1.sort_key == v2.sort_key) == (v1 == v2), version2
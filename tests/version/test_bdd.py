@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from poetry.core.version.bdd import MarkerBDD
+from poetry.core.version.markers import AnyMarker
+from poetry.core.version.markers import EmptyMarker
+from poetry.core.version.markers import parse_marker
+
+
+ATOMS = [
+    'python_version >= "3.8"',
+    'python_version < "3.10"',
+    'python_version == "3.9"',
+    'python_version > "3.11"',
+    'python_full_version >= "3.9.1"',
+    'sys_platform == "linux"',
+    'sys_platform != "win32"',
+    'sys_platform == "darwin"',
+    '"tegra" in platform_release',
+    'extra == "a"',
+    'extra != "b"',
+]
+
+ENVIRONMENTS = [
+    {
+        "python_version": python_version,
+        "python_full_version": f"{python_version}.{patch}",
+        "sys_platform": sys_platform,
+        "platform_release": platform_release,
+        "extra": extras,
+    }
+    for python_version, patch, sys_platform, platform_release, extras in (
+        itertools.product(
+            ["3.7", "3.9", "3.10", "3.12"],
+            [0, 2],
+            ["linux", "win32", "darwin"],
+            ["5.10-tegra", "6.1"],
+            [set(), {"a"}, {"b"}],
+        )
+    )
+]
+
+
+@pytest.fixture
+def bdd() -> MarkerBDD:
+    return MarkerBDD()
+
+
+@pytest.mark.parametrize(
+    ("marker1", "marker2"),
+    [
+        (
+            'python_version >= "3.8" and sys_platform == "linux"',
+            'sys_platform == "linux" and python_version >= "3.8"',
+        ),
+        ('python_version > "3.8"', 'python_version >= "3.9"'),
+        ('python_version <= "3.8"', 'python_version < "3.9"'),
+        (
+            'python_version == "3.8" or python_version == "3.9"',
+            'python_version >= "3.8" and python_version < "3.10"',
+        ),
+        (
+            'sys_platform == "linux" and (extra == "a" or python_version >= "3.8")',
+            'sys_platform == "linux" and extra == "a"'
+            ' or python_version >= "3.8" and sys_platform == "linux"',
+        ),
+        (
+            'sys_platform == "linux" or sys_platform == "darwin"',
+            'sys_platform in "linux darwin"',
+        ),
+        ('sys_platform != "linux" or sys_platform != "win32"', ""),
+        ('"tegra" in platform_release', '"tegra" in platform_release'),
+    ],
+)
+def test_equivalent_markers_are_represented_by_the_same_node(
+    bdd: MarkerBDD, marker1: str, marker2: str
+) -> None:
+    diagram1 = bdd.from_marker(parse_marker(marker1))
+    diagram2 = bdd.from_marker(parse_marker(marker2))
+
+    assert diagram1 == diagram2
+    assert diagram1.node == diagram2.node
+
+
+@pytest.mark.parametrize(
+    "marker",
+    [
+        'sys_platform == "linux" and sys_platform == "win32"',
+        'python_version >= "3.10" and python_version < "3.9"',
+        'python_version > "3.8" and python_version < "3.9"',
+        '"tegra" in platform_release and "tegra" not in platform_release',
+    ],
+)
+def test_contradictions_are_empty(bdd: MarkerBDD, marker: str) -> None:
+    diagram = bdd.from_marker(parse_marker(marker))
+
+    assert diagram.is_empty()
+    assert diagram.to_marker() == EmptyMarker()
+
+
+@pytest.mark.parametrize(
+    "marker",
+    [
+        'python_version < "3.8" or python_version >= "3.8"',
+        'python_version <= "3.8" or python_version >= "3.9"',
+        'sys_platform != "linux" or sys_platform != "win32"',
+        'extra == "a" or extra != "a"',
+    ],
+)
+def test_tautologies_are_any(bdd: MarkerBDD, marker: str) -> None:
+    diagram = bdd.from_marker(parse_marker(marker))
+
+    assert diagram.is_any()
+    assert diagram.to_marker() == AnyMarker()
+
+
+def test_extras_are_not_exclusive(bdd: MarkerBDD) -> None:
+    diagram = bdd.from_marker(parse_marker('extra == "a" and extra == "b"'))
+
+    assert not diagram.is_empty()
+    assert str(diagram.to_marker()) == 'extra == "a" and extra == "b"'
+
+
+@pytest.mark.parametrize(
+    ("marker", "expected"),
+    [
+        (
+            'python_version >= "3.8" and python_version >= "3.9"',
+            'python_version >= "3.9"',
+        ),
+        (
+            'sys_platform != "linux" or sys_platform == "win32"',
+            'sys_platform != "linux"',
+        ),
+        (
+            '(python_version < "3.8" or sys_platform == "linux")'
+            ' and (python_version >= "3.8" or sys_platform == "linux")',
+            'sys_platform == "linux"',
+        ),
+    ],
+)
+def test_to_marker(bdd: MarkerBDD, marker: str, expected: str) -> None:
+    diagram = bdd.from_marker(parse_marker(marker))
+
+    assert str(diagram.to_marker()) == expected
+
+
+def test_operations(bdd: MarkerBDD) -> None:
+    python = bdd.from_marker(parse_marker('python_version >= "3.8"'))
+    linux = bdd.from_marker(parse_marker('sys_platform == "linux"'))
+
+    assert python & linux == bdd.from_marker(
+        parse_marker('python_version >= "3.8" and sys_platform == "linux"')
+    )
+    assert python | linux == bdd.from_marker(
+        parse_marker('python_version >= "3.8" or sys_platform == "linux"')
+    )
+    assert ~python == bdd.from_marker(parse_marker('python_version < "3.8"'))
+    assert bdd.intersection(python, linux) == python & linux
+    assert bdd.union(python, linux) == python | linux
+    assert bdd.intersection() == bdd.true
+    assert bdd.union() == bdd.false
+    assert (python & ~python).is_empty()
+    assert (python | ~python).is_any()
+
+
+def test_size(bdd: MarkerBDD) -> None:
+    diagram = bdd.from_marker(
+        parse_marker('python_version >= "3.8" and python_version < "3.10"')
+    )
+
+    assert len(diagram) == 2
+    assert len(bdd.true) == 0
+
+
+def test_diagrams_of_different_managers_cannot_be_combined(bdd: MarkerBDD) -> None:
+    marker = parse_marker('sys_platform == "linux"')
+    diagram = bdd.from_marker(marker)
+    other = MarkerBDD().from_marker(marker)
+
+    assert diagram != other
+    with pytest.raises(ValueError):
+        diagram.intersect(other)
+
+
+@pytest.mark.parametrize(("atom1", "atom2"), list(itertools.combinations(ATOMS, 2)))
+@pytest.mark.parametrize("operator", ["and", "or"])
+def test_to_marker_is_equivalent(
+    bdd: MarkerBDD, atom1: str, atom2: str, operator: str
+) -> None:
+    marker = parse_marker(f"{atom1} {operator} {atom2}")
+    other = parse_marker('sys_platform == "linux" or extra == "a"')
+    diagram = bdd.from_marker(marker)
+    other_diagram = bdd.from_marker(other)
+
+    for result, validate in (
+        (diagram, marker.validate),
+        (~diagram, lambda env: not marker.validate(env)),
+        (
+            diagram & other_diagram,
+            lambda env: marker.validate(env) and other.validate(env),
+        ),
+        (
+            diagram | ~other_diagram,
+            lambda env: marker.validate(env) or not other.validate(env),
+        ),
+    ):
+        converted = result.to_marker()
+
+        assert bdd.from_marker(converted) == result
+        for environment in ENVIRONMENTS:
+            assert converted.validate(environment) == validate(environment)
@@ -1,30 +1,52 @@
 from __future__ import annotations
 
+import copy
+import gc
 import os
+import pickle
+import weakref
 
 from typing import TYPE_CHECKING
+from typing import Any
 
 import pytest
 
 from poetry.core.constraints.generic import UnionConstraint
 from poetry.core.constraints.generic import parse_constraint as parse_generic_constraint
 from poetry.core.constraints.version import parse_constraint as parse_version_constraint
+from poetry.core.utils.cache import get_cache
+from poetry.core.version.markers import DEFAULT_MAX_CLAUSES
+from poetry.core.version.markers import DEFAULT_MAX_PRODUCT_SIZE
 from poetry.core.version.markers import AnyMarker
 from poetry.core.version.markers import AtomicMarkerUnion
+from poetry.core.version.markers import BaseMarker
 from poetry.core.version.markers import EmptyMarker
+from poetry.core.version.markers import EnvironmentSpace
+from poetry.core.version.markers import ExpansionBudget
 from poetry.core.version.markers import InvalidMarkerError
+from poetry.core.version.markers import MarkerCache
+from poetry.core.version.markers import MarkerEnvironment
 from poetry.core.version.markers import MarkerUnion
 from poetry.core.version.markers import MultiMarker
 from poetry.core.version.markers import SingleMarker
 from poetry.core.version.markers import cnf
 from poetry.core.version.markers import dnf
+from poetry.core.version.markers import get_expansion_budget
+from poetry.core.version.markers import get_marker_cache
 from poetry.core.version.markers import intersection
 from poetry.core.version.markers import parse_marker
+from poetry.core.version.markers import set_expansion_budget
+from poetry.core.version.markers import set_marker_cache
+from poetry.core.version.markers import unbounded_expansion
 from poetry.core.version.markers import union
 
 
 if TYPE_CHECKING:
-    from poetry.core.version.markers import BaseMarker
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
 
 EMPTY = "<empty>"
 
@@ -1538,6 +1560,58 @@ def test_validate(
     m = parse_marker(marker_string)
 
     assert m.validate(environment) is expected
+    assert m.compile()(environment) is expected
+    if environment is not None:
+        assert m.validate(MarkerEnvironment(environment)) is expected
+
+
+def test_marker_environment_parses_values_once(mocker: MockerFixture) -> None:
+    environment = MarkerEnvironment({"python_version": "3.11"})
+    parser = mocker.Mock(side_effect=parse_version_constraint)
+
+    first = environment.parsed("python_version", True, parser)
+    second = environment.parsed("python_version", True, parser)
+
+    assert first is second
+    assert parser.call_count == 1
+    assert environment.parsed("sys_platform", False, parser) is None
+    assert parser.call_count == 1
+
+
+def test_compiled_markers_share_marker_environment() -> None:
+    markers = [
+        parse_marker(m)
+        for m in [
+            'python_version >= "3.8" and sys_platform == "linux"',
+            'python_version < "3.12" or platform_machine == "x86_64"',
+            'sys_platform != "win32" and extra == "foo"',
+            'extra != "bar" and python_full_version >= "3.11.0"',
+        ]
+    ]
+    environment = MarkerEnvironment(
+        {
+            "python_version": "3.11",
+            "python_full_version": "3.11.7",
+            "sys_platform": "linux",
+            "platform_machine": "x86_64",
+            "extra": {"foo"},
+        }
+    )
+
+    assert [m.compile()(environment) for m in markers] == [True] * 4
+    assert set(environment._parsed) == {
+        ("python_version", True),
+        ("python_full_version", True),
+        ("sys_platform", False),
+    }
+
+
+def test_compile_is_cached_and_markers_remain_picklable() -> None:
+    marker = parse_marker('python_version >= "3.8" or extra == "foo"')
+
+    assert marker.compile()({"python_version": "3.7", "extra": "foo"})
+    assert marker._evaluator is marker._evaluator
+    assert pickle.loads(pickle.dumps(marker)) == marker
 
 
 @pytest.mark.parametrize(
@@ -2753,3 +2827,547 @@ def test_merging_python_version_and_python_full_version(
 
     union = parse_marker(m).union(parse_marker(m2))
     assert str(union) == expected_union
+
+
+@pytest.fixture
+def marker_cache() -> Iterator[MarkerCache]:
+    cache = MarkerCache(maxsize=100)
+    previous = set_marker_cache(cache)
+    try:
+        yield cache
+    finally:
+        set_marker_cache(previous)
+
+
+def test_marker_cache_statistics(marker_cache: MarkerCache) -> None:
+    marker_string = 'python_version >= "3.8" or sys_platform == "linux"'
+
+    marker = parse_marker(marker_string)
+    info = marker_cache.info()
+
+    assert get_marker_cache() is marker_cache
+    assert info.hits == 0
+    assert info.misses > 0
+    # Parsed markers are looked up in the function cache of parse_marker() first.
+    assert parse_marker(marker_string) is marker
+    assert marker_cache.info() == info
+
+    function_cache = get_cache("poetry.core.version.markers.parse_marker")
+    assert function_cache is not None
+    function_cache.clear()
+
+    assert parse_marker(marker_string) is marker
+    assert marker_cache.info().hits == 1
+
+
+def test_marker_cache_is_bounded(marker_cache: MarkerCache) -> None:
+    for i in range(200):
+        parse_marker(f'python_version >= "3.{i}"')
+
+    info = marker_cache.info()
+    assert info.currsize == 100
+    assert info.evictions > 0
+
+
+def test_marker_cache_disabled() -> None:
+    marker_string = 'python_version >= "3.8" or sys_platform == "linux"'
+    previous = set_marker_cache(None)
+    assert previous is not None
+    info = previous.info()
+    try:
+        parse_marker(marker_string)
+        parse_marker(marker_string)
+    finally:
+        set_marker_cache(previous)
+
+    assert get_marker_cache() is previous
+    assert previous.info() == info
+
+
+def test_marker_cache_save_and_load(
+    marker_cache: MarkerCache, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    cache_file = tmp_path / "cache" / "markers.pickle"
+    marker_string = (
+        'python_version >= "3.8" and (sys_platform == "linux"'
+        ' or sys_platform == "darwin") and extra != "a"'
+    )
+    marker = parse_marker(marker_string)
+    marker_cache.save(cache_file)
+
+    loaded_cache = MarkerCache(path=cache_file)
+    set_marker_cache(loaded_cache)
+    merge = mocker.spy(SingleMarker, "intersect")
+    loaded_marker = parse_marker(marker_string)
+
+    assert loaded_marker == marker
+    assert str(loaded_marker) == str(marker)
+    assert loaded_cache.info().hits == 1
+    assert merge.call_count == 0
+    assert loaded_cache.items() == marker_cache.items()
+
+
+def test_marker_cache_ignores_invalid_file(tmp_path: Path) -> None:
+    cache_file = tmp_path / "markers.pickle"
+    cache_file.write_bytes(b"invalid")
+
+    cache = MarkerCache(path=cache_file)
+
+    assert len(cache) == 0
+
+
+def test_marker_cache_save_without_path() -> None:
+    with pytest.raises(ValueError):
+        MarkerCache().save()
+
+
+def test_markers_are_interned() -> None:
+    marker_string = (
+        'python_version >= "3.8" and (sys_platform == "linux"'
+        ' or sys_platform == "darwin") and extra != "a"'
+    )
+    marker = parse_marker(marker_string)
+    assert isinstance(marker, MultiMarker)
+
+    assert SingleMarker("python_version", ">= 3.8") is marker.markers[0]
+    assert MultiMarker(*marker.markers) is marker
+    assert AnyMarker() is AnyMarker()
+    assert EmptyMarker() is EmptyMarker()
+    assert pickle.loads(pickle.dumps(marker)) is marker
+    assert copy.deepcopy(marker) is marker
+
+
+def test_interned_markers_hash_is_computed_once(mocker: MockerFixture) -> None:
+    compute_hash = mocker.spy(MarkerUnion, "_compute_hash")
+    markers = [SingleMarker("sys_platform", f"== interned-{i}") for i in range(3)]
+
+    union = MarkerUnion(*markers)
+    for _ in range(3):
+        assert hash(MarkerUnion(*markers)) == hash(union)
+
+    assert compute_hash.call_count == 1
+
+
+def test_swapped_markers_are_equal_but_not_identical() -> None:
+    marker = SingleMarker("sys_platform", '"linux" in', swapped_name_value=True)
+    other = SingleMarker("sys_platform", "in linux")
+
+    assert marker == other
+    assert hash(marker) == hash(other)
+    assert marker is not other
+    assert str(marker) == '"linux" in sys_platform'
+    assert str(other) == 'sys_platform in "linux"'
+
+
+def test_interned_markers_are_garbage_collected() -> None:
+    marker = SingleMarker("sys_platform", "== garbage-collected")
+    ref = weakref.ref(marker)
+
+    del marker
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_markers_are_looked_up_by_arguments_before_they_are_built(
+    mocker: MockerFixture,
+) -> None:
+    init = mocker.spy(SingleMarker, "__init__")
+
+    marker = SingleMarker("sys_platform", "== by-arguments")
+    assert SingleMarker("sys_platform", "== by-arguments") is marker
+    assert init.call_count == 1
+
+    # Equal constraints can have different string representations.
+    other = SingleMarker("sys_platform", parse_generic_constraint("== by-arguments"))
+    assert other is marker
+    assert init.call_count == 2
+
+
+class ExternalMarker(BaseMarker):
+    def __init__(self, value: str) -> None:
+        self.value = value
+
+    def intersect(self, other: BaseMarker) -> BaseMarker:
+        raise NotImplementedError
+
+    def union(self, other: BaseMarker) -> BaseMarker:
+        raise NotImplementedError
+
+    def validate(self, environment: Mapping[str, Any] | None) -> bool:
+        return True
+
+    def without_extras(self) -> BaseMarker:
+        return self
+
+    def exclude(self, marker_name: str) -> BaseMarker:
+        return self
+
+    def only(self, *marker_names: str) -> BaseMarker:
+        return self
+
+    def reduce_by_python_constraint(self, python_constraint: Any) -> BaseMarker:
+        return self
+
+    def invert(self) -> BaseMarker:
+        raise NotImplementedError
+
+    def __str__(self) -> str:
+        return f'external == "{self.value}"'
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ExternalMarker) and self.value == other.value
+
+
+def test_markers_of_external_subclasses_are_not_interned() -> None:
+    marker = ExternalMarker("a")
+
+    assert ExternalMarker("a") is not marker
+    assert ExternalMarker("b").value == "b"
+    assert hash(marker) == hash(ExternalMarker("a"))
+    assert pickle.loads(pickle.dumps(marker)) == marker
+    assert {MultiMarker(marker, ExternalMarker("b"))} == {
+        MultiMarker(ExternalMarker("a"), ExternalMarker("b"))
+    }
+
+
+EXPANSION_MARKER_NAMES = [
+    "os_name",
+    "sys_platform",
+    "platform_machine",
+    "platform_system",
+    "implementation_name",
+    "platform_python_implementation",
+]
+
+
+@pytest.fixture
+def expansion_budget() -> Iterator[ExpansionBudget]:
+    budget = ExpansionBudget(max_product_size=6, max_clauses=3)
+    previous = set_expansion_budget(budget)
+    try:
+        yield budget
+    finally:
+        set_expansion_budget(previous)
+
+
+@pytest.mark.usefixtures("marker_cache")
+def test_expansion_budget_product_size(expansion_budget: ExpansionBudget) -> None:
+    marker = MultiMarker(
+        *(
+            MarkerUnion(
+                SingleMarker(EXPANSION_MARKER_NAMES[2 * i], "== x"),
+                SingleMarker(EXPANSION_MARKER_NAMES[2 * i + 1], "== x"),
+            )
+            for i in range(3)
+        )
+    )
+
+    assert dnf(marker) is marker
+    assert expansion_budget.info() == (1, 0, 6, 3)
+
+    assert cnf(marker.invert()) is marker.invert()
+    assert expansion_budget.info() == (2, 0, 6, 3)
+
+
+@pytest.mark.usefixtures("marker_cache")
+def test_expansion_budget_clauses(expansion_budget: ExpansionBudget) -> None:
+    marker = MultiMarker(
+        MarkerUnion(
+            *(SingleMarker(name, "== x") for name in EXPANSION_MARKER_NAMES[:3])
+        ),
+        MarkerUnion(
+            *(SingleMarker(name, "== x") for name in EXPANSION_MARKER_NAMES[3:5])
+        ),
+    )
+
+    assert dnf(marker) is marker
+    assert expansion_budget.info() == (0, 1, 6, 3)
+
+    expansion_budget.reset()
+    assert expansion_budget.info() == (0, 0, 6, 3)
+
+
+@pytest.mark.usefixtures("marker_cache")
+def test_expansion_budget_within_limits(expansion_budget: ExpansionBudget) -> None:
+    marker = parse_marker(
+        '(sys_platform == "linux" or python_version >= "3.8") and extra == "a"'
+    )
+
+    assert str(dnf(marker)) == (
+        'sys_platform == "linux" and extra == "a"'
+        ' or python_version >= "3.8" and extra == "a"'
+    )
+    assert expansion_budget.info() == (0, 0, 6, 3)
+
+
+@pytest.mark.usefixtures("marker_cache")
+def test_unbounded_expansion(expansion_budget: ExpansionBudget) -> None:
+    marker = MultiMarker(
+        MarkerUnion(
+            *(SingleMarker(name, "== x") for name in EXPANSION_MARKER_NAMES[:3])
+        ),
+        MarkerUnion(
+            *(SingleMarker(name, "== x") for name in EXPANSION_MARKER_NAMES[3:5])
+        ),
+    )
+
+    with unbounded_expansion():
+        result = dnf(marker)
+
+    assert isinstance(result, MarkerUnion)
+    assert len(result.markers) == 6
+    assert expansion_budget.info() == (0, 0, 6, 3)
+
+
+@pytest.mark.usefixtures("marker_cache")
+def test_intersection_exceeding_expansion_budget_is_unnormalized(
+    expansion_budget: ExpansionBudget,
+) -> None:
+    markers = [
+        MarkerUnion(
+            SingleMarker(EXPANSION_MARKER_NAMES[2 * i], "== x"),
+            SingleMarker(EXPANSION_MARKER_NAMES[2 * i + 1], "== x"),
+        )
+        for i in range(3)
+    ]
+
+    assert intersection(*markers) == MultiMarker(*markers)
+    assert expansion_budget.info().product_size_exceeded == 1
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_expansion_budget_invalid_limit(limit: int) -> None:
+    with pytest.raises(ValueError):
+        ExpansionBudget(max_product_size=limit)
+    with pytest.raises(ValueError):
+        ExpansionBudget(max_clauses=limit)
+
+
+def test_default_expansion_budget() -> None:
+    budget = get_expansion_budget()
+
+    assert budget.max_product_size is None
+    assert budget.max_clauses is None
+
+    budget = ExpansionBudget()
+
+    assert budget.max_product_size == DEFAULT_MAX_PRODUCT_SIZE
+    assert budget.max_clauses == DEFAULT_MAX_CLAUSES
+
+
+@pytest.fixture
+def environment_space() -> EnvironmentSpace:
+    return EnvironmentSpace(
+        {
+            "python_version": python_version,
+            "python_full_version": f"{python_version}.0",
+            "sys_platform": sys_platform,
+        }
+        for python_version in ("3.9", "3.10", "3.11")
+        for sys_platform in ("linux", "win32")
+    )
+
+
+@pytest.mark.parametrize(
+    ("marker", "expected"),
+    [
+        ("", 0b111111),
+        ("<empty>", 0),
+        ('sys_platform == "linux"', 0b010101),
+        ('python_version >= "3.10"', 0b111100),
+        ('python_version >= "3.10" and sys_platform == "linux"', 0b010100),
+        ('python_version < "3.10" or sys_platform == "win32"', 0b101011),
+        ('python_version >= "3.12"', 0),
+    ],
+)
+def test_environment_space_mask(
+    environment_space: EnvironmentSpace, marker: str, expected: int
+) -> None:
+    m = EmptyMarker() if marker == "<empty>" else parse_marker(marker)
+
+    assert environment_space.mask(m) == expected
+    assert environment_space.mask(m) == sum(
+        1 << i
+        for i, env in enumerate(environment_space.environments)
+        if m.validate(env)
+    )
+
+
+def test_environment_space_masks_can_be_combined(
+    environment_space: EnvironmentSpace,
+) -> None:
+    m1 = parse_marker('python_version >= "3.10"')
+    m2 = parse_marker('sys_platform == "linux"')
+
+    assert environment_space.mask(m1.intersect(m2)) == (
+        environment_space.mask(m1) & environment_space.mask(m2)
+    )
+    assert environment_space.mask(m1.union(m2)) == (
+        environment_space.mask(m1) | environment_space.mask(m2)
+    )
+    assert environment_space.mask(m1.invert()) == (
+        environment_space.all & ~environment_space.mask(m1)
+    )
+
+
+def test_environment_space_select_and_partition(
+    environment_space: EnvironmentSpace,
+) -> None:
+    linux = parse_marker('sys_platform == "linux"')
+    not_win32 = parse_marker('sys_platform != "win32"')
+    old = parse_marker('python_version < "3.10"')
+
+    assert len(environment_space) == 6
+    assert [env["sys_platform"] for env in environment_space.select(0b000101)] == [
+        "linux",
+        "linux",
+    ]
+    assert environment_space.partition([linux, old, not_win32]) == {
+        0b010101: [linux, not_win32],
+        0b000011: [old],
+    }
+
+
+@pytest.mark.parametrize(
+    ("marker", "expected"),
+    [
+        ('python_version >= "3.8"', ""),
+        ('python_version >= "3.12"', EMPTY),
+        (
+            'python_version >= "3.8" and sys_platform == "linux"',
+            'sys_platform == "linux"',
+        ),
+        (
+            'python_version >= "3.12" or sys_platform == "linux"',
+            'sys_platform == "linux"',
+        ),
+        (
+            'python_version < "3.11" and sys_platform == "linux"',
+            'python_version < "3.11" and sys_platform == "linux"',
+        ),
+    ],
+)
+def test_environment_space_reduce(
+    environment_space: EnvironmentSpace, marker: str, expected: str
+) -> None:
+    m = parse_marker(marker)
+    reduced = environment_space.reduce(m)
+
+    assert (EMPTY if reduced.is_empty() else str(reduced)) == expected
+    assert environment_space.mask(reduced) == environment_space.mask(m)
+
+
+@pytest.mark.parametrize("error", [False, True])
+def test_intersection_cycle_in_cnf(
+    monkeypatch: pytest.MonkeyPatch, error: bool
+) -> None:
+    import poetry.core.version.markers as markers_module
+
+    m1 = parse_marker('python_version >= "3.8"')
+    m2 = parse_marker('sys_platform == "linux" or extra == "foo"')
+    original_cnf = markers_module.cnf
+    disjunction = dnf(MultiMarker(m1, m2))
+
+    def reentrant_cnf(marker: BaseMarker) -> BaseMarker:
+        if marker == disjunction:
+            if error:
+                raise RecursionError
+            intersection(m1, m2)
+        return original_cnf(marker)
+
+    monkeypatch.setattr(markers_module, "cnf", reentrant_cnf)
+
+    # the CNF is not a candidate anymore
+    assert str(intersection(m1, m2)) == (
+        'python_version >= "3.8" and (sys_platform == "linux" or extra == "foo")'
+    )
+    assert not markers_module._normalization.active
+
+
+@pytest.mark.parametrize("error", [False, True])
+def test_union_cycle_in_dnf(monkeypatch: pytest.MonkeyPatch, error: bool) -> None:
+    import poetry.core.version.markers as markers_module
+
+    m1 = parse_marker('python_version >= "3.8"')
+    m2 = parse_marker('sys_platform == "linux" and extra == "foo"')
+    original_dnf = markers_module.dnf
+    conjunction = cnf(MarkerUnion(m1, m2))
+
+    def reentrant_dnf(marker: BaseMarker) -> BaseMarker:
+        if marker == conjunction:
+            if error:
+                raise RecursionError
+            union(m1, m2)
+        return original_dnf(marker)
+
+    monkeypatch.setattr(markers_module, "dnf", reentrant_dnf)
+
+    # the DNF is not a candidate anymore
+    assert str(union(m1, m2)) == (
+        'python_version >= "3.8" or sys_platform == "linux" and extra == "foo"'
+    )
+    assert not markers_module._normalization.active
+
+
+def test_intersection_cycle_in_dnf(monkeypatch: pytest.MonkeyPatch) -> None:
+    import poetry.core.version.markers as markers_module
+
+    m1 = parse_marker('python_version >= "3.8"')
+    m2 = parse_marker('sys_platform == "linux" or extra == "foo"')
+    original_dnf = markers_module.dnf
+
+    def reentrant_dnf(marker: BaseMarker) -> BaseMarker:
+        intersection(m1, m2)
+        return original_dnf(marker)
+
+    monkeypatch.setattr(markers_module, "dnf", reentrant_dnf)
+
+    # There is no call that is choosing a candidate.
+    with pytest.raises(RecursionError):
+        intersection(m1, m2)
+    assert not markers_module._normalization.active
+
+
+def test_results_depending_on_cycles_are_not_cached(
+    monkeypatch: pytest.MonkeyPatch, marker_cache: MarkerCache
+) -> None:
+    import poetry.core.version.markers as markers_module
+
+    m1 = parse_marker('python_version >= "3.8"')
+    m2 = parse_marker('sys_platform == "linux" or extra == "foo"')
+    m3 = parse_marker('python_version >= "3.9"')
+    m4 = parse_marker('sys_platform == "win32" or extra == "bar"')
+    original_cnf = markers_module.cnf
+    original_markers_from_groups = markers_module._markers_from_groups
+    outer = dnf(MultiMarker(m1, m2))
+    inner = dnf(MultiMarker(m3, m4))
+    cycles: list[BaseMarker] = []
+
+    def reentrant_cnf(marker: BaseMarker) -> BaseMarker:
+        if marker == outer:
+            parse_marker('os_name == "nt"')
+        elif marker == inner:
+            cycles.append(marker)
+            intersection(m1, m2)
+        return original_cnf(marker)
+
+    def markers_from_groups(*args: Any) -> BaseMarker:
+        # the cycle is detected and handled within this intersection
+        intersection(m3, m4)
+        return original_markers_from_groups(*args)
+
+    monkeypatch.setattr(markers_module, "cnf", reentrant_cnf)
+    monkeypatch.setattr(markers_module, "_markers_from_groups", markers_from_groups)
+    intersection(m1, m2)
+
+    assert cycles == [inner]
+    assert ("_parse_marker", 'os_name == "nt"') not in marker_cache
+
+    monkeypatch.undo()
+    parse_marker('os_name == "nt"')
+
+    assert ("_parse_marker", 'os_name == "nt"') in marker_cache
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import shutil
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from poetry.core.version.grammars import GRAMMAR_DIR
+from poetry.core.version.grammars import GRAMMAR_PEP_508_CONSTRAINTS
+from poetry.core.version.grammars import GRAMMAR_PEP_508_MARKERS
+from poetry.core.version.parser import Parser
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize(
+    ("grammar", "text"),
+    [
+        (
+            GRAMMAR_PEP_508_MARKERS,
+            'python_version >= "3.8" and ("linux" in sys_platform or extra == "a")',
+        ),
+        (
+            GRAMMAR_PEP_508_CONSTRAINTS,
+            'foo[bar] (>=1.0,<2) ; python_version >= "3.8" or os_name == "nt"',
+        ),
+    ],
+)
+def test_shipped_tables_are_up_to_date(grammar: Path, text: str) -> None:
+    parser = Parser(grammar)
+
+    lark = parser._load_tables()
+
+    assert lark is not None, "Outdated parser tables, run 'make grammars/tables'."
+    assert lark.parse(text) == parser._create().parse(text)
+
+
+@pytest.fixture
+def grammar(tmp_path: Path) -> Path:
+    for grammar in GRAMMAR_DIR.glob("*.lark"):
+        shutil.copy(grammar, tmp_path)
+
+    return tmp_path / GRAMMAR_PEP_508_MARKERS.name
+
+
+def test_save_and_load_tables(grammar: Path) -> None:
+    parser = Parser(grammar)
+    assert parser._load_tables() is None
+
+    parser.save_tables()
+
+    assert parser.tables.exists()
+    assert parser._load_tables() is not None
+    assert parser.parse('os_name == "nt"') == parser._create().parse('os_name == "nt"')
+
+
+def test_tables_of_other_grammars_are_ignored(grammar: Path) -> None:
+    parser = Parser(grammar)
+    parser.save_tables()
+
+    with grammar.open("a") as f:
+        f.write("\n")
+
+    assert parser._load_tables() is None
+    assert parser.parse('os_name == "nt"')
+
+
+def test_invalid_tables_are_ignored(grammar: Path) -> None:
+    parser = Parser(grammar)
+    parser.tables.write_bytes(b"invalid")
+
+    assert parser._load_tables() is None
+    assert parser.parse('os_name == "nt"')
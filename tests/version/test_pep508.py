@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import random
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pytest
+
+from poetry.core.version.markers import _compact_markers
+from poetry.core.version.markers import _markers_from_groups
+from poetry.core.version.markers import _parser as marker_parser
+from poetry.core.version.markers import parse_marker
+from poetry.core.version.pep508 import PEP508SyntaxError
+from poetry.core.version.pep508 import parse_marker_groups
+from poetry.core.version.pep508 import parse_requirement_parts
+from poetry.core.version.requirements import Requirement
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+MARKER_NAMES = [
+    "python_version",
+    "python_full_version",
+    "platform_release",
+    "sys_platform",
+    "os.name",
+    "platform_machine",
+    "implementation_name",
+    "extra",
+]
+OPERATORS = ["==", "!=", ">=", "<=", ">", "<", "~=", "===", "in", "not in"]
+VALUES = ["3.8", "3.10.1", "linux", "win32", "tegra", "x86_64 aarch64", "a-b", ""]
+WHITESPACE = ["", " ", "  ", "\t"]
+VERSION_CONSTRAINTS = [">=1.0", "<2", "== 1.2.*", "~=3.2", "!=1.5", "===1.0", ">= 2"]
+
+
+def random_marker(rnd: random.Random, depth: int = 2) -> str:
+    parts = []
+    for i in range(rnd.randint(1, 3)):
+        if i:
+            parts.append(rnd.choice([" and ", " or ", "and ", " or"]))
+        if depth and rnd.random() < 0.25:
+            parts.append(f"({random_marker(rnd, depth - 1)})")
+            continue
+
+        name = rnd.choice(MARKER_NAMES)
+        op = rnd.choice(OPERATORS)
+        quote = rnd.choice("\"'")
+        value = f"{quote}{rnd.choice(VALUES)}{quote}"
+        ws = rnd.choice(WHITESPACE)
+        if rnd.random() < 0.2:
+            name, value = value, name
+        parts.append(f"{name}{ws}{op}{ws}{value}")
+
+    return "".join(parts)
+
+
+def random_requirement(rnd: random.Random) -> str:
+    ws = rnd.choice(WHITESPACE)
+    requirement = rnd.choice(["foo", "Foo-bar.baz_2", "a"])
+    if rnd.random() < 0.3:
+        extras = rnd.sample(["bar", "baz", "qux"], rnd.randint(0, 2))
+        requirement += f"{ws}[{','.join(extras)}]"
+    if rnd.random() < 0.2:
+        requirement += f"{ws}@ {rnd.choice(['http://example.com', 'file:///a/b'])} "
+    elif rnd.random() < 0.7:
+        constraints = ",".join(rnd.sample(VERSION_CONSTRAINTS, rnd.randint(1, 2)))
+        requirement += f"{ws}({constraints})" if rnd.random() < 0.3 else constraints
+    if rnd.random() < 0.5:
+        requirement += f"{ws};{ws}{random_marker(rnd)}"
+
+    return requirement
+
+
+def mutate(rnd: random.Random, text: str) -> str:
+    position = rnd.randint(0, len(text))
+    if rnd.random() < 0.5:
+        return text[:position] + text[position + 1 :]
+    return text[:position] + rnd.choice("()[]\"', ;=<>!@\\") + text[position:]
+
+
+def outcome(func: Callable[[str], Any], text: str) -> Any:
+    try:
+        return func(text)
+    except Exception as e:
+        return type(e)
+
+
+def lark_marker(text: str) -> str:
+    return str(_compact_markers(marker_parser.parse(text).children))
+
+
+def fast_marker(text: str) -> str:
+    return str(_markers_from_groups(parse_marker_groups(text)))
+
+
+def lark_requirement(text: str) -> tuple[Any, ...]:
+    parts = Requirement._parse_with_lark(text)
+    return parts.name, parts.extras, parts.constraints, parts.url, str(parts.marker)
+
+
+def fast_requirement(text: str) -> tuple[Any, ...]:
+    parts = parse_requirement_parts(text)
+    marker = parse_marker(parts.marker) if parts.marker is not None else None
+    return parts.name, parts.extras, parts.constraints, parts.url, str(marker)
+
+
+@pytest.mark.parametrize(
+    ("generate", "lark", "fast"),
+    [
+        (random_marker, lark_marker, fast_marker),
+        (random_requirement, lark_requirement, fast_requirement),
+    ],
+)
+@pytest.mark.parametrize("seed", range(5))
+def test_differential_fuzz(
+    generate: Callable[[random.Random], str],
+    lark: Callable[[str], Any],
+    fast: Callable[[str], Any],
+    seed: int,
+) -> None:
+    rnd = random.Random(seed)
+    for _ in range(200):
+        text = generate(rnd)
+        if rnd.random() < 0.5:
+            text = mutate(rnd, text)
+
+        expected = outcome(lark, text)
+        actual = outcome(fast, text)
+        if actual is PEP508SyntaxError:
+            # The fast parser must only reject markers Lark rejects, too,
+            # or that contain escape sequences.
+            assert isinstance(expected, type) or "\\" in text, text
+        else:
+            assert actual == expected, text
+
+
+@pytest.mark.parametrize(
+    "marker",
+    [
+        "",
+        "python_version",
+        'python_version == "3.8" and',
+        'python_version == "3.8" or (sys_platform == "linux"',
+        'python_version = "3.8"',
+        'python_version == "3.8" sys_platform == "linux"',
+        'python_version not  in "3.8"',
+        '"3.8" == "3.8"',
+        'python_version == "3.8"\n',
+    ],
+)
+def test_parse_marker_groups_invalid(marker: str) -> None:
+    with pytest.raises(PEP508SyntaxError):
+        parse_marker_groups(marker)
+
+
+def test_parse_marker_groups() -> None:
+    groups = parse_marker_groups(
+        'python_version >= "3.8" and (sys_platform == "linux" or'
+        " 'tegra' in platform_release) or extra == 'foo'"
+    )
+
+    assert groups == [
+        [
+            ("python_version", ">=", "3.8", False),
+            [
+                [("sys_platform", "==", "linux", False)],
+                [("platform_release", "in", "tegra", True)],
+            ],
+        ],
+        [("extra", "==", "foo", False)],
+    ]
+
+
+def test_parse_requirement_parts() -> None:
+    parts = parse_requirement_parts(
+        'foo [bar, baz] (>=1.0, <2) ; python_version >= "3.8"'
+    )
+
+    assert parts.name == "foo"
+    assert parts.extras == ["bar", "baz"]
+    assert parts.constraints == [">=1.0", "<2"]
+    assert parts.url is None
+    assert parts.marker == 'python_version >= "3.8"'